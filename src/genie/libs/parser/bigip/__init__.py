@@ -1,3 +1,14 @@
 from genie import abstract
 abstract.declare_token(__name__)
 
+# The parser modules are listed in registry.PARSERS, and built on import
+from . import registry
+
+
+def __getattr__(name):
+    '''return the parser classes of the registry by name'''
+    parser_cls = registry.get_parser_class(name)
+    if parser_cls is None:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(
+            __name__, name))
+    return parser_cls
@@ -0,0 +1,216 @@
+'''Bulk collection of F5 BIG-IP iControl REST endpoints
+
+Collections such as /mgmt/tm/ltm/pool/members can hold thousands of items.
+They are requested page by page with $top and $skip, optionally with only
+the fields listed in $select, and many endpoints are requested at once over
+a bounded pool of threads sharing the keep-alive session of the device.
+
+example:
+
+    >>> for endpoint, item in iter_collect(device, ['/mgmt/tm/ltm/pool',
+    ...                                             '/mgmt/tm/ltm/virtual'],
+    ...                                    select=['name', 'partition']):
+    ...     print(endpoint, item['name'])
+
+    >>> collect(device, endpoints)['/mgmt/tm/ltm/pool']['items']
+
+The parsers of the registry accept the same arguments, and return the same
+dict as without them:
+
+    >>> LtmPool(device=device, context='rest').parse(page_size=500)
+'''
+
+# Global Imports
+import queue
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Number of items requested per page by default
+PAGE_SIZE = 500
+
+# Pages requested at most per endpoint
+MAX_PAGES = 10000
+
+# Number of requests sent at once by default, below the default connection
+# pool size of requests sessions so connections are kept alive and reused
+MAX_WORKERS = 4
+
+# Keys describing a page, dropped when the pages are merged
+PAGE_KEYS = ('currentItemCount', 'itemsPerPage', 'pageIndex', 'startIndex',
+             'totalItems', 'totalPages', 'nextLink', 'previousLink')
+
+
+def get_page(device, endpoint, skip=0, top=None, select=None):
+    '''return the json of one page of endpoint'''
+    params = []
+    if top:
+        params.append('$top={}'.format(top))
+    if skip:
+        params.append('$skip={}'.format(skip))
+    if select:
+        params.append('$select={}'.format(','.join(select)))
+    url = '{}?{}'.format(endpoint, '&'.join(params)) if params else endpoint
+    return device.get(url).json()
+
+
+def iter_pages(device, endpoint, select=None, page_size=None):
+    '''yield the json of each page of endpoint
+
+        Paging stops at the first page holding other than page_size items,
+        at totalItems or totalPages when the pages have them, at a page
+        repeating the previous one, as returned by endpoints ignoring $skip,
+        or after MAX_PAGES pages.
+
+        Args:
+            device (`Device`): BIG-IP device
+            endpoint (`str`): iControl REST endpoint
+            select (`list`): only request these fields of the items
+            page_size (`int`): items per page, defaults to PAGE_SIZE
+    '''
+    page_size = page_size or PAGE_SIZE
+    skip = 0
+    previous = None
+    for _ in range(MAX_PAGES):
+        page = get_page(device, endpoint, skip, page_size, select)
+        items = page.get('items') if page else None
+        if previous is not None and items == previous:
+            logger.warning('{} ignores $skip, stopped paging at {} items'
+                           .format(endpoint, skip))
+            return
+        yield page
+        # Responses other than collections have no items, and endpoints
+        # ignoring $top return all their items at once
+        if not items or len(items) != page_size:
+            return
+        skip += page_size
+        if page.get('totalItems') is not None and \
+           skip >= page['totalItems']:
+            return
+        if page.get('totalPages') is not None and \
+           page.get('pageIndex') is not None and \
+           page['pageIndex'] >= page['totalPages']:
+            return
+        previous = items
+    logger.warning('{} returned more than {} pages of {} items, stopped '
+                   'paging'.format(endpoint, MAX_PAGES, page_size))
+
+
+def get_collection(device, endpoint, select=None, page_size=None):
+    '''return the json of endpoint, requested page by page
+
+        The items of all the pages are merged into the first page, and the
+        keys describing the page are dropped, so the result is the json of
+        endpoint requested at once.
+    '''
+    result = None
+    for page in iter_pages(device, endpoint, select, page_size):
+        if result is None:
+            result = page
+        elif page:
+            result.setdefault('items', []).extend(page.get('items', ()))
+    if not result:
+        return {}
+    for key in PAGE_KEYS:
+        result.pop(key, None)
+    return result
+
+
+def iter_collect(device, endpoints, select=None, page_size=None,
+                 max_workers=None):
+    '''yield (endpoint, item) for the items of each endpoint, as pages are
+       received
+
+        Endpoints are requested at once by up to max_workers threads. The
+        items of an endpoint are yielded in order, items of different
+        endpoints can be interleaved. A response which is not a collection
+        is yielded as a single item.
+
+        Args:
+            device (`Device`): BIG-IP device
+            endpoints (`list`): iControl REST endpoints
+            select (`list`): only request these fields of the items
+            page_size (`int`): items per page, defaults to PAGE_SIZE
+            max_workers (`int`): number of requests sent at once, defaults
+                                 to MAX_WORKERS
+    '''
+    endpoints = list(endpoints)
+    if not endpoints:
+        return
+    max_workers = min(max_workers or MAX_WORKERS, len(endpoints))
+    received = queue.Queue(maxsize=max_workers * 2)
+    pending = iter(endpoints)
+    pending_lock = threading.Lock()
+    stop = threading.Event()
+
+    def put(message):
+        # Gives up when the caller stopped reading
+        while not stop.is_set():
+            try:
+                received.put(message, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def worker():
+        while not stop.is_set():
+            with pending_lock:
+                endpoint = next(pending, None)
+            if endpoint is None:
+                break
+            try:
+                for page in iter_pages(device, endpoint, select, page_size):
+                    if not put((endpoint, page, None)):
+                        return
+            except Exception as e:
+                put((endpoint, None, e))
+        put(None)
+
+    for _ in range(max_workers):
+        threading.Thread(target=worker, daemon=True).start()
+
+    try:
+        running = max_workers
+        while running:
+            message = received.get()
+            if message is None:
+                running -= 1
+                continue
+            endpoint, page, exception = message
+            if exception is not None:
+                raise exception
+            if not page:
+                continue
+            if 'items' in page:
+                for item in page['items']:
+                    yield endpoint, item
+            else:
+                yield endpoint, page
+    finally:
+        # Stops the workers when the caller stops early, or on error
+        stop.set()
+
+
+def collect(device, endpoints, select=None, page_size=None,
+            max_workers=None):
+    '''return `dict` of endpoint to its json, as returned by get_collection
+
+        Endpoints are requested at once by up to max_workers threads.
+    '''
+    endpoints = list(endpoints)
+    if not endpoints:
+        return {}
+    max_workers = min(max_workers or MAX_WORKERS, len(endpoints))
+    if max_workers <= 1:
+        return {endpoint: get_collection(device, endpoint, select, page_size)
+                for endpoint in endpoints}
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers) as executor:
+        results = executor.map(
+            lambda endpoint: get_collection(device, endpoint, select,
+                                            page_size),
+            endpoints)
+        return dict(zip(endpoints, results))
@@ -0,0 +1,885 @@
+'''Registry of the F5 BIG-IP REST parsers
+
+Every BIG-IP parser returns the json of a GET on its endpoint. Instead of
+repeating the parser code in each module, the table below lists the module
+name, class name and endpoint of each parser. The modules are two line stubs
+written by write_modules, their classes are built from the table when the
+module is first imported:
+
+    >>> from genie.libs.parser.bigip.get_sys_version import SysVersion
+    >>> from genie.libs.parser.bigip import SysVersion
+
+The stubs keep the modules visible to genie.abstract lookups and pkgutil,
+which learn the modules of a package from its files.
+'''
+
+# Global Imports
+import os
+import sys
+import json
+import importlib
+from collections import defaultdict
+
+# Metaparser
+from genie.metaparser import MetaParser
+
+# Parser
+from .collection import get_collection
+
+# <module name> <class name> <endpoint>
+PARSERS = '''\
+get_access_acl_stats AccessAclstats /mgmt/tm/access/acl-stats
+get_access_bundle_install_tasks AccessBundleinstalltasks /mgmt/tm/access/bundle-install-tasks
+get_access_profile_access_misc_stats AccessProfileaccessmiscstats /mgmt/tm/access/profile-access-misc-stats
+get_access_profile_rewrite_stats AccessProfilerewritestats /mgmt/tm/access/profile-rewrite-stats
+get_access_profile_rewritestats AccessProfilerewriteStats /mgmt/tm/access/profile-rewrite/stats
+get_access_redeploy_iapp_tasks AccessRedeployiapptasks /mgmt/tm/access/redeploy-iapp-tasks
+get_access_sessionkill_sessions AccessSessionKillsessions /mgmt/tm/access/session/kill-sessions
+get_access_usecase_pack_info AccessUsecasepackinfo /mgmt/tm/access/usecase-pack-info
+get_adc_fileobjectssl_cert AdcFileobjectSslcert /mgmt/tm/adc/fileobject/ssl-cert
+get_adc_fileobjectssl_crl AdcFileobjectSslcrl /mgmt/tm/adc/fileobject/ssl-crl
+get_adc_fileobjectssl_csr AdcFileobjectSslcsr /mgmt/tm/adc/fileobject/ssl-csr
+get_adc_fileobjectssl_key AdcFileobjectSslkey /mgmt/tm/adc/fileobject/ssl-key
+get_analytics_afm_sweepergenerate_report AnalyticsAfmsweeperGeneratereport /mgmt/tm/analytics/afm-sweeper/generate-report
+get_analytics_afm_sweeperreport_results AnalyticsAfmsweeperReportresults /mgmt/tm/analytics/afm-sweeper/report-results
+get_analytics_application_security_anomaliesgenerate_report AnalyticsApplicationsecurityanomaliesGeneratereport /mgmt/tm/analytics/application-security-anomalies/generate-report
+get_analytics_application_security_anomaliesreport_results AnalyticsApplicationsecurityanomaliesReportresults /mgmt/tm/analytics/application-security-anomalies/report-results
+get_analytics_application_security_incidentsgenerate_report AnalyticsApplicationsecurityincidentsGeneratereport /mgmt/tm/analytics/application-security-incidents/generate-report
+get_analytics_application_security_incidentsreport_results AnalyticsApplicationsecurityincidentsReportresults /mgmt/tm/analytics/application-security-incidents/report-results
+get_analytics_application_security_networkgenerate_report AnalyticsApplicationsecuritynetworkGeneratereport /mgmt/tm/analytics/application-security-network/generate-report
+get_analytics_application_security_networkreport_results AnalyticsApplicationsecuritynetworkReportresults /mgmt/tm/analytics/application-security-network/report-results
+get_analytics_application_securitygenerate_report AnalyticsApplicationsecurityGeneratereport /mgmt/tm/analytics/application-security/generate-report
+get_analytics_application_securityreport_results AnalyticsApplicationsecurityReportresults /mgmt/tm/analytics/application-security/report-results
+get_analytics_asm_bypassgenerate_report AnalyticsAsmbypassGeneratereport /mgmt/tm/analytics/asm-bypass/generate-report
+get_analytics_asm_bypassreport_results AnalyticsAsmbypassReportresults /mgmt/tm/analytics/asm-bypass/report-results
+get_analytics_asm_cpugenerate_report AnalyticsAsmcpuGeneratereport /mgmt/tm/analytics/asm-cpu/generate-report
+get_analytics_asm_cpureport_results AnalyticsAsmcpuReportresults /mgmt/tm/analytics/asm-cpu/report-results
+get_analytics_asm_enforced_entitiesgenerate_report AnalyticsAsmenforcedentitiesGeneratereport /mgmt/tm/analytics/asm-enforced-entities/generate-report
+get_analytics_asm_enforced_entitiesreport_results AnalyticsAsmenforcedentitiesReportresults /mgmt/tm/analytics/asm-enforced-entities/report-results
+get_analytics_asm_learning_suggestionsgenerate_report AnalyticsAsmlearningsuggestionsGeneratereport /mgmt/tm/analytics/asm-learning-suggestions/generate-report
+get_analytics_asm_learning_suggestionsreport_results AnalyticsAsmlearningsuggestionsReportresults /mgmt/tm/analytics/asm-learning-suggestions/report-results
+get_analytics_asm_memorygenerate_report AnalyticsAsmmemoryGeneratereport /mgmt/tm/analytics/asm-memory/generate-report
+get_analytics_asm_memoryreport_results AnalyticsAsmmemoryReportresults /mgmt/tm/analytics/asm-memory/report-results
+get_analytics_asm_policy_changesgenerate_report AnalyticsAsmpolicychangesGeneratereport /mgmt/tm/analytics/asm-policy-changes/generate-report
+get_analytics_asm_policy_changesreport_results AnalyticsAsmpolicychangesReportresults /mgmt/tm/analytics/asm-policy-changes/report-results
+get_analytics_bot_defense_eventgenerate_report AnalyticsBotdefenseeventGeneratereport /mgmt/tm/analytics/bot-defense-event/generate-report
+get_analytics_bot_defense_eventreport_results AnalyticsBotdefenseeventReportresults /mgmt/tm/analytics/bot-defense-event/report-results
+get_analytics_cpu_per_vipgenerate_report AnalyticsCpupervipGeneratereport /mgmt/tm/analytics/cpu-per-vip/generate-report
+get_analytics_cpu_per_vipreport_results AnalyticsCpupervipReportresults /mgmt/tm/analytics/cpu-per-vip/report-results
+get_analytics_cpugenerate_report AnalyticsCpuGeneratereport /mgmt/tm/analytics/cpu/generate-report
+get_analytics_cpureport_results AnalyticsCpuReportresults /mgmt/tm/analytics/cpu/report-results
+get_analytics_disk_infogenerate_report AnalyticsDiskinfoGeneratereport /mgmt/tm/analytics/disk-info/generate-report
+get_analytics_disk_inforeport_results AnalyticsDiskinfoReportresults /mgmt/tm/analytics/disk-info/report-results
+get_analytics_dns_rpzgenerate_report AnalyticsDnsrpzGeneratereport /mgmt/tm/analytics/dns-rpz/generate-report
+get_analytics_dns_rpzreport_results AnalyticsDnsrpzReportresults /mgmt/tm/analytics/dns-rpz/report-results
+get_analytics_dnsgenerate_report AnalyticsDnsGeneratereport /mgmt/tm/analytics/dns/generate-report
+get_analytics_dnsreport_results AnalyticsDnsReportresults /mgmt/tm/analytics/dns/report-results
+get_analytics_dos_l3generate_report AnalyticsDosl3Generatereport /mgmt/tm/analytics/dos-l3/generate-report
+get_analytics_dos_l3report_results AnalyticsDosl3Reportresults /mgmt/tm/analytics/dos-l3/report-results
+get_analytics_dos_vis_attacksgenerate_report AnalyticsDosvisattacksGeneratereport /mgmt/tm/analytics/dos-vis-attacks/generate-report
+get_analytics_dos_vis_attacksreport_results AnalyticsDosvisattacksReportresults /mgmt/tm/analytics/dos-vis-attacks/report-results
+get_analytics_dos_vis_commongenerate_report AnalyticsDosviscommonGeneratereport /mgmt/tm/analytics/dos-vis-common/generate-report
+get_analytics_dos_vis_commonreport_results AnalyticsDosviscommonReportresults /mgmt/tm/analytics/dos-vis-common/report-results
+get_analytics_dos_vis_vipsgenerate_report AnalyticsDosvisvipsGeneratereport /mgmt/tm/analytics/dos-vis-vips/generate-report
+get_analytics_dos_vis_vipsreport_results AnalyticsDosvisvipsReportresults /mgmt/tm/analytics/dos-vis-vips/report-results
+get_analytics_fw_natgenerate_report AnalyticsFwnatGeneratereport /mgmt/tm/analytics/fw-nat/generate-report
+get_analytics_fw_natreport_results AnalyticsFwnatReportresults /mgmt/tm/analytics/fw-nat/report-results
+get_analytics_genericgenerate_report AnalyticsGenericGeneratereport /mgmt/tm/analytics/generic/generate-report
+get_analytics_genericreport_results AnalyticsGenericReportresults /mgmt/tm/analytics/generic/report-results
+get_analytics_httpgenerate_report AnalyticsHttpGeneratereport /mgmt/tm/analytics/http/generate-report
+get_analytics_httpreport_results AnalyticsHttpReportresults /mgmt/tm/analytics/http/report-results
+get_analytics_ip_intelligencegenerate_report AnalyticsIpintelligenceGeneratereport /mgmt/tm/analytics/ip-intelligence/generate-report
+get_analytics_ip_intelligencereport_results AnalyticsIpintelligenceReportresults /mgmt/tm/analytics/ip-intelligence/report-results
+get_analytics_ip_layergenerate_report AnalyticsIplayerGeneratereport /mgmt/tm/analytics/ip-layer/generate-report
+get_analytics_ip_layerreport_results AnalyticsIplayerReportresults /mgmt/tm/analytics/ip-layer/report-results
+get_analytics_lsn_poolgenerate_report AnalyticsLsnpoolGeneratereport /mgmt/tm/analytics/lsn-pool/generate-report
+get_analytics_lsn_poolreport_results AnalyticsLsnpoolReportresults /mgmt/tm/analytics/lsn-pool/report-results
+get_analytics_memory_per_processgenerate_report AnalyticsMemoryperprocessGeneratereport /mgmt/tm/analytics/memory-per-process/generate-report
+get_analytics_memory_per_processreport_results AnalyticsMemoryperprocessReportresults /mgmt/tm/analytics/memory-per-process/report-results
+get_analytics_memorygenerate_report AnalyticsMemoryGeneratereport /mgmt/tm/analytics/memory/generate-report
+get_analytics_memoryreport_results AnalyticsMemoryReportresults /mgmt/tm/analytics/memory/report-results
+get_analytics_networkgenerate_report AnalyticsNetworkGeneratereport /mgmt/tm/analytics/network/generate-report
+get_analytics_networkreport_results AnalyticsNetworkReportresults /mgmt/tm/analytics/network/report-results
+get_analytics_pemgenerate_report AnalyticsPemGeneratereport /mgmt/tm/analytics/pem/generate-report
+get_analytics_pemreport_results AnalyticsPemReportresults /mgmt/tm/analytics/pem/report-results
+get_analytics_proc_cpugenerate_report AnalyticsProccpuGeneratereport /mgmt/tm/analytics/proc-cpu/generate-report
+get_analytics_proc_cpureport_results AnalyticsProccpuReportresults /mgmt/tm/analytics/proc-cpu/report-results
+get_analytics_protocol_inspectiongenerate_report AnalyticsProtocolinspectionGeneratereport /mgmt/tm/analytics/protocol-inspection/generate-report
+get_analytics_protocol_inspectionreport_results AnalyticsProtocolinspectionReportresults /mgmt/tm/analytics/protocol-inspection/report-results
+get_analytics_protocol_security_httpgenerate_report AnalyticsProtocolsecurityhttpGeneratereport /mgmt/tm/analytics/protocol-security-http/generate-report
+get_analytics_protocol_security_httpreport_results AnalyticsProtocolsecurityhttpReportresults /mgmt/tm/analytics/protocol-security-http/report-results
+get_analytics_protocol_securitygenerate_report AnalyticsProtocolsecurityGeneratereport /mgmt/tm/analytics/protocol-security/generate-report
+get_analytics_protocol_securityreport_results AnalyticsProtocolsecurityReportresults /mgmt/tm/analytics/protocol-security/report-results
+get_analytics_sipgenerate_report AnalyticsSipGeneratereport /mgmt/tm/analytics/sip/generate-report
+get_analytics_sipreport_results AnalyticsSipReportresults /mgmt/tm/analytics/sip/report-results
+get_analytics_ssl_orchestrator_service_virtualgenerate_report AnalyticsSslorchestratorservicevirtualGeneratereport /mgmt/tm/analytics/ssl-orchestrator-service-virtual/generate-report
+get_analytics_ssl_orchestrator_service_virtualreport_results AnalyticsSslorchestratorservicevirtualReportresults /mgmt/tm/analytics/ssl-orchestrator-service-virtual/report-results
+get_analytics_ssl_orchestratorgenerate_report AnalyticsSslorchestratorGeneratereport /mgmt/tm/analytics/ssl-orchestrator/generate-report
+get_analytics_ssl_orchestratorreport_results AnalyticsSslorchestratorReportresults /mgmt/tm/analytics/ssl-orchestrator/report-results
+get_analytics_swg_blockedgenerate_report AnalyticsSwgblockedGeneratereport /mgmt/tm/analytics/swg-blocked/generate-report
+get_analytics_swg_blockedreport_results AnalyticsSwgblockedReportresults /mgmt/tm/analytics/swg-blocked/report-results
+get_analytics_swggenerate_report AnalyticsSwgGeneratereport /mgmt/tm/analytics/swg/generate-report
+get_analytics_swgreport_results AnalyticsSwgReportresults /mgmt/tm/analytics/swg/report-results
+get_analytics_system_monitorgenerate_report AnalyticsSystemmonitorGeneratereport /mgmt/tm/analytics/system-monitor/generate-report
+get_analytics_system_monitorreport_results AnalyticsSystemmonitorReportresults /mgmt/tm/analytics/system-monitor/report-results
+get_analytics_tcp_analyticsgenerate_report AnalyticsTcpanalyticsGeneratereport /mgmt/tm/analytics/tcp-analytics/generate-report
+get_analytics_tcp_analyticsreport_results AnalyticsTcpanalyticsReportresults /mgmt/tm/analytics/tcp-analytics/report-results
+get_analytics_tcpgenerate_report AnalyticsTcpGeneratereport /mgmt/tm/analytics/tcp/generate-report
+get_analytics_tcpreport_results AnalyticsTcpReportresults /mgmt/tm/analytics/tcp/report-results
+get_analytics_traffic_classificationgenerate_report AnalyticsTrafficclassificationGeneratereport /mgmt/tm/analytics/traffic-classification/generate-report
+get_analytics_traffic_classificationreport_results AnalyticsTrafficclassificationReportresults /mgmt/tm/analytics/traffic-classification/report-results
+get_analytics_udpgenerate_report AnalyticsUdpGeneratereport /mgmt/tm/analytics/udp/generate-report
+get_analytics_udpreport_results AnalyticsUdpReportresults /mgmt/tm/analytics/udp/report-results
+get_analytics_vcmpgenerate_report AnalyticsVcmpGeneratereport /mgmt/tm/analytics/vcmp/generate-report
+get_analytics_vcmpreport_results AnalyticsVcmpReportresults /mgmt/tm/analytics/vcmp/report-results
+get_analytics_virtualgenerate_report AnalyticsVirtualGeneratereport /mgmt/tm/analytics/virtual/generate-report
+get_analytics_virtualreport_results AnalyticsVirtualReportresults /mgmt/tm/analytics/virtual/report-results
+get_auth_cert_ldap AuthCertldap /mgmt/tm/auth/cert-ldap
+get_auth_ldap AuthLdap /mgmt/tm/auth/ldap
+get_auth_login_failures AuthLoginfailures /mgmt/tm/auth/login-failures
+get_auth_partition AuthPartition /mgmt/tm/auth/partition
+get_auth_password_policy AuthPasswordpolicy /mgmt/tm/auth/password-policy
+get_auth_radius AuthRadius /mgmt/tm/auth/radius
+get_auth_radius_server AuthRadiusserver /mgmt/tm/auth/radius-server
+get_auth_remote_role AuthRemoterole /mgmt/tm/auth/remote-role
+get_auth_remote_user AuthRemoteuser /mgmt/tm/auth/remote-user
+get_auth_source AuthSource /mgmt/tm/auth/source
+get_auth_tacacs AuthTacacs /mgmt/tm/auth/tacacs
+get_auth_user AuthUser /mgmt/tm/auth/user
+get_cli_alias CliAlias /mgmt/tm/cli/alias
+get_cli_aliasprivate CliAliasPrivate /mgmt/tm/cli/alias/private
+get_cli_aliasshared CliAliasShared /mgmt/tm/cli/alias/shared
+get_cli_global_settings CliGlobalsettings /mgmt/tm/cli/global-settings
+get_cli_history CliHistory /mgmt/tm/cli/history
+get_cli_preference CliPreference /mgmt/tm/cli/preference
+get_cli_script CliScript /mgmt/tm/cli/script
+get_cli_version CliVersion /mgmt/tm/cli/version
+get_cloud_cmdevice_group CloudCmDevicegroup /mgmt/tm/cloud/cm/device-group
+get_cloud_ltmnode_addresses CloudLtmNodeaddresses /mgmt/tm/cloud/ltm/node-addresses
+get_cloud_ltmpool_members CloudLtmPoolmembers /mgmt/tm/cloud/ltm/pool-members
+get_cloud_ltmpools CloudLtmPools /mgmt/tm/cloud/ltm/pools
+get_cloud_ltmvirtual_servers CloudLtmVirtualservers /mgmt/tm/cloud/ltm/virtual-servers
+get_cloud_servicesiapp CloudServicesIapp /mgmt/tm/cloud/services/iapp
+get_cloud_templatesiapp CloudTemplatesIapp /mgmt/tm/cloud/templates/iapp
+get_cm_cert CmCert /mgmt/tm/cm/cert
+get_cm_device CmDevice /mgmt/tm/cm/device
+get_cm_device_group CmDevicegroup /mgmt/tm/cm/device-group
+get_cm_failover_status CmFailoverstatus /mgmt/tm/cm/failover-status
+get_cm_key CmKey /mgmt/tm/cm/key
+get_cm_sha1_fingerprint CmSha1fingerprint /mgmt/tm/cm/sha1-fingerprint
+get_cm_sync_status CmSyncstatus /mgmt/tm/cm/sync-status
+get_cm_traffic_group CmTrafficgroup /mgmt/tm/cm/traffic-group
+get_cm_trust_domain CmTrustdomain /mgmt/tm/cm/trust-domain
+get_file_apmcustomization_group FileApmCustomizationgroup /mgmt/tm/file/apm/policy/customization-group
+get_file_apmcustomization_image_file FileApmCustomizationimagefile /mgmt/tm/file/apm/policy/customization-image-file
+get_file_apmcustomization_template_file FileApmCustomizationtemplatefile /mgmt/tm/file/apm/policy/customization-template-file
+get_file_apmepsec_file_object FileApmEpsecfileobject /mgmt/tm/file/apm/epsec/epsec-file-object
+get_file_apmkerberos_keytab_file FileApmKerberoskeytabfile /mgmt/tm/file/apm/aaa/kerberos-keytab-file
+get_file_apmping_access_properties_files FileApmPingaccesspropertiesfiles /mgmt/tm/file/apm/aaa/ping-access-properties-files
+get_file_apmsandbox_file FileApmSandboxfile /mgmt/tm/file/apm/resource/sandbox-file
+get_file_apmsecurid_config_files FileApmSecuridconfigfiles /mgmt/tm/file/apm/aaa/securid-config-files
+get_gtm_datacenter GtmDatacenter /mgmt/tm/gtm/datacenter
+get_gtm_distributed_app GtmDistributedapp /mgmt/tm/gtm/distributed-app
+get_gtm_global_settings GtmGlobalsettings /mgmt/tm/gtm/global-settings
+get_gtm_global_settingsgeneral GtmGlobalsettingsGeneral /mgmt/tm/gtm/global-settings/general
+get_gtm_global_settingsload_balancing GtmGlobalsettingsLoadbalancing /mgmt/tm/gtm/global-settings/load-balancing
+get_gtm_global_settingsmetrics GtmGlobalsettingsMetrics /mgmt/tm/gtm/global-settings/metrics
+get_gtm_global_settingsmetrics_exclusions GtmGlobalsettingsMetricsexclusions /mgmt/tm/gtm/global-settings/metrics-exclusions
+get_gtm_iquery GtmIquery /mgmt/tm/gtm/iquery
+get_gtm_ldns GtmLdns /mgmt/tm/gtm/ldns
+get_gtm_link GtmLink /mgmt/tm/gtm/link
+get_gtm_listener GtmListener /mgmt/tm/gtm/listener
+get_gtm_monitor GtmMonitor /mgmt/tm/gtm/monitor
+get_gtm_monitorbigip GtmMonitorBigip /mgmt/tm/gtm/monitor/bigip
+get_gtm_monitorbigip_link GtmMonitorBigiplink /mgmt/tm/gtm/monitor/bigip-link
+get_gtm_monitorexternal GtmMonitorExternal /mgmt/tm/gtm/monitor/external
+get_gtm_monitorfirepass GtmMonitorFirepass /mgmt/tm/gtm/monitor/firepass
+get_gtm_monitorftp GtmMonitorFtp /mgmt/tm/gtm/monitor/ftp
+get_gtm_monitorgateway_icmp GtmMonitorGatewayicmp /mgmt/tm/gtm/monitor/gateway-icmp
+get_gtm_monitorgtp GtmMonitorGtp /mgmt/tm/gtm/monitor/gtp
+get_gtm_monitorhttp GtmMonitorHttp /mgmt/tm/gtm/monitor/http
+get_gtm_monitorhttps GtmMonitorHttps /mgmt/tm/gtm/monitor/https
+get_gtm_monitorimap GtmMonitorImap /mgmt/tm/gtm/monitor/imap
+get_gtm_monitorldap GtmMonitorLdap /mgmt/tm/gtm/monitor/ldap
+get_gtm_monitormssql GtmMonitorMssql /mgmt/tm/gtm/monitor/mssql
+get_gtm_monitormysql GtmMonitorMysql /mgmt/tm/gtm/monitor/mysql
+get_gtm_monitornntp GtmMonitorNntp /mgmt/tm/gtm/monitor/nntp
+get_gtm_monitornone GtmMonitorNone /mgmt/tm/gtm/monitor/none
+get_gtm_monitororacle GtmMonitorOracle /mgmt/tm/gtm/monitor/oracle
+get_gtm_monitorpop3 GtmMonitorPop3 /mgmt/tm/gtm/monitor/pop3
+get_gtm_monitorpostgresql GtmMonitorPostgresql /mgmt/tm/gtm/monitor/postgresql
+get_gtm_monitorradius GtmMonitorRadius /mgmt/tm/gtm/monitor/radius
+get_gtm_monitorradius_accounting GtmMonitorRadiusaccounting /mgmt/tm/gtm/monitor/radius-accounting
+get_gtm_monitorreal_server GtmMonitorRealserver /mgmt/tm/gtm/monitor/real-server
+get_gtm_monitorscripted GtmMonitorScripted /mgmt/tm/gtm/monitor/scripted
+get_gtm_monitorsip GtmMonitorSip /mgmt/tm/gtm/monitor/sip
+get_gtm_monitorsmtp GtmMonitorSmtp /mgmt/tm/gtm/monitor/smtp
+get_gtm_monitorsnmp GtmMonitorSnmp /mgmt/tm/gtm/monitor/snmp
+get_gtm_monitorsnmp_link GtmMonitorSnmplink /mgmt/tm/gtm/monitor/snmp-link
+get_gtm_monitorsoap GtmMonitorSoap /mgmt/tm/gtm/monitor/soap
+get_gtm_monitortcp GtmMonitorTcp /mgmt/tm/gtm/monitor/tcp
+get_gtm_monitortcp_half_open GtmMonitorTcphalfopen /mgmt/tm/gtm/monitor/tcp-half-open
+get_gtm_monitorudp GtmMonitorUdp /mgmt/tm/gtm/monitor/udp
+get_gtm_monitorwap GtmMonitorWap /mgmt/tm/gtm/monitor/wap
+get_gtm_monitorwmi GtmMonitorWmi /mgmt/tm/gtm/monitor/wmi
+get_gtm_path GtmPath /mgmt/tm/gtm/path
+get_gtm_persist GtmPersist /mgmt/tm/gtm/persist
+get_gtm_pool GtmPool /mgmt/tm/gtm/pool
+get_gtm_poola GtmPoolA /mgmt/tm/gtm/pool/a
+get_gtm_poolaaaa GtmPoolAaaa /mgmt/tm/gtm/pool/aaaa
+get_gtm_poolcname GtmPoolCname /mgmt/tm/gtm/pool/cname
+get_gtm_poolmx GtmPoolMx /mgmt/tm/gtm/pool/mx
+get_gtm_poolnaptr GtmPoolNaptr /mgmt/tm/gtm/pool/naptr
+get_gtm_poolsrv GtmPoolSrv /mgmt/tm/gtm/pool/srv
+get_gtm_prober_pool GtmProberpool /mgmt/tm/gtm/prober-pool
+get_gtm_region GtmRegion /mgmt/tm/gtm/region
+get_gtm_rule GtmRule /mgmt/tm/gtm/rule
+get_gtm_server GtmServer /mgmt/tm/gtm/server
+get_gtm_sync_status GtmSyncstatus /mgmt/tm/gtm/sync-status
+get_gtm_topology GtmTopology /mgmt/tm/gtm/topology
+get_gtm_traffic GtmTraffic /mgmt/tm/gtm/traffic
+get_gtm_wideip GtmWideip /mgmt/tm/gtm/wideip
+get_gtm_wideipa GtmWideipA /mgmt/tm/gtm/wideip/a
+get_gtm_wideipaaaa GtmWideipAaaa /mgmt/tm/gtm/wideip/aaaa
+get_gtm_wideipcname GtmWideipCname /mgmt/tm/gtm/wideip/cname
+get_gtm_wideipmx GtmWideipMx /mgmt/tm/gtm/wideip/mx
+get_gtm_wideipnaptr GtmWideipNaptr /mgmt/tm/gtm/wideip/naptr
+get_gtm_wideipsrv GtmWideipSrv /mgmt/tm/gtm/wideip/srv
+get_live_update_asm_attack_signatures Live_updateAsmattacksignatures /mgmt/tm/live-update/asm-attack-signatures
+get_live_update_asm_attack_signaturesavailability Live_updateAsmattacksignaturesAvailability /mgmt/tm/live-update/asm-attack-signatures/availability
+get_live_update_asm_attack_signaturesinstall_schedule Live_updateAsmattacksignaturesInstallschedule /mgmt/tm/live-update/asm-attack-signatures/install-schedule
+get_live_update_asm_attack_signaturesinstallations Live_updateAsmattacksignaturesInstallations /mgmt/tm/live-update/asm-attack-signatures/installations
+get_live_update_asm_attack_signaturesupdate_files Live_updateAsmattacksignaturesUpdatefiles /mgmt/tm/live-update/asm-attack-signatures/update-files
+get_live_update_bot_signatures Live_updateBotsignatures /mgmt/tm/live-update/bot-signatures
+get_live_update_bot_signaturesavailability Live_updateBotsignaturesAvailability /mgmt/tm/live-update/bot-signatures/availability
+get_live_update_bot_signaturesinstall_schedule Live_updateBotsignaturesInstallschedule /mgmt/tm/live-update/bot-signatures/install-schedule
+get_live_update_bot_signaturesinstallations Live_updateBotsignaturesInstallations /mgmt/tm/live-update/bot-signatures/installations
+get_live_update_bot_signaturesupdate_files Live_updateBotsignaturesUpdatefiles /mgmt/tm/live-update/bot-signatures/update-files
+get_live_update_browser_challenges Live_updateBrowserchallenges /mgmt/tm/live-update/browser-challenges
+get_live_update_browser_challengesavailability Live_updateBrowserchallengesAvailability /mgmt/tm/live-update/browser-challenges/availability
+get_live_update_browser_challengesinstall_schedule Live_updateBrowserchallengesInstallschedule /mgmt/tm/live-update/browser-challenges/install-schedule
+get_live_update_browser_challengesinstallations Live_updateBrowserchallengesInstallations /mgmt/tm/live-update/browser-challenges/installations
+get_live_update_browser_challengesupdate_files Live_updateBrowserchallengesUpdatefiles /mgmt/tm/live-update/browser-challenges/update-files
+get_live_update_server_technologies Live_updateServertechnologies /mgmt/tm/live-update/server-technologies
+get_live_update_server_technologiesavailability Live_updateServertechnologiesAvailability /mgmt/tm/live-update/server-technologies/availability
+get_live_update_server_technologiesinstall_schedule Live_updateServertechnologiesInstallschedule /mgmt/tm/live-update/server-technologies/install-schedule
+get_live_update_server_technologiesinstallations Live_updateServertechnologiesInstallations /mgmt/tm/live-update/server-technologies/installations
+get_live_update_server_technologiesupdate_files Live_updateServertechnologiesUpdatefiles /mgmt/tm/live-update/server-technologies/update-files
+get_live_update_threat_campaigns Live_updateThreatcampaigns /mgmt/tm/live-update/threat-campaigns
+get_live_update_threat_campaignsavailability Live_updateThreatcampaignsAvailability /mgmt/tm/live-update/threat-campaigns/availability
+get_live_update_threat_campaignsinstall_schedule Live_updateThreatcampaignsInstallschedule /mgmt/tm/live-update/threat-campaigns/install-schedule
+get_live_update_threat_campaignsinstallations Live_updateThreatcampaignsInstallations /mgmt/tm/live-update/threat-campaigns/installations
+get_live_update_threat_campaignsupdate_files Live_updateThreatcampaignsUpdatefiles /mgmt/tm/live-update/threat-campaigns/update-files
+get_ltm_auth LtmAuth /mgmt/tm/ltm/auth
+get_ltm_authcrldp_server LtmAuthCrldpserver /mgmt/tm/ltm/auth/crldp-server
+get_ltm_authkerberos_delegation LtmAuthKerberosdelegation /mgmt/tm/ltm/auth/kerberos-delegation
+get_ltm_authldap LtmAuthLdap /mgmt/tm/ltm/auth/ldap
+get_ltm_authocsp_responder LtmAuthOcspresponder /mgmt/tm/ltm/auth/ocsp-responder
+get_ltm_authprofile LtmAuthProfile /mgmt/tm/ltm/auth/profile
+get_ltm_authradius LtmAuthRadius /mgmt/tm/ltm/auth/radius
+get_ltm_authradius_server LtmAuthRadiusserver /mgmt/tm/ltm/auth/radius-server
+get_ltm_authssl_cc_ldap LtmAuthSslccldap /mgmt/tm/ltm/auth/ssl-cc-ldap
+get_ltm_authssl_crldp LtmAuthSslcrldp /mgmt/tm/ltm/auth/ssl-crldp
+get_ltm_authssl_ocsp LtmAuthSslocsp /mgmt/tm/ltm/auth/ssl-ocsp
+get_ltm_authtacacs LtmAuthTacacs /mgmt/tm/ltm/auth/tacacs
+get_ltm_cipher LtmCipher /mgmt/tm/ltm/cipher
+get_ltm_ciphergroup LtmCipherGroup /mgmt/tm/ltm/cipher/group
+get_ltm_cipherrule LtmCipherRule /mgmt/tm/ltm/cipher/rule
+get_ltm_data_group LtmDatagroup /mgmt/tm/ltm/data-group
+get_ltm_data_groupexternal LtmDatagroupExternal /mgmt/tm/ltm/data-group/external
+get_ltm_data_groupinternal LtmDatagroupInternal /mgmt/tm/ltm/data-group/internal
+get_ltm_default_node_monitor LtmDefaultnodemonitor /mgmt/tm/ltm/default-node-monitor
+get_ltm_dns LtmDns /mgmt/tm/ltm/dns
+get_ltm_dnsanalytics LtmDnsAnalytics /mgmt/tm/ltm/dns/analytics
+get_ltm_dnscache LtmDnsCache /mgmt/tm/ltm/dns/cache
+get_ltm_dnsdnssec LtmDnsDnssec /mgmt/tm/ltm/dns/dnssec
+get_ltm_dnsglobal_settings LtmDnsGlobalsettings /mgmt/tm/ltm/dns/analytics/global-settings
+get_ltm_dnskey LtmDnsKey /mgmt/tm/ltm/dns/dnssec/key
+get_ltm_dnsnameserver LtmDnsNameserver /mgmt/tm/ltm/dns/nameserver
+get_ltm_dnsresolver LtmDnsResolver /mgmt/tm/ltm/dns/cache/resolver
+get_ltm_dnstransparent LtmDnsTransparent /mgmt/tm/ltm/dns/cache/transparent
+get_ltm_dnstsig_key LtmDnsTsigkey /mgmt/tm/ltm/dns/tsig-key
+get_ltm_dnsvalidating_resolver LtmDnsValidatingresolver /mgmt/tm/ltm/dns/cache/validating-resolver
+get_ltm_dnszone LtmDnsZone /mgmt/tm/ltm/dns/zone
+get_ltm_eviction_policy LtmEvictionpolicy /mgmt/tm/ltm/eviction-policy
+get_ltm_global_settings LtmGlobalsettings /mgmt/tm/ltm/global-settings
+get_ltm_global_settingsconnection LtmGlobalsettingsConnection /mgmt/tm/ltm/global-settings/connection
+get_ltm_global_settingsgeneral LtmGlobalsettingsGeneral /mgmt/tm/ltm/global-settings/general
+get_ltm_global_settingsrule LtmGlobalsettingsRule /mgmt/tm/ltm/global-settings/rule
+get_ltm_global_settingstraffic_control LtmGlobalsettingsTrafficcontrol /mgmt/tm/ltm/global-settings/traffic-control
+get_ltm_html_rule LtmHtmlrule /mgmt/tm/ltm/html-rule
+get_ltm_html_rulecomment_raise_event LtmHtmlruleCommentraiseevent /mgmt/tm/ltm/html-rule/comment-raise-event
+get_ltm_html_rulecomment_remove LtmHtmlruleCommentremove /mgmt/tm/ltm/html-rule/comment-remove
+get_ltm_html_ruletag_append_html LtmHtmlruleTagappendhtml /mgmt/tm/ltm/html-rule/tag-append-html
+get_ltm_html_ruletag_prepend_html LtmHtmlruleTagprependhtml /mgmt/tm/ltm/html-rule/tag-prepend-html
+get_ltm_html_ruletag_raise_event LtmHtmlruleTagraiseevent /mgmt/tm/ltm/html-rule/tag-raise-event
+get_ltm_html_ruletag_remove LtmHtmlruleTagremove /mgmt/tm/ltm/html-rule/tag-remove
+get_ltm_html_ruletag_remove_attribute LtmHtmlruleTagremoveattribute /mgmt/tm/ltm/html-rule/tag-remove-attribute
+get_ltm_ifile LtmIfile /mgmt/tm/ltm/ifile
+get_ltm_message_routing LtmMessagerouting /mgmt/tm/ltm/message-routing
+get_ltm_message_routingdiameter LtmMessageroutingDiameter /mgmt/tm/ltm/message-routing/diameter
+get_ltm_message_routinggeneric LtmMessageroutingGeneric /mgmt/tm/ltm/message-routing/generic
+get_ltm_message_routingmqtt LtmMessageroutingMqtt /mgmt/tm/ltm/message-routing/mqtt
+get_ltm_message_routingpeer LtmMessageroutingPeer /mgmt/tm/ltm/message-routing/diameter/peer
+get_ltm_message_routingprofile LtmMessageroutingProfile /mgmt/tm/ltm/message-routing/diameter/profile
+get_ltm_message_routingprotocol LtmMessageroutingProtocol /mgmt/tm/ltm/message-routing/generic/protocol
+get_ltm_message_routingroute LtmMessageroutingRoute /mgmt/tm/ltm/message-routing/generic/route
+get_ltm_message_routingrouter LtmMessageroutingRouter /mgmt/tm/ltm/message-routing/mqtt/profile/router
+get_ltm_message_routingsession LtmMessageroutingSession /mgmt/tm/ltm/message-routing/mqtt/profile/session
+get_ltm_message_routingsip LtmMessageroutingSip /mgmt/tm/ltm/message-routing/sip
+get_ltm_message_routingtransport_config LtmMessageroutingTransportconfig /mgmt/tm/ltm/message-routing/generic/transport-config
+get_ltm_monitor LtmMonitor /mgmt/tm/ltm/monitor
+get_ltm_monitordiameter LtmMonitorDiameter /mgmt/tm/ltm/monitor/diameter
+get_ltm_monitordns LtmMonitorDns /mgmt/tm/ltm/monitor/dns
+get_ltm_monitorexternal LtmMonitorExternal /mgmt/tm/ltm/monitor/external
+get_ltm_monitorfirepass LtmMonitorFirepass /mgmt/tm/ltm/monitor/firepass
+get_ltm_monitorftp LtmMonitorFtp /mgmt/tm/ltm/monitor/ftp
+get_ltm_monitorgateway_icmp LtmMonitorGatewayicmp /mgmt/tm/ltm/monitor/gateway-icmp
+get_ltm_monitorhttp LtmMonitorHttp /mgmt/tm/ltm/monitor/http
+get_ltm_monitorhttps LtmMonitorHttps /mgmt/tm/ltm/monitor/https
+get_ltm_monitoricmp LtmMonitorIcmp /mgmt/tm/ltm/monitor/icmp
+get_ltm_monitorimap LtmMonitorImap /mgmt/tm/ltm/monitor/imap
+get_ltm_monitorinband LtmMonitorInband /mgmt/tm/ltm/monitor/inband
+get_ltm_monitorldap LtmMonitorLdap /mgmt/tm/ltm/monitor/ldap
+get_ltm_monitormodule_score LtmMonitorModulescore /mgmt/tm/ltm/monitor/module-score
+get_ltm_monitormqtt LtmMonitorMqtt /mgmt/tm/ltm/monitor/mqtt
+get_ltm_monitormssql LtmMonitorMssql /mgmt/tm/ltm/monitor/mssql
+get_ltm_monitormysql LtmMonitorMysql /mgmt/tm/ltm/monitor/mysql
+get_ltm_monitornntp LtmMonitorNntp /mgmt/tm/ltm/monitor/nntp
+get_ltm_monitornone LtmMonitorNone /mgmt/tm/ltm/monitor/none
+get_ltm_monitororacle LtmMonitorOracle /mgmt/tm/ltm/monitor/oracle
+get_ltm_monitorpop3 LtmMonitorPop3 /mgmt/tm/ltm/monitor/pop3
+get_ltm_monitorpostgresql LtmMonitorPostgresql /mgmt/tm/ltm/monitor/postgresql
+get_ltm_monitorradius LtmMonitorRadius /mgmt/tm/ltm/monitor/radius
+get_ltm_monitorradius_accounting LtmMonitorRadiusaccounting /mgmt/tm/ltm/monitor/radius-accounting
+get_ltm_monitorreal_server LtmMonitorRealserver /mgmt/tm/ltm/monitor/real-server
+get_ltm_monitorrpc LtmMonitorRpc /mgmt/tm/ltm/monitor/rpc
+get_ltm_monitorsasp LtmMonitorSasp /mgmt/tm/ltm/monitor/sasp
+get_ltm_monitorscripted LtmMonitorScripted /mgmt/tm/ltm/monitor/scripted
+get_ltm_monitorsip LtmMonitorSip /mgmt/tm/ltm/monitor/sip
+get_ltm_monitorsmb LtmMonitorSmb /mgmt/tm/ltm/monitor/smb
+get_ltm_monitorsmtp LtmMonitorSmtp /mgmt/tm/ltm/monitor/smtp
+get_ltm_monitorsnmp_dca LtmMonitorSnmpdca /mgmt/tm/ltm/monitor/snmp-dca
+get_ltm_monitorsnmp_dca_base LtmMonitorSnmpdcabase /mgmt/tm/ltm/monitor/snmp-dca-base
+get_ltm_monitorsoap LtmMonitorSoap /mgmt/tm/ltm/monitor/soap
+get_ltm_monitortcp LtmMonitorTcp /mgmt/tm/ltm/monitor/tcp
+get_ltm_monitortcp_echo LtmMonitorTcpecho /mgmt/tm/ltm/monitor/tcp-echo
+get_ltm_monitortcp_half_open LtmMonitorTcphalfopen /mgmt/tm/ltm/monitor/tcp-half-open
+get_ltm_monitorudp LtmMonitorUdp /mgmt/tm/ltm/monitor/udp
+get_ltm_monitorvirtual_location LtmMonitorVirtuallocation /mgmt/tm/ltm/monitor/virtual-location
+get_ltm_monitorwap LtmMonitorWap /mgmt/tm/ltm/monitor/wap
+get_ltm_monitorwmi LtmMonitorWmi /mgmt/tm/ltm/monitor/wmi
+get_ltm_nat LtmNat /mgmt/tm/ltm/nat
+get_ltm_node LtmNode /mgmt/tm/ltm/node
+get_ltm_persistence LtmPersistence /mgmt/tm/ltm/persistence
+get_ltm_persistencecookie LtmPersistenceCookie /mgmt/tm/ltm/persistence/cookie
+get_ltm_persistencedest_addr LtmPersistenceDestaddr /mgmt/tm/ltm/persistence/dest-addr
+get_ltm_persistenceglobal_settings LtmPersistenceGlobalsettings /mgmt/tm/ltm/persistence/global-settings
+get_ltm_persistencehash LtmPersistenceHash /mgmt/tm/ltm/persistence/hash
+get_ltm_persistencehost LtmPersistenceHost /mgmt/tm/ltm/persistence/host
+get_ltm_persistencemsrdp LtmPersistenceMsrdp /mgmt/tm/ltm/persistence/msrdp
+get_ltm_persistencepersist_records LtmPersistencePersistrecords /mgmt/tm/ltm/persistence/persist-records
+get_ltm_persistencesip LtmPersistenceSip /mgmt/tm/ltm/persistence/sip
+get_ltm_persistencesource_addr LtmPersistenceSourceaddr /mgmt/tm/ltm/persistence/source-addr
+get_ltm_persistencessl LtmPersistenceSsl /mgmt/tm/ltm/persistence/ssl
+get_ltm_persistenceuniversal LtmPersistenceUniversal /mgmt/tm/ltm/persistence/universal
+get_ltm_policy LtmPolicy /mgmt/tm/ltm/policy
+get_ltm_policy_strategy LtmPolicystrategy /mgmt/tm/ltm/policy-strategy
+get_ltm_pool LtmPool /mgmt/tm/ltm/pool
+get_ltm_profile LtmProfile /mgmt/tm/ltm/profile
+get_ltm_profilecertificate_authority LtmProfileCertificateauthority /mgmt/tm/ltm/profile/certificate-authority
+get_ltm_profileclient_ldap LtmProfileClientldap /mgmt/tm/ltm/profile/client-ldap
+get_ltm_profileclient_ssl LtmProfileClientssl /mgmt/tm/ltm/profile/client-ssl
+get_ltm_profileconnector LtmProfileConnector /mgmt/tm/ltm/profile/connector
+get_ltm_profiledhcpv4 LtmProfileDhcpv4 /mgmt/tm/ltm/profile/dhcpv4
+get_ltm_profiledhcpv6 LtmProfileDhcpv6 /mgmt/tm/ltm/profile/dhcpv6
+get_ltm_profilediameter LtmProfileDiameter /mgmt/tm/ltm/profile/diameter
+get_ltm_profiledns LtmProfileDns /mgmt/tm/ltm/profile/dns
+get_ltm_profiledns_logging LtmProfileDnslogging /mgmt/tm/ltm/profile/dns-logging
+get_ltm_profilefasthttp LtmProfileFasthttp /mgmt/tm/ltm/profile/fasthttp
+get_ltm_profilefastl4 LtmProfileFastl4 /mgmt/tm/ltm/profile/fastl4
+get_ltm_profilefix LtmProfileFix /mgmt/tm/ltm/profile/fix
+get_ltm_profileftp LtmProfileFtp /mgmt/tm/ltm/profile/ftp
+get_ltm_profilegtp LtmProfileGtp /mgmt/tm/ltm/profile/gtp
+get_ltm_profilehtml LtmProfileHtml /mgmt/tm/ltm/profile/html
+get_ltm_profilehttp LtmProfileHttp /mgmt/tm/ltm/profile/http
+get_ltm_profilehttp2 LtmProfileHttp2 /mgmt/tm/ltm/profile/http2
+get_ltm_profilehttp_compression LtmProfileHttpcompression /mgmt/tm/ltm/profile/http-compression
+get_ltm_profilehttp_proxy_connect LtmProfileHttpproxyconnect /mgmt/tm/ltm/profile/http-proxy-connect
+get_ltm_profilehttprouter LtmProfileHttprouter /mgmt/tm/ltm/profile/httprouter
+get_ltm_profileicap LtmProfileIcap /mgmt/tm/ltm/profile/icap
+get_ltm_profileimap LtmProfileImap /mgmt/tm/ltm/profile/imap
+get_ltm_profileipother LtmProfileIpother /mgmt/tm/ltm/profile/ipother
+get_ltm_profileipsecalg LtmProfileIpsecalg /mgmt/tm/ltm/profile/ipsecalg
+get_ltm_profilemblb LtmProfileMblb /mgmt/tm/ltm/profile/mblb
+get_ltm_profilemqtt LtmProfileMqtt /mgmt/tm/ltm/profile/mqtt
+get_ltm_profilenetflow LtmProfileNetflow /mgmt/tm/ltm/profile/netflow
+get_ltm_profilentlm LtmProfileNtlm /mgmt/tm/ltm/profile/ntlm
+get_ltm_profileocsp_stapling_params LtmProfileOcspstaplingparams /mgmt/tm/ltm/profile/ocsp-stapling-params
+get_ltm_profileone_connect LtmProfileOneconnect /mgmt/tm/ltm/profile/one-connect
+get_ltm_profilepop3 LtmProfilePop3 /mgmt/tm/ltm/profile/pop3
+get_ltm_profilepptp LtmProfilePptp /mgmt/tm/ltm/profile/pptp
+get_ltm_profileqoe LtmProfileQoe /mgmt/tm/ltm/profile/qoe
+get_ltm_profileradius LtmProfileRadius /mgmt/tm/ltm/profile/radius
+get_ltm_profilerequest_adapt LtmProfileRequestadapt /mgmt/tm/ltm/profile/request-adapt
+get_ltm_profilerequest_log LtmProfileRequestlog /mgmt/tm/ltm/profile/request-log
+get_ltm_profileresponse_adapt LtmProfileResponseadapt /mgmt/tm/ltm/profile/response-adapt
+get_ltm_profilerewrite LtmProfileRewrite /mgmt/tm/ltm/profile/rewrite
+get_ltm_profilertsp LtmProfileRtsp /mgmt/tm/ltm/profile/rtsp
+get_ltm_profilesctp LtmProfileSctp /mgmt/tm/ltm/profile/sctp
+get_ltm_profileserver_ldap LtmProfileServerldap /mgmt/tm/ltm/profile/server-ldap
+get_ltm_profileserver_ssl LtmProfileServerssl /mgmt/tm/ltm/profile/server-ssl
+get_ltm_profileservice LtmProfileService /mgmt/tm/ltm/profile/service
+get_ltm_profilesip LtmProfileSip /mgmt/tm/ltm/profile/sip
+get_ltm_profilesmtps LtmProfileSmtps /mgmt/tm/ltm/profile/smtps
+get_ltm_profilesocks LtmProfileSocks /mgmt/tm/ltm/profile/socks
+get_ltm_profilesplitsessionclient LtmProfileSplitsessionclient /mgmt/tm/ltm/profile/splitsessionclient
+get_ltm_profilesplitsessionserver LtmProfileSplitsessionserver /mgmt/tm/ltm/profile/splitsessionserver
+get_ltm_profilestatistics LtmProfileStatistics /mgmt/tm/ltm/profile/statistics
+get_ltm_profilestream LtmProfileStream /mgmt/tm/ltm/profile/stream
+get_ltm_profiletcp LtmProfileTcp /mgmt/tm/ltm/profile/tcp
+get_ltm_profiletcp_analytics LtmProfileTcpanalytics /mgmt/tm/ltm/profile/tcp-analytics
+get_ltm_profiletftp LtmProfileTftp /mgmt/tm/ltm/profile/tftp
+get_ltm_profileudp LtmProfileUdp /mgmt/tm/ltm/profile/udp
+get_ltm_profileweb_acceleration LtmProfileWebacceleration /mgmt/tm/ltm/profile/web-acceleration
+get_ltm_profilewebsocket LtmProfileWebsocket /mgmt/tm/ltm/profile/websocket
+get_ltm_profilexml LtmProfileXml /mgmt/tm/ltm/profile/xml
+get_ltm_rule LtmRule /mgmt/tm/ltm/rule
+get_ltm_rule_profiler LtmRuleprofiler /mgmt/tm/ltm/rule-profiler
+get_ltm_snat LtmSnat /mgmt/tm/ltm/snat
+get_ltm_snat_translation LtmSnattranslation /mgmt/tm/ltm/snat-translation
+get_ltm_snatpool LtmSnatpool /mgmt/tm/ltm/snatpool
+get_ltm_tacdb LtmTacdb /mgmt/tm/ltm/tacdb
+get_ltm_tacdbcustomdb LtmTacdbCustomdb /mgmt/tm/ltm/tacdb/customdb
+get_ltm_tacdbcustomdb_file LtmTacdbCustomdbfile /mgmt/tm/ltm/tacdb/customdb-file
+get_ltm_tacdblicenseddb LtmTacdbLicenseddb /mgmt/tm/ltm/tacdb/licenseddb
+get_ltm_tacdblicenseddb_file LtmTacdbLicenseddbfile /mgmt/tm/ltm/tacdb/licenseddb-file
+get_ltm_tacdbquery LtmTacdbQuery /mgmt/tm/ltm/tacdb/query
+get_ltm_traffic_class LtmTrafficclass /mgmt/tm/ltm/traffic-class
+get_ltm_traffic_matching_criteria LtmTrafficmatchingcriteria /mgmt/tm/ltm/traffic-matching-criteria
+get_ltm_urlcat_query LtmUrlcatquery /mgmt/tm/ltm/urlcat-query
+get_ltm_virtual LtmVirtual /mgmt/tm/ltm/virtual
+get_ltm_virtual_address LtmVirtualaddress /mgmt/tm/ltm/virtual-address
+get_net_address_list NetAddresslist /mgmt/tm/net/address-list
+get_net_arp NetArp /mgmt/tm/net/arp
+get_net_bwc NetBwc /mgmt/tm/net/bwc
+get_net_bwcpolicy NetBwcPolicy /mgmt/tm/net/bwc/policy
+get_net_bwcpriority_group NetBwcPrioritygroup /mgmt/tm/net/bwc/priority-group
+get_net_bwcprobe NetBwcProbe /mgmt/tm/net/bwc/probe
+get_net_clone_stats NetClonestats /mgmt/tm/net/clone-stats
+get_net_cmetrics NetCmetrics /mgmt/tm/net/cmetrics
+get_net_cos NetCos /mgmt/tm/net/cos
+get_net_cosglobal_settings NetCosGlobalsettings /mgmt/tm/net/cos/global-settings
+get_net_cosmap_8021p NetCosMap8021p /mgmt/tm/net/cos/map-8021p
+get_net_cosmap_dscp NetCosMapdscp /mgmt/tm/net/cos/map-dscp
+get_net_costraffic_priority NetCosTrafficpriority /mgmt/tm/net/cos/traffic-priority
+get_net_dag_globals NetDagglobals /mgmt/tm/net/dag-globals
+get_net_dns_resolver NetDnsresolver /mgmt/tm/net/dns-resolver
+get_net_fdb NetFdb /mgmt/tm/net/fdb
+get_net_fdbtunnel NetFdbTunnel /mgmt/tm/net/fdb/tunnel
+get_net_fdbvlan NetFdbVlan /mgmt/tm/net/fdb/vlan
+get_net_ike_evt_stat NetIkeevtstat /mgmt/tm/net/ike-evt-stat
+get_net_ike_msg_stat NetIkemsgstat /mgmt/tm/net/ike-msg-stat
+get_net_interface NetInterface /mgmt/tm/net/interface
+get_net_interface_cos NetInterfacecos /mgmt/tm/net/interface-cos
+get_net_interface_ddm NetInterfaceddm /mgmt/tm/net/interface-ddm
+get_net_ipsec NetIpsec /mgmt/tm/net/ipsec
+get_net_ipsec_stat NetIpsecstat /mgmt/tm/net/ipsec-stat
+get_net_ipsecike_daemon NetIpsecIkedaemon /mgmt/tm/net/ipsec/ike-daemon
+get_net_ipsecike_peer NetIpsecIkepeer /mgmt/tm/net/ipsec/ike-peer
+get_net_ipsecike_sa NetIpsecIkesa /mgmt/tm/net/ipsec/ike-sa
+get_net_ipsecipsec_policy NetIpsecIpsecpolicy /mgmt/tm/net/ipsec/ipsec-policy
+get_net_ipsecipsec_sa NetIpsecIpsecsa /mgmt/tm/net/ipsec/ipsec-sa
+get_net_ipsecmanual_security_association NetIpsecManualsecurityassociation /mgmt/tm/net/ipsec/manual-security-association
+get_net_ipsectraffic_selector NetIpsecTrafficselector /mgmt/tm/net/ipsec/traffic-selector
+get_net_lldp_globals NetLldpglobals /mgmt/tm/net/lldp-globals
+get_net_lldp_neighbors NetLldpneighbors /mgmt/tm/net/lldp-neighbors
+get_net_mroute NetMroute /mgmt/tm/net/mroute
+get_net_multicast_globals NetMulticastglobals /mgmt/tm/net/multicast-globals
+get_net_ndp NetNdp /mgmt/tm/net/ndp
+get_net_packet_filter NetPacketfilter /mgmt/tm/net/packet-filter
+get_net_packet_filter_trusted NetPacketfiltertrusted /mgmt/tm/net/packet-filter-trusted
+get_net_packet_tester NetPackettester /mgmt/tm/net/packet-tester
+get_net_packet_testersecurity NetPackettesterSecurity /mgmt/tm/net/packet-tester/security
+get_net_port_list NetPortlist /mgmt/tm/net/port-list
+get_net_port_mirror NetPortmirror /mgmt/tm/net/port-mirror
+get_net_rate_shaping NetRateshaping /mgmt/tm/net/rate-shaping
+get_net_rate_shapingclass NetRateshapingClass /mgmt/tm/net/rate-shaping/class
+get_net_rate_shapingcolor_policer NetRateshapingColorpolicer /mgmt/tm/net/rate-shaping/color-policer
+get_net_rate_shapingdrop_policy NetRateshapingDroppolicy /mgmt/tm/net/rate-shaping/drop-policy
+get_net_rate_shapingqueue NetRateshapingQueue /mgmt/tm/net/rate-shaping/queue
+get_net_rate_shapingshaping_policy NetRateshapingShapingpolicy /mgmt/tm/net/rate-shaping/shaping-policy
+get_net_route NetRoute /mgmt/tm/net/route
+get_net_route_domain NetRoutedomain /mgmt/tm/net/route-domain
+get_net_router_advertisement NetRouteradvertisement /mgmt/tm/net/router-advertisement
+get_net_routing NetRouting /mgmt/tm/net/routing
+get_net_routingaccess_list NetRoutingAccesslist /mgmt/tm/net/routing/access-list
+get_net_routingas_path NetRoutingAspath /mgmt/tm/net/routing/as-path
+get_net_routingbfd NetRoutingBfd /mgmt/tm/net/routing/bfd
+get_net_routingbgp NetRoutingBgp /mgmt/tm/net/routing/bgp
+get_net_routingcommunity_list NetRoutingCommunitylist /mgmt/tm/net/routing/community-list
+get_net_routingdebug NetRoutingDebug /mgmt/tm/net/routing/debug
+get_net_routingextcommunity_list NetRoutingExtcommunitylist /mgmt/tm/net/routing/extcommunity-list
+get_net_routingprefix_list NetRoutingPrefixlist /mgmt/tm/net/routing/prefix-list
+get_net_routingprofile NetRoutingProfile /mgmt/tm/net/routing/profile
+get_net_routingroute_map NetRoutingRoutemap /mgmt/tm/net/routing/route-map
+get_net_rst_cause NetRstcause /mgmt/tm/net/rst-cause
+get_net_self NetSelf /mgmt/tm/net/self
+get_net_self_allow NetSelfallow /mgmt/tm/net/self-allow
+get_net_service_policy NetServicepolicy /mgmt/tm/net/service-policy
+get_net_sfc NetSfc /mgmt/tm/net/sfc
+get_net_sfcchain NetSfcChain /mgmt/tm/net/sfc/chain
+get_net_sfchop NetSfcHop /mgmt/tm/net/sfc/hop
+get_net_sfcsf NetSfcSf /mgmt/tm/net/sfc/sf
+get_net_stp NetStp /mgmt/tm/net/stp
+get_net_stp_globals NetStpglobals /mgmt/tm/net/stp-globals
+get_net_timer_policy NetTimerpolicy /mgmt/tm/net/timer-policy
+get_net_trunk NetTrunk /mgmt/tm/net/trunk
+get_net_tunnels NetTunnels /mgmt/tm/net/tunnels
+get_net_tunnelsetherip NetTunnelsEtherip /mgmt/tm/net/tunnels/etherip
+get_net_tunnelsfec NetTunnelsFec /mgmt/tm/net/tunnels/fec
+get_net_tunnelsfec_stat NetTunnelsFecstat /mgmt/tm/net/tunnels/fec-stat
+get_net_tunnelsgeneve NetTunnelsGeneve /mgmt/tm/net/tunnels/geneve
+get_net_tunnelsgre NetTunnelsGre /mgmt/tm/net/tunnels/gre
+get_net_tunnelsipip NetTunnelsIpip /mgmt/tm/net/tunnels/ipip
+get_net_tunnelsipsec NetTunnelsIpsec /mgmt/tm/net/tunnels/ipsec
+get_net_tunnelslw4o6 NetTunnelsLw4o6 /mgmt/tm/net/tunnels/lw4o6
+get_net_tunnelsmap NetTunnelsMap /mgmt/tm/net/tunnels/map
+get_net_tunnelsppp NetTunnelsPpp /mgmt/tm/net/tunnels/ppp
+get_net_tunnelstcp_forward NetTunnelsTcpforward /mgmt/tm/net/tunnels/tcp-forward
+get_net_tunnelstunnel NetTunnelsTunnel /mgmt/tm/net/tunnels/tunnel
+get_net_tunnelsv6rd NetTunnelsV6rd /mgmt/tm/net/tunnels/v6rd
+get_net_tunnelsvxlan NetTunnelsVxlan /mgmt/tm/net/tunnels/vxlan
+get_net_tunnelswccp NetTunnelsWccp /mgmt/tm/net/tunnels/wccp
+get_net_vlan NetVlan /mgmt/tm/net/vlan
+get_net_vlan_allowed NetVlanallowed /mgmt/tm/net/vlan-allowed
+get_net_vlan_group NetVlangroup /mgmt/tm/net/vlan-group
+get_net_wccp NetWccp /mgmt/tm/net/wccp
+get_security_firewall SecurityFirewall /mgmt/tm/security/firewall
+get_security_firewallmanagement_ip_rules SecurityFirewallManagementiprules /mgmt/tm/security/firewall/management-ip-rules
+get_security_firewalluuid_default_autogenerate SecurityFirewallUuiddefaultautogenerate /mgmt/tm/security/firewall/uuid-default-autogenerate
+get_shared_bigip_failover_state SharedBigipfailoverstate /mgmt/tm/shared/bigip-failover-state
+get_shared_licensingactivation SharedLicensingActivation /mgmt/tm/shared/licensing/activation
+get_shared_licensingregistration SharedLicensingRegistration /mgmt/tm/shared/licensing/registration
+get_shared_sysbackup SharedSysBackup /mgmt/tm/shared/sys/backup
+get_sys_alert SysAlert /mgmt/tm/sys/alert
+get_sys_alertlcd SysAlertLcd /mgmt/tm/sys/alert/lcd
+get_sys_aom SysAom /mgmt/tm/sys/aom
+get_sys_application SysApplication /mgmt/tm/sys/application
+get_sys_applicationapl_script SysApplicationAplscript /mgmt/tm/sys/application/apl-script
+get_sys_applicationcustom_stat SysApplicationCustomstat /mgmt/tm/sys/application/custom-stat
+get_sys_applicationservice SysApplicationService /mgmt/tm/sys/application/service
+get_sys_applicationtemplate SysApplicationTemplate /mgmt/tm/sys/application/template
+get_sys_applicationtemplate_model_tasks SysApplicationTemplatemodeltasks /mgmt/tm/sys/application/template-model-tasks
+get_sys_autoscale_group SysAutoscalegroup /mgmt/tm/sys/autoscale-group
+get_sys_clock SysClock /mgmt/tm/sys/clock
+get_sys_cluster SysCluster /mgmt/tm/sys/cluster
+get_sys_connection SysConnection /mgmt/tm/sys/connection
+get_sys_console SysConsole /mgmt/tm/sys/console
+get_sys_cpu SysCpu /mgmt/tm/sys/cpu
+get_sys_crypto SysCrypto /mgmt/tm/sys/crypto
+get_sys_cryptoallow_key_export SysCryptoAllowkeyexport /mgmt/tm/sys/crypto/allow-key-export
+get_sys_cryptoca_bundle_manager SysCryptoCabundlemanager /mgmt/tm/sys/crypto/ca-bundle-manager
+get_sys_cryptocert SysCryptoCert /mgmt/tm/sys/crypto/cert
+get_sys_cryptocert_order_manager SysCryptoCertordermanager /mgmt/tm/sys/crypto/cert-order-manager
+get_sys_cryptocert_validator SysCryptoCertvalidator /mgmt/tm/sys/crypto/cert-validator
+get_sys_cryptoclient SysCryptoClient /mgmt/tm/sys/crypto/client
+get_sys_cryptocrl SysCryptoCrl /mgmt/tm/sys/crypto/cert-validator/crl
+get_sys_cryptocsr SysCryptoCsr /mgmt/tm/sys/crypto/csr
+get_sys_cryptoencrypted_attributes SysCryptoEncryptedattributes /mgmt/tm/sys/crypto/encrypted-attributes
+get_sys_cryptoexternal_hsm SysCryptoExternalhsm /mgmt/tm/sys/crypto/fips/external-hsm
+get_sys_cryptofips SysCryptoFips /mgmt/tm/sys/crypto/fips
+get_sys_cryptokey SysCryptoKey /mgmt/tm/sys/crypto/key
+get_sys_cryptomaster_key SysCryptoMasterkey /mgmt/tm/sys/crypto/master-key
+get_sys_cryptonethsm_partition SysCryptoNethsmpartition /mgmt/tm/sys/crypto/fips/nethsm-partition
+get_sys_cryptoocsp SysCryptoOcsp /mgmt/tm/sys/crypto/cert-validator/ocsp
+get_sys_cryptoserver SysCryptoServer /mgmt/tm/sys/crypto/server
+get_sys_daemon_ha SysDaemonha /mgmt/tm/sys/daemon-ha
+get_sys_daemon_log_settings SysDaemonlogsettings /mgmt/tm/sys/daemon-log-settings
+get_sys_daemon_log_settingsclusterd SysDaemonlogsettingsClusterd /mgmt/tm/sys/daemon-log-settings/clusterd
+get_sys_daemon_log_settingscsyncd SysDaemonlogsettingsCsyncd /mgmt/tm/sys/daemon-log-settings/csyncd
+get_sys_daemon_log_settingsicr_eventd SysDaemonlogsettingsIcreventd /mgmt/tm/sys/daemon-log-settings/icr-eventd
+get_sys_daemon_log_settingsicrd SysDaemonlogsettingsIcrd /mgmt/tm/sys/daemon-log-settings/icrd
+get_sys_daemon_log_settingslind SysDaemonlogsettingsLind /mgmt/tm/sys/daemon-log-settings/lind
+get_sys_daemon_log_settingsmcpd SysDaemonlogsettingsMcpd /mgmt/tm/sys/daemon-log-settings/mcpd
+get_sys_daemon_log_settingstmm SysDaemonlogsettingsTmm /mgmt/tm/sys/daemon-log-settings/tmm
+get_sys_datastor SysDatastor /mgmt/tm/sys/datastor
+get_sys_db SysDb /mgmt/tm/sys/db
+get_sys_diags SysDiags /mgmt/tm/sys/diags
+get_sys_diagsihealth SysDiagsIhealth /mgmt/tm/sys/diags/ihealth
+get_sys_diagsihealth_request SysDiagsIhealthrequest /mgmt/tm/sys/diags/ihealth-request
+get_sys_diagsihealth_result SysDiagsIhealthresult /mgmt/tm/sys/diags/ihealth-result
+get_sys_disk SysDisk /mgmt/tm/sys/disk
+get_sys_diskapplication_volume SysDiskApplicationvolume /mgmt/tm/sys/disk/application-volume
+get_sys_diskdirectory SysDiskDirectory /mgmt/tm/sys/disk/directory
+get_sys_disklogical_disk SysDiskLogicaldisk /mgmt/tm/sys/disk/logical-disk
+get_sys_dns SysDns /mgmt/tm/sys/dns
+get_sys_dynad SysDynad /mgmt/tm/sys/dynad
+get_sys_dynadinstrumentation SysDynadInstrumentation /mgmt/tm/sys/dynad/instrumentation
+get_sys_dynadkey SysDynadKey /mgmt/tm/sys/dynad/key
+get_sys_dynadrpm SysDynadRpm /mgmt/tm/sys/dynad/rpm
+get_sys_dynadsettings SysDynadSettings /mgmt/tm/sys/dynad/settings
+get_sys_dynadstatus SysDynadStatus /mgmt/tm/sys/dynad/status
+get_sys_ecm SysEcm /mgmt/tm/sys/ecm
+get_sys_ecmcloud_provider SysEcmCloudprovider /mgmt/tm/sys/ecm/cloud-provider
+get_sys_ecmconfig SysEcmConfig /mgmt/tm/sys/ecm/config
+get_sys_failover SysFailover /mgmt/tm/sys/failover
+get_sys_feature_module SysFeaturemodule /mgmt/tm/sys/feature-module
+get_sys_file SysFile /mgmt/tm/sys/file
+get_sys_fileapache_ssl_cert SysFileApachesslcert /mgmt/tm/sys/file/apache-ssl-cert
+get_sys_filebrowser_capabilities_db SysFileBrowsercapabilitiesdb /mgmt/tm/sys/file/browser-capabilities-db
+get_sys_filedashboard_viewset SysFileDashboardviewset /mgmt/tm/sys/file/dashboard-viewset
+get_sys_filedata_group SysFileDatagroup /mgmt/tm/sys/file/data-group
+get_sys_filedevice_capabilities_db SysFileDevicecapabilitiesdb /mgmt/tm/sys/file/device-capabilities-db
+get_sys_fileexternal_monitor SysFileExternalmonitor /mgmt/tm/sys/file/external-monitor
+get_sys_fileifile SysFileIfile /mgmt/tm/sys/file/ifile
+get_sys_filelwtunneltbl SysFileLwtunneltbl /mgmt/tm/sys/file/lwtunneltbl
+get_sys_filessl_cert SysFileSslcert /mgmt/tm/sys/file/ssl-cert
+get_sys_filessl_crl SysFileSslcrl /mgmt/tm/sys/file/ssl-crl
+get_sys_filessl_csr SysFileSslcsr /mgmt/tm/sys/file/ssl-csr
+get_sys_filessl_key SysFileSslkey /mgmt/tm/sys/file/ssl-key
+get_sys_filesystem_ssl_cert SysFileSystemsslcert /mgmt/tm/sys/file/system-ssl-cert
+get_sys_filesystem_ssl_key SysFileSystemsslkey /mgmt/tm/sys/file/system-ssl-key
+get_sys_fix_connection SysFixconnection /mgmt/tm/sys/fix-connection
+get_sys_folder SysFolder /mgmt/tm/sys/folder
+get_sys_fpga SysFpga /mgmt/tm/sys/fpga
+get_sys_fpgafirmware_config SysFpgaFirmwareconfig /mgmt/tm/sys/fpga/firmware-config
+get_sys_fpgainfo SysFpgaInfo /mgmt/tm/sys/fpga/info
+get_sys_fpgaturboflex_profile SysFpgaTurboflexprofile /mgmt/tm/sys/fpga/turboflex-profile
+get_sys_global_settings SysGlobalsettings /mgmt/tm/sys/global-settings
+get_sys_ha_group SysHagroup /mgmt/tm/sys/ha-group
+get_sys_ha_mirror SysHamirror /mgmt/tm/sys/ha-mirror
+get_sys_ha_status SysHastatus /mgmt/tm/sys/ha-status
+get_sys_hardware SysHardware /mgmt/tm/sys/hardware
+get_sys_host_info SysHostinfo /mgmt/tm/sys/host-info
+get_sys_httpd SysHttpd /mgmt/tm/sys/httpd
+get_sys_hypervisor_info SysHypervisorinfo /mgmt/tm/sys/hypervisor-info
+get_sys_icall SysIcall /mgmt/tm/sys/icall
+get_sys_icallhandler SysIcallHandler /mgmt/tm/sys/icall/handler
+get_sys_icallistats_trigger SysIcallIstatstrigger /mgmt/tm/sys/icall/istats-trigger
+get_sys_icallperiodic SysIcallPeriodic /mgmt/tm/sys/icall/handler/periodic
+get_sys_icallperpetual SysIcallPerpetual /mgmt/tm/sys/icall/handler/perpetual
+get_sys_icallpublisher SysIcallPublisher /mgmt/tm/sys/icall/publisher
+get_sys_icallscript SysIcallScript /mgmt/tm/sys/icall/script
+get_sys_icalltriggered SysIcallTriggered /mgmt/tm/sys/icall/handler/triggered
+get_sys_icmp_stat SysIcmpstat /mgmt/tm/sys/icmp-stat
+get_sys_icontrol_soap SysIcontrolsoap /mgmt/tm/sys/icontrol-soap
+get_sys_internal_proxy SysInternalproxy /mgmt/tm/sys/internal-proxy
+get_sys_ip_address SysIpaddress /mgmt/tm/sys/ip-address
+get_sys_ip_stat SysIpstat /mgmt/tm/sys/ip-stat
+get_sys_ipfix SysIpfix /mgmt/tm/sys/ipfix
+get_sys_ipfixdestination SysIpfixDestination /mgmt/tm/sys/ipfix/destination
+get_sys_ipfixelement SysIpfixElement /mgmt/tm/sys/ipfix/element
+get_sys_ipfixirules SysIpfixIrules /mgmt/tm/sys/ipfix/irules
+get_sys_iprep_status SysIprepstatus /mgmt/tm/sys/iprep-status
+get_sys_license SysLicense /mgmt/tm/sys/license
+get_sys_log SysLog /mgmt/tm/sys/log
+get_sys_log_config SysLogconfig /mgmt/tm/sys/log-config
+get_sys_log_configalertd SysLogconfigAlertd /mgmt/tm/sys/log-config/destination/alertd
+get_sys_log_configarcsight SysLogconfigArcsight /mgmt/tm/sys/log-config/destination/arcsight
+get_sys_log_configdestination SysLogconfigDestination /mgmt/tm/sys/log-config/destination
+get_sys_log_configfilter SysLogconfigFilter /mgmt/tm/sys/log-config/filter
+get_sys_log_configipfix SysLogconfigIpfix /mgmt/tm/sys/log-config/destination/ipfix
+get_sys_log_configlocal_database SysLogconfigLocaldatabase /mgmt/tm/sys/log-config/destination/local-database
+get_sys_log_configlocal_syslog SysLogconfigLocalsyslog /mgmt/tm/sys/log-config/destination/local-syslog
+get_sys_log_configmanagement_port SysLogconfigManagementport /mgmt/tm/sys/log-config/destination/management-port
+get_sys_log_configpublisher SysLogconfigPublisher /mgmt/tm/sys/log-config/publisher
+get_sys_log_configremote_high_speed_log SysLogconfigRemotehighspeedlog /mgmt/tm/sys/log-config/destination/remote-high-speed-log
+get_sys_log_configremote_syslog SysLogconfigRemotesyslog /mgmt/tm/sys/log-config/destination/remote-syslog
+get_sys_log_configsplunk SysLogconfigSplunk /mgmt/tm/sys/log-config/destination/splunk
+get_sys_log_rotate SysLogrotate /mgmt/tm/sys/log-rotate
+get_sys_mac_address SysMacaddress /mgmt/tm/sys/mac-address
+get_sys_management_dhcp SysManagementdhcp /mgmt/tm/sys/management-dhcp
+get_sys_management_ip SysManagementip /mgmt/tm/sys/management-ip
+get_sys_management_ovsdb SysManagementovsdb /mgmt/tm/sys/management-ovsdb
+get_sys_management_proxy_config SysManagementproxyconfig /mgmt/tm/sys/management-proxy-config
+get_sys_management_route SysManagementroute /mgmt/tm/sys/management-route
+get_sys_mcp_state SysMcpstate /mgmt/tm/sys/mcp-state
+get_sys_memory SysMemory /mgmt/tm/sys/memory
+get_sys_nethsm SysNethsm /mgmt/tm/sys/nethsm
+get_sys_nethsmasync_queue_stat SysNethsmAsyncqueuestat /mgmt/tm/sys/nethsm/async-queue-stat
+get_sys_nethsmpkcs11d_stat SysNethsmPkcs11dstat /mgmt/tm/sys/nethsm/pkcs11d-stat
+get_sys_nethsmsync_queue_stat SysNethsmSyncqueuestat /mgmt/tm/sys/nethsm/sync-queue-stat
+get_sys_ntp SysNtp /mgmt/tm/sys/ntp
+get_sys_outbound_smtp SysOutboundsmtp /mgmt/tm/sys/outbound-smtp
+get_sys_performance SysPerformance /mgmt/tm/sys/performance
+get_sys_performanceall_stats SysPerformanceAllstats /mgmt/tm/sys/performance/all-stats
+get_sys_performanceconnections SysPerformanceConnections /mgmt/tm/sys/performance/connections
+get_sys_performancednsexpress SysPerformanceDnsexpress /mgmt/tm/sys/performance/dnsexpress
+get_sys_performancednssec SysPerformanceDnssec /mgmt/tm/sys/performance/dnssec
+get_sys_performancegtm SysPerformanceGtm /mgmt/tm/sys/performance/gtm
+get_sys_performanceramcache SysPerformanceRamcache /mgmt/tm/sys/performance/ramcache
+get_sys_performancesystem SysPerformanceSystem /mgmt/tm/sys/performance/system
+get_sys_performancethroughput SysPerformanceThroughput /mgmt/tm/sys/performance/throughput
+get_sys_pfman SysPfman /mgmt/tm/sys/pfman
+get_sys_pfmanconsumer SysPfmanConsumer /mgmt/tm/sys/pfman/consumer
+get_sys_pfmandevice SysPfmanDevice /mgmt/tm/sys/pfman/device
+get_sys_pptp_call_info SysPptpcallinfo /mgmt/tm/sys/pptp-call-info
+get_sys_proc_info SysProcinfo /mgmt/tm/sys/proc-info
+get_sys_provision SysProvision /mgmt/tm/sys/provision
+get_sys_pva_traffic SysPvatraffic /mgmt/tm/sys/pva-traffic
+get_sys_raid SysRaid /mgmt/tm/sys/raid
+get_sys_raidarray SysRaidArray /mgmt/tm/sys/raid/array
+get_sys_raidbay SysRaidBay /mgmt/tm/sys/raid/bay
+get_sys_raiddisk SysRaidDisk /mgmt/tm/sys/raid/disk
+get_sys_ready SysReady /mgmt/tm/sys/ready
+get_sys_scriptd SysScriptd /mgmt/tm/sys/scriptd
+get_sys_service SysService /mgmt/tm/sys/service
+get_sys_sflow SysSflow /mgmt/tm/sys/sflow
+get_sys_sflowdata_source SysSflowDatasource /mgmt/tm/sys/sflow/data-source
+get_sys_sflowglobal_settings SysSflowGlobalsettings /mgmt/tm/sys/sflow/global-settings
+get_sys_sflowhttp SysSflowHttp /mgmt/tm/sys/sflow/data-source/http
+get_sys_sflowinterface SysSflowInterface /mgmt/tm/sys/sflow/data-source/interface
+get_sys_sflowreceiver SysSflowReceiver /mgmt/tm/sys/sflow/receiver
+get_sys_sflowsystem SysSflowSystem /mgmt/tm/sys/sflow/data-source/system
+get_sys_sflowvlan SysSflowVlan /mgmt/tm/sys/sflow/global-settings/vlan
+get_sys_smtp_server SysSmtpserver /mgmt/tm/sys/smtp-server
+get_sys_snmp SysSnmp /mgmt/tm/sys/snmp
+get_sys_software SysSoftware /mgmt/tm/sys/software
+get_sys_softwareblock_device_hotfix SysSoftwareBlockdevicehotfix /mgmt/tm/sys/software/block-device-hotfix
+get_sys_softwareblock_device_image SysSoftwareBlockdeviceimage /mgmt/tm/sys/software/block-device-image
+get_sys_softwarehotfix SysSoftwareHotfix /mgmt/tm/sys/software/hotfix
+get_sys_softwareimage SysSoftwareImage /mgmt/tm/sys/software/image
+get_sys_softwaresignature SysSoftwareSignature /mgmt/tm/sys/software/signature
+get_sys_softwarestatus SysSoftwareStatus /mgmt/tm/sys/software/status
+get_sys_softwareupdate SysSoftwareUpdate /mgmt/tm/sys/software/update
+get_sys_softwareupdate_status SysSoftwareUpdatestatus /mgmt/tm/sys/software/update-status
+get_sys_softwarevolume SysSoftwareVolume /mgmt/tm/sys/software/volume
+get_sys_sshd SysSshd /mgmt/tm/sys/sshd
+get_sys_state_mirroring SysStatemirroring /mgmt/tm/sys/state-mirroring
+get_sys_sync_sys_files SysSyncsysfiles /mgmt/tm/sys/sync-sys-files
+get_sys_syslog SysSyslog /mgmt/tm/sys/syslog
+get_sys_tmm_info SysTmminfo /mgmt/tm/sys/tmm-info
+get_sys_tmm_traffic SysTmmtraffic /mgmt/tm/sys/tmm-traffic
+get_sys_traffic SysTraffic /mgmt/tm/sys/traffic
+get_sys_turboflex SysTurboflex /mgmt/tm/sys/turboflex
+get_sys_turboflexall SysTurboflexAll /mgmt/tm/sys/turboflex/profile/all
+get_sys_turboflexfeature SysTurboflexFeature /mgmt/tm/sys/turboflex/profile/feature
+get_sys_turboflexfeatures SysTurboflexFeatures /mgmt/tm/sys/turboflex/features
+get_sys_turboflexprofile SysTurboflexProfile /mgmt/tm/sys/turboflex/profile
+get_sys_turboflexprofile_config SysTurboflexProfileconfig /mgmt/tm/sys/turboflex/profile-config
+get_sys_turboflexwarning SysTurboflexWarning /mgmt/tm/sys/turboflex/warning
+get_sys_ucs SysUcs /mgmt/tm/sys/ucs
+get_sys_url_db SysUrldb /mgmt/tm/sys/url-db
+get_sys_url_dbdownload_result SysUrldbDownloadresult /mgmt/tm/sys/url-db/download-result
+get_sys_url_dbdownload_schedule SysUrldbDownloadschedule /mgmt/tm/sys/url-db/download-schedule
+get_sys_url_dburl_category SysUrldbUrlcategory /mgmt/tm/sys/url-db/url-category
+get_sys_version SysVersion /mgmt/tm/sys/version
+get_wom_profile WomProfile /mgmt/tm/wom/profile
+get_wom_profileisession WomProfileIsession /mgmt/tm/wom/profile/isession
+'''
+
+# module name to (class name, endpoint), parsed from PARSERS on first use
+_modules = None
+# class name to module name
+_classes = None
+
+
+def get_parser_modules():
+    '''return `dict` of module name to (class name, endpoint)'''
+    global _modules, _classes
+    if _modules is None:
+        modules = {}
+        for line in PARSERS.splitlines():
+            module_name, class_name, endpoint = line.split()
+            modules[module_name] = (class_name, endpoint)
+        _classes = {class_name: module_name
+                    for module_name, (class_name, _) in modules.items()}
+        _modules = modules
+    return _modules
+
+
+def get_parser_class(class_name):
+    '''return the parser class named class_name, None if unknown'''
+    get_parser_modules()
+    module_name = _classes.get(class_name)
+    if module_name is None:
+        return None
+    module = importlib.import_module('{}.{}'.format(__package__,
+                                                     module_name))
+    return getattr(module, class_name)
+
+
+def rest(self, select=None, page_size=None):
+
+    if select or page_size:
+        # Collection requested page by page, see collection.get_collection
+        return get_collection(self.device, self.cli_command, select=select,
+                              page_size=page_size)
+
+    response = self.device.get(self.cli_command)
+
+    response_json = response.json()
+
+    if not response_json:
+        return {}
+
+    return response_json
+
+
+def build_module(module, class_name, endpoint):
+    '''add the schema and parser classes of endpoint to module'''
+    schema_cls = type(class_name + 'Schema', (MetaParser,), {
+        '__module__': module.__name__,
+        'schema': {}})
+    parser_cls = type(class_name, (schema_cls,), {
+        '__module__': module.__name__,
+        '__doc__': ' To F5 resource for {}\n    '.format(endpoint),
+        'cli_command': endpoint,
+        'rest': rest})
+
+    module.json = json
+    module.defaultdict = defaultdict
+    module.MetaParser = MetaParser
+    setattr(module, schema_cls.__name__, schema_cls)
+    setattr(module, parser_cls.__name__, parser_cls)
+    return module
+
+
+def build_parser_module(name):
+    '''build the classes of the module name listed in PARSERS, called by the
+       module on import'''
+    module_name = name.rpartition('.')[2]
+    class_name, endpoint = get_parser_modules()[module_name]
+    build_module(sys.modules[name], class_name, endpoint)
+
+
+# Content of the module files, see write_modules
+MODULE = '''\
+from .registry import build_parser_module
+build_parser_module(__name__)
+'''
+
+
+def write_modules(directory=None):
+    '''write the module file of each parser listed in PARSERS, and remove
+       the module files of parsers no longer listed, to run after editing
+       PARSERS
+
+        Args:
+            directory (`str`): package directory, defaults to the directory
+                               of this module
+
+        Returns:
+            `list` of the module names written or removed
+    '''
+    directory = directory or os.path.dirname(os.path.abspath(__file__))
+    changed = []
+    modules = get_parser_modules()
+    for module_name in modules:
+        path = os.path.join(directory, module_name + '.py')
+        if os.path.exists(path):
+            with open(path) as f:
+                if f.read() == MODULE:
+                    continue
+        with open(path, 'w') as f:
+            f.write(MODULE)
+        changed.append(module_name)
+    for file_name in os.listdir(directory):
+        module_name, ext = os.path.splitext(file_name)
+        if ext == '.py' and module_name.startswith('get_') and \
+           module_name not in modules:
+            os.remove(os.path.join(directory, file_name))
+            changed.append(module_name)
+    return changed
+
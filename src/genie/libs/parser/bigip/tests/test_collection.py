@@ -0,0 +1,146 @@
+# Python
+import threading
+import unittest
+from unittest.mock import Mock, patch
+from urllib.parse import urlsplit, parse_qs
+
+# Parser
+from genie.libs.parser.bigip import collection
+from genie.libs.parser.bigip.collection import get_collection, \
+    iter_pages, iter_collect, collect
+from genie.libs.parser.bigip.get_ltm_pool import LtmPool
+
+MEMBERS = '/mgmt/tm/ltm/pool/members'
+POOLS = '/mgmt/tm/ltm/pool'
+VERSION = '/mgmt/tm/sys/version'
+
+
+class _Device(object):
+    '''BIG-IP device paging its collections like iControl REST'''
+
+    def __init__(self):
+        self.collections = {
+            MEMBERS: [{'name': 'member{}'.format(i), 'address': str(i),
+                       'state': 'up'} for i in range(7)],
+            POOLS: [{'name': 'pool{}'.format(i)} for i in range(3)],
+        }
+        # Collections returning all their items whatever $skip and $top are
+        self.unpaged = set()
+        self.urls = []
+        self.lock = threading.Lock()
+
+    def get(self, url):
+        with self.lock:
+            self.urls.append(url)
+        split = urlsplit(url)
+        query = {k: v[0] for k, v in parse_qs(split.query).items()}
+        if split.path == VERSION:
+            json = {'kind': 'tm:sys:version:versionstats',
+                    'entries': {'version': '15.1'}}
+        else:
+            items = self.collections[split.path]
+            skip = int(query.get('$skip', 0))
+            top = int(query.get('$top', len(items)))
+            if split.path in self.unpaged:
+                skip, top = 0, len(items)
+            page = items[skip:skip + top]
+            if '$select' in query:
+                fields = query['$select'].split(',')
+                page = [{k: v for k, v in item.items() if k in fields}
+                        for item in page]
+            json = {'kind': 'collectionstate', 'selfLink': split.path,
+                    'items': page}
+            if '$top' in query and split.path not in self.unpaged:
+                json.update({'currentItemCount': len(page),
+                             'totalItems': len(items)})
+        response = Mock()
+        response.json.return_value = json
+        return response
+
+
+class TestCollection(unittest.TestCase):
+
+    def setUp(self):
+        self.device = _Device()
+
+    def test_get_collection(self):
+        result = get_collection(self.device, MEMBERS, page_size=3)
+        self.assertEqual(result, {'kind': 'collectionstate',
+                                  'selfLink': MEMBERS,
+                                  'items': self.device.collections[MEMBERS]})
+        self.assertEqual(self.device.urls, [
+            MEMBERS + '?$top=3',
+            MEMBERS + '?$top=3&$skip=3',
+            MEMBERS + '?$top=3&$skip=6'])
+
+    def test_select(self):
+        result = get_collection(self.device, MEMBERS, page_size=7,
+                                select=['name', 'state'])
+        self.assertEqual(result['items'][0], {'name': 'member0',
+                                              'state': 'up'})
+        # The page holds totalItems items
+        self.assertEqual(self.device.urls,
+                         [MEMBERS + '?$top=7&$select=name,state'])
+
+    def test_skip_ignored(self):
+        self.device.unpaged.add(MEMBERS)
+        # The second page repeats the first one
+        result = get_collection(self.device, MEMBERS, page_size=7)
+        self.assertEqual(result['items'], self.device.collections[MEMBERS])
+        self.assertEqual(self.device.urls, [MEMBERS + '?$top=7',
+                                            MEMBERS + '?$top=7&$skip=7'])
+        # The first page holds more than $top items
+        self.device.urls = []
+        result = get_collection(self.device, MEMBERS, page_size=3)
+        self.assertEqual(result['items'], self.device.collections[MEMBERS])
+        self.assertEqual(self.device.urls, [MEMBERS + '?$top=3'])
+
+    @patch.object(collection, 'MAX_PAGES', 2)
+    def test_max_pages(self):
+        self.assertEqual(len(list(iter_pages(self.device, MEMBERS,
+                                             page_size=1))), 2)
+
+    def test_rest(self):
+        parsed_output = LtmPool(device=self.device, context='rest').parse()
+        self.assertEqual(self.device.urls, [POOLS])
+        self.assertEqual(LtmPool(device=self.device,
+                                 context='rest').parse(page_size=2),
+                         parsed_output)
+        self.assertEqual(len(self.device.urls), 3)
+
+    def test_iter_collect(self):
+        items = list(iter_collect(self.device, [MEMBERS, POOLS, VERSION],
+                                  page_size=2, max_workers=3))
+        self.assertEqual([item for endpoint, item in items
+                          if endpoint == MEMBERS],
+                         self.device.collections[MEMBERS])
+        self.assertEqual([item for endpoint, item in items
+                          if endpoint == POOLS],
+                         self.device.collections[POOLS])
+        self.assertIn((VERSION, {'kind': 'tm:sys:version:versionstats',
+                                 'entries': {'version': '15.1'}}), items)
+        self.assertEqual(list(iter_collect(self.device, [])), [])
+
+    def test_iter_collect_stop(self):
+        items = iter_collect(self.device, [MEMBERS, POOLS], page_size=1,
+                             max_workers=2)
+        next(items)
+        items.close()
+
+    def test_iter_collect_error(self):
+        with self.assertRaises(KeyError):
+            list(iter_collect(self.device, [MEMBERS, '/mgmt/tm/unknown']))
+
+    def test_collect(self):
+        for max_workers in (1, 2):
+            results = collect(self.device, [MEMBERS, POOLS, VERSION],
+                              page_size=2, max_workers=max_workers)
+            self.assertEqual(list(results), [MEMBERS, POOLS, VERSION])
+            self.assertEqual(results[POOLS]['items'],
+                             self.device.collections[POOLS])
+            self.assertEqual(results[VERSION]['entries'],
+                             {'version': '15.1'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+# Python
+import os
+import sys
+import pickle
+import pkgutil
+import tempfile
+import importlib
+import unittest
+from unittest.mock import Mock
+
+# Genie
+from genie.abstract import Lookup
+
+# Metaparser
+from genie.metaparser import MetaParser
+
+# Parser
+from genie.libs import parser
+from genie.libs.parser import bigip
+from genie.libs.parser.bigip import registry
+from genie.libs.parser.bigip.get_sys_version import SysVersion
+
+
+class TestRegistry(unittest.TestCase):
+
+    def test_parser_modules(self):
+        modules = registry.get_parser_modules()
+        self.assertEqual(len(modules), 739)
+        self.assertEqual(modules['get_sys_version'],
+                         ('SysVersion', '/mgmt/tm/sys/version'))
+        # Class names are unique
+        self.assertEqual(len({c for c, _ in modules.values()}), len(modules))
+
+    def test_import(self):
+        module = importlib.import_module(
+            'genie.libs.parser.bigip.get_sys_version')
+        SysVersion = module.SysVersion
+        self.assertEqual(SysVersion.__module__,
+                         'genie.libs.parser.bigip.get_sys_version')
+        self.assertEqual(SysVersion.__mro__[1:],
+                         (module.SysVersionSchema, MetaParser, object))
+        self.assertEqual(SysVersion.cli_command, '/mgmt/tm/sys/version')
+        self.assertEqual(SysVersion.schema, {})
+        self.assertIs(pickle.loads(pickle.dumps(SysVersion)), SysVersion)
+
+        module = importlib.import_module(
+            'genie.libs.parser.bigip.get_analytics_cpureport_results')
+        self.assertEqual(module.AnalyticsCpuReportresults.cli_command,
+                         '/mgmt/tm/analytics/cpu/report-results')
+
+        with self.assertRaises(ImportError):
+            importlib.import_module('genie.libs.parser.bigip.get_unknown')
+
+    def test_module_files(self):
+        directory = os.path.dirname(registry.__file__)
+        modules = registry.get_parser_modules()
+        names = {name for _, name, _ in pkgutil.iter_modules(bigip.__path__)
+                 if name.startswith('get_')}
+        self.assertEqual(names, set(modules))
+        for module_name in modules:
+            with open(os.path.join(directory, module_name + '.py')) as f:
+                self.assertEqual(f.read(), registry.MODULE, module_name)
+
+    def test_write_modules(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, 'get_unknown.py'), 'w') as f:
+                f.write(registry.MODULE)
+            changed = registry.write_modules(directory)
+            self.assertEqual(len(changed), 740)
+            self.assertIn('get_unknown', changed)
+            self.assertEqual(len(os.listdir(directory)), 739)
+            self.assertEqual(registry.write_modules(directory), [])
+
+    def test_lookup(self):
+        lookup = Lookup('bigip', packages={'parser': parser})
+        parser_cls = lookup.parser.get_sys_version.SysVersion
+        self.assertEqual(parser_cls.__module__,
+                         'genie.libs.parser.bigip.get_sys_version')
+        self.assertEqual(parser_cls.cli_command, '/mgmt/tm/sys/version')
+
+    def test_lazy(self):
+        name = 'genie.libs.parser.bigip.get_net_vlan'
+        sys.modules.pop(name, None)
+        self.assertIsNone(registry.get_parser_class('Unknown'))
+        self.assertNotIn(name, sys.modules)
+        self.assertIs(bigip.NetVlan,
+                      registry.get_parser_class('NetVlan'))
+        self.assertIn(name, sys.modules)
+        with self.assertRaises(AttributeError):
+            bigip.Unknown
+
+    def test_rest(self):
+        device = Mock(**{'get.return_value.json.return_value':
+                         {'version': '15.1'}})
+        parsed_output = SysVersion(device=device, context='rest').parse()
+        self.assertEqual(parsed_output, {'version': '15.1'})
+        device.get.assert_called_once_with('/mgmt/tm/sys/version')
+
+        device.get.return_value.json.return_value = None
+        self.assertEqual(SysVersion(device=device).rest(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
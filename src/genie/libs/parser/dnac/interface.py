@@ -6,7 +6,10 @@
 """
 
 import os
+import json
+import time
 import logging
+import threading
 import pprint
 import re
 import unittest
@@ -29,6 +32,139 @@ from genie.libs.parser.utils.common import Common
 
 logger = logging.getLogger(__name__)
 
+NETWORK_DEVICE_CMD = '/dna/intent/api/v1/network-device'
+NETWORK_DEVICE_ID_CMD = '/dna/intent/api/v1/network-device/{device_id}'
+
+# Number of records requested per page of the interface and network device
+# APIs
+PAGE_SIZE = 500
+
+# Pages requested at most by get_paged
+MAX_PAGES = 1000
+
+# Above this number of unknown device ids, the whole network device inventory
+# is fetched page by page instead of looking each device up
+BULK_LOOKUP_THRESHOLD = 10
+
+# Number of device lookups sent at once, below the default connection pool
+# size of requests sessions so connections are reused
+LOOKUP_WORKERS = 8
+
+# Seconds the hostname of a device id is kept
+HOSTNAME_TTL = 300
+
+# Device id to (expiry time, hostname). Device ids are unique across
+# controllers.
+_hostnames = {}
+_hostnames_lock = threading.Lock()
+
+
+def get_paged(device, cmd, page_size=None):
+    '''return the records of a DNAC API, requested page by page
+
+        Paging stops at the first page shorter than page_size, or adding no
+        record not seen already, as returned by APIs ignoring offset and
+        limit, or after MAX_PAGES pages.
+
+        Args:
+            device (`Device`): DNAC device
+            cmd (`str`): API supporting the offset and limit parameters
+            page_size (`int`): records per page, defaults to PAGE_SIZE
+
+        Returns:
+            `list` of records
+    '''
+    page_size = page_size or PAGE_SIZE
+    records = []
+    seen = set()
+    # DNAC offsets start at 1
+    offset = 1
+    for _ in range(MAX_PAGES):
+        page = device.get('{}?offset={}&limit={}'.format(
+            cmd, offset, page_size)).json()['response']
+        new = 0
+        for record in page:
+            key = _record_key(record)
+            if key not in seen:
+                seen.add(key)
+                records.append(record)
+                new += 1
+        if len(page) < page_size:
+            return records
+        if not new:
+            logger.warning('{} ignores offset and limit, stopped paging at '
+                           'offset {}'.format(cmd, offset))
+            return records
+        offset += page_size
+    logger.warning('{} returned more than {} pages of {} records, stopped '
+                   'paging'.format(cmd, MAX_PAGES, page_size))
+    return records
+
+
+def _record_key(record):
+    '''return the id of a record, its content when it has none'''
+    if isinstance(record, dict) and record.get('id') is not None:
+        return record['id']
+    return json.dumps(record, sort_keys=True, default=str)
+
+
+def get_hostnames(device, device_ids):
+    '''return the hostname of each device id
+
+        Hostnames are kept HOSTNAME_TTL seconds. Above BULK_LOOKUP_THRESHOLD
+        unknown ids, the network device inventory is fetched page by page,
+        the remaining ids are looked up concurrently.
+
+        Args:
+            device (`Device`): DNAC device
+            device_ids (`list`): network device ids
+
+        Returns:
+            `dict` of device id to hostname
+    '''
+    now = time.monotonic()
+    id_to_hostname = {}
+    missing = []
+    with _hostnames_lock:
+        for device_id in dict.fromkeys(device_ids):
+            entry = _hostnames.get(device_id)
+            if entry is not None and entry[0] > now:
+                id_to_hostname[device_id] = entry[1]
+            else:
+                missing.append(device_id)
+
+    found = {}
+    if len(missing) > BULK_LOOKUP_THRESHOLD:
+        for device_info in get_paged(device, NETWORK_DEVICE_CMD):
+            found[device_info['id']] = device_info['hostname']
+        missing = [device_id for device_id in missing
+                   if device_id not in found]
+
+    def get_hostname(device_id):
+        device_info = device.get(NETWORK_DEVICE_ID_CMD.format(
+            device_id=device_id)).json()['response']
+        return device_info['hostname']
+
+    if len(missing) == 1:
+        found[missing[0]] = get_hostname(missing[0])
+    elif missing:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(min(LOOKUP_WORKERS, len(missing))) as executor:
+            found.update(zip(missing, executor.map(get_hostname, missing)))
+
+    expires = time.monotonic() + HOSTNAME_TTL
+    with _hostnames_lock:
+        for device_id, hostname in found.items():
+            _hostnames[device_id] = (expires, hostname)
+    id_to_hostname.update(found)
+    return id_to_hostname
+
+
+def clear_hostname_cache():
+    '''drop the hostnames kept by get_hostnames'''
+    with _hostnames_lock:
+        _hostnames.clear()
+
 # ============================================
 # Schema for '/dna/intent/api/v1/interface'
 # ============================================
@@ -94,27 +230,19 @@ class Interface(InterfaceSchema):
         if output is None:
             if interface:
                 cmd = self.cli_command[1].format(interface=interface)
+                out = self.device.get(cmd).json()['response']
             else:
-                cmd = self.cli_command[0]
-            out = self.device.get(cmd).json()['response']
+                out = get_paged(self.device, self.cli_command[0])
 
         else:
             out = output
 
-        # get device by id
-        cmd = '/dna/intent/api/v1/network-device/{device_id}'
+        id_to_hostname = get_hostnames(
+            self.device, [intf_dict['deviceId'] for intf_dict in out])
 
         result_dict={}
-        id_to_hostname = {}
         for intf_dict in out:
-            device_id = intf_dict['deviceId']
-            if device_id not in id_to_hostname:
-                device_id_cmd = cmd.format(device_id=device_id)
-                device_info = self.device.get(device_id_cmd).json()['response']
-                hostname = device_info['hostname']
-                id_to_hostname[device_id] = hostname
-            else:
-                hostname = id_to_hostname[device_id]
+            hostname = id_to_hostname[intf_dict['deviceId']]
 
             host_info = result_dict.setdefault('hostname', {}).setdefault(hostname, {}).setdefault('interfaces', {})
             # remove None values
@@ -1,6 +1,12 @@
 # Python
+import json
+import threading
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+from urllib.parse import urlsplit, parse_qs
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+import requests
 from requests.models import Response
 # ATS
 from pyats.topology import Device
@@ -9,7 +15,8 @@ from genie.metaparser.util.exceptions import SchemaEmptyParserError, \
     SchemaMissingKeyError
 
 # Parser
-from genie.libs.parser.dnac.interface import Interface
+from genie.libs.parser.dnac import interface
+from genie.libs.parser.dnac.interface import Interface, clear_hostname_cache
 
 
 class TestInterfaceRest(unittest.TestCase):
@@ -215,5 +222,143 @@ class TestInterfaceRest(unittest.TestCase):
         self.assertEqual(parsed_output, self.golden_parsed_output)
 
 
+class _DnacHandler(BaseHTTPRequestHandler):
+    '''Serves the interface and network device APIs of a fake DNAC'''
+
+    interfaces = [
+        {'adminStatus': 'UP', 'deviceId': 'device-{}'.format(i),
+         'ifIndex': str(i), 'interfaceType': 'Physical',
+         'isisSupport': 'false', 'lastUpdated': '2019-05-31 16:17:51.735',
+         'ospfSupport': 'false', 'pid': 'ISR4451-X/K9', 'portMode': 'routed',
+         'portName': 'GigabitEthernet0/0/{}'.format(i),
+         'serialNo': 'FTX1842AHM1', 'series': 'Cisco 4400', 'status': 'up',
+         'voiceVlan': None}
+        for i in range(3)]
+
+    # device-2 was added after the inventory was fetched
+    devices = [{'id': 'device-0', 'hostname': 'router-0'},
+               {'id': 'device-1', 'hostname': 'router-1'}]
+
+    requests = []
+
+    # Serve all the records whatever offset and limit are
+    ignore_paging = False
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        self.requests.append(url.path)
+        if url.path == '/dna/intent/api/v1/interface':
+            response = self._page(self.interfaces, query)
+        elif url.path == '/dna/intent/api/v1/network-device':
+            response = self._page(self.devices, query)
+        else:
+            device_id = url.path.rsplit('/', 1)[-1]
+            response = {'id': device_id,
+                        'hostname': device_id.replace('device', 'router')}
+
+        body = json.dumps({'response': response}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _page(self, records, query):
+        if self.ignore_paging:
+            return records
+        offset = int(query['offset'][0]) - 1
+        return records[offset:offset + int(query['limit'][0])]
+
+    def log_message(self, *args):
+        pass
+
+
+class _RestDevice(object):
+    '''Device sending its requests to a local server'''
+
+    def __init__(self, url):
+        self.url = url
+        self.session = requests.Session()
+
+    def get(self, api_url):
+        return self.session.get(self.url + api_url)
+
+
+class TestInterfaceRestServer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = HTTPServer(('127.0.0.1', 0), _DnacHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.device = _RestDevice(
+            'http://127.0.0.1:{}'.format(cls.server.server_port))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.device.session.close()
+
+    def setUp(self):
+        clear_hostname_cache()
+        _DnacHandler.requests = []
+        self.addCleanup(clear_hostname_cache)
+
+    def check(self, parsed_output):
+        self.assertEqual(sorted(parsed_output['hostname']),
+                         ['router-0', 'router-1', 'router-2'])
+        self.assertEqual(
+            parsed_output['hostname']['router-2']['interfaces']
+                         ['GigabitEthernet0/0/2']['ifIndex'], '2')
+
+    @patch.object(interface, 'PAGE_SIZE', 2)
+    def test_lookups(self):
+        self.check(Interface(device=self.device).parse())
+        # 2 pages of interfaces, then each device looked up
+        self.assertEqual(_DnacHandler.requests.count(
+            '/dna/intent/api/v1/interface'), 2)
+        self.assertEqual(len(_DnacHandler.requests), 5)
+
+        # Hostnames are kept between calls
+        self.check(Interface(device=self.device).parse())
+        self.assertEqual(len(_DnacHandler.requests), 7)
+
+    @patch.object(interface, 'PAGE_SIZE', 2)
+    @patch.object(interface, 'BULK_LOOKUP_THRESHOLD', 1)
+    def test_bulk_inventory(self):
+        self.check(Interface(device=self.device).parse())
+        self.assertEqual(_DnacHandler.requests, [
+            '/dna/intent/api/v1/interface',
+            '/dna/intent/api/v1/interface',
+            '/dna/intent/api/v1/network-device',
+            '/dna/intent/api/v1/network-device',
+            '/dna/intent/api/v1/network-device/device-2'])
+
+    @patch.object(interface, 'PAGE_SIZE', 2)
+    @patch.object(_DnacHandler, 'ignore_paging', True)
+    def test_paging_ignored(self):
+        self.check(Interface(device=self.device).parse())
+        # The second page repeats the first one
+        self.assertEqual(_DnacHandler.requests.count(
+            '/dna/intent/api/v1/interface'), 2)
+
+    @patch.object(interface, 'PAGE_SIZE', 1)
+    @patch.object(interface, 'MAX_PAGES', 2)
+    def test_max_pages(self):
+        records = interface.get_paged(self.device,
+                                      '/dna/intent/api/v1/interface')
+        self.assertEqual([record['ifIndex'] for record in records],
+                         ['0', '1'])
+
+    def test_hostname_ttl(self):
+        Interface(device=self.device).parse()
+        with patch.object(interface.time, 'monotonic',
+                          return_value=interface.time.monotonic() +
+                          interface.HOSTNAME_TTL + 1):
+            Interface(device=self.device).parse()
+        self.assertEqual(len(_DnacHandler.requests), 8)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -115,6 +115,11 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 # Parser
 from genie.libs.parser.iosxe.show_vrf import ShowVrf
+from genie.libs.parser.utils.device_cache import cached_execute, \
+                                                 cached_parse
+from genie.libs.parser.utils.fanout import execute_many
+from genie.libs.parser.utils.running_config import running_config, \
+                                                   execute_config
 
 
 # ============================================
@@ -1855,8 +1860,7 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
         show_vrf_output = None
         if ('rd' in cmd and 'summary' in cmd and
             output != '% RD does not match the default RD of any VRF'):
-            obj = ShowVrf(device=self.device)
-            show_vrf_output = obj.parse()
+            show_vrf_output = cached_parse(ShowVrf, self.device)
             # try:
             #     show_vrf_output = obj.parse()
             # except Exception:
@@ -1875,8 +1879,14 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                     commands_list = ['show run | sec address-family ipv4 vrf',
                                      'show run | sec address-family ipv6 vrf']
                 
-                for command in commands_list:
-                    out_vrf = self.device.execute(command)
+                if running_config(self.device) is not None:
+                    # Answered from the running-config of the session
+                    outputs = [execute_config(self.device, command)
+                               for command in commands_list]
+                else:
+                    outputs = execute_many(self.device, commands_list)
+
+                for out_vrf in outputs:
 
                     rc1 = re.compile(r'address\-family\s+(?P<address_family>'
                                       'ipv4|ipv6)\s+vrf\s+(?P<vrf>\S+)')
@@ -4394,7 +4404,8 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
                             '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
 
         # Get VRF name by executing 'show bgp all neighbors | i BGP neighbor'
-        out_vrf = self.device.execute('show bgp all neighbors | i BGP neighbor')
+        out_vrf = cached_execute(self.device,
+                                 'show bgp all neighbors | i BGP neighbor')
         vrf = 'default'
         for line in out_vrf.splitlines():
             line = line.strip()
@@ -5052,7 +5063,8 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
                             '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
 
         # Get VRF name by executing 'show bgp all neighbors | i BGP neighbor'
-        out_vrf = self.device.execute('show bgp all neighbors | i BGP neighbor')
+        out_vrf = cached_execute(self.device,
+                                 'show bgp all neighbors | i BGP neighbor')
         vrf = 'default'
         for line in out_vrf.splitlines():
             line = line.strip()
@@ -5620,7 +5632,8 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
 
         if not vrf:
             # Get VRF name by executing 'show bgp all neighbors | i BGP neighbor'
-            out_vrf = self.device.execute('show bgp all neighbors | i BGP neighbor')
+            out_vrf = cached_execute(
+                self.device, 'show bgp all neighbors | i BGP neighbor')
             vrf='default'
             p = re.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
                             '(, +vrf +(?P<vrf>[0-9A-Za-z]+))?, +remote AS '
@@ -6227,7 +6240,7 @@ class ShowBgpAllClusterIds(ShowBgpAllClusterIdsSchema):
         # find vrf names
         # show vrf detail | inc \(VRF
         cmd_vrfs = 'show vrf detail | inc \(VRF'
-        out_vrf = self.device.execute(cmd_vrfs)
+        out_vrf = cached_execute(self.device, cmd_vrfs)
         vrf_dict = {'0':'default'}
         p = re.compile(r'^\s*VRF +(?P<vrf_name>[0-9a-zA-Z]+)'
                         ' +\(+VRF +Id += +(?P<vrf_id>[0-9]+)+\)+;'
@@ -20,6 +20,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.columnar import Table, CODES, INTEGERS, VALUES
 
 
 class ShowMacAddressTableSchema(MetaParser):
@@ -60,19 +61,88 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
     cli_command = ['show mac address-table',
                    'show mac address-table vlan {vlan}']
 
+    # Columns of the Table returned by columns(), one row per interface or
+    # drop of each mac address
+    COLUMNS = (('vlan', CODES), ('mac', CODES), ('interface', CODES),
+               ('drop', CODES), ('entry_type', CODES), ('entry', CODES),
+               ('learn', CODES), ('age', INTEGERS), ('protocols', VALUES))
+
+    def get_command(self, vlan=''):
+        """Return the command of cli_command for the arguments"""
+        if vlan:
+            return self.cli_command[1].format(vlan=vlan)
+        return self.cli_command[0]
+
     def cli(self, vlan='', output=None):
         if output is None:
             # get output from device
-            if vlan:
-                out = self.device.execute(self.cli_command[1].format(vlan=vlan))
-            else:
-                out = self.device.execute(self.cli_command[0])
+            out = self.device.execute(self.get_command(vlan=vlan))
         else:
             out = output
 
         # initial return dictionary
-        ret_dict = mac_dict = {}
+        ret_dict = {}
+        for row in self._rows(out, ret_dict):
+            self._merge_row(ret_dict, row)
+
+        return ret_dict
+
+    def columns(self, vlan='', output=None):
+        """Parse the output into a Table of COLUMNS, see utils.columnar.
+           table_to_dict() converts it to the cli() result."""
+        if output is None:
+            out = self.device.execute(self.get_command(vlan=vlan))
+        else:
+            out = output
+
+        table = Table(self.COLUMNS)
+        for row in self._rows(out, table.meta):
+            table.append(row)
+
+        return table
+
+    @classmethod
+    def table_to_dict(cls, table):
+        """Return the cli() result of a Table returned by columns()"""
+        ret_dict = {}
+        for row in table.rows():
+            cls._merge_row(ret_dict, row)
+        ret_dict.update(table.meta)
+
+        return ret_dict
+
+    @staticmethod
+    def _merge_row(ret_dict, row):
+        """Add a row of COLUMNS to the cli() result"""
+        vlan = row['vlan']
+        vlan_dict = ret_dict.setdefault('mac_table', {}) \
+            .setdefault('vlans', {}).setdefault(str(vlan), {})
+        vlan_dict['vlan'] = vlan
+        mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
+                            .setdefault(row['mac'], {})
+        mac_dict.update({'mac_address': row['mac']})
+
+        if row.get('drop'):
+            drop_dict = mac_dict.setdefault('drop', {})
+            drop_dict.update({'drop': True})
+            drop_dict.update({'entry_type': row['entry_type']})
+            return
+
+        intf = row['interface']
+        intf_dict = mac_dict.setdefault('interfaces', {}) \
+                            .setdefault(intf, {})
+        intf_dict.update({'interface': intf})
+        for key in ('entry_type', 'entry', 'learn', 'age'):
+            if row.get(key) is not None:
+                intf_dict.update({key: row[key]})
+        if row.get('protocols') is not None:
+            intf_dict.update({'protocols': list(row['protocols'])})
+
+    def _rows(self, out, meta):
+        """Yield the rows of COLUMNS of the output, and set the values of
+           the whole output in meta"""
         entry_type = entry = learn = age = ''
+        mac_row = None
 
         # Total Mac Addresses for this criterion: 93
         p1 = re.compile(r'^Total +Mac +Addresses +for +this +criterion: +(?P<val>\d+)$')
@@ -100,14 +170,14 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                         r'+(?P<mac>[\w.]+) +(?P<entry_type>\w+) '
                         r'+(?P<protocols>[\w\,]+) '
                         r'+(?P<intfs>\S+|[^\s]+\s[^\s]+)$')
-        
+
         for line in out.splitlines():
             line = line.strip()
 
             # Total Mac Addresses for this criterion: 93
             m = p1.match(line)
             if m:
-                ret_dict.update({'total_mac_addresses': int(m.groupdict()['val'])})
+                meta.update({'total_mac_addresses': int(m.groupdict()['val'])})
                 continue
 
             # 10    aaaa.bbff.8888    STATIC      Gi1/0/8 Gi1/0/9
@@ -116,60 +186,42 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
             m = p2.match(line)
             if m:
                 group = m.groupdict()
-                mac = group['mac']
-                vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
-                                          else group['vlan'].lower()
+                mac_row = self._mac_row(group)
                 intfs = group['intfs'].strip()
-                vlan_dict = ret_dict.setdefault('mac_table', {}) \
-                .setdefault('vlans', {}).setdefault(str(vlan), {})
-                vlan_dict['vlan'] = vlan
-                mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
-                                    .setdefault(mac, {})
-                mac_dict.update({'mac_address': mac})
 
                 if 'drop' in intfs.lower():
-                    drop_dict = mac_dict.setdefault('drop', {})
-                    drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': group['entry_type'].lower()})
+                    yield dict(mac_row, drop=True,
+                               entry_type=group['entry_type'].lower())
                     continue
 
+                entry_type = group['entry_type'].lower()
+                if group['entry']:
+                    entry = group['entry'].strip()
                 for intf in intfs.replace(' ',',').split(','):
-                    intf = Common.convert_intf_name(intf)
-                    intf_dict = mac_dict.setdefault('interfaces', {}) \
-                                        .setdefault(intf, {})
-                    intf_dict.update({'interface': intf})
-                    entry_type = group['entry_type'].lower()
-                    intf_dict.update({'entry_type': entry_type})
-                    if group['entry']:
-                        entry = group['entry'].strip()
-                        intf_dict.update({'entry': entry})
+                    yield dict(mac_row,
+                               interface=Common.convert_intf_name(intf),
+                               entry_type=entry_type,
+                               entry=entry if group['entry'] else None)
                 continue
 
             # Gi1/9,Gi1/10,Gi1/11,Gi1/12
             #               Router,Switch
             m = p3.match(line)
-            if m:
+            if m and mac_row:
                 group = m.groupdict()
                 intfs = group['intfs'].strip()
 
                 if 'drop' in intfs.lower():
-                    drop_dict = mac_dict.setdefault('drop', {})
-                    drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': entry_type})
+                    yield dict(mac_row, drop=True, entry_type=entry_type)
                     continue
 
                 for intf in intfs.split(','):
-                    intf = Common.convert_intf_name(intf)
-                    intf_dict = mac_dict.setdefault('interfaces', {}) \
-                                        .setdefault(intf, {})
-                    intf_dict.update({'interface': intf})
-                    intf_dict.update({'entry_type': entry_type})
-                    if entry:
-                        intf_dict.update({'entry': entry})
-                    if learn:
-                        intf_dict.update({'learn': learn})
-                    if age:
-                        intf_dict.update({'age': age})
+                    yield dict(mac_row,
+                               interface=Common.convert_intf_name(intf),
+                               entry_type=entry_type,
+                               entry=entry or None,
+                               learn=learn or None,
+                               age=age or None)
                 continue
 
             # *  101  44dd.eeff.55bb   dynamic  Yes         10   Gi1/40
@@ -179,81 +231,62 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
             m = p4.match(line)
             if m:
                 group = m.groupdict()
-                mac = group['mac']
-                vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
-                                          else group['vlan'].lower()
+                mac_row = self._mac_row(group)
                 intfs = group['intfs'].strip()
-                vlan_dict = ret_dict.setdefault('mac_table', {}) \
-                .setdefault('vlans', {}).setdefault(str(vlan), {})
-                vlan_dict['vlan'] = vlan
-                mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
-                                    .setdefault(mac, {})
-                mac_dict.update({'mac_address': mac})
 
                 if 'drop' in intfs.lower():
-                    drop_dict = mac_dict.setdefault('drop', {})
-                    drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': group['entry_type'].lower()})
+                    yield dict(mac_row, drop=True,
+                               entry_type=group['entry_type'].lower())
                     continue
 
+                entry_type = group['entry_type'].lower()
+                if group['entry']:
+                    entry = group['entry'].strip()
+                if group['learn']:
+                    learn = group['learn']
+                if group['age']:
+                    age = int(group['age']) if group['age'].isdigit() \
+                        else None
                 for intf in intfs.split(','):
-                    intf = Common.convert_intf_name(intf)
-                    intf_dict = mac_dict.setdefault('interfaces', {}) \
-                                        .setdefault(intf, {})
-                    intf_dict.update({'interface': intf})
-                    entry_type = group['entry_type'].lower()
-                    intf_dict.update({'entry_type': entry_type})
-                    if group['entry']:
-                        entry = group['entry'].strip()
-                        intf_dict.update({'entry': entry})
-                    if group['learn']:
-                        learn = group['learn']
-                        intf_dict.update({'learn': learn})
-                    if group['age']:
-                        if group['age'].isdigit():
-                            age = int(group['age'])
-                            intf_dict.update({'age': age})
-                        else:
-                            age = None
+                    yield dict(mac_row,
+                               interface=Common.convert_intf_name(intf),
+                               entry_type=entry_type,
+                               entry=entry if group['entry'] else None,
+                               learn=learn if group['learn'] else None,
+                               age=age if group['age'] else None)
                 continue
 
             # 964    0000.0000.0000   dynamic ip,ipx                Router
             m = p5.match(line)
             if m:
                 group = m.groupdict()
-                mac = group['mac']
-                vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
-                                          else group['vlan'].lower()
+                mac_row = self._mac_row(group)
                 intfs = group['intfs'].strip()
-                vlan_dict = ret_dict.setdefault('mac_table', {}) \
-                .setdefault('vlans', {}).setdefault(str(vlan), {})
-                vlan_dict['vlan'] = vlan
-                mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
-                                    .setdefault(mac, {})
-                mac_dict.update({'mac_address': mac})
 
                 if 'drop' in intfs.lower():
-                    drop_dict = mac_dict.setdefault('drop', {})
-                    drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': group['entry_type'].lower()})
+                    yield dict(mac_row, drop=True,
+                               entry_type=group['entry_type'].lower())
                     continue
 
+                entry_type = group['entry_type'].lower()
+                if group['entry']:
+                    entry = group['entry'].strip()
+                protocols = group['protocols'].split(',') \
+                    if group['protocols'] else None
                 for intf in intfs.replace(' ',',').split(','):
-                    intf = Common.convert_intf_name(intf)
-                    intf_dict = mac_dict.setdefault('interfaces', {}) \
-                                        .setdefault(intf, {})
-                    intf_dict.update({'interface': intf})
-                    entry_type = group['entry_type'].lower()
-                    intf_dict.update({'entry_type': entry_type})
-                    if group['entry']:
-                        entry = group['entry'].strip()
-                        intf_dict.update({'entry': entry})
-
-                    if group['protocols']:
-                        intf_dict.update({'protocols': group['protocols'].split(',')})
+                    yield dict(mac_row,
+                               interface=Common.convert_intf_name(intf),
+                               entry_type=entry_type,
+                               entry=entry if group['entry'] else None,
+                               protocols=protocols)
                 continue
 
-        return ret_dict
+    @staticmethod
+    def _mac_row(group):
+        """Return the vlan and mac columns of a matched entry"""
+        vlan = int(group['vlan']) if re.search(r'\d+', group['vlan']) \
+                                  else group['vlan'].lower()
+        return {'vlan': vlan, 'mac': group['mac']}
 
 
 class ShowMacAddressTableAgingTimeSchema(MetaParser):
@@ -8,6 +8,7 @@ IOSXE parsers for the following show commands:
 
 # Python
 import re
+import copy
 
 # Metaparser
 from genie.metaparser import MetaParser
@@ -15,6 +16,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, And, D
 
 # Common
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.columnar import Table, CODES, INTEGERS
 
 # =========================================================
 # Schema for 'show flow monitor {name} cache format table'
@@ -214,6 +216,11 @@ class ShowFlowMonitorCache(ShowFlowMonitorCacheSchema):
 
     cli_command = 'show flow monitor {name} cache'
 
+    # Columns of the Table returned by columns(), one row per entry
+    COLUMNS = (('ip_vrf_id_input', CODES), ('ipv4_src_addr', CODES),
+               ('ipv4_dst_addr', CODES), ('intf_input', CODES),
+               ('intf_output', CODES), ('pkts', INTEGERS))
+
     def cli(self, name, output=None):
         if output is None:
             cmd = self.cli_command.format(name=name)
@@ -223,7 +230,39 @@ class ShowFlowMonitorCache(ShowFlowMonitorCacheSchema):
 
         # Init vars
         ret_dict = {}
-        index = 0
+        for index, row in enumerate(self._rows(out, ret_dict), 1):
+            ret_dict.setdefault('entries', {}).setdefault(index, {}) \
+                    .update(row)
+
+        return ret_dict
+
+    def columns(self, name, output=None):
+        '''Parse the output into a Table of COLUMNS, see utils.columnar.
+           table_to_dict() converts it to the cli() result.'''
+        if output is None:
+            out = self.device.execute(self.cli_command.format(name=name))
+        else:
+            out = output
+
+        table = Table(self.COLUMNS)
+        for row in self._rows(out, table.meta):
+            table.append(row)
+
+        return table
+
+    @staticmethod
+    def table_to_dict(table):
+        '''Return the cli() result of a Table returned by columns()'''
+        ret_dict = copy.deepcopy(table.meta)
+        for index, row in enumerate(table.rows(), 1):
+            ret_dict.setdefault('entries', {})[index] = row
+
+        return ret_dict
+
+    def _rows(self, out, meta):
+        '''Yield the entries of the output, as rows of COLUMNS, and set the
+           values of the whole output in meta'''
+        entry_dict = None
 
         # Cache type:                               Normal (Platform cache)
         p1 = re.compile(r'^Cache +type: +(?P<cache_type>[\S\s]+)$')
@@ -279,42 +318,42 @@ class ShowFlowMonitorCache(ShowFlowMonitorCacheSchema):
             m = p1.match(line)
             if m:
                 group = m.groupdict()
-                ret_dict.update({'cache_type': group['cache_type']})
+                meta.update({'cache_type': group['cache_type']})
                 continue
 
             # Cache size:                                   16
             m = p2.match(line)
             if m:
                 group = m.groupdict()
-                ret_dict.update({'cache_size': int(group['cache_size'])})
+                meta.update({'cache_size': int(group['cache_size'])})
                 continue
             
             # Current entries:                               1
             m = p3.match(line)
             if m:
                 group = m.groupdict()
-                ret_dict.update({'current_entries': int(group['current_entries'])})
+                meta.update({'current_entries': int(group['current_entries'])})
                 continue
 
             # High Watermark:                                1
             m = p4.match(line)
             if m:
                 group = m.groupdict()
-                ret_dict.update({'high_water_mark': int(group['high_water_mark'])})
+                meta.update({'high_water_mark': int(group['high_water_mark'])})
                 continue
 
             # Flows added:                                   1
             m = p5.match(line)
             if m:
                 group = m.groupdict()
-                ret_dict.update({'flows_added': int(group['flows_added'])})
+                meta.update({'flows_added': int(group['flows_added'])})
                 continue
 
             # Flows aged:                                   0
             m = p6.match(line)
             if m:
                 group = m.groupdict()
-                aged_dict = ret_dict.setdefault('flows_aged', {})
+                aged_dict = meta.setdefault('flows_aged', {})
                 aged_dict.update({'total': int(group['flows_aged'])})
                 continue
 
@@ -323,6 +362,7 @@ class ShowFlowMonitorCache(ShowFlowMonitorCacheSchema):
             if m:
                 group = m.groupdict()
                 key = group['key'].lower().replace(' ', '_')
+                aged_dict = meta.setdefault('flows_aged', {})
                 aged_dict.update({key: int(group['value'])})
 
                 secs = group['secs']
@@ -333,9 +373,10 @@ class ShowFlowMonitorCache(ShowFlowMonitorCacheSchema):
             # 0   (DEFAULT)   192.168.189.254    192.168.189.253    Null   Te0/0/0.1003     2
             m = p8.match(line)
             if m:
-                index += 1
+                if entry_dict is not None:
+                    yield entry_dict
                 group = m.groupdict()
-                entry_dict = ret_dict.setdefault('entries', {}).setdefault(index, {})
+                entry_dict = {}
 
                 entry_dict.update({'ip_vrf_id_input': group['ip_vrf_id_input']})
                 entry_dict.update({'ipv4_src_addr': group['ipv4_src_addr']})
@@ -348,48 +389,50 @@ class ShowFlowMonitorCache(ShowFlowMonitorCacheSchema):
             # IP VRF ID INPUT:           0          (DEFAULT)
             m = p9.match(line)
             if m:
-                index += 1
+                if entry_dict is not None:
+                    yield entry_dict
                 group = m.groupdict()
-                entry_dict = ret_dict.setdefault('entries', {}).setdefault(index, {})
+                entry_dict = {}
                 entry_dict.update({'ip_vrf_id_input': group['id']})
                 continue
 
             # IPV4 SOURCE ADDRESS:       192.168.189.254
             m = p10.match(line)
-            if m:
+            if m and entry_dict is not None:
                 group = m.groupdict()
                 entry_dict.update({'ipv4_src_addr': group['src']})
                 continue
 
             # IPV4 DESTINATION ADDRESS:  192.168.189.253
             m = p11.match(line)
-            if m:
+            if m and entry_dict is not None:
                 group = m.groupdict()
                 entry_dict.update({'ipv4_dst_addr': group['dst']})
                 continue
 
             # interface input:           Null
             m = p12.match(line)
-            if m:
+            if m and entry_dict is not None:
                 group = m.groupdict()
                 entry_dict.update({'intf_input': Common.convert_intf_name(group['input'])})
                 continue
 
             # interface output:          Te0/0/0.1003
             m = p13.match(line)
-            if m:
+            if m and entry_dict is not None:
                 group = m.groupdict()
                 entry_dict.update({'intf_output': Common.convert_intf_name(group['output'])})
                 continue
 
             # counter packets:           3
             m = p14.match(line)
-            if m:
+            if m and entry_dict is not None:
                 group = m.groupdict()
                 entry_dict.update({'pkts': int(group['pkts'])})
                 continue
 
-        return ret_dict
+        if entry_dict is not None:
+            yield entry_dict
 
 
 class ShowFlowMonitorCacheRecord(ShowFlowMonitorCache):
@@ -21,6 +21,7 @@ from genie.metaparser.util.schemaengine import (Schema,
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.columnar import Table, CODES, INTEGERS
 
 
 class ShowIpNatTranslationsSchema(MetaParser):
@@ -74,21 +75,88 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
                    'show ip nat translations vrf {vrf}',
                    'show ip nat translations vrf {vrf} verbose']
 
+    # Columns of the Table returned by columns(), one row per translation
+    COLUMNS = (('vrf', CODES), ('protocol', CODES), ('inside_global', CODES),
+               ('inside_local', CODES), ('outside_local', CODES),
+               ('outside_global', CODES), ('group_id', INTEGERS),
+               ('time_left', CODES), ('create', CODES), ('use', CODES),
+               ('timeout', CODES), ('map_id_in', INTEGERS),
+               ('mac_address', CODES), ('input_idb', CODES),
+               ('entry_id', CODES), ('use_count', INTEGERS))
+
+    # Columns under 'details' in the cli() result
+    DETAILS = ('create', 'use', 'timeout', 'map_id_in', 'mac_address',
+               'input_idb', 'entry_id', 'use_count')
+
+    def get_command(self, vrf=None, option=None):
+        if option and vrf is None:
+            return self.cli_command[1].format(verbose=option)
+        elif option and vrf:
+            return self.cli_command[3].format(vrf=vrf, verbose=option)
+        elif vrf and option is None:
+            return self.cli_command[2].format(vrf=vrf)
+        return self.cli_command[0]
+
     def cli(self, vrf=None, option=None, output=None):
         if output is None:
-            if option and vrf is None:
-                cmd = self.cli_command[1].format(verbose=option)
-            elif option and vrf:
-                cmd = self.cli_command[3].format(vrf=vrf, verbose=option)
-            elif vrf and option is None:
-                cmd = self.cli_command[2].format(vrf=vrf)
-            else:
-                cmd = self.cli_command[0]
+            out = self.device.execute(self.get_command(vrf=vrf, option=option))
+        else:
+            out = output
+
+        # initialize variables
+        ret_dict = {}
+        meta = {}
+
+        for index, row in enumerate(self._rows(out, meta), 1):
+            self._merge_row(ret_dict, index, row)
+
+        if meta:
+            ret_dict.setdefault('vrf', {}).update(meta)
 
-            out = self.device.execute(cmd)
+        return ret_dict
+
+    def columns(self, vrf=None, option=None, output=None):
+        '''Parse the output into a Table of COLUMNS, see utils.columnar.
+           table_to_dict() converts it to the cli() result.'''
+        if output is None:
+            out = self.device.execute(self.get_command(vrf=vrf, option=option))
         else:
             out = output
 
+        table = Table(self.COLUMNS)
+        for row in self._rows(out, table.meta):
+            table.append(row)
+
+        return table
+
+    @classmethod
+    def table_to_dict(cls, table):
+        '''Return the cli() result of a Table returned by columns()'''
+        ret_dict = {}
+        for index, row in enumerate(table.rows(), 1):
+            cls._merge_row(ret_dict, index, row)
+
+        if table.meta:
+            ret_dict.setdefault('vrf', {}).update(table.meta)
+
+        return ret_dict
+
+    @classmethod
+    def _merge_row(cls, ret_dict, index, row):
+        index_dict = ret_dict.setdefault('vrf', {}) \
+            .setdefault(row['vrf'], {}).setdefault('index', {}) \
+            .setdefault(index, {})
+        for key, value in row.items():
+            if key == 'vrf' or value is None:
+                continue
+            if key in cls.DETAILS:
+                index_dict.setdefault('details', {})[key] = value
+            else:
+                index_dict[key] = value
+
+    def _rows(self, out, meta):
+        '''Yield the translations of the output, as rows of COLUMNS, and
+           set the values of the whole output in meta'''
         # udp  10.5.5.1:1025          192.0.2.1:4000 --- ---
         # udp  10.5.5.1:1024          192.0.2.3:4000 --- ---
         # udp  10.5.5.1:1026          192.0.2.2:4000 --- ---
@@ -135,76 +203,44 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
         # Format(H:M:S) Time-left :0:0:-1
         p8 = re.compile(r'^Format\S+ +Time\-left +\:(?P<time_left>\S+)$')
 
-        # initialize variables
-        ret_dict = {}
-        index_dict = {}
-        tmp_dict = {}
-        index = 1
-        m8_index = 1
-        vrf_name = ''
-        vrf_flag = False
+        # The vrf of the first translation is the vrf of the output
+        vrf_name = 'default'
+        row = None
+        index = 0
 
         for line in out.splitlines():
             line = line.strip()
 
             # udp  10.5.5.1:1025          192.0.2.1:4000 --- ---
-            # udp  10.5.5.1:1024          192.0.2.3:4000 --- ---
-            # udp  10.5.5.1:1026          192.0.2.2:4000 --- ---
             # --- 172.16.94.209     192.168.1.95 --- ---
-            # --- 172.16.94.210     192.168.1.89 --- ---
-            # udp 172.16.94.209:1220  192.168.1.95:1220  172.16.169.132:53    172.16.169.132:53
-            # tcp 172.16.94.209:11012 192.168.1.89:11012 172.16.196.220:23    172.16.196.220:23
-            # tcp 172.16.94.209:1067  192.168.1.95:1067  172.16.196.161:23    172.16.196.161:23
             # any ---                ---                10.1.0.2          10.144.0.2
             m1 = p1.match(line)
             if m1:
-                group = m1.groupdict()
-                if 'vrf' in ret_dict:
-                    if vrf_flag:
-                        protocol_dict = index_dict.setdefault(index, {})
-                        protocol_dict.update(group)
-                        
-                    elif vrf_flag == False and index >= 2:
-                        default_dict = vrf_dict.setdefault('default', {})
-                        index_dict = default_dict.setdefault('index', {})
-                        protocol_dict = index_dict.setdefault(index, {})
-                        protocol_dict.update(group)
-                        
-                        if tmp_dict:
-                            default_dict = vrf_dict.setdefault('default', {})
-                            index_dict = default_dict.setdefault('index', {})
-                            protocol_dict = index_dict.setdefault(index, {})
-                            vrf_dict['default']['index'].update(tmp_dict)
-                            tmp_dict.clear()
-
-                else:
-                    vrf_dict = ret_dict.setdefault('vrf', {})
-
-                    itemp_dict = tmp_dict.setdefault(index, {})
-
-                    itemp_dict.update(group)
-                    
-                    protocol_dict = index_dict.setdefault(index, {})
-                    
+                # The lines following a translation complete it
+                if row is not None:
+                    row['vrf'] = vrf_name
+                    yield row
+                row = m1.groupdict()
                 index += 1
+                continue
 
+            # Total number of translations: 3
+            m6 = p6.match(line)
+            if m6:
+                meta.update({'number_of_translations':
+                             int(m6.groupdict()['number_of_translations'])})
                 continue
-            
+
+            if row is None:
+                continue
+
             # create: 02/15/12 11:38:01, use: 02/15/12 11:39:02, timeout: 00:00:00
             # create 04/09/11 10:51:48, use 04/09/11 10:52:31, timeout: 00:01:00
             m2 = p2.match(line)
             if m2:
-                group = m2.groupdict()
-                if protocol_dict:
-                    details_dict = protocol_dict.setdefault('details', {})
-                    details_dict.update(group)
-                        
-                else:
-                    tmp_details_dict = tmp_dict[1].setdefault('details', {})
-                    tmp_details_dict.update(group)
-
+                row.update(m2.groupdict())
                 continue
-            
+
             # IOS-XE: 
             # Map-Id(In): 1
             # IOS: 
@@ -212,22 +248,13 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
             m3 = p3.match(line)
             if m3:
                 group = m3.groupdict()
+                row.update({'map_id_in': int(group['map_id_in'])})
 
-                if protocol_dict:
-                    details_dict.update({'map_id_in': int(group['map_id_in'])})
+                if group['mac_address']:
+                    row.update({'mac_address': group['mac_address']})
 
-                    if group['mac_address']:
-                        details_dict.update({'mac_address': group['mac_address']})
-                    
-                    if group['input_idb']:
-                        details_dict.update({'input_idb': group['input_idb']})
-
-                else:
-                    tmp_details_dict.update(
-                        {'mac_address': group['mac_address']})
-                    tmp_details_dict.update({'input_idb': group['input_idb']})
-                    tmp_details_dict.update(
-                        {'map_id_in': int(group['map_id_in'])})
+                if group['input_idb']:
+                    row.update({'input_idb': group['input_idb']})
 
                 continue
 
@@ -235,78 +262,35 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
             # Mac-Address: 0000.0000.0000    Input-IDB: TenGigabitEthernet1/1/0
             m4 = p4.match(line)
             if m4:
-                group = m4.groupdict()
-
-                if protocol_dict:
-                    details_dict.update(group)
-                else:
-                    tmp_details_dict.update(group)
-
+                row.update(m4.groupdict())
                 continue
-            
+
             # entry-id: 0x0, use_count:1
             m5 = p5.match(line)
             if m5:
                 group = m5.groupdict()
-                if protocol_dict:
-                    details_dict.update({'entry_id': group['entry_id']})
-                    details_dict.update({'use_count': int(group['use_count'])})
-
-                else:
-                    tmp_details_dict.update({'entry_id': group['entry_id']})
-                    tmp_details_dict.update(
-                        {'use_count': int(group['use_count'])})
-
-                if tmp_dict:
-                    default_dict = vrf_dict.setdefault('default', {})
-                    index_dict = default_dict.setdefault('index', {})
-                    protocol_dict = index_dict.setdefault(index, {})   
-                    vrf_dict['default']['index'].update(tmp_dict)
-                    tmp_dict.clear()
-
-                continue
-            
-            # Total number of translations: 3
-            m6 = p6.match(line)
-            if m6:
-
-                anumber = int(m6.groupdict()['number_of_translations'])
-                total_dict = ret_dict.setdefault('vrf', {})
-                total_dict.update({'number_of_translations': anumber})
-
+                row.update({'entry_id': group['entry_id']})
+                row.update({'use_count': int(group['use_count'])})
                 continue
 
             # Group_id:0   vrf: genie
             m7 = p7.match(line)
             if m7:
                 group = m7.groupdict()
-                vrf_name = group['vrf_name']
-                if tmp_dict:
-                    vrf_name_dict = vrf_dict.setdefault(group['vrf_name'], {})
-                    index_dict = vrf_name_dict.setdefault('index', {})
-                    tmp_dict[1].update({'group_id': int(group['group_id'])})
-                    vrf_flag = True
-
-                else:
-                    protocol_dict.update({'group_id': int(group['group_id'])})
-                
+                row.update({'group_id': int(group['group_id'])})
+                if index == 1:
+                    vrf_name = group['vrf_name']
                 continue
 
             # Format(H:M:S) Time-left :0:0:-1
             m8 = p8.match(line)
             if m8:
-                time_left = m8.groupdict()['time_left']
-                if tmp_dict:
-                    m8_dict = vrf_name_dict.setdefault('index', {})
-                    tmp_dict[1].update({'time_left': time_left})
-                    vrf_dict[vrf_name]['index'].update(tmp_dict)
-                    tmp_dict.clear()
-                else:
-                    protocol_dict.update({'time_left': time_left})
-
+                row.update({'time_left': m8.groupdict()['time_left']})
                 continue
 
-        return ret_dict
+        if row is not None:
+            row['vrf'] = vrf_name
+            yield row
 
 
 class ShowIpNatStatisticsSchema(MetaParser):
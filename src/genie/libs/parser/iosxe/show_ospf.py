@@ -40,6 +40,8 @@ from netaddr import IPAddress, IPNetwork
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.running_config import config_section, \
+    config_include
 
 # ===========================================================
 # Schema for:
@@ -2007,8 +2009,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
 
                     # Execute command to get virtual-link transit_area_id
                     if vl_addr is not None:
-                        cmd = 'show running-config | i virtual-link | i {addr}'.format(addr=vl_addr)
-                        out = self.device.execute(cmd)
+                        out = config_include(self.device, 'virtual-link', vl_addr)
 
                         for line in out.splitlines():
                             line = line.rstrip()
@@ -2047,8 +2048,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
 
                     # Execute command to get sham-link local_id
                     if sl_remote_id is not None:
-                        cmd = 'show running-config | i sham-link | i {remote}'.format(remote=sl_remote_id)
-                        out = self.device.execute(cmd)
+                        out = config_include(self.device, 'sham-link', sl_remote_id)
 
                         for line in out.splitlines():
                             line = line.rstrip()
@@ -2070,8 +2070,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                         intf_name = '{} {}'.format(sl_local_id, sl_remote_id)
 
                 # Get VRF information based on OSPF instance
-                cmd = 'show running-config | section router ospf {}'.format(instance)
-                out = self.device.execute(cmd)
+                out = config_section(self.device, 'router ospf {}'.format(instance))
 
                 for line in out.splitlines():
                     line = line.rstrip()
@@ -2657,8 +2656,7 @@ class ShowIpOspfLinksParser(MetaParser):
 
                 # Get VRF information using the ospf instance
                 if instance is not None:
-                    cmd = 'show running-config | section router ospf {}'.format(instance)
-                    out = self.device.execute(cmd)
+                    out = config_section(self.device, 'router ospf {}'.format(instance))
 
                     for line in out.splitlines():
                         line = line.rstrip()
@@ -3363,8 +3361,7 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
 
                 # Get VRF information using the ospf instance
                 if instance is not None:
-                    cmd = 'show running-config | section router ospf {}'.format(instance)
-                    out = self.device.execute(cmd)
+                    out = config_section(self.device, 'router ospf {}'.format(instance))
 
                     for line in out.splitlines():
                         line = line.rstrip()
@@ -3427,8 +3424,7 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
 
                     # Execute command to get virtual-link transit_area_id
                     if vl_addr is not None and router_id is not None:
-                        cmd = 'show running-config | i virtual-link | i {addr}'.format(addr=vl_addr)
-                        out = self.device.execute(cmd)
+                        out = config_include(self.device, 'virtual-link', vl_addr)
 
                         for line in out.splitlines():
                             line = line.rstrip()
@@ -3467,8 +3463,7 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
 
                     # Execute command to get sham-link local_id
                     if sl_remote_id is not None:
-                        cmd = 'show running-config | i sham-link | i {remote}'.format(remote=sl_remote_id)
-                        out = self.device.execute(cmd)
+                        out = config_include(self.device, 'sham-link', sl_remote_id)
 
                         for line in out.splitlines():
                             line = line.rstrip()
@@ -6040,8 +6035,7 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
                 instance = str(m.groupdict()['instance'])
 
                 # Get VRF information using the ospf instance
-                cmd = 'show running-config | section router ospf {}'.format(instance)
-                out = self.device.execute(cmd)
+                out = config_section(self.device, 'router ospf {}'.format(instance))
 
                 for line in out.splitlines():
                     line = line.rstrip()
@@ -8,6 +8,11 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
 
+# import parser utils
+from genie.libs.parser.utils.stream import Records, iter_lines, build_result
+from genie.libs.parser.utils.compact import Layout, intern_str, \
+    build_compact, expand_result
+
 
 # ====================================================
 #  distributor class for show ip route
@@ -186,8 +191,57 @@ class ShowIpRoute(ShowIpRouteSchema):
     exclude = ['updated']
     IP_VER='ipv4'
 
-    def cli(self, vrf=None, protocol=None, output=None):
+    # Records of the routes returned by compact()
+    ROUTE_LAYOUT = Layout(
+        'Route',
+        ['route', 'active', 'route_preference', 'metric', 'source_protocol',
+         'source_protocol_codes', 'mask', 'known_via', 'distance', 'type',
+         'net', 'redist_via', 'redist_via_tag', 'update', 'next_hop'],
+        nested={
+            'update': Layout('RouteUpdate', ['from', 'interface', 'age'],
+                             interned=['from', 'interface']),
+            'next_hop': Layout('RouteNextHop', [
+                'outgoing_interface', 'next_hop_list'], nested={
+                'outgoing_interface': Layout(
+                    'RouteOutgoingInterface',
+                    ['outgoing_interface', 'updated'], keyed=True,
+                    interned=['outgoing_interface', 'updated']),
+                'next_hop_list': Layout(
+                    'RouteNextHopPath',
+                    ['index', 'next_hop', 'outgoing_interface', 'updated',
+                     'age', 'from', 'metric', 'share_count', 'loading',
+                     'hops', 'minimum_mtu', 'reliability',
+                     'minimum_bandwidth', 'total_delay', 'vrf'], keyed=True,
+                    interned=['next_hop', 'outgoing_interface', 'updated',
+                              'from', 'vrf'])})},
+        interned=['source_protocol', 'source_protocol_codes', 'type'])
+    ROUTE_PATH = ('vrf', None, 'address_family', None, 'routes', None)
 
+    def cli(self, vrf=None, protocol=None, output=None):
+        return build_result(self.parse_iter(vrf=vrf, protocol=protocol,
+                                            output=output))
+
+    def compact(self, vrf=None, protocol=None, output=None):
+        """Return the cli() result with the routes stored as records of
+           ROUTE_LAYOUT, see utils.compact. Routes are converted as they
+           are parsed.
+        """
+        return build_compact(self.parse_iter(vrf=vrf, protocol=protocol,
+                                             output=output),
+                             self.ROUTE_LAYOUT)
+
+    @classmethod
+    def compact_to_dict(cls, result):
+        """Return the cli() result of a result returned by compact()"""
+        return expand_result(result, cls.ROUTE_PATH, cls.ROUTE_LAYOUT)
+
+    def parse_iter(self, vrf=None, protocol=None, output=None):
+        """Yield the routes one by one, as (path, route) where path is the
+           keys leading to the route in the cli() result:
+           ('vrf', vrf, 'address_family', af, 'routes', route).
+
+           output can also be a file object or any iterable of lines.
+        """
         if output is None:
             if vrf and protocol:
                 cmd = self.command[1].format(vrf=vrf, protocol=protocol)
@@ -221,7 +275,7 @@ class ShowIpRoute(ShowIpRouteSchema):
         source_protocol_dict['local_connected'] = ['LC']
         source_protocol_dict['bgp'] = ['B']
 
-        result_dict = {}
+        records = Records()
 
         # initial regexp pattern
         p100 = re.compile(r'^Routing +entry +for +'
@@ -254,7 +308,10 @@ class ShowIpRoute(ShowIpRouteSchema):
         ret_dict = {}
         index = 0
 
-        for line in out.splitlines():
+        for line in iter_lines(out):
+            if records.completed:
+                yield from records.pop()
+
             if line:
                 line = line.strip()
             else:
@@ -320,6 +377,7 @@ class ShowIpRoute(ShowIpRouteSchema):
 
                 if m.groupdict()['code1']:
                     source_protocol_codes = '{} {}'.format(source_protocol_codes, m.groupdict()['code1'])
+                source_protocol_codes = intern_str(source_protocol_codes)
 
                 if m.groupdict()['network']:
                     network = m.groupdict()['network']
@@ -338,20 +396,19 @@ class ShowIpRoute(ShowIpRouteSchema):
                         metrics = routepreference.split('/')[1]
 
                 if m.groupdict()['next_hop']:
-                    next_hop = m.groupdict()['next_hop']
+                    next_hop = intern_str(m.groupdict()['next_hop'])
                     index = 1
                 else:
                     index = 0
 
                 if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
+                    interface = intern_str(m.groupdict()['interface'])
 
                 if m.groupdict()['date']:
-                    updated = m.groupdict()['date']
+                    updated = intern_str(m.groupdict()['date'])
 
-                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                        .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
+                route_dict = records.open('vrf', vrf, 'address_family', af,
+                                          'routes', route)
 
                 route_dict['route'] = route
                 route_dict['active'] = active
@@ -392,17 +449,16 @@ class ShowIpRoute(ShowIpRouteSchema):
                     route_preference = routepreference.split('/')[0]
                     metrics = routepreference.split('/')[1]
 
-                next_hop = m.groupdict()['next_hop']
+                next_hop = intern_str(m.groupdict()['next_hop'])
                 index +=1
                 if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
+                    interface = intern_str(m.groupdict()['interface'])
 
                 if m.groupdict()['date']:
-                    updated = m.groupdict()['date']
+                    updated = intern_str(m.groupdict()['date'])
 
-                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                        .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
+                route_dict = records.open('vrf', vrf, 'address_family', af,
+                                          'routes', route)
 
                 route_dict['route'] = route
                 route_dict['active'] = active
@@ -448,15 +504,14 @@ class ShowIpRoute(ShowIpRouteSchema):
 
                 index += 1
                 if m.groupdict()['next_hop']:
-                    next_hop = m.groupdict()['next_hop']
+                    next_hop = intern_str(m.groupdict()['next_hop'])
                 if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
+                    interface = intern_str(m.groupdict()['interface'])
                 if m.groupdict()['date']:
-                    updated = m.groupdict()['date']
+                    updated = intern_str(m.groupdict()['date'])
 
-                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                        .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
+                route_dict = records.open('vrf', vrf, 'address_family', af,
+                                          'routes', route)
 
                 route_dict['route'] = route
 
@@ -497,18 +552,17 @@ class ShowIpRoute(ShowIpRouteSchema):
                 tmp_next_hop = m.groupdict()['next_hop']
                 if tmp_next_hop:
                     if '%' in  tmp_next_hop:
-                        next_hop = tmp_next_hop.split('%')[0]
-                        vrf_val = tmp_next_hop.split('%')[1]
+                        next_hop = intern_str(tmp_next_hop.split('%')[0])
+                        vrf_val = intern_str(tmp_next_hop.split('%')[1])
                     else:
-                        next_hop = tmp_next_hop
+                        next_hop = intern_str(tmp_next_hop)
 
                 if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
+                    interface = intern_str(m.groupdict()['interface'])
 
                 index += 1
-                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                        .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
+                route_dict = records.open('vrf', vrf, 'address_family', af,
+                                          'routes', route)
 
                 route_dict['route'] = route
                 route_dict['active'] = active
@@ -539,9 +593,8 @@ class ShowIpRoute(ShowIpRouteSchema):
             m = p100.match(line)
             if m:
                 group = m.groupdict()
-                entry_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {}).setdefault('address_family',
-                                                                                              {}).setdefault(af, {})
-                route_dict = entry_dict.setdefault('routes', {}).setdefault(route, {})
+                route_dict = records.open('vrf', vrf, 'address_family', af,
+                                          'routes', route)
                 route_dict.update({'route': group['ip']})
                 route_dict.update({'mask': group['mask']})
                 route_dict.update({'active': True})
@@ -572,7 +625,7 @@ class ShowIpRoute(ShowIpRouteSchema):
             if m:
                 group = m.groupdict()
                 update_dict = route_dict.setdefault('update', {})
-                update_dict.update({k: v for k, v in group.items() if v})
+                update_dict.update({k: intern_str(v) for k, v in group.items() if v})
                 continue
 
             # * 192.168.151.2, from 192.168.151.2, 2w3d ago, via Vlan101
@@ -583,10 +636,10 @@ class ShowIpRoute(ShowIpRouteSchema):
                 index += 1
                 path_dict = route_dict.setdefault('next_hop',{}).setdefault('next_hop_list', {}).setdefault(index, {})
                 path_dict.update({'index': index})
-                path_dict.update({'next_hop': group['nexthop']})
+                path_dict.update({'next_hop': intern_str(group['nexthop'])})
                 path_dict.update({'age': group['age']})
-                path_dict.update({'from': group['from']})
-                path_dict.update({'outgoing_interface': group['interface']})
+                path_dict.update({'from': intern_str(group['from'])})
+                path_dict.update({'outgoing_interface': intern_str(group['interface'])})
                 continue
 
             # Route metric is 10880, traffic share count is 1
@@ -616,7 +669,7 @@ class ShowIpRoute(ShowIpRouteSchema):
                 path_dict.update({k: v for k, v in group.items() if v})
                 continue
 
-        return result_dict
+        yield from records.close()
 
 class ShowIpv6Route(ShowIpRoute):
     """Parser for:
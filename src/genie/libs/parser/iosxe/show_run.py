@@ -16,6 +16,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, And, D
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.running_config import execute_config
 
 # =================================================
 # Schema for:
@@ -276,7 +277,8 @@ class ShowRunInterface(ShowRunInterfaceSchema):
 
 		if output is None:
 			# Execute command on device
-			output = self.device.execute(self.cli_command.format(interface=interface))
+			output = execute_config(self.device,
+				self.cli_command.format(interface=interface))
 
 		# Init vars
 		config_dict = {}
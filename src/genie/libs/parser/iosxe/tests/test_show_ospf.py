@@ -11,6 +11,9 @@ from pyats.topology import loader
 from genie.metaparser.util.exceptions import SchemaEmptyParserError,\
                                              SchemaMissingKeyError
 
+# Parser utils
+from genie.libs.parser.utils.device_cache import collection_session
+
 # iosxe show_ospf
 from genie.libs.parser.iosxe.show_ospf import (ShowIpOspf,
                                                ShowIpOspfInterface,
@@ -1006,6 +1009,77 @@ class test_show_ip_ospf_interface(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output2)
 
+    def test_show_ip_ospf_interface_collection_session(self):
+
+        self.maxDiff = None
+
+        raw1 = '''\
+            Loopback0 is up, line protocol is up 
+              Internet Address 10.4.1.1/32, Area 0.0.0.0, Attached via Interface Enable
+              Process ID 1, Router ID 10.4.1.1, Network Type LOOPBACK, Cost: 1
+              Loopback interface is treated as a stub Host
+            GigabitEthernet1 is up, line protocol is up 
+              Internet Address 10.1.2.1/24, Area 0.0.0.0, Attached via Interface Enable
+              Process ID 1, Router ID 10.4.1.1, Network Type BROADCAST, Cost: 1
+              Transmit Delay is 1 sec, State DR, Priority 1
+            GigabitEthernet2 is up, line protocol is up 
+              Internet Address 10.1.3.1/24, Area 0.0.0.1, Attached via Interface Enable
+              Process ID 2, Router ID 10.229.11.11, Network Type BROADCAST, Cost: 1
+              Transmit Delay is 1 sec, State DR, Priority 1
+            '''
+
+        raw2 = '''\
+            Building configuration...
+
+            Current configuration : 1024 bytes
+            !
+            hostname R1_ospf_xe
+            !
+            interface GigabitEthernet2
+             vrf forwarding VRF1
+             ip address 10.1.3.1 255.255.255.0
+            !
+            router ospf 2 vrf VRF1
+             area 1 sham-link 10.229.11.11 10.151.22.22 cost 111
+             redistribute bgp 100 subnets
+            !
+            router ospf 1
+             mpls traffic-eng router-id Loopback0
+             mpls traffic-eng area 0
+            !
+            end
+            '''
+
+        outputs = {
+            'show ip ospf interface': raw1,
+            'show running-config | section router ospf 1':
+                'router ospf 1\n mpls traffic-eng router-id Loopback0\n',
+            'show running-config | section router ospf 2':
+                'router ospf 2 vrf VRF1\n redistribute bgp 100 subnets\n',
+            'show running-config': raw2,
+        }
+
+        self.device.execute = Mock(side_effect=outputs.__getitem__)
+        parsed_output = ShowIpOspfInterface(device=self.device).parse()
+        self.assertEqual(self.device.execute.call_count, 4)
+        self.assertEqual(
+            sorted(parsed_output['vrf']['default']['address_family']['ipv4']
+                   ['instance']['1']['areas']['0.0.0.0']['interfaces']),
+            ['GigabitEthernet1', 'Loopback0'])
+        self.assertIn('2', parsed_output['vrf']['VRF1']['address_family']
+                      ['ipv4']['instance'])
+
+        # The running-config is fetched once, and filtered locally
+        self.device.execute = Mock(side_effect=outputs.__getitem__)
+        with collection_session(self.device):
+            self.assertEqual(
+                ShowIpOspfInterface(device=self.device).parse(),
+                parsed_output)
+        commands = [args[0] for args, kwargs in
+                    self.device.execute.call_args_list]
+        self.assertEqual(commands, ['show ip ospf interface',
+                                    'show running-config'])
+
     def test_show_ip_ospf_interface_full3(self):
 
         self.maxDiff = None
@@ -58,6 +58,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 
 # Parser
 from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
+from genie.libs.parser.utils.blocks import Blocks
 
 # Logger
 logger = logging.getLogger(__name__)
@@ -2465,40 +2466,59 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
         , 'cummulative_no_no_policy', 'route_refresh_request_sent']
 
         
+    # Neighbors of the output, see parse_blocks
+    blocks = Blocks(
+        # BGP neighbor is 10.16.2.2
+        # BGP neighbor is 10.1.5.5, vrf VRF1
+        header=r'^BGP +neighbor +is +',
+        # BGP instance 0: 'default'
+        context=[r'^BGP +instance +[0-9]+: +'])
+
+    def get_command(self, vrf_type='all', vrf='all', instance='all',
+                    neighbor='', address_family=''):
+        if vrf_type == 'all':
+            if neighbor:
+                return self.cli_command[1].format(instance=instance,
+                                                  neighbor=neighbor)
+            return self.cli_command[0].format(instance=instance)
+        if address_family:
+            if neighbor:
+                return self.cli_command[3].format(
+                    vrf_type=vrf_type, instance=instance, neighbor=neighbor,
+                    vrf=vrf, address_family=address_family)
+            return self.cli_command[5].format(
+                vrf_type=vrf_type, instance=instance,
+                address_family=address_family, vrf=vrf)
+        if neighbor:
+            return self.cli_command[2].format(
+                vrf_type=vrf_type, instance=instance, neighbor=neighbor,
+                vrf=vrf)
+        return self.cli_command[4].format(vrf_type=vrf_type,
+                                          instance=instance, vrf=vrf)
+
+    def parse_blocks(self, vrf_type='all', vrf='all', instance='all',
+                     neighbor='', address_family='', processes=None,
+                     chunk_lines=None, output=None):
+        """ Return the cli() result, parsing the output neighbor by
+            neighbor over processes worker processes, see utils.blocks
+        """
+        if output is None:
+            output = self.device.execute(self.get_command(
+                vrf_type=vrf_type, vrf=vrf, instance=instance,
+                neighbor=neighbor, address_family=address_family))
+
+        return self.blocks.parse(
+            self, output, processes=processes, chunk_lines=chunk_lines,
+            vrf_type=vrf_type, vrf=vrf, instance=instance, neighbor=neighbor,
+            address_family=address_family)
+
     def cli(self, vrf_type='all', vrf='all', instance='all', neighbor='', address_family='', output=None):
         assert vrf_type in ['all', 'vrf']
         assert address_family in ['', 'ipv4 unicast', 'ipv6 unicast']
         if output is None:
-            if vrf_type == 'all':
-                if neighbor:
-                    out = self.device.execute(self.cli_command[1].format(instance=instance,
-                                                                         neighbor=neighbor))
-                else:
-                    out = self.device.execute(self.cli_command[0].format(instance=instance))
-
-            else:
-                if address_family:
-                    if neighbor:
-                        out = self.device.execute(self.cli_command[3].format(vrf_type=vrf_type,
-                                                                     instance=instance,
-                                                                     neighbor=neighbor,
-                                                                     vrf=vrf,
-                                                                     address_family=address_family))
-                    else:
-                        out = self.device.execute(self.cli_command[5].format(vrf_type=vrf_type,
-                                                       instance=instance,
-                                                       address_family=address_family,
-                                                                             vrf=vrf))
-                else:
-                    if neighbor:
-                        out = self.device.execute(self.cli_command[2].format(vrf_type=vrf_type,
-                                                   instance=instance,
-                                                   neighbor=neighbor,
-                                                   vrf=vrf))
-                    else:
-                        out = self.device.execute(self.cli_command[4].format(vrf_type=vrf_type,
-                                                   instance=instance,
-                                                   vrf=vrf))
+            out = self.device.execute(self.get_command(
+                vrf_type=vrf_type, vrf=vrf, instance=instance,
+                neighbor=neighbor, address_family=address_family))
         else:
             out = output
         # Init variables
@@ -26,6 +26,7 @@ from netaddr import IPAddress, IPNetwork
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.blocks import Blocks
 
 #============================================
 # Schema for 'show isis fast-reroute summary'
@@ -3556,6 +3557,25 @@ class ShowIsisDatabaseDetail(ShowIsisDatabaseDetailSchema):
 
     cli_command = 'show isis database detail'
 
+    # LSPs of the output, see parse_blocks
+    blocks = Blocks(
+        # R3.00-00            * 0x0000000d    0x0476        578  /*            1/0/0
+        header=r'^[\w\-\.]+( *\*)? +\w+ +\w+ +(\d+|\*)( *\/(\d+|\*))? +'
+               r'\d+\/\d+\/\d+$',
+        # IS-IS test (Level-1) Link State Database
+        context=[r'IS\-IS\s+(\S+)?\s*\(*Level\-\d+\)*\s+Link\s+State\s+'
+                 r'Database'])
+
+    def parse_blocks(self, processes=None, chunk_lines=None, output=None):
+        ''' Return the cli() result, parsing the output LSP by LSP over
+            processes worker processes, see utils.blocks
+        '''
+        if not output:
+            output = self.device.execute(self.cli_command)
+
+        return self.blocks.parse(self, output, processes=processes,
+                                 chunk_lines=chunk_lines)
+
     def cli(self, output=None):
 
         if not output:
@@ -22,6 +22,9 @@ from netaddr import IPAddress, IPNetwork
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
+# Parser
+from genie.libs.parser.utils.device_cache import cached_parse
+
 
 # ==================================================
 # Schema for 'show ospf vrf all-inclusive interface'
@@ -291,6 +294,7 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
 
         # Init vars
         ret_dict = {}
+        vl_out = None
         af = "ipv4"  # this is ospf - always ipv4
         instance = ""
         # Mapping dict
@@ -499,8 +503,10 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
                     vl_transit_area_id = None
 
                     # Execute 'show ospf vrf all-inclusive virtual-links' to get the vl_transit_area_id
-                    obj = ShowOspfVrfAllInclusiveVirtualLinks(device=self.device)
-                    vl_out = obj.parse()
+                    # once for all the virtual links
+                    if vl_out is None:
+                        vl_out = cached_parse(
+                            ShowOspfVrfAllInclusiveVirtualLinks, self.device)
 
                     for vl_vrf in vl_out["vrf"]:
                         for vl_af in vl_out["vrf"][vl_vrf]["address_family"]:
@@ -1046,6 +1052,7 @@ class ShowOspfVrfAllInclusiveNeighborDetail(
 
         # Init vars
         ret_dict = {}
+        vl_out = None
         af = "ipv4"  # this is ospf - always ipv4
 
         p1 = re.compile(
@@ -1159,8 +1166,10 @@ class ShowOspfVrfAllInclusiveNeighborDetail(
                         name = "VL" + str(n.groupdict()["num"])
 
                     # Execute 'show ospf vrf all-inclusive virtual-links' to get the vl_transit_area_id
-                    obj = ShowOspfVrfAllInclusiveVirtualLinks(device=self.device)
-                    vl_out = obj.parse()
+                    # once for all the virtual links
+                    if vl_out is None:
+                        vl_out = cached_parse(
+                            ShowOspfVrfAllInclusiveVirtualLinks, self.device)
 
                     for vl_vrf in vl_out["vrf"]:
                         for vl_af in vl_out["vrf"][vl_vrf]["address_family"]:
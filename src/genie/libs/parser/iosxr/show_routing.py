@@ -8,6 +8,10 @@ from genie.metaparser.util.schemaengine import Schema, \
     Any, \
     Optional
 
+# import parser utils
+from genie.libs.parser.utils.compact import Layout, intern_str, \
+    compact_result, expand_result
+
 
 # ====================================================
 #  schema for show route ipv4
@@ -127,6 +131,36 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
     protocol_set = {'ospf', 'odr', 'isis', 'eigrp', 'static', 'mobile',
                     'rip', 'lisp', 'nhrp', 'local', 'connected', 'bgp'}
 
+    # Records of the routes returned by compact()
+    ROUTE_LAYOUT = Layout(
+        'Route',
+        ['route', 'active', 'ip', 'mask', 'route_preference', 'metric',
+         'source_protocol', 'source_protocol_codes', 'known_via', 'distance',
+         'type', 'tag', 'installed', 'redist_advertisers', 'next_hop'],
+        nested={
+            'installed': Layout('RouteInstalled', ['date', 'for']),
+            'redist_advertisers': Layout(
+                'RouteRedistAdvertiser', ['protoid', 'clientid'],
+                keyed=True),
+            'next_hop': Layout('RouteNextHop', [
+                'outgoing_interface', 'next_hop_list'], nested={
+                'outgoing_interface': Layout(
+                    'RouteOutgoingInterface',
+                    ['outgoing_interface', 'updated', 'metric',
+                     'share_count'], keyed=True,
+                    interned=['outgoing_interface', 'updated']),
+                'next_hop_list': Layout(
+                    'RouteNextHopPath',
+                    ['index', 'next_hop', 'outgoing_interface', 'updated',
+                     'metric', 'from', 'table', 'address_family',
+                     'table_id', 'nexthop_in_vrf'], keyed=True,
+                    interned=['next_hop', 'outgoing_interface', 'updated',
+                              'from', 'table', 'address_family',
+                              'table_id', 'nexthop_in_vrf'])})},
+        interned=['source_protocol', 'source_protocol_codes', 'known_via',
+                  'type', 'tag'])
+    ROUTE_PATH = ('vrf', None, 'address_family', None, 'routes', None)
+
     def cli(self, vrf=None, route=None, protocol=None, output=None):
         
         # Check if argument from device.parse is protocol or route
@@ -291,13 +325,14 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                 code3 = group['code3']
                 if code3:
                     code1 = '{} {}'.format(code1, code3)
+                code1 = intern_str(code1)
                 
                 network = group['network']
                 route_preference = int(group['route_preference'])
                 metric = int(group['metric'])
-                next_hop = group['next_hop']
-                updated = group['date']
-                interface = group['interface']
+                next_hop = intern_str(group['next_hop'])
+                updated = intern_str(group['date'])
+                interface = intern_str(group['interface'])
 
                 route_dict = ret_dict.setdefault('vrf', {}). \
                     setdefault(vrf, {}). \
@@ -333,9 +368,9 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                 group = m.groupdict()
                 route_preference = int(group['route_preference'])
                 metric = int(group['metric'])
-                next_hop = group['next_hop']
-                updated = group['date']
-                interface = group['interface']
+                next_hop = intern_str(group['next_hop'])
+                updated = intern_str(group['date'])
+                interface = intern_str(group['interface'])
                 route_dict.update({'route_preference': route_preference})
                 route_dict.update({'metric': metric})
                 index += 1
@@ -362,8 +397,8 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                     code1 = group.get('code1', None)
                     source_protocol = None
                     network = group.get('network', None)
-                    updated = group.get('date', None)
-                    interface = group.get('interface', None)
+                    updated = intern_str(group.get('date', None))
+                    interface = intern_str(group.get('interface', None))
 
                     if network:
                         route_dict = ret_dict.setdefault('vrf', {}). \
@@ -385,6 +420,7 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                         code2 = group.get('code2', None)
                         if code2:
                             code1 = '{} {}'.format(code1, code2)
+                        code1 = intern_str(code1)
 
                         if source_protocol:
                             route_dict.update({'source_protocol': source_protocol})
@@ -452,7 +488,7 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                 source_protocol = None
                 network = group.get('network', None)
                 updated = group.get('date', None)
-                interface = group.get('interface', None)
+                interface = intern_str(group.get('interface', None))
 
                 if network:
                     route_dict = ret_dict.setdefault('vrf', {}). \
@@ -524,9 +560,9 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
             m = p11.match(line)
             if m:
                 group = m.groupdict()
-                nexthop = group['nexthop']
-                _from = group['from']
-                interface = group['interface']
+                nexthop = intern_str(group['nexthop'])
+                _from = intern_str(group['from'])
+                interface = intern_str(group['interface'])
 
                 index += 1
                 outgoing_interface_dict = route_dict.setdefault('next_hop', {}). \
@@ -589,6 +625,18 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
         
         return ret_dict
 
+    def compact(self, vrf=None, route=None, protocol=None, output=None):
+        """Return the cli() result with the routes stored as records of
+           ROUTE_LAYOUT, see utils.compact"""
+        return compact_result(self.cli(vrf=vrf, route=route,
+                                       protocol=protocol, output=output),
+                              self.ROUTE_PATH, self.ROUTE_LAYOUT)
+
+    @classmethod
+    def compact_to_dict(cls, result):
+        """Return the cli() result of a result returned by compact()"""
+        return expand_result(result, cls.ROUTE_PATH, cls.ROUTE_LAYOUT)
+
 
 # ====================================================
 #  parser for show route ipv6
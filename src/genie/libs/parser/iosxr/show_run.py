@@ -15,6 +15,9 @@ from collections import OrderedDict
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
+# import parser utils
+from genie.libs.parser.utils.running_config import execute_config
+
 
 # ====================================
 # Schema for 'show run key chain'
@@ -193,7 +196,7 @@ class ShowRunRouterIsis(ShowRunRouterIsisSchema):
     
     def cli(self, output=None):
         if output is None:
-            out = self.device.execute(self.cli_command)
+            out = execute_config(self.device, self.cli_command)
         else:
             out = output
         
@@ -5855,6 +5855,12 @@ class TestShowIsisDatabaseDetail(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output_4)
 
+    def test_output_1_blocks(self):
+        self.device = Mock(**self.golden_output_1)
+        obj = ShowIsisDatabaseDetail(device=self.device)
+        parsed_output = obj.parse_blocks(processes=0, chunk_lines=1)
+        self.assertEqual(parsed_output, self.golden_parsed_output_1)
+
 class TestShowIsisPrivateAll(unittest.TestCase):
 
     maxDiff = None
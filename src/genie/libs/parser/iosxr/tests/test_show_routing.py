@@ -1443,6 +1443,16 @@ class TestShowRouteIpv4(unittest.TestCase):
         parsed_output = obj.parse(vrf='HIPTV', route='172.25.254.37/32')
         self.assertEqual(parsed_output, self.golden_parsed_output_12)
 
+    def test_show_route_ipv4_compact(self):
+        self.device = Mock(**self.golden_output_1)
+        obj = ShowRouteIpv4(device=self.device)
+        compact = obj.compact()
+        routes = compact['vrf']['default']['address_family']['ipv4']\
+            ['routes']
+        self.assertTrue(all(route.active for route in routes.values()))
+        self.assertEqual(ShowRouteIpv4.compact_to_dict(compact),
+                         self.golden_parsed_output_1)
+
 
 # ============================================
 # unit test for 'show route ipv6'
@@ -1,5 +1,6 @@
 # Python
 import unittest
+import textwrap
 from unittest.mock import Mock
 
 # ATS
@@ -9,6 +10,9 @@ from pyats.topology import loader
 # Metaparser
 from genie.metaparser.util.exceptions import SchemaEmptyParserError, SchemaMissingKeyError
 
+# Parser utils
+from genie.libs.parser.utils.device_cache import collection_session
+
 # iosxr show_run
 from genie.libs.parser.iosxr.show_run import ShowRunKeyChain,ShowRunRouterIsis
 
@@ -462,6 +466,20 @@ class test_show_run_router_isis(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output2)
 
+    def test_show_run_router_isis_collection_session(self):
+        self.maxDiff = None
+        # Running-config holding the router isis section of golden_output1
+        lines = self.golden_output1['execute.return_value'].splitlines()
+        running_config = 'hostname R2\n!\n{}\n' \
+            'interface Loopback0\n ipv4 address 10.4.1.1 255.255.255.255\n' \
+            '!\nend\n'.format(textwrap.dedent('\n'.join(lines[3:])))
+        self.device = Mock(**{'execute.return_value': running_config})
+        with collection_session(self.device):
+            obj = ShowRunRouterIsis(device=self.device)
+            parsed_output = obj.parse()
+        self.assertEqual(parsed_output, self.golden_parsed_output1)
+        self.device.execute.assert_called_once_with('show running-config')
+
     def test_show_run_router_isis_empty(self):
         self.maxDiff = None
         self.device = Mock(**self.empty_output)
@@ -20,6 +20,9 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Use, Or
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.schema import ListSchema
+from genie.libs.parser.utils.stream import build_result
+from genie.libs.parser.utils.structured import structured_output
 
 
 # =======================================================
@@ -405,323 +408,78 @@ class ShowInterfacesSchema(MetaParser):
     #     }
     # }
 
-    def verify_physical_interface_list(value):
-        # Pass physical-interface list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('physical interface is not a list')
-        def verify_logical_interface_list(value):
-            # Pass address-family list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('logical-interface is not a list')
-
-            def verify_address_family_list(value):
-                # Pass address-family list of dict in value
-                if not isinstance(value, list):
-                    raise SchemaError('address-family is not a list')
-
-                def verify_interface_address_list(value):
-                    # Pass physical-interface list of dict in value
-                    if not isinstance(value, list) and not isinstance(value, dict):
-                        raise SchemaError('interface-address is not a list/dict')
-
-                    interface_address_schema = Schema({
-                        Optional("ifa-broadcast"): str,
-                        Optional("ifa-destination"): str,
-                        "ifa-flags": {
-                            Optional("ifaf-current-preferred"): bool,
-                            Optional("ifaf-current-primary"): bool,
-                            Optional("ifaf-is-primary"): bool,
-                            Optional("ifaf-is-preferred"): bool,
-                            Optional("ifaf-kernel"): bool,
-                            Optional("ifaf-preferred"): bool,
-                            Optional("ifaf-primary"): bool,
-                            Optional("ifaf-is-default"): bool,
-                            Optional("ifaf-none"): bool,
-                            Optional("ifaf-dest-route-down"): bool,
-                        },
-                        Optional("ifa-local"): str
-                    })
-
-                    # Validate each dictionary in list
-                    if isinstance(value, dict):
-                        value = [value]
-                    for item in value:
-                        interface_address_schema.validate(item)
-                    return value
-
-                af_schema = Schema({
-                    Optional("address-family-flags"): {
-                        Optional("ifff-is-primary"): bool,
-                        Optional("ifff-no-redirects"): bool,
-                        Optional("ifff-none"): bool,
-                        Optional("ifff-sendbcast-pkt-to-re"): bool,
-                        Optional("internal-flags"): bool,
-                        Optional("ifff-primary"): bool,
-                        Optional("ifff-receive-ttl-exceeded"): bool,
-                        Optional("ifff-receive-options"): bool,
-                        Optional("ifff-encapsulation"): str,
-                    },
-                    "address-family-name": str,
-                    Optional("interface-address"): Use(verify_interface_address_list),
-                    Optional("intf-curr-cnt"): str,
-                    Optional("intf-dropcnt"): str,
-                    Optional("intf-unresolved-cnt"): str,
-                    Optional("generation"): str,
-                    Optional("route-table"): str,
-                    Optional("max-local-cache"): str,
-                    Optional("maximum-labels"): str,
-                    "mtu": str,
-                    Optional("new-hold-limit"): str
-                })
-                # Validate each dictionary in list
-                for item in value:
-                    af_schema.validate(item)
-                return value
-
-            l_i_schema = Schema({
-                Optional("address-family"): Use(verify_address_family_list),
-                Optional("encapsulation"): str,
-                Optional("filter-information"): str,
-                "if-config-flags": {
-                    "iff-snmp-traps": bool,
-                    "iff-up": bool,
-                    Optional("internal-flags"): str
-                },
-                "local-index": str,
-                Optional("logical-interface-bandwidth"): str,
-                "name": str,
-                Optional("policer-overhead"): str,
-                Optional("snmp-index"): str,
-                Optional("traffic-statistics"): {
-                    Optional("@junos:style"): str,
-                    "input-packets": str,
-                    Optional("input-bytes"): str,
-                    "output-packets": str,
-                    Optional("output-bytes"): str,
-                    Optional("ipv6-transit-statistics"): {
-                        "input-bytes": str,
-                        "input-packets": str,
-                        "output-bytes": str,
-                        "output-packets": str,
-                    },
-                },
-                Optional("transit-traffic-statistics"): {
-                        "input-bps": str,
-                        "input-bytes": str,
-                        "input-packets": str,
-                        "input-pps": str,
-                        Optional("ipv6-transit-statistics"): {
-                            "input-bps": str,
-                            "input-bytes": str,
-                            "input-packets": str,
-                            "input-pps": str,
-                            "output-bps": str,
-                            "output-bytes": str,
-                            "output-packets": str,
-                            "output-pps": str
-                        },
-                        "output-bps": str,
-                        "output-bytes": str,
-                        "output-packets": str,
-                        "output-pps": str
-                    }
-            })
-            # Validate each dictionary in list
-            for item in value:
-                l_i_schema.validate(item)
-            return value
-
-        def verify_queue_list(value):
-            # Pass address-family list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('queue is not a list')
-            
-            queue_schema = Schema({
-                "queue-counters-queued-packets": str,
-                "queue-counters-total-drop-packets": str,
-                "queue-counters-trans-packets": str,
-                "queue-number": str
-            })
-            # Validate each dictionary in list
-            for item in value:
-                queue_schema.validate(item)
-            return value
-
-        # Create physical-interface Schema
-        physical_interface_schema = Schema({
-            Optional("active-alarms"): {
-                Optional("interface-alarms"): {
-                    Optional("alarm-not-present"): bool,
-                    Optional("ethernet-alarm-link-down"): bool,
-                }
-            },
-            Optional("active-defects"): {
-                Optional("interface-alarms"): {
-                    Optional("alarm-not-present"): bool,
-                    Optional("ethernet-alarm-link-down"): bool
-                }
-            },
-            Optional("admin-status"): {
-                Optional("#text"): str,
-                Optional("@junos:format"): str
-            },
-            Optional("bpdu-error"): str,
-            Optional("clocking"): str,
-            Optional("current-physical-address"): str,
-            Optional("description"): str,
-            Optional("eth-switch-error"): str,
-            Optional("ethernet-fec-mode"): {
-                Optional("@junos:style"): str,
-                "enabled_fec_mode": str
-            },
-            Optional("ethernet-fec-statistics"): {
-                Optional("@junos:style"): str,
-                "fec_ccw_count": str,
-                "fec_ccw_error_rate": str,
-                "fec_nccw_count": str,
-                "fec_nccw_error_rate": str
-            },
-            Optional("ethernet-pcs-statistics"): {
-                Optional("@junos:style"): str,
-                "bit-error-seconds": str,
-                "errored-blocks-seconds": str
-            },
-            Optional("hardware-physical-address"): str,
-            Optional("if-config-flags"): {
-                Optional("internal-flags"): str,
-                "iff-snmp-traps": bool,
-                Optional("iff-hardware-down"): bool,
-            },
-            Optional("if-auto-negotiation"): str,
-            "if-device-flags": {
-                "ifdf-present": bool,
-                "ifdf-running": bool,
-                Optional("ifdf-loopback"): bool,
-                Optional("ifdf-down"): bool,
-            },
-            Optional("if-flow-control"): str,
-            Optional("if-media-flags"): {
-                "ifmf-none": bool
-            },
-            Optional("if-remote-fault"): str,
-            Optional("if-type"): str,
-            Optional("ifd-specific-config-flags"): {
-                Optional("internal-flags"): str
-            },
-            Optional("interface-flapped"): {
-                "#text": str,
-                Optional("@junos:seconds"): str
-            },
-            Optional("interface-transmit-statistics"): str,
-            Optional("l2pt-error"): str,
-            Optional("ld-pdu-error"): str,
-            Optional("link-level-type"): str,
-            Optional("link-type"): str,
-            Optional("link-mode"): str,
-            Optional("local-index"): str,
-            Optional("logical-interface"): Use(verify_logical_interface_list),
-            Optional("loopback"): str,
-            Optional("lsi-traffic-statistics"): {
-                Optional("@junos:style"): str,
-                "input-bps": str,
+    # Validators of the lists, sharing their schemas across parses
+    verify_interface_address_list = ListSchema({
+        Optional("ifa-broadcast"): str,
+        Optional("ifa-destination"): str,
+        "ifa-flags": {
+            Optional("ifaf-current-preferred"): bool,
+            Optional("ifaf-current-primary"): bool,
+            Optional("ifaf-is-primary"): bool,
+            Optional("ifaf-is-preferred"): bool,
+            Optional("ifaf-kernel"): bool,
+            Optional("ifaf-preferred"): bool,
+            Optional("ifaf-primary"): bool,
+            Optional("ifaf-is-default"): bool,
+            Optional("ifaf-none"): bool,
+            Optional("ifaf-dest-route-down"): bool,
+        },
+        Optional("ifa-local"): str
+    }, 'interface-address is not a list/dict', single=True)
+
+    verify_address_family_list = ListSchema({
+        Optional("address-family-flags"): {
+            Optional("ifff-is-primary"): bool,
+            Optional("ifff-no-redirects"): bool,
+            Optional("ifff-none"): bool,
+            Optional("ifff-sendbcast-pkt-to-re"): bool,
+            Optional("internal-flags"): bool,
+            Optional("ifff-primary"): bool,
+            Optional("ifff-receive-ttl-exceeded"): bool,
+            Optional("ifff-receive-options"): bool,
+            Optional("ifff-encapsulation"): str,
+        },
+        "address-family-name": str,
+        Optional("interface-address"): Use(verify_interface_address_list),
+        Optional("intf-curr-cnt"): str,
+        Optional("intf-dropcnt"): str,
+        Optional("intf-unresolved-cnt"): str,
+        Optional("generation"): str,
+        Optional("route-table"): str,
+        Optional("max-local-cache"): str,
+        Optional("maximum-labels"): str,
+        "mtu": str,
+        Optional("new-hold-limit"): str
+    }, 'address-family is not a list')
+
+    verify_logical_interface_list = ListSchema({
+        Optional("address-family"): Use(verify_address_family_list),
+        Optional("encapsulation"): str,
+        Optional("filter-information"): str,
+        "if-config-flags": {
+            "iff-snmp-traps": bool,
+            "iff-up": bool,
+            Optional("internal-flags"): str
+        },
+        "local-index": str,
+        Optional("logical-interface-bandwidth"): str,
+        "name": str,
+        Optional("policer-overhead"): str,
+        Optional("snmp-index"): str,
+        Optional("traffic-statistics"): {
+            Optional("@junos:style"): str,
+            "input-packets": str,
+            Optional("input-bytes"): str,
+            "output-packets": str,
+            Optional("output-bytes"): str,
+            Optional("ipv6-transit-statistics"): {
                 "input-bytes": str,
                 "input-packets": str,
-                "input-pps": str
-            },
-            Optional("mru"): str,
-            Optional("mtu"): str,
-            "name": str,
-            Optional("oper-status"): str,
-            Optional("pad-to-minimum-frame-size"): str,
-            Optional("physical-interface-cos-information"): {
-                "physical-interface-cos-hw-max-queues": str,
-                "physical-interface-cos-use-max-queues": str
-            },
-            Optional("snmp-index"): str,
-            Optional("sonet-mode"): str,
-            Optional("source-filtering"): str,
-            Optional("speed"): str,
-            Optional("stp-traffic-statistics"): {
-                Optional("@junos:style"): str,
-                Optional("stp-input-bytes-dropped"): str,
-                Optional("stp-input-packets-dropped"): str,
-                Optional("stp-output-bytes-dropped"): str,
-                Optional("stp-output-packets-dropped"): str
-            },
-            Optional("traffic-statistics"): {
-                Optional("@junos:style"): str,
-                Optional("input-bps"): str,
-                Optional("output-bytes"): str,
-                Optional("input-bytes"): str,
-                Optional("input-packets"): str,
-                Optional("input-pps"): str,
-                Optional("output-bps"): str,
-                Optional("output-packets"): str,
-                Optional("output-pps"): str,
-                Optional("ipv6-transit-statistics"): {
-                    Optional("input-bps"): str,
-                    Optional("input-bytes"): str,
-                    Optional("input-packets"): str,
-                    Optional("input-pps"): str,
-                    Optional("output-bps"): str,
-                    Optional("output-bytes"): str,
-                    Optional("output-packets"): str,
-                    Optional("output-pps"): str
-                },
-            },
-            Optional("output-error-list"): {
-                Optional("aged-packets"): str,
-                Optional("carrier-transitions"): str,
-                Optional("hs-link-crc-errors"): str,
-                Optional("mtu-errors"): str,
-                Optional("output-collisions"): str,
-                Optional("output-drops"): str,
-                Optional("output-errors"): str,
-                Optional("output-fifo-errors"): str,
-                Optional("output-resource-errors"): str
-            },
-            Optional("ethernet-mac-statistics"): {
-                    Optional("@junos:style"): str,
-                    "input-broadcasts": str,
-                    "input-bytes": str,
-                    "input-code-violations": str,
-                    "input-crc-errors": str,
-                    "input-fifo-errors": str,
-                    "input-fragment-frames": str,
-                    "input-jabber-frames": str,
-                    "input-mac-control-frames": str,
-                    "input-mac-pause-frames": str,
-                    "input-multicasts": str,
-                    "input-oversized-frames": str,
-                    "input-packets": str,
-                    Optional("input-total-errors"): str,
-                    "input-unicasts": str,
-                    "input-vlan-tagged-frames": str,
-                    "output-broadcasts": str,
-                    "output-bytes": str,
-                    "output-crc-errors": str,
-                    "output-fifo-errors": str,
-                    "output-mac-control-frames": str,
-                    "output-mac-pause-frames": str,
-                    "output-multicasts": str,
-                    "output-packets": str,
-                    Optional("output-total-errors"): str,
-                    "output-unicasts": str
-            },
-            Optional("input-error-list"): {
-                    Optional("framing-errors"): str,
-                    Optional("input-discards"): str,
-                    Optional("input-drops"): str,
-                    Optional("input-errors"): str,
-                    Optional("input-fifo-errors"): str,
-                    Optional("input-giants"): str,
-                    Optional("input-l2-channel-errors"): str,
-                    Optional("input-l2-mismatch-timeouts"): str,
-                    Optional("input-l3-incompletes"): str,
-                    Optional("input-resource-errors"): str,
-                    Optional("input-runts"): str
+                "output-bytes": str,
+                "output-packets": str,
             },
-            Optional("transit-traffic-statistics"): {
+        },
+        Optional("transit-traffic-statistics"): {
                 "input-bps": str,
                 "input-bytes": str,
                 "input-packets": str,
@@ -740,21 +498,219 @@ class ShowInterfacesSchema(MetaParser):
                 "output-bytes": str,
                 "output-packets": str,
                 "output-pps": str
+            }
+    }, 'logical-interface is not a list')
+
+    verify_queue_list = ListSchema({
+        "queue-counters-queued-packets": str,
+        "queue-counters-total-drop-packets": str,
+        "queue-counters-trans-packets": str,
+        "queue-number": str
+    }, 'queue is not a list')
+
+    verify_physical_interface_list = ListSchema({
+        Optional("active-alarms"): {
+            Optional("interface-alarms"): {
+                Optional("alarm-not-present"): bool,
+                Optional("ethernet-alarm-link-down"): bool,
+            }
+        },
+        Optional("active-defects"): {
+            Optional("interface-alarms"): {
+                Optional("alarm-not-present"): bool,
+                Optional("ethernet-alarm-link-down"): bool
+            }
+        },
+        Optional("admin-status"): {
+            Optional("#text"): str,
+            Optional("@junos:format"): str
+        },
+        Optional("bpdu-error"): str,
+        Optional("clocking"): str,
+        Optional("current-physical-address"): str,
+        Optional("description"): str,
+        Optional("eth-switch-error"): str,
+        Optional("ethernet-fec-mode"): {
+            Optional("@junos:style"): str,
+            "enabled_fec_mode": str
+        },
+        Optional("ethernet-fec-statistics"): {
+            Optional("@junos:style"): str,
+            "fec_ccw_count": str,
+            "fec_ccw_error_rate": str,
+            "fec_nccw_count": str,
+            "fec_nccw_error_rate": str
+        },
+        Optional("ethernet-pcs-statistics"): {
+            Optional("@junos:style"): str,
+            "bit-error-seconds": str,
+            "errored-blocks-seconds": str
+        },
+        Optional("hardware-physical-address"): str,
+        Optional("if-config-flags"): {
+            Optional("internal-flags"): str,
+            "iff-snmp-traps": bool,
+            Optional("iff-hardware-down"): bool,
+        },
+        Optional("if-auto-negotiation"): str,
+        "if-device-flags": {
+            "ifdf-present": bool,
+            "ifdf-running": bool,
+            Optional("ifdf-loopback"): bool,
+            Optional("ifdf-down"): bool,
+        },
+        Optional("if-flow-control"): str,
+        Optional("if-media-flags"): {
+            "ifmf-none": bool
+        },
+        Optional("if-remote-fault"): str,
+        Optional("if-type"): str,
+        Optional("ifd-specific-config-flags"): {
+            Optional("internal-flags"): str
+        },
+        Optional("interface-flapped"): {
+            "#text": str,
+            Optional("@junos:seconds"): str
+        },
+        Optional("interface-transmit-statistics"): str,
+        Optional("l2pt-error"): str,
+        Optional("ld-pdu-error"): str,
+        Optional("link-level-type"): str,
+        Optional("link-type"): str,
+        Optional("link-mode"): str,
+        Optional("local-index"): str,
+        Optional("logical-interface"): Use(verify_logical_interface_list),
+        Optional("loopback"): str,
+        Optional("lsi-traffic-statistics"): {
+            Optional("@junos:style"): str,
+            "input-bps": str,
+            "input-bytes": str,
+            "input-packets": str,
+            "input-pps": str
+        },
+        Optional("mru"): str,
+        Optional("mtu"): str,
+        "name": str,
+        Optional("oper-status"): str,
+        Optional("pad-to-minimum-frame-size"): str,
+        Optional("physical-interface-cos-information"): {
+            "physical-interface-cos-hw-max-queues": str,
+            "physical-interface-cos-use-max-queues": str
+        },
+        Optional("snmp-index"): str,
+        Optional("sonet-mode"): str,
+        Optional("source-filtering"): str,
+        Optional("speed"): str,
+        Optional("stp-traffic-statistics"): {
+            Optional("@junos:style"): str,
+            Optional("stp-input-bytes-dropped"): str,
+            Optional("stp-input-packets-dropped"): str,
+            Optional("stp-output-bytes-dropped"): str,
+            Optional("stp-output-packets-dropped"): str
+        },
+        Optional("traffic-statistics"): {
+            Optional("@junos:style"): str,
+            Optional("input-bps"): str,
+            Optional("output-bytes"): str,
+            Optional("input-bytes"): str,
+            Optional("input-packets"): str,
+            Optional("input-pps"): str,
+            Optional("output-bps"): str,
+            Optional("output-packets"): str,
+            Optional("output-pps"): str,
+            Optional("ipv6-transit-statistics"): {
+                Optional("input-bps"): str,
+                Optional("input-bytes"): str,
+                Optional("input-packets"): str,
+                Optional("input-pps"): str,
+                Optional("output-bps"): str,
+                Optional("output-bytes"): str,
+                Optional("output-packets"): str,
+                Optional("output-pps"): str
             },
-            Optional("queue-counters"): {
+        },
+        Optional("output-error-list"): {
+            Optional("aged-packets"): str,
+            Optional("carrier-transitions"): str,
+            Optional("hs-link-crc-errors"): str,
+            Optional("mtu-errors"): str,
+            Optional("output-collisions"): str,
+            Optional("output-drops"): str,
+            Optional("output-errors"): str,
+            Optional("output-fifo-errors"): str,
+            Optional("output-resource-errors"): str
+        },
+        Optional("ethernet-mac-statistics"): {
                 Optional("@junos:style"): str,
-                "interface-cos-short-summary": {
-                    "intf-cos-num-queues-in-use": str,
-                    "intf-cos-num-queues-supported": str,
-                },
-                "queue": Use(verify_queue_list)
+                "input-broadcasts": str,
+                "input-bytes": str,
+                "input-code-violations": str,
+                "input-crc-errors": str,
+                "input-fifo-errors": str,
+                "input-fragment-frames": str,
+                "input-jabber-frames": str,
+                "input-mac-control-frames": str,
+                "input-mac-pause-frames": str,
+                "input-multicasts": str,
+                "input-oversized-frames": str,
+                "input-packets": str,
+                Optional("input-total-errors"): str,
+                "input-unicasts": str,
+                "input-vlan-tagged-frames": str,
+                "output-broadcasts": str,
+                "output-bytes": str,
+                "output-crc-errors": str,
+                "output-fifo-errors": str,
+                "output-mac-control-frames": str,
+                "output-mac-pause-frames": str,
+                "output-multicasts": str,
+                "output-packets": str,
+                Optional("output-total-errors"): str,
+                "output-unicasts": str
+        },
+        Optional("input-error-list"): {
+                Optional("framing-errors"): str,
+                Optional("input-discards"): str,
+                Optional("input-drops"): str,
+                Optional("input-errors"): str,
+                Optional("input-fifo-errors"): str,
+                Optional("input-giants"): str,
+                Optional("input-l2-channel-errors"): str,
+                Optional("input-l2-mismatch-timeouts"): str,
+                Optional("input-l3-incompletes"): str,
+                Optional("input-resource-errors"): str,
+                Optional("input-runts"): str
+        },
+        Optional("transit-traffic-statistics"): {
+            "input-bps": str,
+            "input-bytes": str,
+            "input-packets": str,
+            "input-pps": str,
+            Optional("ipv6-transit-statistics"): {
+                "input-bps": str,
+                "input-bytes": str,
+                "input-packets": str,
+                "input-pps": str,
+                "output-bps": str,
+                "output-bytes": str,
+                "output-packets": str,
+                "output-pps": str
             },
-        })
-        # Validate each dictionary in list
-        for item in value:
-            physical_interface_schema.validate(item)
-        return value
-    
+            "output-bps": str,
+            "output-bytes": str,
+            "output-packets": str,
+            "output-pps": str
+        },
+        Optional("queue-counters"): {
+            Optional("@junos:style"): str,
+            "interface-cos-short-summary": {
+                "intf-cos-num-queues-in-use": str,
+                "intf-cos-num-queues-supported": str,
+            },
+            "queue": Use(verify_queue_list)
+        },
+    }, 'physical interface is not a list')
+
     schema = {
         Optional("@xmlns:junos"): str,
         "interface-information": {
@@ -767,6 +723,38 @@ class ShowInterfacesSchema(MetaParser):
 class ShowInterfaces(ShowInterfacesSchema):
     cli_command = ['show interfaces']
 
+    # parse(context='json') calls json()
+    CONTEXT_LIST = MetaParser.CONTEXT_LIST + ('json',)
+
+    def xml(self, output=None):
+        return self.parse_structured('xml', self.cli_command[0], output)
+
+    def json(self, output=None):
+        return self.parse_structured('json', self.cli_command[0], output)
+
+    def parse_structured(self, display, command, output=None):
+        """ Return the result of the '| display xml' or '| display json'
+            output of command, read incrementally
+        """
+        if not output:
+            output = self.device.execute(
+                '{} | display {}'.format(command, display))
+        return build_result(self.parse_iter_structured(display, output))
+
+    def parse_iter_structured(self, display, output):
+        """ Yield the physical interfaces of the '| display xml' or
+            '| display json' output one by one, as (path, record) where path
+            is the keys leading to the record in the result
+        """
+        structured = structured_output(output, display)
+        interface_schema = self.verify_physical_interface_list.schema
+        index = 0
+        for event, name, element in structured.iter(('physical-interface',)):
+            if event == 'end':
+                yield (('interface-information', 'physical-interface', index),
+                       structured.to_dict(element, interface_schema))
+                index += 1
+
     def cli(self, output=None):
 
         if not output:
@@ -1783,6 +1771,20 @@ class ShowInterfaces(ShowInterfacesSchema):
 class ShowInterfacesExtensive(ShowInterfaces):
     cli_command = ['show interfaces extensive',
         'show interfaces {interface} extensive']
+
+    def xml(self, interface=None, output=None):
+        return self.parse_structured('xml', self.get_command(interface),
+                                     output)
+
+    def json(self, interface=None, output=None):
+        return self.parse_structured('json', self.get_command(interface),
+                                     output)
+
+    def get_command(self, interface=None):
+        if interface:
+            return self.cli_command[1].format(interface=interface)
+        return self.cli_command[0]
+
     def cli(self, interface=None, output=None):
 
         if not output:
@@ -2847,6 +2849,15 @@ class ShowInterfacesQueue(ShowInterfacesQueueSchema):
 
 class ShowInterfacesExtensiveInterface(ShowInterfaces):
     cli_command = 'show interfaces extensive {interface}'
+
+    def xml(self, interface, output=None):
+        return self.parse_structured(
+            'xml', self.cli_command.format(interface=interface), output)
+
+    def json(self, interface, output=None):
+        return self.parse_structured(
+            'json', self.cli_command.format(interface=interface), output)
+
     def cli(self, interface, output=None):
 
         if not output:
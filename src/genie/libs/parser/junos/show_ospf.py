@@ -40,6 +40,11 @@ from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, Optional, Use,
                                                 Schema, Or)
 
+# import parser utils
+from genie.libs.parser.utils.schema import ListSchema
+from genie.libs.parser.utils.stream import build_result
+from genie.libs.parser.utils.structured import structured_output, schema_of
+
 
 class ShowOspfInterfaceBriefSchema(MetaParser):
     """ Schema for:
@@ -2249,132 +2254,110 @@ class ShowOspfDatabaseExtensiveSchema(MetaParser):
             ]
         }
     }'''
-    def validate_ospf_database(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-database is not a list')
-
-        def validate_ospf_link(value):
-            if not isinstance(value, list):
-                raise SchemaError('ospf-link is not a list')
-            ospf_link_schema = Schema({
-                "link-data": str,
-                "link-id": str,
-                "link-type-name": str,
-                "link-type-value": str,
-                "metric": str,
-                "ospf-topology-count": str
-            })
-            for item in value:
-                ospf_link_schema.validate(item)
-            return value
-
-        def validate_ospf_lsa_topology_link(value):
-            if not isinstance(value, list):
-                raise SchemaError('ospf-lsa-topology-link is not a list')
-            ospf_lsa_topology_ink_schema = Schema({
-                "link-type-name":
-                str,
-                "ospf-lsa-topology-link-metric":
-                str,
-                "ospf-lsa-topology-link-node-id":
-                str,
-                "ospf-lsa-topology-link-state":
-                str
-            })
-            for item in value:
-                ospf_lsa_topology_ink_schema.validate(item)
-            return value
-
-        ospf_database_schema = Schema({
-            "advertising-router": str,
-            "age": str,
-            "checksum": str,
-            "lsa-id": str,
-            Optional("our-entry"): bool,
-            "lsa-length": str,
-            "lsa-type": str,
-            "options": str,
-            Optional("ospf-network-lsa"): {
-                "address-mask": str,
-                "attached-router": list,
-                "ospf-lsa-topology": {
-                    "ospf-lsa-topology-link":
-                    Use(validate_ospf_lsa_topology_link),
-                    "ospf-topology-id": str,
-                    "ospf-topology-name": str
-                }
+    # Validators of the lists, sharing their schemas across parses
+    validate_ospf_link = ListSchema({
+        "link-data": str,
+        "link-id": str,
+        "link-type-name": str,
+        "link-type-value": str,
+        "metric": str,
+        "ospf-topology-count": str
+    }, 'ospf-link is not a list')
+
+    validate_ospf_lsa_topology_link = ListSchema({
+        "link-type-name": str,
+        "ospf-lsa-topology-link-metric": str,
+        "ospf-lsa-topology-link-node-id": str,
+        "ospf-lsa-topology-link-state": str
+    }, 'ospf-lsa-topology-link is not a list')
+
+    validate_ospf_database = ListSchema({
+        "advertising-router": str,
+        "age": str,
+        "checksum": str,
+        "lsa-id": str,
+        Optional("our-entry"): bool,
+        "lsa-length": str,
+        "lsa-type": str,
+        "options": str,
+        Optional("ospf-network-lsa"): {
+            "address-mask": str,
+            "attached-router": list,
+            "ospf-lsa-topology": {
+                "ospf-lsa-topology-link":
+                Use(validate_ospf_lsa_topology_link),
+                "ospf-topology-id": str,
+                "ospf-topology-name": str
+            }
+        },
+        "ospf-database-extensive": {
+            "aging-timer": {
+                "#text": str
             },
-            "ospf-database-extensive": {
-                "aging-timer": {
-                    "#text": str
-                },
-                Optional("expiration-time"): {
-                    "#text": str
-                },
-                Optional("installation-time"): {
-                    "#text": str
-                },
-                Optional("generation-timer"): {
-                    "#text": str
-                },
-                Optional("lsa-change-count"): str,
-                Optional("lsa-changed-time"): {
-                    "#text": str
-                },
-                Optional("send-time"): {
-                    Optional("#text"): str
-                },
-                Optional("database-entry-state"): str
+            Optional("expiration-time"): {
+                "#text": str
             },
-            Optional("ospf-router-lsa"): {
-                "bits": str,
-                "link-count": str,
-                "ospf-link": Use(validate_ospf_link),
-                Optional("ospf-lsa-topology"): {
-                    "ospf-lsa-topology-link":
-                    Use(validate_ospf_lsa_topology_link),
-                    "ospf-topology-id": str,
-                    "ospf-topology-name": str
-                }
+            Optional("installation-time"): {
+                "#text": str
             },
-            Optional("ospf-opaque-area-lsa"): {
-                "tlv-block": {
-                    "formatted-tlv-data": str,
-                    "tlv-length": str,
-                    "tlv-type-name": str,
-                    "tlv-type-value": str
-                },
-                Optional("te-subtlv"): {
-                    "formatted-tlv-data": list,
-                    "tlv-length": list,
-                    "tlv-type-name": list,
-                    "tlv-type-value": list
-                }
+            Optional("generation-timer"): {
+                "#text": str
             },
-            Optional("ospf-external-lsa"): {
-                "address-mask": str,
-                "ospf-external-lsa-topology": {
-                    "forward-address": str,
-                    "ospf-topology-id": str,
-                    "ospf-topology-metric": str,
-                    "ospf-topology-name": str,
-                    "tag": str,
-                    "type-value": str
-                }
+            Optional("lsa-change-count"): str,
+            Optional("lsa-changed-time"): {
+                "#text": str
             },
-            Optional("ospf-summary-lsa"): {
-                "address-mask": str,
-                "ospf-summary-lsa-topology": {
-                    "ospf-topology-name": str,
-                    "ospf-topology-id": str,
-                    "ospf-topology-metric": str,
-                }
+            Optional("send-time"): {
+                Optional("#text"): str
             },
-            "sequence-number": str
-        })
-        for item in value:
-            ospf_database_schema.validate(item)
-        return value
+            Optional("database-entry-state"): str
+        },
+        Optional("ospf-router-lsa"): {
+            "bits": str,
+            "link-count": str,
+            "ospf-link": Use(validate_ospf_link),
+            Optional("ospf-lsa-topology"): {
+                "ospf-lsa-topology-link":
+                Use(validate_ospf_lsa_topology_link),
+                "ospf-topology-id": str,
+                "ospf-topology-name": str
+            }
+        },
+        Optional("ospf-opaque-area-lsa"): {
+            "tlv-block": {
+                "formatted-tlv-data": str,
+                "tlv-length": str,
+                "tlv-type-name": str,
+                "tlv-type-value": str
+            },
+            Optional("te-subtlv"): {
+                "formatted-tlv-data": list,
+                "tlv-length": list,
+                "tlv-type-name": list,
+                "tlv-type-value": list
+            }
+        },
+        Optional("ospf-external-lsa"): {
+            "address-mask": str,
+            "ospf-external-lsa-topology": {
+                "forward-address": str,
+                "ospf-topology-id": str,
+                "ospf-topology-metric": str,
+                "ospf-topology-name": str,
+                "tag": str,
+                "type-value": str
+            }
+        },
+        Optional("ospf-summary-lsa"): {
+            "address-mask": str,
+            "ospf-summary-lsa-topology": {
+                "ospf-topology-name": str,
+                "ospf-topology-id": str,
+                "ospf-topology-metric": str,
+            }
+        },
+        "sequence-number": str
+    }, 'ospf-database is not a list')
 
     schema = {
         "ospf-database-information": {
@@ -2395,6 +2378,49 @@ class ShowOspfDatabaseExtensive(ShowOspfDatabaseExtensiveSchema):
         'show ospf database extensive',
         'show ospf database {data_type} extensive'
         ]
+    xml_command = [command + ' | display xml' for command in cli_command]
+    json_command = [command + ' | display json' for command in cli_command]
+
+    # parse(context='json') calls json()
+    CONTEXT_LIST = MetaParser.CONTEXT_LIST + ('json',)
+
+    def xml(self, data_type=None, output=None):
+        if not output:
+            output = self.device.execute(
+                self.xml_command[1].format(data_type=data_type)
+                if data_type else self.xml_command[0])
+        return build_result(self.parse_iter_structured('xml', output))
+
+    def json(self, data_type=None, output=None):
+        if not output:
+            output = self.device.execute(
+                self.json_command[1].format(data_type=data_type)
+                if data_type else self.json_command[0])
+        return build_result(self.parse_iter_structured('json', output))
+
+    def parse_iter_structured(self, display, output):
+        """ Yield the area header and the lsas of the '| display xml' or
+            '| display json' output one by one, as (path, record) where path
+            is the keys leading to the record in the result. The xml output
+            is read incrementally.
+        """
+        structured = structured_output(output, display)
+        header_schema = schema_of(
+            self.schema['ospf-database-information'], 'ospf-area-header')
+        lsa_schema = self.validate_ospf_database.schema
+        index = 0
+
+        for event, name, element in structured.iter(
+                ('ospf-area-header', 'ospf-database')):
+            if event == 'start':
+                continue
+            if name == 'ospf-area-header':
+                yield (('ospf-database-information', 'ospf-area-header'),
+                       structured.to_dict(element, header_schema))
+            else:
+                yield (('ospf-database-information', 'ospf-database', index),
+                       structured.to_dict(element, lsa_schema))
+                index += 1
 
     def cli(self, data_type=None, output=None):
         if not output:
@@ -3296,6 +3322,18 @@ class ShowOspfDatabaseAdvertisingRouterExtensive(ShowOspfDatabaseExtensive):
             out = output
         return super().cli(output=out)
 
+    def xml(self, ipaddress, output=None):
+        if not output:
+            output = self.device.execute(
+                self.cli_command.format(ipaddress=ipaddress) + ' | display xml')
+        return super().xml(output=output)
+
+    def json(self, ipaddress, output=None):
+        if not output:
+            output = self.device.execute(
+                self.cli_command.format(ipaddress=ipaddress) + ' | display json')
+        return super().json(output=output)
+
 class ShowOspfNeighborExtensiveSchema(MetaParser):
     """ Schema for:
             * show ospf neighbor extensive
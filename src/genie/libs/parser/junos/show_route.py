@@ -29,6 +29,12 @@ import re
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema
+
+# import parser utils
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.schema import ListSchema
+from genie.libs.parser.utils.stream import Records, iter_lines, build_result
+from genie.libs.parser.utils.structured import structured_output
 '''
 Schema for:
     * show route table {table}
@@ -240,81 +246,52 @@ class ShowRouteSchema(MetaParser):
             }
         }
     """
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        def validate_rt_list(value):
-            # Pass rt list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('rt list is not a list')
-            
-            def validate_nh_list(value):
-                # Pass nh list of dict in value
-                if not isinstance(value, list):
-                    raise SchemaError('nh list is not a list')
-                # Create nh-list Entry Schema
-                nh_schema = Schema({
-                            Optional("mpls-label"): str,
-                            Optional("selected-next-hop"): str,
-                            Optional("nh-local-interface"): str,
-                            Optional("nh-table"): str,
-                            Optional("to"): str,
-                            Optional("via"): str
-                        })
-                # Validate each dictionary in list
-                for item in value:
-                    nh_schema.validate(item)
-                return value
-
-            # Create rt-list Entry Schema
-            rt_schema = Schema({
-                    Optional("@junos:style"): str,
-                    Optional("rt-destination"): str,
-                    "rt-entry": {
-                        Optional("active-tag"): str,
-                        "age": {
-                            "#text": str,
-                            Optional("@junos:seconds"): str
-                        },
-                        Optional('as-path'): str,
-                        Optional("current-active"): str,
-                        Optional("last-active"): str,
-                        Optional("learned-from"): str,
-                        Optional("local-preference"): str,
-                        Optional("med"): str,
-                        Optional("metric"): str,
-                        Optional("metric2"): str,
-                        Optional("nh"): Use(validate_nh_list),
-                        Optional('nh-type'): str,
-                        "preference": str,
-                        Optional("preference2"): str,
-                        "protocol-name": str,
-                        Optional('rt-tag'): str,
-                        Optional("validation-state"): str
-                    }
-                })
-            # Validate each dictionary in list
-            for item in value:
-                rt_schema.validate(item)
-            return value
-
-
-        # Create RouteEntry Schema
-        route_entry_schema = Schema({
-                "active-route-count": str,
-                "destination-count": str,
-                "hidden-route-count": str,
-                "holddown-route-count": str,
-                Optional("rt"): Use(validate_rt_list),
-                "table-name": str,
-                "total-route-count": str
-            })
-        # Validate each dictionary in list
-        for item in value:
-            route_entry_schema.validate(item)
-        return value
+    # Validators of the lists, sharing their schemas across parses
+    validate_nh_list = ListSchema({
+        Optional("mpls-label"): str,
+        Optional("selected-next-hop"): str,
+        Optional("nh-local-interface"): str,
+        Optional("nh-table"): str,
+        Optional("to"): str,
+        Optional("via"): str
+    }, 'nh list is not a list')
+
+    validate_rt_list = ListSchema({
+        Optional("@junos:style"): str,
+        Optional("rt-destination"): str,
+        "rt-entry": {
+            Optional("active-tag"): str,
+            "age": {
+                "#text": str,
+                Optional("@junos:seconds"): str
+            },
+            Optional('as-path'): str,
+            Optional("current-active"): str,
+            Optional("last-active"): str,
+            Optional("learned-from"): str,
+            Optional("local-preference"): str,
+            Optional("med"): str,
+            Optional("metric"): str,
+            Optional("metric2"): str,
+            Optional("nh"): Use(validate_nh_list),
+            Optional('nh-type'): str,
+            "preference": str,
+            Optional("preference2"): str,
+            "protocol-name": str,
+            Optional('rt-tag'): str,
+            Optional("validation-state"): str
+        }
+    }, 'rt list is not a list')
+
+    validate_route_table_list = ListSchema({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): Use(validate_rt_list),
+        "table-name": str,
+        "total-route-count": str
+    }, 'route-table is not a list')
 
     # Main Schema
     schema = {
@@ -340,84 +317,118 @@ class ShowRoute(ShowRouteSchema):
                     'show route protocol {protocol} {ip_address}',
                     'show route protocol {protocol} table {table}']
 
-    def cli(self, protocol=None, ip_address=None, table=None, output=None):
-        if not output:
-            if protocol and table:
-                cmd = self.cli_command[4].format(
-                    protocol=protocol,
-                    table=table
-                )
-            elif ip_address and not protocol:
-                cmd = self.cli_command[1].format(
-                    ip_address=ip_address
-                )
-            elif protocol and not ip_address:
-                cmd = self.cli_command[2].format(
-                    protocol=protocol
-                )
-            elif ip_address and protocol:
-                cmd = self.cli_command[3].format(
-                    ip_address=ip_address,
-                    protocol=protocol
-                )
-            else:
-                cmd = self.cli_command[0]
-
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        ret_dict = {}
-        rt_destination = None
-
-
+    patterns = Patterns(
         # inet.0: 932 destinations, 1618 routes (932 active, 0 holddown, 0 hidden)
-        p1 = re.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
-                r'destinations, +(?P<total_route_count>\d+) +routes +'
-                r'\((?P<active_route_count>\d+) +active, +(?P<holddown>\d+) +'
-                r'holddown, +(?P<hidden>\d+) +hidden\)$')
-        
+        p1=r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
+           r'destinations, +(?P<total_route_count>\d+) +routes +'
+           r'\((?P<active_route_count>\d+) +active, +(?P<holddown>\d+) +'
+           r'holddown, +(?P<hidden>\d+) +hidden\)$',
+
         # 10.220.0.0/16      *[BGP/170] 3w3d 03:12:24, MED 12003, localpref 120, from 10.169.14.240
         # 10.169.14.240/32  *[Static/5] 5w2d 15:42:25
         # *[OSPF3/10] 3w1d 17:03:23, metric 5
         # 0.0.0.0/0          *[OSPF/150/10] 3w3d 03:24:58, metric 101, tag 0
         # 167963             *[LDP/9] 1w6d 20:41:01, metric 1, metric2 100, tag 65000500
         # 10.16.2.2/32         *[Static/5] 00:00:02
-        p2 = re.compile(r'^((?P<rt_destination>\S+) +)?(?P<active_tag>[\*\+\-])?'
-                        r'\[(?P<protocol>[\w\-]+)\/(?P<preference>\d+)'
-                        r'(\/(?P<preference2>\d+))?\] +(?P<text>\S+( +\S+)?)'
-                        r'(, +metric +(?P<metric>\d+))?(, +metric2 +(?P<metric2>\d+))?'
-                        r'(, +tag +(?P<rt_tag>\d+))?(, +MED +(?P<med>\w+))?'
-                        r'(, +localpref +(?P<local_preference>\d+))?'
-                        r'(, +from +(?P<learned_from>\S+))?$')
+        p2=r'^((?P<rt_destination>\S+) +)?(?P<active_tag>[\*\+\-])?'
+           r'\[(?P<protocol>[\w\-]+)\/(?P<preference>\d+)'
+           r'(\/(?P<preference2>\d+))?\] +(?P<text>\S+( +\S+)?)'
+           r'(, +metric +(?P<metric>\d+))?(, +metric2 +(?P<metric2>\d+))?'
+           r'(, +tag +(?P<rt_tag>\d+))?(, +MED +(?P<med>\w+))?'
+           r'(, +localpref +(?P<local_preference>\d+))?'
+           r'(, +from +(?P<learned_from>\S+))?$',
 
         # MultiRecv
-        p2_1 = re.compile(r'^(?P<nh_type>MultiRecv)$')
-        
+        p2_1=r'^(?P<nh_type>MultiRecv)$',
+
         # >  to 10.169.14.121 via ge-0/0/1.0
-        p3 = re.compile(r'^(\> +)?(to +(?P<to>\S+) +)?via +(?P<via>\S+)'
-                        r'(, +(?P<mpls_label>[\S\s]+))?$')
-        
+        p3=r'^(\> +)?(to +(?P<to>\S+) +)?via +(?P<via>\S+)'
+           r'(, +(?P<mpls_label>[\S\s]+))?$',
+
         # Local via fxp0.0
-        p3_1 = re.compile(r'^Local +via +(?P<nh_local_interface>\S+)$')
+        p3_1=r'^Local +via +(?P<nh_local_interface>\S+)$',
 
         # AS path: (65151 65000) I, validation-state: unverified
         # AS path: I
         # AS path: 3 4 I, validation-state: unverified
-        p4 = re.compile(r'AS +path:(?P<as_path>([()\d\s]+ )?\w)'
-                        r'(, validation-state: +(?P<validation_state>\S+))?$')
-        
+        p4=r'AS +path:(?P<as_path>([()\d\s]+ )?\w)'
+           r'(, validation-state: +(?P<validation_state>\S+))?$',
+
         # to table inet.0
-        p5 = re.compile(r'^to +table +(?P<nh_table>\S+)$')
+        p5=r'^to +table +(?P<nh_table>\S+)$',
 
         # 2001:db8:eb18:ca45::1/128
-        pIP = re.compile(r'^(?P<rt_destination>[\w:\/]+)$')
+        pIP=r'^(?P<rt_destination>[\w:\/]+)$'
+    )
+
+    xml_command = [command + ' | display xml' for command in cli_command]
+    json_command = [command + ' | display json' for command in cli_command]
+
+    # parse(context='json') calls json()
+    CONTEXT_LIST = MetaParser.CONTEXT_LIST + ('json',)
+
+    def cli(self, protocol=None, ip_address=None, table=None, output=None):
+        return build_result(self.parse_iter(
+            protocol=protocol, ip_address=ip_address, table=table,
+            output=output))
+
+    def xml(self, protocol=None, ip_address=None, table=None, output=None):
+        return build_result(self.parse_iter_structured(
+            'xml', protocol=protocol, ip_address=ip_address, table=table,
+            output=output))
+
+    def json(self, protocol=None, ip_address=None, table=None, output=None):
+        return build_result(self.parse_iter_structured(
+            'json', protocol=protocol, ip_address=ip_address, table=table,
+            output=output))
+
+    def get_command(self, commands, protocol=None, ip_address=None,
+                    table=None):
+        """ Return the command of commands, cli_command, xml_command or
+            json_command, for the arguments
+        """
+        if protocol and table:
+            return commands[4].format(protocol=protocol, table=table)
+        elif ip_address and not protocol:
+            return commands[1].format(ip_address=ip_address)
+        elif protocol and not ip_address:
+            return commands[2].format(protocol=protocol)
+        elif ip_address and protocol:
+            return commands[3].format(ip_address=ip_address,
+                                      protocol=protocol)
+        return commands[0]
+
+    def parse_iter(self, protocol=None, ip_address=None, table=None, output=None):
+        """ Yield the route tables and routes one by one, as (path, record)
+            where path is the keys leading to the record in the cli() result:
+            ('route-information', 'route-table', table_index) for a route
+            table, without its routes, and
+            ('route-information', 'route-table', table_index, 'rt', rt_index)
+            for a route.
+
+            output can also be a file object or any iterable of lines.
+        """
+        if not output:
+            out = self.device.execute(self.get_command(
+                self.cli_command, protocol=protocol, ip_address=ip_address,
+                table=table))
+        else:
+            out = output
+
+        records = Records()
+        table_index = -1
+        rt_destination = None
+
+        p = self.patterns
+
+        for line in iter_lines(out):
+            if records.completed:
+                yield from records.pop()
 
-        for line in out.splitlines():
             line = line.strip()
 
             # inet.0: 932 destinations, 1618 routes (932 active, 0 holddown, 0 hidden)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 table_name = group['table_name']
@@ -426,8 +437,8 @@ class ShowRoute(ShowRouteSchema):
                 active_route_count = group['active_route_count']
                 holddown = group['holddown']
                 hidden = group['hidden']
-                route_information_dict = ret_dict.setdefault('route-information', {})
-                route_table_list = route_information_dict.setdefault('route-table', [])
+                table_index += 1
+                rt_index = 0
                 route_table_dict = {}
                 route_table_dict.update({'active-route-count': active_route_count})
                 route_table_dict.update({'destination-count': destination_count})
@@ -435,12 +446,13 @@ class ShowRoute(ShowRouteSchema):
                 route_table_dict.update({'holddown-route-count': holddown})
                 route_table_dict.update({'table-name': table_name})
                 route_table_dict.update({'total-route-count': total_route_count})
-                route_table_list.append(route_table_dict)
+                records.add(route_table_dict, 'route-information',
+                            'route-table', table_index)
                 continue
             
             # 10.169.14.240/32  *[Static/5] 5w2d 15:42:25
             # *[OSPF3/10] 3w1d 17:03:23, metric 5
-            m = p2.match(line) 
+            m = p.p2.match(line) 
             if m:
                 group = m.groupdict()
                 if not rt_destination:
@@ -456,9 +468,9 @@ class ShowRoute(ShowRouteSchema):
                 learned_from = group['learned_from']
                 local_preference = group['local_preference']
                 med = group['med']
-                rt_list = route_table_dict.setdefault('rt', [])
-                rt_dict = {}
-                rt_list.append(rt_dict)
+                rt_dict = records.open('route-information', 'route-table',
+                                       table_index, 'rt', rt_index)
+                rt_index += 1
                 rt_entry_dict = {}
                 if active_tag:
                     rt_entry_dict.update({'active-tag': active_tag})
@@ -486,14 +498,14 @@ class ShowRoute(ShowRouteSchema):
                 rt_destination = None
                 continue
             
-            m = p2_1.match(line)
+            m = p.p2_1.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'nh-type': group['nh_type']})
                 continue
 
             # >  to 10.169.14.121 via ge-0/0/1.0
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 nh_list = rt_entry_dict.setdefault('nh', [])
@@ -503,7 +515,7 @@ class ShowRoute(ShowRouteSchema):
                 continue
 
             # Local via fxp0.0
-            m = p3_1.match(line)
+            m = p.p3_1.match(line)
             if m:
                 group = m.groupdict()
                 nh_list = rt_entry_dict.setdefault('nh', [])
@@ -514,14 +526,14 @@ class ShowRoute(ShowRouteSchema):
             
             # AS path: (65151 65000) I, validation-state: unverified
             # AS path: I
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({k.replace('_', '-'):v for k, v in group.items() if v is not None})
                 continue
             
             # to table inet.0
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 nh_list = rt_entry_dict.setdefault('nh', [])
@@ -531,12 +543,60 @@ class ShowRoute(ShowRouteSchema):
                 continue
 
             # 2001:db8:eb18:ca45::1/128
-            m = pIP.match(line)
+            m = p.pIP.match(line)
             if m:
                 group = m.groupdict()
                 rt_destination = group['rt_destination']
                 continue
-        return ret_dict
+
+        yield from records.close()
+
+    def parse_iter_structured(self, display='xml', protocol=None,
+                              ip_address=None, table=None, output=None):
+        """ Yield the route tables and routes of the '| display xml' or
+            '| display json' output one by one, as parse_iter does. The xml
+            output is read incrementally.
+
+            A route with several entries is yielded as one route per entry,
+            the first one with the destination, as in the cli output.
+        """
+        if not output:
+            commands = self.json_command if display == 'json' \
+                else self.xml_command
+            output = self.device.execute(self.get_command(
+                commands, protocol=protocol, ip_address=ip_address,
+                table=table))
+
+        structured = structured_output(output, display)
+        table_schema = self.validate_route_table_list.schema
+        rt_schema = self.validate_rt_list.schema
+        table_index = -1
+        rt_index = 0
+
+        for event, name, element in structured.iter(('route-table', 'rt')):
+            if name == 'route-table':
+                if event == 'start':
+                    table_index += 1
+                    rt_index = 0
+                else:
+                    yield (('route-information', 'route-table', table_index),
+                           structured.to_dict(element, table_schema))
+                continue
+            if event == 'start':
+                continue
+
+            rt_dict = structured.to_dict(element, rt_schema)
+            entries = rt_dict.get('rt-entry')
+            if not isinstance(entries, list):
+                entries = [entries]
+            for entry in entries:
+                if entry is not None:
+                    rt_dict['rt-entry'] = entry
+                yield (('route-information', 'route-table', table_index,
+                        'rt', rt_index), rt_dict)
+                rt_index += 1
+                rt_dict = {k: v for k, v in rt_dict.items()
+                           if k != 'rt-destination'}
 
 class ShowRouteProtocolNoMore(ShowRoute):
     """ Parser for:
@@ -648,176 +708,109 @@ class ShowRouteProtocolExtensiveSchema(MetaParser):
             }
         }
     """
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        def validate_rt_list(value):
-            # Pass rt list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('rt is not a list')
-            def validate_rt_entry_list(value):
-                if isinstance(value, dict):
-                    value = [value]
-                if not isinstance(value, list):
-                    raise SchemaError('rt-entry is not a list')
-                def validate_nh_list(value):
-                    # Pass nh list of dict in value
-                    if not isinstance(value, list):
-                        raise SchemaError('nh is not a list')
-                    nh_schema = Schema({
-                        Optional("@junos:indent"): str,
-                        Optional("label-element"): str,
-                        Optional("label-element-childcount"): str,
-                        Optional("label-element-lspid"): str,
-                        Optional("label-element-parent"): str,
-                        Optional("label-element-refcount"): str,
-                        Optional("label-ttl-action"): str,
-                        Optional("load-balance-label"): str,
-                        Optional("mpls-label"): str,
-                        "nh-string": str,
-                        Optional("selected-next-hop"): str,
-                        Optional("session"): str,
-                        Optional("to"): str,
-                        "via": str,
-                        Optional("weight"): str
-                    })
-                    # Validate each dictionary in list
-                    for item in value:
-                        nh_schema.validate(item)
-                    return value
-                def validate_protocol_nh_list(value):
-                    # Pass nh list of dict in value
-                    if isinstance(value, dict):
-                        value = [value]
-                    if not isinstance(value, list):
-                        raise SchemaError('protocol-nh is not a list')
-                    def validate_nh_list(value):
-                        # Pass nh list of dict in value
-                        if isinstance(value, dict):
-                            value = [value]
-                        if not isinstance(value, list):
-                            raise SchemaError('nh is not a list')
-                        nh_schema = Schema({
-                            Optional("@junos:indent"): str,
-                            Optional("label-element"): str,
-                            Optional("label-element-childcount"): str,
-                            Optional("label-element-lspid"): str,
-                            Optional("label-element-parent"): str,
-                            Optional("label-element-refcount"): str,
-                            Optional("label-ttl-action"): str,
-                            Optional("load-balance-label"): str,
-                            Optional("mpls-label"): str,
-                            "nh-string": str,
-                            Optional("selected-next-hop"): str,
-                            Optional("session"): str,
-                            Optional("to"): str,
-                            "via": str,
-                            Optional("weight"): str
-                        })
-                        # Validate each dictionary in list
-                        for item in value:
-                            nh_schema.validate(item)
-                        return value
-                    protocol_nh_schema = Schema({
-                        Optional("@junos:indent"): str,
-                        Optional("forwarding-nh-count"): str,
-                        "indirect-nh": str,
-                        Optional("label-ttl-action"): str,
-                        Optional("load-balance-label"): str,
-                        Optional("metric"): str,
-                        Optional("mpls-label"): str,
-                        Optional("nh"): Use(validate_nh_list),
-                        Optional("nh-index"): str,
-                        Optional("nh-type"): str,
-                        Optional("output"): str,
-                        "to": str
-                    })
-                    # Validate each dictionary in list
-                    for item in value:
-                        protocol_nh_schema.validate(item)
-                    return value
-                rt_entry_schema = Schema({
-                    Optional("active-tag"): str,
-                    Optional("age"): {
-                        "#text": str,
-                        Optional("@junos:seconds"): str
-                    },
-                    Optional("announce-bits"): str,
-                    Optional("announce-tasks"): str,
-                    Optional("as-path"): str,
-                    Optional("cluster-list"): str,
-                    Optional("bgp-path-attributes"): {
-                        "attr-as-path-effective": {
-                            "aspath-effective-string": str,
-                            "attr-value": str
-                        }
-                    },
-                    Optional("current-active"): str,
-                    Optional("inactive-reason"): str,
-                    Optional("last-active"): str,
-                    Optional("local-as"): str,
-                    Optional("metric"): str,
-                    Optional("metric2"): str,
-                    Optional("nh"): Use(validate_nh_list),
-                    "nh-address": str,
-                    Optional("nh-index"): str,
-                    Optional("nh-kernel-id"): str,
-                    "nh-reference-count": str,
-                    Optional("gateway"): str,
-                    Optional("nh-type"): str,
-                    "preference": str,
-                    Optional("preference2"): str,
-                    "protocol-name": str,
-                    Optional("protocol-nh"): Use(validate_protocol_nh_list),
-                    "rt-entry-state": str,
-                    Optional("rt-ospf-area"): str,
-                    Optional("rt-tag"): str,
-                    "task-name": str,
-                    Optional("validation-state"): str
-                })
-                # Validate each dictionary in list
-                for item in value:
-                    rt_entry_schema.validate(item)
-                return value
-
-            # Create rt Schema
-            rt_schema = Schema({
-                Optional("@junos:style"): str,
-                "rt-announced-count": str,
-                "rt-destination": str,
-                Optional("rt-entry"): Use(validate_rt_entry_list),
-                "rt-entry-count": {
-                    "#text": str,
-                    Optional("@junos:format"): str
-                },
-                Optional("rt-prefix-length"): str,
-                Optional("rt-state"): str,
-                Optional("tsi"): {
-                    "#text": str,
-                    Optional("@junos:indent"): str
-                }
-            })
-            # Validate each dictionary in list
-            for item in value:
-                rt_schema.validate(item)
-            return value
+    # Validators of the lists, sharing their schemas across parses
+    nh_schema = {
+        Optional("@junos:indent"): str,
+        Optional("label-element"): str,
+        Optional("label-element-childcount"): str,
+        Optional("label-element-lspid"): str,
+        Optional("label-element-parent"): str,
+        Optional("label-element-refcount"): str,
+        Optional("label-ttl-action"): str,
+        Optional("load-balance-label"): str,
+        Optional("mpls-label"): str,
+        "nh-string": str,
+        Optional("selected-next-hop"): str,
+        Optional("session"): str,
+        Optional("to"): str,
+        "via": str,
+        Optional("weight"): str
+    }
 
-        # Create Route Table Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            Optional("rt"): Use(validate_rt_list),
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+    validate_nh_list = ListSchema(nh_schema, 'nh is not a list')
+
+    validate_protocol_nh_list = ListSchema({
+        Optional("@junos:indent"): str,
+        Optional("forwarding-nh-count"): str,
+        "indirect-nh": str,
+        Optional("label-ttl-action"): str,
+        Optional("load-balance-label"): str,
+        Optional("metric"): str,
+        Optional("mpls-label"): str,
+        Optional("nh"): Use(ListSchema(nh_schema, 'nh is not a list',
+                                       single=True)),
+        Optional("nh-index"): str,
+        Optional("nh-type"): str,
+        Optional("output"): str,
+        "to": str
+    }, 'protocol-nh is not a list', single=True)
+
+    validate_rt_entry_list = ListSchema({
+        Optional("active-tag"): str,
+        Optional("age"): {
+            "#text": str,
+            Optional("@junos:seconds"): str
+        },
+        Optional("announce-bits"): str,
+        Optional("announce-tasks"): str,
+        Optional("as-path"): str,
+        Optional("cluster-list"): str,
+        Optional("bgp-path-attributes"): {
+            "attr-as-path-effective": {
+                "aspath-effective-string": str,
+                "attr-value": str
+            }
+        },
+        Optional("current-active"): str,
+        Optional("inactive-reason"): str,
+        Optional("last-active"): str,
+        Optional("local-as"): str,
+        Optional("metric"): str,
+        Optional("metric2"): str,
+        Optional("nh"): Use(validate_nh_list),
+        "nh-address": str,
+        Optional("nh-index"): str,
+        Optional("nh-kernel-id"): str,
+        "nh-reference-count": str,
+        Optional("gateway"): str,
+        Optional("nh-type"): str,
+        "preference": str,
+        Optional("preference2"): str,
+        "protocol-name": str,
+        Optional("protocol-nh"): Use(validate_protocol_nh_list),
+        "rt-entry-state": str,
+        Optional("rt-ospf-area"): str,
+        Optional("rt-tag"): str,
+        "task-name": str,
+        Optional("validation-state"): str
+    }, 'rt-entry is not a list', single=True)
+
+    validate_rt_list = ListSchema({
+        Optional("@junos:style"): str,
+        "rt-announced-count": str,
+        "rt-destination": str,
+        Optional("rt-entry"): Use(validate_rt_entry_list),
+        "rt-entry-count": {
+            "#text": str,
+            Optional("@junos:format"): str
+        },
+        Optional("rt-prefix-length"): str,
+        Optional("rt-state"): str,
+        Optional("tsi"): {
+            "#text": str,
+            Optional("@junos:indent"): str
+        }
+    }, 'rt is not a list')
+
+    validate_route_table_list = ListSchema({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): Use(validate_rt_list),
+        "table-name": str,
+        "total-route-count": str
+    }, 'route-table is not a list')
 
     # Main Schema
     schema = {
@@ -844,153 +837,123 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                     'show route {route} extensive',
                     'show route extensive',
                     'show route extensive {destination}']
-    def cli(self, protocol=None, table=None, destination=None, route=None, output=None):
-        if not output:
-            if protocol and table and destination:
-                cmd = self.cli_command[2].format(
-                    protocol=protocol,
-                    table=table,
-                    destination=destination)
-            elif table and protocol:
-                cmd = self.cli_command[1].format(
-                    protocol=protocol,
-                    table=table)
-            elif protocol:
-                cmd = self.cli_command[0].format(
-                    protocol=protocol)
-            elif route:
-                cmd = self.cli_command[3].format(
-                    route=route)
-            elif destination:
-                cmd = self.cli_command[5].format(
-                    destination=destination)
-            else:
-                cmd = self.cli_command[4]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        ret_dict = {}
-        state_type = None
-        forwarding_nh_count = None
-        protocol_nh_found = None
-        originating_rib_found = None
 
+    patterns = Patterns(
         # inet.0: 929 destinations, 1615 routes (929 active, 0 holddown, 0 hidden)
-        p1 = re.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
-                        r'destinations, +(?P<total_route_count>\d+) +routes +'
-                        r'\((?P<active_route_count>\d+) +active, +(?P<holddown_route_count>\d+) +'
-                        r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$')
+        p1=r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
+           r'destinations, +(?P<total_route_count>\d+) +routes +'
+           r'\((?P<active_route_count>\d+) +active, +(?P<holddown_route_count>\d+) +'
+           r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$',
 
         # 0.0.0.0/0 (1 entry, 1 announced)
         # 10.1.0.0/24 (2 entries, 1 announced)
         # 0.0.0.0 (1 entry, 1 announced)
-        p2 = re.compile(r'^(?P<rt_destination>\S+)(\/(?P<rt_prefix_length>\d+))? +'
-                        r'\((?P<format>(?P<text>\d+) +(entry|entries)), +(?P<announced>\d+) +announced\)$')
+        p2=r'^(?P<rt_destination>\S+)(\/(?P<rt_prefix_length>\d+))? +'
+           r'\((?P<format>(?P<text>\d+) +(entry|entries)), +(?P<announced>\d+) +announced\)$',
 
         # State: <FlashAll>
         # State: <Active Int Ext>
-        p3 = re.compile(r'State: +\<(?P<rt_state>[\S\s]+)\>$')
+        p3=r'State: +\<(?P<rt_state>[\S\s]+)\>$',
 
         # *OSPF   Preference: 150/10
         # *BGP    Preference: 170/-121
-        p4 = re.compile(r'^(?P<active_tag>\*)?(?P<protocol>\S+)\s+'
-                        r'Preference:\s+(?P<preference>\d+)(\/(\-)?(?P<preference2>\d+))?$')
+        p4=r'^(?P<active_tag>\*)?(?P<protocol>\S+)\s+'
+           r'Preference:\s+(?P<preference>\d+)(\/(\-)?(?P<preference2>\d+))?$',
 
         # Next hop type: Router, Next hop index: 613
-        p5 = re.compile(r'^Next +hop type: +(?P<nh_type>\S+), +Next +hop +'
-                        r'index: +(?P<nh_index>\d+)$')
+        p5=r'^Next +hop type: +(?P<nh_type>\S+), +Next +hop +'
+           r'index: +(?P<nh_index>\d+)$',
 
         # Address: 0xdfa7934
-        p6 = re.compile(r'^Address: +(?P<nh_address>\S+)$')
+        p6=r'^Address: +(?P<nh_address>\S+)$',
 
         # Next-hop reference count: 458
-        p7 = re.compile(r'^Next-hop +reference +count: +(?P<nh_reference_count>\d+)$')
+        p7=r'^Next-hop +reference +count: +(?P<nh_reference_count>\d+)$',
 
         # Source: 2.2.2.2
-        p7_1 = re.compile(r'^Source: +(?P<gateway>\S+)$')
+        p7_1=r'^Source: +(?P<gateway>\S+)$',
 
         # Next hop: 10.169.14.121 via ge-0/0/1.0 weight 0x1, selected
         # Nexthop: 10.169.14.121 via ge-0/0/1.0
-        p8 = re.compile(r'^(?P<nh_string>Next *hop):( +(?P<to>\S+))? +via +(?P<via>\S+)'
-                        r'( +weight +(?P<weight>\w+))?(, +(?P<selected_next_hop>\w+))?$')
+        p8=r'^(?P<nh_string>Next *hop):( +(?P<to>\S+))? +via +(?P<via>\S+)'
+           r'( +weight +(?P<weight>\w+))?(, +(?P<selected_next_hop>\w+))?$',
 
         # Protocol next hop: 10.169.14.240
-        p8_1 = re.compile(r'^Protocol +next +hop: +(?P<to>\S+)( +Metric: +(?P<metric>\d+))?$')
+        p8_1=r'^Protocol +next +hop: +(?P<to>\S+)( +Metric: +(?P<metric>\d+))?$',
 
         # Session Id: 0x141
-        p9 = re.compile(r'^Session +Id: +\d+[a-z]+(?P<session_id>\w+)$')
+        p9=r'^Session +Id: +\d+[a-z]+(?P<session_id>\w+)$',
 
-        # Local AS: 65171 
-        p10 = re.compile(r'^Local +AS: (?P<local_as>\d+)$')
+        # Local AS: 65171
+        p10=r'^Local +AS: (?P<local_as>\d+)$',
 
-        # Age: 3w2d 4:43:35   Metric: 101 
+        # Age: 3w2d 4:43:35   Metric: 101
         # Age: 3:07:25    Metric: 200
         # Age: 29w6d 21:42:46
-        p11 = re.compile(r'^Age:\s+(?P<age>(\w+(\s+\S+)?)|[\d:]+)(\s+Metric:\s+(?P<metric>\d+))?$')
+        p11=r'^Age:\s+(?P<age>(\w+(\s+\S+)?)|[\d:]+)(\s+Metric:\s+(?P<metric>\d+))?$',
 
         # Age: 12 Metric2: 50
-        p11_2 = re.compile(r'^Age:\s+(?P<age>(\w+(\s+\S+)?)|[\d:]+)(\s+Metric2:\s+(?P<metric2>\d+))?$')
+        p11_2=r'^Age:\s+(?P<age>(\w+(\s+\S+)?)|[\d:]+)(\s+Metric2:\s+(?P<metric2>\d+))?$',
 
-        # Validation State: unverified 
-        p12 = re.compile(r'^Validation +State: +(?P<validation_state>\S+)$')
+        # Validation State: unverified
+        p12=r'^Validation +State: +(?P<validation_state>\S+)$',
+
+        # Tag: 0
+        p13=r'^Tag: +(?P<rt_tag>\d+)$',
 
-        # Tag: 0 
-        p13 = re.compile(r'^Tag: +(?P<rt_tag>\d+)$')
-        
         # Task: OSPF
-        p14 = re.compile(r'^Task: +(?P<task>\S+)$')
+        p14=r'^Task: +(?P<task>\S+)$',
 
-        # Announcement bits (3): 0-KRT 5-LDP 7-Resolve tree 3 
-        p15 = re.compile(r'^Announcement +bits +\((?P<announce_bits>\d+)\): +'
-                         r'(?P<announce_tasks>[\S\s]+)$')
+        # Announcement bits (3): 0-KRT 5-LDP 7-Resolve tree 3
+        p15=r'^Announcement +bits +\((?P<announce_bits>\d+)\): +'
+            r'(?P<announce_tasks>[\S\s]+)$',
 
-        # AS path: I 
-        p16 = re.compile(r'^(?P<aspath_effective_string>AS +path:) +(?P<attr_value>\S+)$')
+        # AS path: I
+        p16=r'^(?P<aspath_effective_string>AS +path:) +(?P<attr_value>\S+)$',
 
         # KRT in-kernel 0.0.0.0/0 -> {10.169.14.121}
-        p17 = re.compile(r'^(?P<text>KRT +in-kernel+[\S\s]+)$')
+        p17=r'^(?P<text>KRT +in-kernel+[\S\s]+)$',
 
         # Inactive reason: Route Preference
-        p18 = re.compile(r'^Inactive\s+reason: +(?P<inactive_reason>[\S\s]+)$')
+        p18=r'^Inactive\s+reason: +(?P<inactive_reason>[\S\s]+)$',
 
         # Area: 0.0.0.8
-        p19 = re.compile(r'^Area: +(?P<rt_ospf_area>\S+)$')
+        p19=r'^Area: +(?P<rt_ospf_area>\S+)$',
 
         # Label operation: Push 17000
         # Label operation: Push 17000, Push 1650, Push 1913(top)
-        p20 = re.compile(r'^Label +operation: +(?P<mpls_label>[\S\s]+)$')
+        p20=r'^Label +operation: +(?P<mpls_label>[\S\s]+)$',
 
         # Label TTL action: no-prop-ttl
         # Label TTL action: no-prop-ttl, no-prop-ttl, no-prop-ttl(top)
-        p21 = re.compile(r'^Label +TTL +action: +(?P<label_ttl_action>[\S\s]+)$')
+        p21=r'^Label +TTL +action: +(?P<label_ttl_action>[\S\s]+)$',
 
         # Load balance label: Label 17000: None; Label 1650: None; Label 1913: None;
-        p22 = re.compile(r'^Load +balance +label: +(?P<load_balance_label>[\S\s]+)$')
+        p22=r'^Load +balance +label: +(?P<load_balance_label>[\S\s]+)$',
 
         # Label element ptr: 0xc5f6ec0
-        p23 = re.compile(r'^Label +element +ptr: +(?P<label_element>\S+)$')
+        p23=r'^Label +element +ptr: +(?P<label_element>\S+)$',
 
         # Label parent element ptr: 0x0
-        p24 = re.compile(r'^Label +parent +element +ptr: +(?P<label_element_parent>\S+)$')
-        
+        p24=r'^Label +parent +element +ptr: +(?P<label_element_parent>\S+)$',
+
         # Label element references: 2
-        p25 = re.compile(r'^Label +element +references: +(?P<label_element_refcount>\d+)$')
+        p25=r'^Label +element +references: +(?P<label_element_refcount>\d+)$',
 
         # Label element child references: 1
-        p26 = re.compile(r'^Label +element +child +references: +(?P<label_element_childcount>\d+)$')
+        p26=r'^Label +element +child +references: +(?P<label_element_childcount>\d+)$',
 
         # Label element lsp id: 0
-        p27 = re.compile(r'^Label +element +lsp +id: +(?P<label_element_lspid>\d+)$')
+        p27=r'^Label +element +lsp +id: +(?P<label_element_lspid>\d+)$',
 
         # Task: OSPF3 I/O./var/run/ppmd_control
-        p28 = re.compile(r'^Task: +(?P<task_name>[\S\s]+)$')
+        p28=r'^Task: +(?P<task_name>[\S\s]+)$',
 
         # OSPF3 realm ipv6-unicast area : 0.0.0.0, LSA ID : 0.0.0.1, LSA type : Extern
-        p29 = re.compile(r'^OSPF3\s+realm\s+ipv6-unicast\s+area\s:[\S\s]+$')
+        p29=r'^OSPF3\s+realm\s+ipv6-unicast\s+area\s:[\S\s]+$',
 
         # Page 0 idx 1, (group hktGCS002 type Internal) Type 1 val 0x10c0b9b0 (adv_entry)
-        p30 = re.compile(r'^Page +\d+ +idx +\d+[\S\s]+$')
+        p30=r'^Page +\d+ +idx +\d+[\S\s]+$',
 
         # Advertised metrics:
         #     Flags: Nexthop Change
@@ -1002,31 +965,66 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
         # Path 10.220.0.0
         # from 10.169.14.240
         # Vector len 4.  Val: 1
-        p31 = re.compile(r'^(Advertised +metrics:)|'
-                         r'(Flags: +)|(Nexthop: +)|(MED: +)|'
-                         r'(Localpref: +)|(AS +path:)|(Communities:)|'
-                         r'(Path +\S+)|(from +\S+)|(Vector +len)')
-        
+        p31=r'^(Advertised +metrics:)|'
+            r'(Flags: +)|(Nexthop: +)|(MED: +)|'
+            r'(Localpref: +)|(AS +path:)|(Communities:)|'
+            r'(Path +\S+)|(from +\S+)|(Vector +len)',
+
         # Indirect next hop: 0xc285884 1048574 INH Session ID: 0x1ac
-        p32 = re.compile(r'^Indirect +next +hop: +(?P<indirect_nh>[\S\s]+)$')
+        p32=r'^Indirect +next +hop: +(?P<indirect_nh>[\S\s]+)$',
 
         # Indirect next hops: 1
-        p33 = re.compile(r'^Indirect +next +hops: +(?P<forwarding_nh_count>\d+)$')
+        p33=r'^Indirect +next +hops: +(?P<forwarding_nh_count>\d+)$',
 
         # 10.169.14.240/32 Originating RIB: inet.0
-        p34 = re.compile(r'^\S+ +Originating +RIB: +[\S\s]+$')
+        p34=r'^\S+ +Originating +RIB: +[\S\s]+$',
 
         # Node path count: 1
         # Forwarding nexthops: 1
-        p35 = re.compile(r'^(Node +path +count: +)|(Forwarding +nexthops: +)[\S\s]+$')
+        p35=r'^(Node +path +count: +)|(Forwarding +nexthops: +)[\S\s]+$',
 
         # Cluster list:  2.2.2.2 4.4.4.4
-        p36 = re.compile(r'^Cluster +list: +(?P<cluster_list>[\S\s]+)$')
+        p36=r'^Cluster +list: +(?P<cluster_list>[\S\s]+)$'
+    )
+
+    def cli(self, protocol=None, table=None, destination=None, route=None, output=None):
+        if not output:
+            if protocol and table and destination:
+                cmd = self.cli_command[2].format(
+                    protocol=protocol,
+                    table=table,
+                    destination=destination)
+            elif table and protocol:
+                cmd = self.cli_command[1].format(
+                    protocol=protocol,
+                    table=table)
+            elif protocol:
+                cmd = self.cli_command[0].format(
+                    protocol=protocol)
+            elif route:
+                cmd = self.cli_command[3].format(
+                    route=route)
+            elif destination:
+                cmd = self.cli_command[5].format(
+                    destination=destination)
+            else:
+                cmd = self.cli_command[4]
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        ret_dict = {}
+        state_type = None
+        forwarding_nh_count = None
+        protocol_nh_found = None
+        originating_rib_found = None
+
+        p = self.patterns
 
         for line in out.splitlines():
             line = line.strip()
             # inet.0: 929 destinations, 1615 routes (929 active, 0 holddown, 0 hidden)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 route_table = ret_dict.setdefault('route-information', {}). \
@@ -1038,7 +1036,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
 
             # 0.0.0.0/0 (1 entry, 1 announced)
             # 10.1.0.0/24 (2 entries, 1 announced)
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 state_type = 'route_table'
@@ -1061,7 +1059,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
 
             # State: <FlashAll>
             # State: <Active Int Ext>
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 if state_type == 'route_table':
@@ -1071,7 +1069,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # *OSPF   Preference: 150/10
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 state_type = 'protocol'
@@ -1104,7 +1102,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Next hop type: Router, Next hop index: 613
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 nh_type = group['nh_type']
@@ -1114,28 +1112,28 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Address: 0xdfa7934
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'nh-address': group['nh_address']})
                 continue
 
             # Next-hop reference count: 458
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'nh-reference-count': group['nh_reference_count']})
                 continue
 
             # Source: 2.2.2.2
-            m = p7_1.match(line)
+            m = p.p7_1.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'gateway': group['gateway']})
                 continue
 
             # Next hop: 10.169.14.121 via ge-0/0/1.0 weight 0x1, selected
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 group = m.groupdict()
                 if originating_rib_found:
@@ -1163,7 +1161,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
             
             # Protocol Next hop: 10.169.14.121 via ge-0/0/1.0 weight 0x1, selected
-            m = p8_1.match(line)
+            m = p.p8_1.match(line)
             if m:
                 group = m.groupdict()
                 protocol_nh_found = True
@@ -1177,7 +1175,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Session Id: 0x141
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 group = m.groupdict()
                 if originating_rib_found:
@@ -1191,14 +1189,14 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Local AS: 65171 
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'local-as': group['local_as']})
                 continue
 
             # Age: 3w2d 4:43:35   Metric: 101 
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 group = m.groupdict()
                 age_dict = rt_entry_dict.setdefault('age', {})
@@ -1209,7 +1207,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Age: 12 Metric2: 50
-            m = p11_2.match(line)
+            m = p.p11_2.match(line)
             if m:
                 group = m.groupdict()
                 age_dict = rt_entry_dict.setdefault('age', {})
@@ -1220,28 +1218,28 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue            
 
             # Validation State: unverified 
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'validation-state': group['validation_state']})
                 continue
 
             # Tag: 0 
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'rt-tag': group['rt_tag']})
                 continue
             
             # Task: OSPF
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'task-name': group['task']})
                 continue
 
             # Announcement bits (3): 0-KRT 5-LDP 7-Resolve tree 3 
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'announce-bits': group['announce_bits']})
@@ -1249,7 +1247,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # AS path: I 
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 group = m.groupdict()
                 attr_as_path_dict = rt_entry_dict.setdefault('bgp-path-attributes', {}). \
@@ -1261,7 +1259,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # KRT in-kernel 0.0.0.0/0 -> {10.169.14.121}
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 group = m.groupdict()
                 tsi_dict = rt_dict.setdefault('tsi', {})
@@ -1269,14 +1267,14 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
             
             # Inactive reason: Route Preference
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'inactive-reason': group['inactive_reason']})
                 continue
             
             # Area: 0.0.0.8
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'rt-ospf-area': group['rt_ospf_area']})
@@ -1284,7 +1282,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
 
             # Label operation: Push 17000
             # Label operation: Push 17000, Push 1650, Push 1913(top)
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 group = m.groupdict()
                 if protocol_nh_found:
@@ -1297,7 +1295,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
 
             # Label TTL action: no-prop-ttl
             # Label TTL action: no-prop-ttl, no-prop-ttl, no-prop-ttl(top)
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 group = m.groupdict()
                 if protocol_nh_found:
@@ -1309,7 +1307,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Load balance label: Label 17000: None; Label 1650: None; Label 1913: None;
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 group = m.groupdict()
                 if protocol_nh_found:
@@ -1321,7 +1319,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Label element ptr: 0xc5f6ec0
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 group = m.groupdict()
                 if protocol_nh_found:
@@ -1333,7 +1331,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Label parent element ptr: 0x0
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 group = m.groupdict()
                 nh_dict.update({k.replace('_', '-'):
@@ -1341,7 +1339,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
             
             # Label element references: 2
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 group = m.groupdict()
                 nh_dict.update({k.replace('_', '-'):
@@ -1349,7 +1347,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Label element child references: 1
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 group = m.groupdict()
                 nh_dict.update({k.replace('_', '-'):
@@ -1357,7 +1355,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Label element lsp id: 0
-            m = p27.match(line)
+            m = p.p27.match(line)
             if m:
                 group = m.groupdict()
                 nh_dict.update({k.replace('_', '-'):
@@ -1365,7 +1363,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Task: OSPF3 I/O./var/run/ppmd_control
-            m = p28.match(line)
+            m = p.p28.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({k.replace('_', '-'):
@@ -1373,7 +1371,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
             
             # OSPF3 realm ipv6-unicast area : 0.0.0.0, LSA ID : 0.0.0.1, LSA type : Extern
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 group = m.groupdict()
                 text = tsi_dict.get('#text', '')
@@ -1381,7 +1379,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
             
             # Page 0 idx 1, (group hktGCS002 type Internal) Type 1 val 0x10c0b9b0 (adv_entry)
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 group = m.groupdict()
                 text = tsi_dict.get('#text', '')
@@ -1398,7 +1396,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
             # Path 10.220.0.0
             # from 10.169.14.240
             # Vector len 4.  Val: 1
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 group = m.groupdict()
                 text = tsi_dict.get('#text', '')
@@ -1406,7 +1404,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Indirect next hop: 0xc285884 1048574 INH Session ID: 0x1ac
-            m = p32.match(line)
+            m = p.p32.match(line)
             if m:
                 group = m.groupdict()
                 protocol_nh_dict.update({k.replace('_', '-'):
@@ -1414,7 +1412,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Indirect next hops: 1
-            m = p33.match(line)
+            m = p.p33.match(line)
             if m:
                 group = m.groupdict()
                 protocol_nh_found = True
@@ -1422,7 +1420,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # 10.169.14.240/32 Originating RIB: inet.0
-            m = p34.match(line)
+            m = p.p34.match(line)
             if m:
                 originating_rib_found = True
                 proto_output = protocol_nh_dict.get('output', '')
@@ -1432,7 +1430,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
 
             # Node path count: 1
             # Forwarding nexthops: 1
-            m = p35.match(line)
+            m = p.p35.match(line)
             if m:
                 proto_output = protocol_nh_dict.get('output', '')
                 proto_output = '{}{}\n'.format(proto_output, line)
@@ -1440,7 +1438,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Cluster list:  2.2.2.2 4.4.4.4
-            m = p36.match(line)
+            m = p.p36.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'cluster-list': group['cluster_list']})
@@ -12099,6 +12099,105 @@ class TestShowInterfacesExtensive(unittest.TestCase):
         parsed_output = interface_obj.parse(interface='ge-0/0/0')
         self.assertEqual(parsed_output, self.golden_parsed_output)
 
+    json_output = {'execute.return_value': '''
+        show interfaces ge-0/0/0 extensive | display json
+        {
+            "interface-information" : [
+            {
+                "attributes" : {"xmlns" : "http://xml.juniper.net/junos/19.2R1/junos-interface", "junos:style" : "normal"},
+                "physical-interface" : [
+                {
+                    "name" : [{"data" : "ge-0/0/0"}],
+                    "admin-status" : [{"data" : "up", "attributes" : {"junos:format" : "Enabled"}}],
+                    "oper-status" : [{"data" : "up"}],
+                    "local-index" : [{"data" : "148"}],
+                    "snmp-index" : [{"data" : "526"}],
+                    "mtu" : [{"data" : "1514"}],
+                    "if-device-flags" : [
+                    {
+                        "ifdf-present" : [{"data" : [null]}],
+                        "ifdf-running" : [{"data" : [null]}]
+                    }
+                    ],
+                    "logical-interface" : [
+                    {
+                        "name" : [{"data" : "ge-0/0/0.0"}],
+                        "local-index" : [{"data" : "333"}],
+                        "if-config-flags" : [
+                        {
+                            "iff-up" : [{"data" : [null]}],
+                            "iff-snmp-traps" : [{"data" : [null]}],
+                            "internal-flags" : [{"data" : "0x4004000"}]
+                        }
+                        ],
+                        "address-family" : [
+                        {
+                            "address-family-name" : [{"data" : "inet"}],
+                            "mtu" : [{"data" : "1500"}],
+                            "interface-address" : [
+                            {
+                                "ifa-flags" : [
+                                {
+                                    "ifaf-current-preferred" : [{"data" : [null]}],
+                                    "ifaf-current-primary" : [{"data" : [null]}]
+                                }
+                                ],
+                                "ifa-destination" : [{"data" : "10.0.0.0/24"}],
+                                "ifa-local" : [{"data" : "10.0.0.1"}]
+                            }
+                            ]
+                        }
+                        ]
+                    }
+                    ]
+                }
+                ]
+            }
+            ]
+        }
+    '''}
+
+    json_parsed_output = {
+        'interface-information': {
+            'physical-interface': [{
+                'admin-status': {'#text': 'up', '@junos:format': 'Enabled'},
+                'if-device-flags': {'ifdf-present': True,
+                                    'ifdf-running': True},
+                'local-index': '148',
+                'logical-interface': [{
+                    'address-family': [{
+                        'address-family-name': 'inet',
+                        'interface-address': [{
+                            'ifa-destination': '10.0.0.0/24',
+                            'ifa-flags': {'ifaf-current-preferred': True,
+                                          'ifaf-current-primary': True},
+                            'ifa-local': '10.0.0.1'
+                        }],
+                        'mtu': '1500'
+                    }],
+                    'if-config-flags': {'iff-snmp-traps': True,
+                                        'iff-up': True,
+                                        'internal-flags': '0x4004000'},
+                    'local-index': '333',
+                    'name': 'ge-0/0/0.0'
+                }],
+                'mtu': '1514',
+                'name': 'ge-0/0/0',
+                'oper-status': 'up',
+                'snmp-index': '526'
+            }]
+        }
+    }
+
+    def test_json(self):
+        self.device = Mock(**self.json_output)
+        interface_obj = ShowInterfacesExtensive(device=self.device,
+                                                context='json')
+        parsed_output = interface_obj.parse(interface='ge-0/0/0')
+        self.assertEqual(parsed_output, self.json_parsed_output)
+        self.device.execute.assert_called_once_with(
+            'show interfaces ge-0/0/0 extensive | display json')
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
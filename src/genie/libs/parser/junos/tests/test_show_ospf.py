@@ -11738,6 +11738,112 @@ class TestShowOspfDatabaseExtensive(unittest.TestCase):
         parsed_output = obj.parse(data_type='netsummary')
         self.assertEqual(parsed_output, self.golden_parsed_output_3)
 
+    xml_output = {'execute.return_value': '''
+        show ospf database extensive | display xml
+        <rpc-reply xmlns:junos="http://xml.juniper.net/junos/19.2R1/junos">
+            <ospf-database-information xmlns="http://xml.juniper.net/junos/19.2R1/junos-routing">
+                <ospf-area-header>
+                    <ospf-area>0.0.0.8</ospf-area>
+                </ospf-area-header>
+                <ospf-database heading="Type       ID               Adv Rtr           Seq      Age  Opt  Cksum  Len">
+                    <lsa-type>Router</lsa-type>
+                    <lsa-id>10.34.2.250</lsa-id>
+                    <advertising-router>10.34.2.250</advertising-router>
+                    <sequence-number>0x800019c2</sequence-number>
+                    <age>1783</age>
+                    <options>0x22</options>
+                    <checksum>0x7e9b</checksum>
+                    <lsa-length>60</lsa-length>
+                    <our-entry/>
+                    <ospf-router-lsa>
+                        <bits>0x0</bits>
+                        <link-count>2</link-count>
+                        <ospf-link>
+                            <link-id>10.34.2.251</link-id>
+                            <link-data>10.34.2.250</link-data>
+                            <link-type-name>PointToPoint</link-type-name>
+                            <link-type-value>1</link-type-value>
+                            <ospf-topology-count>0</ospf-topology-count>
+                            <metric>5</metric>
+                        </ospf-link>
+                        <ospf-link>
+                            <link-id>10.34.2.252</link-id>
+                            <link-data>255.255.255.252</link-data>
+                            <link-type-name>Stub</link-type-name>
+                            <link-type-value>3</link-type-value>
+                            <ospf-topology-count>0</ospf-topology-count>
+                            <metric>5</metric>
+                        </ospf-link>
+                    </ospf-router-lsa>
+                    <ospf-database-extensive>
+                        <aging-timer junos:seconds="1817">00:30:17</aging-timer>
+                        <installation-time junos:seconds="1783">00:29:43</installation-time>
+                        <expiration-time junos:seconds="1817">00:30:17</expiration-time>
+                    </ospf-database-extensive>
+                </ospf-database>
+            </ospf-database-information>
+        </rpc-reply>
+    '''}
+
+    xml_parsed_output = {
+        'ospf-database-information': {
+            'ospf-area-header': {'ospf-area': '0.0.0.8'},
+            'ospf-database': [{
+                'advertising-router': '10.34.2.250',
+                'age': '1783',
+                'checksum': '0x7e9b',
+                'lsa-id': '10.34.2.250',
+                'lsa-length': '60',
+                'lsa-type': 'Router',
+                'options': '0x22',
+                'our-entry': True,
+                'ospf-database-extensive': {
+                    'aging-timer': {'#text': '00:30:17'},
+                    'expiration-time': {'#text': '00:30:17'},
+                    'installation-time': {'#text': '00:29:43'}
+                },
+                'ospf-router-lsa': {
+                    'bits': '0x0',
+                    'link-count': '2',
+                    'ospf-link': [{
+                        'link-data': '10.34.2.250',
+                        'link-id': '10.34.2.251',
+                        'link-type-name': 'PointToPoint',
+                        'link-type-value': '1',
+                        'metric': '5',
+                        'ospf-topology-count': '0'
+                    }, {
+                        'link-data': '255.255.255.252',
+                        'link-id': '10.34.2.252',
+                        'link-type-name': 'Stub',
+                        'link-type-value': '3',
+                        'metric': '5',
+                        'ospf-topology-count': '0'
+                    }]
+                },
+                'sequence-number': '0x800019c2'
+            }]
+        }
+    }
+
+    def test_xml(self):
+        self.device = Mock(**self.xml_output)
+        obj = ShowOspfDatabaseExtensive(device=self.device, context='xml')
+        parsed_output = obj.parse()
+        self.assertEqual(parsed_output, self.xml_parsed_output)
+        self.device.execute.assert_called_once_with(
+            'show ospf database extensive | display xml')
+
+    def test_xml_advertising_router(self):
+        self.device = Mock(**self.xml_output)
+        obj = ShowOspfDatabaseAdvertisingRouterExtensive(device=self.device,
+                                                         context='xml')
+        parsed_output = obj.parse(ipaddress='10.34.2.250')
+        self.assertEqual(parsed_output, self.xml_parsed_output)
+        self.device.execute.assert_called_once_with(
+            'show ospf database advertising-router 10.34.2.250 extensive'
+            ' | display xml')
+
     def test_golden_4(self):
         self.device = Mock(**self.golden_output_4)
         obj = ShowOspfDatabaseExtensive(device=self.device)
@@ -56519,5 +56519,226 @@ class TestShowRouteTableLabelSwitchedName(unittest.TestCase):
         parsed_output = obj.parse(table="mpls.0", name='test_lsp_01')
         self.assertEqual(parsed_output, self.golden_parsed_output_1)
 
+
+class TestShowRouteStructured(unittest.TestCase):
+    """ Unit tests for:
+            * show route protocol {protocol} | display xml
+            * show route protocol {protocol} | display json
+    """
+
+    maxDiff = None
+
+    xml_output = '''
+<rpc-reply xmlns:junos="http://xml.juniper.net/junos/18.2R2/junos">
+    <route-information xmlns="http://xml.juniper.net/junos/18.2R2/junos-routing">
+        <!-- keepalive -->
+        <route-table>
+            <table-name>inet.0</table-name>
+            <destination-count>932</destination-count>
+            <total-route-count>1618</total-route-count>
+            <active-route-count>932</active-route-count>
+            <holddown-route-count>0</holddown-route-count>
+            <hidden-route-count>0</hidden-route-count>
+            <rt junos:style="brief">
+                <rt-destination>10.169.14.240/32</rt-destination>
+                <rt-entry>
+                    <active-tag>*</active-tag>
+                    <current-active/>
+                    <last-active/>
+                    <protocol-name>Static</protocol-name>
+                    <preference>5</preference>
+                    <age junos:seconds="3253345">5w2d 15:42:25</age>
+                    <nh>
+                        <selected-next-hop/>
+                        <to>10.169.14.121</to>
+                        <via>ge-0/0/1.0</via>
+                    </nh>
+                </rt-entry>
+                <rt-entry>
+                    <protocol-name>OSPF</protocol-name>
+                    <preference>10</preference>
+                    <age junos:seconds="100">00:01:40</age>
+                    <nh>
+                        <to>10.169.14.122</to>
+                        <via>ge-0/0/2.0</via>
+                    </nh>
+                    <nh>
+                        <to>10.169.14.123</to>
+                        <via>ge-0/0/3.0</via>
+                    </nh>
+                </rt-entry>
+            </rt>
+        </route-table>
+        <route-table>
+            <table-name>inet.3</table-name>
+            <destination-count>12</destination-count>
+            <total-route-count>12</total-route-count>
+            <active-route-count>12</active-route-count>
+            <holddown-route-count>0</holddown-route-count>
+            <hidden-route-count>0</hidden-route-count>
+        </route-table>
+    </route-information>
+    <cli>
+        <banner></banner>
+    </cli>
+</rpc-reply>
+
+{master}
+'''
+
+    json_output = '''
+{
+    "route-information" : [
+    {
+        "attributes" : {"xmlns" : "http://xml.juniper.net/junos/18.2R2/junos-routing"},
+        "route-table" : [
+        {
+            "table-name" : [{"data" : "inet.0"}],
+            "destination-count" : [{"data" : "932"}],
+            "total-route-count" : [{"data" : "1618"}],
+            "active-route-count" : [{"data" : "932"}],
+            "holddown-route-count" : [{"data" : "0"}],
+            "hidden-route-count" : [{"data" : "0"}],
+            "rt" : [
+            {
+                "attributes" : {"junos:style" : "brief"},
+                "rt-destination" : [{"data" : "10.169.14.240/32"}],
+                "rt-entry" : [
+                {
+                    "active-tag" : [{"data" : "*"}],
+                    "current-active" : [{"data" : [null]}],
+                    "last-active" : [{"data" : [null]}],
+                    "protocol-name" : [{"data" : "Static"}],
+                    "preference" : [{"data" : "5"}],
+                    "age" : [{"data" : "5w2d 15:42:25", "attributes" : {"junos:seconds" : "3253345"}}],
+                    "nh" : [
+                    {
+                        "selected-next-hop" : [{"data" : [null]}],
+                        "to" : [{"data" : "10.169.14.121"}],
+                        "via" : [{"data" : "ge-0/0/1.0"}]
+                    }
+                    ]
+                },
+                {
+                    "protocol-name" : [{"data" : "OSPF"}],
+                    "preference" : [{"data" : "10"}],
+                    "age" : [{"data" : "00:01:40", "attributes" : {"junos:seconds" : "100"}}],
+                    "nh" : [
+                    {
+                        "to" : [{"data" : "10.169.14.122"}],
+                        "via" : [{"data" : "ge-0/0/2.0"}]
+                    },
+                    {
+                        "to" : [{"data" : "10.169.14.123"}],
+                        "via" : [{"data" : "ge-0/0/3.0"}]
+                    }
+                    ]
+                }
+                ]
+            }
+            ]
+        },
+        {
+            "table-name" : [{"data" : "inet.3"}],
+            "destination-count" : [{"data" : "12"}],
+            "total-route-count" : [{"data" : "12"}],
+            "active-route-count" : [{"data" : "12"}],
+            "holddown-route-count" : [{"data" : "0"}],
+            "hidden-route-count" : [{"data" : "0"}]
+        }
+        ]
+    }
+    ]
+}
+
+{master}
+'''
+
+    parsed_output = {
+        "route-information": {
+            "route-table": [{
+                "active-route-count": "932",
+                "destination-count": "932",
+                "hidden-route-count": "0",
+                "holddown-route-count": "0",
+                "rt": [{
+                    "@junos:style": "brief",
+                    "rt-destination": "10.169.14.240/32",
+                    "rt-entry": {
+                        "active-tag": "*",
+                        "age": {
+                            "#text": "5w2d 15:42:25",
+                            "@junos:seconds": "3253345"
+                        },
+                        "current-active": "",
+                        "last-active": "",
+                        "nh": [{
+                            "selected-next-hop": "",
+                            "to": "10.169.14.121",
+                            "via": "ge-0/0/1.0"
+                        }],
+                        "preference": "5",
+                        "protocol-name": "Static"
+                    }
+                }, {
+                    "@junos:style": "brief",
+                    "rt-entry": {
+                        "age": {
+                            "#text": "00:01:40",
+                            "@junos:seconds": "100"
+                        },
+                        "nh": [{
+                            "to": "10.169.14.122",
+                            "via": "ge-0/0/2.0"
+                        }, {
+                            "to": "10.169.14.123",
+                            "via": "ge-0/0/3.0"
+                        }],
+                        "preference": "10",
+                        "protocol-name": "OSPF"
+                    }
+                }],
+                "table-name": "inet.0",
+                "total-route-count": "1618"
+            }, {
+                "active-route-count": "12",
+                "destination-count": "12",
+                "hidden-route-count": "0",
+                "holddown-route-count": "0",
+                "table-name": "inet.3",
+                "total-route-count": "12"
+            }]
+        }
+    }
+
+    def test_empty(self):
+        device = Mock(**{'execute.return_value': ''})
+        obj = ShowRoute(device=device, context='xml')
+        with self.assertRaises(SchemaEmptyParserError):
+            obj.parse(protocol='static')
+
+    def test_xml(self):
+        device = Mock(**{'execute.return_value': self.xml_output})
+        obj = ShowRoute(device=device, context='xml')
+        parsed_output = obj.parse(protocol='static')
+        self.assertEqual(parsed_output, self.parsed_output)
+        device.execute.assert_called_once_with(
+            'show route protocol static | display xml')
+
+    def test_xml_lines(self):
+        obj = ShowRoute(device=Mock(), context='xml')
+        parsed_output = obj.parse(
+            output=iter(self.xml_output.splitlines(True)))
+        self.assertEqual(parsed_output, self.parsed_output)
+
+    def test_json(self):
+        device = Mock(**{'execute.return_value': self.json_output})
+        obj = ShowRoute(device=device, context='json')
+        parsed_output = obj.parse(protocol='static', table='inet.0')
+        self.assertEqual(parsed_output, self.parsed_output)
+        device.execute.assert_called_once_with(
+            'show route protocol static table inet.0 | display json')
+
+
 if __name__ == '__main__':
     unittest.main()
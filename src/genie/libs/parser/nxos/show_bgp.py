@@ -8,6 +8,7 @@ NXOS parsers for the following show commands:
     * 'show bgp peer-template <WORD>'
     * 'show bgp vrf all all'
     * 'show bgp vrf all all neighbors'
+    * 'show bgp vrf all all neighbors | xml'
     * 'show bgp vrf all all nexthop-database'
     * 'show bgp vrf <WORD> all summary'
     * 'show bgp vrf <WORD> all summary | xml'
@@ -63,6 +64,7 @@ from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.nxos.xml_rows import iter_rows, map_row, find_leaf
 
 
 # =====================================
@@ -796,6 +798,68 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
 
         return parsed_dict
 
+    # Schema keys of the leaves of the xml rows
+    XML_FIELDS = {
+        '__readonly__': {
+            'processid': ('bgp_pid', int),
+            'protocolstartedreason': 'bgp_protocol_started_reason',
+            'protocoltag': 'bgp_tag',
+            'protocolstate': ('bgp_protocol_state', str.lower),
+            'isolatemode': 'bgp_isolate_mode',
+            'mmode': 'bgp_mmode',
+            'memorystate': ('bgp_memory_state', str.lower),
+            'forwardingstatesaved': ('bgp_performance_mode',
+                                     lambda text: 'No' if text == 'false'
+                                     else 'Yes'),
+            'asformat': 'bgp_asformat',
+            'attributeentries': ('num_attr_entries', int),
+            'hwmattributeentries': ('hwm_attr_entries', int),
+            'bytesused': ('bytes_used', int),
+            'entriespendingdelete': ('entries_pending_delete', int),
+            'hwmentriespendingdelete': ('hwm_entries_pending_delete', int),
+            'pathsperattribute': ('bgp_paths_per_hwm_attr', int),
+            'aspathentries': ('bgp_as_path_entries', int),
+            'aspathbytes': ('bytes_used_as_path_entries', int),
+        },
+        'ROW_vrf': {
+            'vrf-id': 'vrf_id',
+            'vrf-state': ('vrf_state', str.lower),
+            'vrf-router-id': 'router_id',
+            'vrf-cfgd-id': 'conf_router_id',
+            'vrf-confed-id': ('confed_id', int),
+            'vrf-cluster-id': 'cluster_id',
+            'vrf-peers': ('num_conf_peers', int),
+            'vrf-pending-peers': ('num_pending_conf_peers', int),
+            'vrf-est-peers': ('num_established_peers', int),
+            'vrf-rd': 'vrf_rd',
+        },
+        'ROW_af': {
+            'af-table-id': ('table_id', lambda text: text if '0x' in text
+                            else '0x' + text),
+            'af-state': ('table_state', str.lower),
+            'nexthop-trigger-delay-critical': (
+                ('next_hop_trigger_delay', 'critical'), int),
+            'nexthop-trigger-delay-non-critical': (
+                ('next_hop_trigger_delay', 'non_critical'), int),
+            'af-aggregate-label': 'aggregate_label',
+            'af-label-mode': 'label_mode',
+            'importdefault_map': 'import_default_map',
+            'importdefault_prefixlimit': ('import_default_prefix_limit', int),
+            'importdefault_prefixcount': ('import_default_prefix_count', int),
+            'exportdefault_map': 'export_default_map',
+            'exportdefault_prefixlimit': ('export_default_prefix_limit', int),
+            'exportdefault_prefixcount': ('export_default_prefix_count', int),
+        },
+        # Keys of the peers, by their number
+        'peers': {
+            'af-num-active-peers': ('active_peers', int),
+            'af-peer-routes': ('routes', int),
+            'af-peer-paths': ('paths', int),
+            'af-peer-networks': ('networks', int),
+            'af-peer-aggregates': ('aggregates', int),
+        },
+    }
+
     def xml(self, vrf='', output=None):
         if output is None:
             if vrf:
@@ -806,259 +870,58 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
             out = output
 
         etree_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        xml_output = ET.fromstring(out)
-
-        for item in xml_output:
-            for data in item:
-                for show in data:
-                    for bgp in show:
-                        for __XML__OPT_Cmd_show_ip_bgp_session_cmd_vrf in bgp:
-                            for process in __XML__OPT_Cmd_show_ip_bgp_session_cmd_vrf:
-                                for __XML__OPT_Cmd_show_bgp_process_cmd_vrf in process:
-                                    for __XML__OPT_Cmd_show_bgp_process_cmd___readonly__ in __XML__OPT_Cmd_show_bgp_process_cmd_vrf:
-                                        for key in __XML__OPT_Cmd_show_bgp_process_cmd___readonly__:
-                                            # Get key text
-                                            text = key.tag[key.tag.find('}')+1:]
-                                            # bgp_pid
-                                            if text == 'processid':
-                                                etree_dict['bgp_pid'] = int(key.text)
-                                            # bgp_protocol_started_reason
-                                            if text == 'protocolstartedreason':
-                                                etree_dict['bgp_protocol_started_reason'] = key.text
-                                            # bgp_tag
-                                            if text == 'protocoltag':
-                                                etree_dict['bgp_tag'] = key.text
-                                            # bgp_protocol_state
-                                            if text == 'protocolstate':
-                                                etree_dict['bgp_protocol_state'] = str(key.text).lower()
-                                            # bgp_isolate_mode
-                                            if text == 'isolatemode':
-                                                etree_dict['bgp_isolate_mode'] = key.text
-                                            # bgp_mmode
-                                            if text == 'mmode':
-                                                etree_dict['bgp_mmode'] = key.text
-                                            # bgp_memory_state
-                                            if text == 'memorystate':
-                                                etree_dict['bgp_memory_state'] = str(key.text).lower()
-                                            # bgp_performance_mode
-                                            if text == 'forwardingstatesaved':
-                                                if key.text == 'false':
-                                                    etree_dict['bgp_performance_mode'] = 'No'
-                                                else:
-                                                    etree_dict['bgp_performance_mode'] = 'Yes'
-                                            # bgp_asformat
-                                            if text == 'asformat':
-                                                etree_dict['bgp_asformat'] = key.text
-                                            if text == 'srgbmin':
-                                                srgbin = key.text
-                                            if text == 'srgbmax':
-                                                srgmax = key.text
-                                                try:
-                                                    etree_dict['segment_routing_global_block'] = srgbin + '-' + srgmax
-                                                except Exception:
-                                                    pass
-                                            # num_attr_entries
-                                            if text == 'attributeentries':
-                                                etree_dict['num_attr_entries'] = int(key.text)
-                                            # hwm_attr_entries
-                                            if text == 'hwmattributeentries':
-                                                etree_dict['hwm_attr_entries'] = int(key.text)
-                                            # bytes_used
-                                            if text == 'bytesused':
-                                                etree_dict['bytes_used'] = int(key.text)
-                                            # entries_pending_delete
-                                            if text == 'entriespendingdelete':
-                                                etree_dict['entries_pending_delete'] = int(key.text)
-                                            # hwm_entries_pending_delete
-                                            if text == 'hwmentriespendingdelete':
-                                                etree_dict['hwm_entries_pending_delete'] = int(key.text)
-                                            # bgp_paths_per_hwm_attr
-                                            if text == 'pathsperattribute':
-                                                etree_dict['bgp_paths_per_hwm_attr'] = int(key.text)
-                                            # bgp_as_path_entries
-                                            if text == 'aspathentries':
-                                                etree_dict['bgp_as_path_entries'] = int(key.text)
-                                            # bytes_used_as_path_entries
-                                            if text == 'aspathbytes':
-                                                etree_dict['bytes_used_as_path_entries'] = int(key.text)
-                                            
-                                            if text == 'TABLE_vrf':
-                                                for table_vrf in key:
-                                                    for row_vrf in table_vrf:
-                                                        vrf_tag = row_vrf.tag[row_vrf.tag.find('}')+1:]
-
-                                                        # vrf
-                                                        #   vrf_name
-                                                        if vrf_tag == 'vrf-name-out':
-                                                            vrf_name = row_vrf.text
-                                                            if 'vrf' not in etree_dict:
-                                                                etree_dict['vrf'] = {}
-                                                            if vrf_name not in etree_dict['vrf']:
-                                                                etree_dict['vrf'][vrf_name] = {}
-                                                                vrf_dict = etree_dict['vrf'][vrf_name]
-                                                        # vrf_id
-                                                        if vrf_tag == 'vrf-id':
-                                                            vrf_dict['vrf_id'] = row_vrf.text
-                                                        # vrf_state
-                                                        if vrf_tag == 'vrf-state':
-                                                            vrf_dict['vrf_state'] = str(row_vrf.text).lower()
-                                                        # router_id
-                                                        if vrf_tag == 'vrf-router-id':
-                                                            vrf_dict['router_id'] = row_vrf.text
-                                                        # conf_router_id
-                                                        if vrf_tag == 'vrf-cfgd-id':
-                                                            vrf_dict['conf_router_id'] = row_vrf.text
-                                                        # confed_id
-                                                        if vrf_tag == 'vrf-confed-id':
-                                                            vrf_dict['confed_id'] = int(row_vrf.text)
-                                                        # cluster_id
-                                                        if vrf_tag == 'vrf-cluster-id':
-                                                           vrf_dict['cluster_id'] = row_vrf.text
-                                                        # num_conf_peers
-                                                        if vrf_tag == 'vrf-peers':
-                                                            vrf_dict['num_conf_peers'] = int(row_vrf.text)
-                                                        # num_pending_conf_peers
-                                                        if vrf_tag == 'vrf-pending-peers':
-                                                            vrf_dict['num_pending_conf_peers'] = int(row_vrf.text)
-                                                        # num_established_peers
-                                                        if vrf_tag == 'vrf-est-peers':
-                                                            vrf_dict['num_established_peers'] = int(row_vrf.text)
-                                                            vrf_dict['vrf_rd'] = 'not configured'
-                                                        # vrf_rd
-                                                        if vrf_tag == 'vrf-rd':
-                                                            vrf_dict['vrf_rd'] = row_vrf.text
-
-                                                        if vrf_tag == 'TABLE_af':
-                                                            for table_af in row_vrf:
-                                                                for row_af in table_af:
-                                                                    af_tag = row_af.tag[row_af.tag.find('}')+1:]
-
-                                                                    # address_family
-                                                                    #   address_family_name
-                                                                    if af_tag == 'af-name':
-                                                                        address_family_name = str(row_af.text).lower()
-                                                                        if 'address_family' not in etree_dict['vrf'][vrf_name]:
-                                                                            etree_dict['vrf'][vrf_name]['address_family'] = {}
-                                                                        if address_family_name not in etree_dict['vrf'][vrf_name]['address_family']:
-                                                                            etree_dict['vrf'][vrf_name]['address_family'][address_family_name] = {}
-                                                                            af_dict = etree_dict['vrf'][vrf_name]['address_family'][address_family_name]
-                                                                        # Initialize empty lists
-                                                                        export_rt_list = ''
-                                                                        import_rt_list = ''
-                                                                    # table_id
-                                                                    if af_tag == 'af-table-id':
-                                                                        table_id = str(row_af.text)
-                                                                        if '0x' in table_id:
-                                                                            af_dict['table_id'] = table_id
-                                                                        else:
-                                                                            af_dict['table_id'] = '0x' + table_id
-                                                                    # table_state
-                                                                    if af_tag == 'af-state':
-                                                                        af_dict['table_state'] = str(row_af.text).lower()
-                                                                    # peers
-                                                                    if af_tag == 'af-num-peers':
-                                                                        peers = int(row_af.text)
-                                                                        if 'peers' not in af_dict:
-                                                                            af_dict['peers'] = {}
-                                                                        if peers not in af_dict['peers']:
-                                                                            af_dict['peers'][peers] = {}
-                                                                    # active_peers
-                                                                    if af_tag == 'af-num-active-peers':
-                                                                        af_dict['peers'][peers]['active_peers'] = int(row_af.text)
-                                                                    # routes
-                                                                    if af_tag == 'af-peer-routes':
-                                                                        af_dict['peers'][peers]['routes'] = int(row_af.text)
-                                                                    # paths
-                                                                    if af_tag == 'af-peer-paths':
-                                                                        af_dict['peers'][peers]['paths'] = int(row_af.text)
-                                                                    # networks
-                                                                    if af_tag == 'af-peer-networks':
-                                                                        af_dict['peers'][peers]['networks'] = int(row_af.text)
-                                                                    # aggregates
-                                                                    if af_tag == 'af-peer-aggregates':
-                                                                        af_dict['peers'][peers]['aggregates'] = int(row_af.text)
-                                                                    # route_reflector
-                                                                    if af_tag == 'af-rr':
-                                                                        if row_af.text == 'true':
-                                                                            af_dict['route_reflector'] = True
-                                                                    # next_hop_trigger_delay
-                                                                    #   critical
-                                                                    if af_tag == 'nexthop-trigger-delay-critical':
-                                                                        if 'next_hop_trigger_delay' not in af_dict:
-                                                                            af_dict['next_hop_trigger_delay'] = {}
-                                                                        af_dict['next_hop_trigger_delay']['critical'] = int(row_af.text)
-                                                                    # next_hop_trigger_delay
-                                                                    #   non_critical
-                                                                    if af_tag == 'nexthop-trigger-delay-non-critical':
-                                                                        af_dict['next_hop_trigger_delay']['non_critical'] = int(row_af.text)
-                                                                    # aggregate_label
-                                                                    if af_tag == 'af-aggregate-label':
-                                                                        af_dict['aggregate_label'] = row_af.text
-                                                                    # label_mode
-                                                                    if af_tag == 'af-label-mode':
-                                                                        af_dict['label_mode'] = row_af.text
-                                                                    # import_default_map
-                                                                    if af_tag == 'importdefault_map':
-                                                                        af_dict['import_default_map'] = row_af.text
-                                                                    # import_default_prefix_limit
-                                                                    if af_tag == 'importdefault_prefixlimit':
-                                                                        af_dict['import_default_prefix_limit'] = int(row_af.text)
-                                                                    # import_default_prefix_count
-                                                                    if af_tag == 'importdefault_prefixcount':
-                                                                        af_dict['import_default_prefix_count'] = int(row_af.text)
-                                                                    # export_default_map
-                                                                    if af_tag == 'exportdefault_map':
-                                                                        af_dict['export_default_map'] = row_af.text
-                                                                    # export_default_prefix_limit
-                                                                    if af_tag == 'exportdefault_prefixlimit':
-                                                                        af_dict['export_default_prefix_limit'] = int(row_af.text)
-                                                                    # export_default_prefix_count
-                                                                    if af_tag == 'exportdefault_prefixcount':
-                                                                        af_dict['export_default_prefix_count'] = int(row_af.text)
-
-                                                                    # TABLE_redist
-                                                                    #   ROW_redist
-                                                                    if af_tag == 'TABLE_redist':
-                                                                        for table_redist in row_af:
-                                                                            for row_redist in table_redist:
-                                                                                row_redist_tag = row_redist.tag[row_redist.tag.find('}')+1:]
-                                                                                # protocol
-                                                                                if row_redist_tag == 'protocol':
-                                                                                    protocol = row_redist.text
-                                                                                    if 'redistribution' not in af_dict:
-                                                                                        af_dict['redistribution'] = {}
-                                                                                    if protocol not in af_dict['redistribution']:
-                                                                                        af_dict['redistribution'][protocol] = {}
-                                                                                # route_map
-                                                                                if row_redist_tag == 'route-map':
-                                                                                    af_dict['redistribution'][protocol]['route_map'] = row_redist.text
-
-                                                                    # TABLE_evpn_export_rt
-                                                                    #   ROW_evpn_export_rt
-                                                                    if af_tag == 'TABLE_evpn_export_rt':
-                                                                        for table_evpn_export in row_af:
-                                                                            for row_export in table_evpn_export:
-                                                                                row_export_tag = row_export.tag[row_export.tag.find('}')+1:]
-                                                                                # export_rt_list
-                                                                                if row_export_tag == 'evpn-export-rt':
-                                                                                    export_rt_list = str(export_rt_list + ' ' + row_export.text).strip()
-                                                                                    af_dict['export_rt_list'] = export_rt_list
-                                                                    # TABLE_evpn_import_rt
-                                                                    #   ROW_evpn_import_rt
-                                                                    if af_tag == 'TABLE_evpn_import_rt':
-                                                                        for table_evpn_import in row_af:
-                                                                            for row_import in table_evpn_import:
-                                                                                row_import_tag = row_import.tag[row_import.tag.find('}')+1:]
-                                                                                # export_rt_list
-                                                                                if row_import_tag == 'evpn-import-rt':
-                                                                                    import_rt_list = str(import_rt_list + ' ' + row_import.text).strip()
-                                                                                    af_dict['import_rt_list'] = import_rt_list
-
-                                                                    # parsed all tags
-                                                                    continue
-                                                                                    
+        fields = self.XML_FIELDS
+        rows = ['__readonly__', 'ROW_vrf', 'ROW_af', 'ROW_redist',
+                'ROW_evpn_export_rt', 'ROW_evpn_import_rt']
+
+        for tag, row, parents in iter_rows(out, rows):
+            if tag == '__readonly__':
+                map_row(row, fields[tag], etree_dict)
+                if 'srgbmin' in row and 'srgbmax' in row:
+                    etree_dict['segment_routing_global_block'] = \
+                        row['srgbmin'] + '-' + row['srgbmax']
+                continue
+
+            # Rows of a vrf, then of an address family
+            vrf_name = find_leaf(row, parents, 'vrf-name-out')
+            if vrf_name is None:
+                continue
+            vrf_dict = etree_dict.setdefault('vrf', {}).setdefault(
+                vrf_name, {})
+            if tag == 'ROW_vrf':
+                if 'vrf-est-peers' in row:
+                    vrf_dict['vrf_rd'] = 'not configured'
+                map_row(row, fields[tag], vrf_dict)
+                continue
+
+            af_name = find_leaf(row, parents, 'af-name')
+            if af_name is None:
+                continue
+            af_dict = vrf_dict.setdefault('address_family', {}).setdefault(
+                af_name.lower(), {})
+            if tag == 'ROW_af':
+                map_row(row, fields[tag], af_dict)
+                if 'af-num-peers' in row:
+                    peers_dict = af_dict.setdefault('peers', {}).setdefault(
+                        int(row['af-num-peers']), {})
+                    map_row(row, fields['peers'], peers_dict)
+                if row.get('af-rr') == 'true':
+                    af_dict['route_reflector'] = True
+            elif tag == 'ROW_redist':
+                if 'protocol' in row:
+                    redist_dict = af_dict.setdefault(
+                        'redistribution', {}).setdefault(row['protocol'], {})
+                    if 'route-map' in row:
+                        redist_dict['route_map'] = row['route-map']
+            elif tag == 'ROW_evpn_export_rt':
+                if 'evpn-export-rt' in row:
+                    af_dict['export_rt_list'] = ' '.join(filter(None, [
+                        af_dict.get('export_rt_list'),
+                        row['evpn-export-rt']]))
+            elif 'evpn-import-rt' in row:
+                af_dict['import_rt_list'] = ' '.join(filter(None, [
+                    af_dict.get('import_rt_list'), row['evpn-import-rt']]))
+
         return etree_dict
 
     def yang(self, vrf=''):
@@ -2339,11 +2202,13 @@ class ShowBgpVrfAllNeighborsSchema(MetaParser):
 class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
     """Parser for:
         show bgp vrf <vrf> all neighbors
-        parser class - implements detail parsing mechanisms for cli and yang output.
+        parser class - implements detail parsing mechanisms for cli, xml and yang output.
         """
     cli_command = ['show bgp vrf {vrf} {address_family} neighbors',
                    'show bgp vrf {vrf} {address_family} neighbors {neighbor}',
                    'show bgp vrf {vrf} all neighbors']
+    xml_command = ['show bgp vrf {vrf} {address_family} neighbors | xml',
+                   'show bgp vrf {vrf} {address_family} neighbors {neighbor} | xml']
     exclude = [
       'up_time',
       'retry_time',
@@ -2365,6 +2230,56 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
       'tbl_ver',
       'msg_rcvd']
 
+    # Schema keys of the leaves of the xml rows
+    XML_FIELDS = {
+        'ROW_neighbor': {
+            'remoteas': ('remote_as', int),
+            'localas': 'local_as',
+            'link': 'link',
+            'index': ('peer_index', int),
+            'description': 'description',
+            'version': ('bgp_version', int),
+            'remote-id': 'router_id',
+            'state': ('session_state', str.lower),
+            'elapsedtime': 'up_time',
+            'lastread': ('bgp_negotiated_keepalive_timers', 'last_read'),
+            'holdtime': (('bgp_negotiated_keepalive_timers', 'hold_time'),
+                         int),
+            'keepalivetime': (('bgp_negotiated_keepalive_timers',
+                               'keepalive_interval'), int),
+            'lastwrite': ('bgp_negotiated_keepalive_timers', 'last_written'),
+            'msgrecvd': ('received_messages', int),
+            'notificationsrcvd': ('received_notifications', int),
+            'recvbufbytes': ('received_bytes_queue', int),
+            'msgsent': ('sent_messages', int),
+            'notificationssent': ('sent_notifications', int),
+            'sentbytesoutstanding': ('sent_bytes_queue', int),
+            'connattempts': (('bgp_session_transport', 'connection',
+                              'attempts'), int),
+            'connsestablished': (('bgp_session_transport', 'connection',
+                                  'established'), int),
+            'connsdropped': (('bgp_session_transport', 'connection',
+                              'dropped'), int),
+            'resettime': ('bgp_session_transport', 'connection',
+                          'last_reset'),
+            'resetreason': ('bgp_session_transport', 'connection',
+                            'reset_reason'),
+            'localaddr': ('bgp_session_transport', 'transport', 'local_host'),
+            'localport': ('bgp_session_transport', 'transport', 'local_port'),
+            'remoteaddr': ('bgp_session_transport', 'transport',
+                           'foreign_host'),
+            'remoteport': ('bgp_session_transport', 'transport',
+                           'foreign_port'),
+            'fd': ('bgp_session_transport', 'transport', 'fd'),
+        },
+        'ROW_saf': {
+            'tableversion': ('bgp_table_version', int),
+            'neighbortableversion': ('neighbor_version', int),
+            'acceptedpaths': (('path', 'accepted_paths'), int),
+            'pfxbytes': (('path', 'memory_usage'), int),
+        },
+    }
+
     def cli(self, vrf='all', address_family='all', neighbor='', output=None):
         if output is None:
             if neighbor:
@@ -3198,6 +3113,45 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
 
         return parsed_dict
 
+    def xml(self, vrf='all', address_family='all', neighbor='', output=None):
+        if output is None:
+            if neighbor:
+                out = self.device.execute(self.xml_command[1].format(
+                    vrf=vrf, address_family=address_family,
+                    neighbor=neighbor))
+            else:
+                out = self.device.execute(self.xml_command[0].format(
+                    vrf=vrf, address_family=address_family))
+        else:
+            out = output
+
+        etree_dict = {}
+        fields = self.XML_FIELDS
+
+        for tag, row, parents in iter_rows(out, ['ROW_neighbor', 'ROW_saf']):
+            neighbor_id = find_leaf(row, parents, 'neighbor')
+            if neighbor_id is None:
+                continue
+            nbr_dict = etree_dict.setdefault('neighbor', {}).setdefault(
+                neighbor_id, {})
+            if tag == 'ROW_neighbor':
+                map_row(row, fields[tag], nbr_dict)
+                if 'state' in row:
+                    nbr_dict['shutdown'] = 'shut' in row['state'].lower()
+                continue
+
+            af_name = row.get('af-name')
+            if af_name is None:
+                continue
+            af_dict = nbr_dict.setdefault('address_family', {}).setdefault(
+                af_name.lower(), {})
+            map_row(row, fields[tag], af_dict)
+            state = find_leaf({}, parents, 'state')
+            if state is not None:
+                af_dict['session_state'] = state.lower()
+
+        return etree_dict
+
     def yang(self, vrf, address_family='', neighbor=''):
         # Initialize empty dictionary
         map_dict = {}
@@ -8973,7 +8927,7 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
         nei = Common.retrieve_xml_child(root=root, key='__XML__PARAM__neighbor-id')
 
         if hasattr(nei, 'tag'):
-            for item in nei.getchildren():
+            for item in nei:
                 if '__XML__value' in item.tag:
                     neighbor = item.text
                     continue
@@ -8981,7 +8935,7 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
                 # cover the senario that __readonly__ may be mssing when
                 # there are values in the output
                 if '__readonly__' in item.tag:
-                    root = item.getchildren()[0]
+                    root = list(item)[0]
                 else:
                     root = item
         else:
@@ -13,6 +13,7 @@
         * show mac address-table address {address} vlan {vlan}
         * show mac address-table address {address} interface {interface}
         * show mac address-table address {address} interface {interface} vlan {vlan}
+        * show mac address-table [...] | json
 
 """
 # Python
@@ -28,6 +29,9 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Default, \
                                          Use
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.compact import Layout, intern_str, \
+                                            compact_result, expand_result
+from genie.libs.parser.nxos.xml_rows import iter_json_rows
 
 class ShowMacAddressTableBaseSchema(MetaParser):
     """Schema for:
@@ -73,6 +77,31 @@ class ShowMacAddressTableBase(ShowMacAddressTableBaseSchema):
         'show mac address-table'
         'show system internal l2fwder mac'"""
 
+    # Records of the mac addresses returned by compact()
+    MAC_LAYOUT = Layout(
+        'MacAddress',
+        ['mac_address', 'entry', 'secure', 'ntfy', 'drop', 'interfaces'],
+        nested={
+            'drop': Layout('MacDrop', ['drop', 'age', 'mac_type'],
+                           interned=['age', 'mac_type']),
+            'interfaces': Layout('MacInterface',
+                                 ['interface', 'age', 'mac_type'],
+                                 keyed=True,
+                                 interned=['interface', 'age', 'mac_type'])},
+        interned=['entry', 'secure', 'ntfy'])
+    MAC_PATH = ('mac_table', 'vlans', None, 'mac_addresses', None)
+
+    def compact(self, *args, **kwargs):
+        """Return the cli() result, for the cli() arguments, with the mac
+           addresses stored as records of MAC_LAYOUT, see utils.compact"""
+        return compact_result(self.cli(*args, **kwargs), self.MAC_PATH,
+                              self.MAC_LAYOUT)
+
+    @classmethod
+    def compact_to_dict(cls, result):
+        """Return the cli() result of a result returned by compact()"""
+        return expand_result(result, cls.MAC_PATH, cls.MAC_LAYOUT)
+
     def cli(self, out):
 
         # initial return dictionary
@@ -96,7 +125,7 @@ class ShowMacAddressTableBase(ShowMacAddressTableBaseSchema):
             m = p1.match(line)
             if m:
                 group = m.groupdict()
-                vlan = str(group['vlan'])
+                vlan = intern_str(str(group['vlan']))
                 vlan_dict = ret_dict.setdefault('mac_table', {})\
                 .setdefault('vlans', {}).setdefault(vlan, {})
                 vlan_dict.update({'vlan': str(vlan)})
@@ -105,24 +134,24 @@ class ShowMacAddressTableBase(ShowMacAddressTableBaseSchema):
                 .setdefault(mac_address,{})
                 mac_dict.update({'mac_address': mac_address})
                 if group['entry']:
-                    mac_dict.update({'entry': str(group['entry']).strip()})
+                    mac_dict.update({'entry': intern_str(str(group['entry']).strip())})
                 if not str(group['drop']) == 'None':
                     intf_dict = mac_dict.setdefault('drop',{})
                     intf_dict.update({'drop': True})
                 port = str(group['ports'])
                 if not port == 'None':
-                    converted_port = Common.convert_intf_name(group['ports'])
+                    converted_port = intern_str(Common.convert_intf_name(group['ports']))
                     intf_dict = mac_dict.setdefault('interfaces',{})\
                     .setdefault(converted_port,{})
                     intf_dict.update({'interface': converted_port})
-                mac_type = str(group['mac_type'])
-                age = str(group['age'])
-                secure = str(group['secure'])
-                ntfy = str(group['ntfy'])
-                intf_dict.update({'mac_type': str(group['mac_type'])})
-                intf_dict.update({'age': str(group['age'])})                
-                mac_dict.update({'secure': str(group['secure'])})
-                mac_dict.update({'ntfy': str(group['ntfy'])})
+                mac_type = intern_str(str(group['mac_type']))
+                age = intern_str(str(group['age']))
+                secure = intern_str(str(group['secure']))
+                ntfy = intern_str(str(group['ntfy']))
+                intf_dict.update({'mac_type': mac_type})
+                intf_dict.update({'age': age})
+                mac_dict.update({'secure': secure})
+                mac_dict.update({'ntfy': ntfy})
                 continue
                 
         return ret_dict
@@ -171,27 +200,32 @@ class ShowMacAddressTable(ShowMacAddressTableBase, ShowMacAddressTableBaseSchema
         'show mac address-table address {address} interface {interface} vlan {vlan}'
     ]
 
+    # parse(context='json') calls json()
+    CONTEXT_LIST = MetaParser.CONTEXT_LIST + ('json',)
+
+    def get_command(self, address=None, interface=None, vlan=None):
+        """Return the command of cli_command for the arguments"""
+        if address and interface and vlan:
+            return self.cli_command[7].format(address=address, interface=interface, vlan=vlan)
+        elif address and interface:
+            return self.cli_command[6].format(address=address, interface=interface)
+        elif address and vlan:
+            return self.cli_command[5].format(address=address, vlan=vlan)
+        elif address:
+            return self.cli_command[4].format(address=address)
+        elif interface and vlan:
+            return self.cli_command[3].format(interface=interface, vlan=vlan)
+        elif interface:
+            return self.cli_command[2].format(interface=interface)
+        elif vlan:
+            return self.cli_command[1].format(vlan=vlan)
+        return self.cli_command[0]
+
     def cli(self, address=None, interface=None, vlan=None, output=None):
 
         if output is None:
-            if address and interface and vlan:
-                cmd = self.cli_command[7].format(address=address, interface=interface, vlan=vlan)
-            elif address and interface:
-                cmd = self.cli_command[6].format(address=address, interface=interface)
-            elif address and vlan:
-                cmd = self.cli_command[5].format(address=address, vlan=vlan)
-            elif address:
-                cmd = self.cli_command[4].format(address=address)
-            elif interface and vlan:
-                cmd = self.cli_command[3].format(interface=interface, vlan=vlan)
-            elif interface:
-                cmd = self.cli_command[2].format(interface=interface)
-            elif vlan:
-                cmd = self.cli_command[1].format(vlan=vlan)
-            else:
-                cmd = self.cli_command[0]
-
-            out = self.device.execute(cmd)
+            out = self.device.execute(self.get_command(
+                address=address, interface=interface, vlan=vlan))
         else:
             out = output
 
@@ -205,6 +239,49 @@ class ShowMacAddressTable(ShowMacAddressTableBase, ShowMacAddressTableBaseSchema
 
         return ret_dict
 
+    def json(self, address=None, interface=None, vlan=None, output=None):
+        """Parse the '| json' output of the command, into the cli() schema"""
+        if output is None:
+            output = self.device.execute(self.get_command(
+                address=address, interface=interface, vlan=vlan) + ' | json')
+
+        ret_dict = {}
+        flags = {'enabled': 'T', 'disabled': 'F'}
+
+        for tag, row, parents in iter_json_rows(output, ['ROW_mac_address']):
+            if 'disp_mac_addr' not in row or 'disp_vlan' not in row:
+                continue
+            # * 1001     0000.01ff.9191   dynamic  0     F      F    Eth1/11
+            vlan = row['disp_vlan']
+            vlan_dict = ret_dict.setdefault('mac_table', {})\
+                .setdefault('vlans', {}).setdefault(vlan, {})
+            vlan_dict['vlan'] = vlan
+            mac_address = row['disp_mac_addr']
+            mac_dict = vlan_dict.setdefault('mac_addresses', {})\
+                .setdefault(mac_address, {})
+            mac_dict['mac_address'] = mac_address
+            if row.get('disp_type'):
+                mac_dict['entry'] = row['disp_type']
+            mac_dict['secure'] = flags.get(row.get('disp_is_secure'), 'F')
+            mac_dict['ntfy'] = flags.get(row.get('disp_is_ntfy'), 'F')
+
+            port = row.get('disp_port')
+            if not port:
+                continue
+            if port.lower() == 'drop':
+                intf_dict = mac_dict.setdefault('drop', {})
+                intf_dict['drop'] = True
+            else:
+                port = Common.convert_intf_name(port)
+                intf_dict = mac_dict.setdefault('interfaces', {})\
+                    .setdefault(port, {})
+                intf_dict['interface'] = port
+            intf_dict['mac_type'] = 'static' \
+                if row.get('disp_is_static') == 'enabled' else 'dynamic'
+            intf_dict['age'] = row.get('disp_age', '-')
+
+        return ret_dict
+
 
 class ShowMacAddressTableAgingTimeSchema(MetaParser):
     """Schema for show mac address-table aging-time"""
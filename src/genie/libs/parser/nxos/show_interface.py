@@ -2,6 +2,7 @@
 
 NXOS parsers for the following show commands:
     * show interface
+    * show interface | json
     * show vrf all interface
     * show ip interface vrf all
     * show ipv6 interface detail vrf all
@@ -24,6 +25,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
                                          
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.nxos.xml_rows import iter_json_rows, map_row
 
 
 # ===========================
@@ -187,6 +189,86 @@ class ShowInterface(ShowInterfaceSchema):
       'in_crc_errors',
       'reliability']
 
+    # parse(context='json') calls json()
+    CONTEXT_LIST = MetaParser.CONTEXT_LIST + ('json',)
+
+    # Schema keys of the leaves of the json rows
+    JSON_FIELDS = {
+        'state': 'link_state',
+        'admin_state': 'admin_state',
+        'desc': 'description',
+        'eth_hw_desc': 'types',
+        'eth_hw_addr': 'mac_address',
+        'eth_bia_addr': 'phys_address',
+        'eth_mtu': ('mtu', int),
+        'eth_bw': ('bandwidth', int),
+        'eth_dly': ('delay', int),
+        'eth_encap': (('encapsulations', 'encapsulation'),
+                      lambda text: text.lower().replace(
+                          '802.1q virtual lan', 'dot1q')),
+        'medium': 'medium',
+        'eth_mode': 'port_mode',
+        'eth_duplex': 'duplex_mode',
+        'eth_speed': ('port_speed', lambda text: text.split()[0]),
+        'eth_media': 'media_type',
+        'eth_beacon': 'beacon',
+        'eth_autoneg': ('auto_negotiate', lambda text: text == 'on'),
+        'eth_in_flowctrl': (('flow_control', 'receive'),
+                            lambda text: text == 'on'),
+        'eth_out_flowctrl': (('flow_control', 'send'),
+                             lambda text: text == 'on'),
+        'eth_mdix': 'auto_mdix',
+        'eth_swt_monitor': 'switchport_monitor',
+        'eth_ethertype': 'ethertype',
+        'eth_eee_state': 'efficient_ethernet',
+        'eth_link_flapped': 'last_link_flapped',
+        'eth_reset_cntr': ('interface_reset', int),
+        'eth_clear_counters': ('counters', 'last_clear'),
+        'eth_load_interval1_rx': (('counters', 'rate', 'load_interval'), int),
+        'eth_inrate1_bits': (('counters', 'rate', 'in_rate'), int),
+        'eth_inrate1_pkts': (('counters', 'rate', 'in_rate_pkts'), int),
+        'eth_outrate1_bits': (('counters', 'rate', 'out_rate'), int),
+        'eth_outrate1_pkts': (('counters', 'rate', 'out_rate_pkts'), int),
+        'eth_inucast': (('counters', 'in_unicast_pkts'), int),
+        'eth_inmcast': (('counters', 'in_multicast_pkts'), int),
+        'eth_inbcast': (('counters', 'in_broadcast_pkts'), int),
+        'eth_inpkts': (('counters', 'in_pkts'), int),
+        'eth_inbytes': (('counters', 'in_octets'), int),
+        'eth_jumbo_inpkts': (('counters', 'in_jumbo_packets'), int),
+        'eth_storm_supp': (('counters', 'in_storm_suppression_packets'), int),
+        'eth_runts': (('counters', 'in_runts'), int),
+        'eth_giants': (('counters', 'in_oversize_frame'), int),
+        'eth_crc': (('counters', 'in_crc_errors'), int),
+        'eth_nobuf': (('counters', 'in_no_buffer'), int),
+        'eth_inerr': (('counters', 'in_errors'), int),
+        'eth_frame': (('counters', 'in_short_frame'), int),
+        'eth_overrun': (('counters', 'in_overrun'), int),
+        'eth_underrun': (('counters', 'in_underrun'), int),
+        'eth_ignored': (('counters', 'in_ignored'), int),
+        'eth_watchdog': (('counters', 'in_watchdog'), int),
+        'eth_bad_eth': (('counters', 'in_bad_etype_drop'), int),
+        'eth_bad_proto': (('counters', 'in_unknown_protos'), int),
+        'eth_in_ifdown_drops': (('counters', 'in_if_down_drop'), int),
+        'eth_dribble': (('counters', 'in_with_dribble'), int),
+        'eth_indiscard': (('counters', 'in_discard'), int),
+        'eth_inpause': (('counters', 'in_mac_pause_frames'), int),
+        'eth_outucast': (('counters', 'out_unicast_pkts'), int),
+        'eth_outmcast': (('counters', 'out_multicast_pkts'), int),
+        'eth_outbcast': (('counters', 'out_broadcast_pkts'), int),
+        'eth_outpkts': (('counters', 'out_pkts'), int),
+        'eth_outbytes': (('counters', 'out_octets'), int),
+        'eth_jumbo_outpkts': (('counters', 'out_jumbo_packets'), int),
+        'eth_outerr': (('counters', 'out_errors'), int),
+        'eth_coll': (('counters', 'out_collision'), int),
+        'eth_deferred': (('counters', 'out_deferred'), int),
+        'eth_latecoll': (('counters', 'out_late_collision'), int),
+        'eth_lostcarrier': (('counters', 'out_lost_carrier'), int),
+        'eth_nocarrier': (('counters', 'out_no_carrier'), int),
+        'eth_babbles': (('counters', 'out_babble'), int),
+        'eth_outdiscard': (('counters', 'out_discard'), int),
+        'eth_outpause': (('counters', 'out_mac_pause_frames'), int),
+    }
+
     def cli(self, interface="", output=None):
         if output is None:
             if interface:
@@ -1054,6 +1136,56 @@ class ShowInterface(ShowInterfaceSchema):
 
         return interface_dict
 
+    def json(self, interface="", output=None):
+        '''Parse the '| json' output of the command, into the cli() schema
+        '''
+        if output is None:
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            output = self.device.execute(cmd + ' | json')
+
+        interface_dict = {}
+        fields = self.JSON_FIELDS
+
+        for tag, row, parents in iter_json_rows(output, ['ROW_interface']):
+            if 'interface' not in row:
+                continue
+            intf_dict = interface_dict.setdefault(row['interface'], {})
+            intf_dict['port_channel'] = {'port_channel_member': False}
+            map_row(row, fields, intf_dict)
+
+            # Ethernet2/2 is up
+            # admin state is up, Dedicated Interface
+            if 'state' in row:
+                intf_dict['oper_status'] = row['state']
+            intf_dict['enabled'] = row.get('admin_state') == 'up'
+            if row.get('share_state') == 'Dedicated':
+                intf_dict['dedicated_interface'] = True
+
+            # Internet Address is 10.4.4.4/24
+            if 'eth_ip_addr' in row and 'eth_ip_mask' in row:
+                address = row['eth_ip_addr'] + '/' + row['eth_ip_mask']
+                intf_dict.setdefault('ipv4', {})[address] = {
+                    'ip': row['eth_ip_addr'],
+                    'prefix_length': row['eth_ip_mask']}
+
+            # reliability 255/255, txload 1/255, rxload 1/255
+            for key in ('reliability', 'txload', 'rxload'):
+                if 'eth_' + key in row:
+                    intf_dict[key] = row['eth_' + key] + '/255'
+
+            # Members in this channel: Eth1/15, Eth1/16
+            if row.get('eth_members'):
+                intf_dict['port_channel'].update({
+                    'port_channel_member': True,
+                    'port_channel_member_intfs': [
+                        Common.convert_intf_name(item.strip())
+                        for item in row['eth_members'].split(',')]})
+
+        return interface_dict
+
 
 # ===================================
 # Schema for 'show interface vrf all'
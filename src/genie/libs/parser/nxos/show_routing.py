@@ -20,6 +20,7 @@ NXOS parser for the following show commands:
     * show ip route vrf {vrf}
     * show ip route vrf all
     * show ip route
+    * show ip route [...] | json
     * show ipv6 route {route} {protocol} interface {interface} vrf {vrf}
     * show ipv6 route {route} {protocol} interface {interface}
     * show ipv6 route {route} {protocol} vrf {vrf}
@@ -51,6 +52,8 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.stream import Records, iter_lines, build_result
+from genie.libs.parser.nxos.xml_rows import iter_json_rows, map_row, find_leaf
 
 # =================================
 # Parser for 'show routing vrf all'
@@ -588,90 +591,128 @@ class ShowIpRoute(ShowIpRouteSchema):
     exclude = [
         'updated']
 
+    # parse(context='json') calls json()
+    CONTEXT_LIST = MetaParser.CONTEXT_LIST + ('json',)
+
+    # Schema keys of the leaves of the json rows
+    JSON_FIELDS = {
+        'ROW_prefix': {
+            'ucast-nhops': ('ubest', int),
+            'mcast-nhops': ('mbest', int),
+        },
+        'ROW_path': {
+            'type': 'source_protocol_status',
+            'pref': ('route_preference', int),
+            'metric': ('metric', int),
+            'segid': ('segid', int),
+            'tunnelid': 'tunnelid',
+            'encap': ('encap', str.lower),
+        },
+    }
+
     def cli(self, route=None, protocol=None, vrf=None, interface=None, output=None, cmd=None):
+        return build_result(self.parse_iter(
+            route=route, protocol=protocol, vrf=vrf, interface=interface,
+            output=output, cmd=cmd))
+
+    def get_command(self, commands, route=None, protocol=None, vrf=None,
+                    interface=None):
+        """Return the command of commands for the arguments
+        """
+        if protocol and route and interface and vrf:
+            return commands[0].format(
+                    protocol=protocol,
+                    route=route,
+                    interface=interface,
+                    vrf=vrf,
+                    )
+        elif protocol and route and interface:
+            return commands[1].format(
+                    protocol=protocol,
+                    route=route,
+                    interface=interface,
+                    )
+        elif protocol and route and vrf:
+            return commands[2].format(
+                    protocol=protocol,
+                    route=route,
+                    vrf=vrf,
+                    )
+        elif protocol and interface and vrf:
+            return commands[3].format(
+                    protocol=protocol,
+                    vrf=vrf,
+                    interface=interface,
+                    )
+        elif route and interface and vrf:
+            return commands[4].format(
+                    vrf=vrf,
+                    route=route,
+                    interface=interface,
+                    )
+        elif protocol and route:
+            return commands[5].format(
+                    protocol=protocol,
+                    route=route,
+                    )
+        elif protocol and interface:
+            return commands[6].format(
+                    protocol=protocol,
+                    interface=interface,
+                    )
+        elif protocol and vrf:
+            return commands[7].format(
+                    protocol=protocol,
+                    vrf=vrf,
+                    )
+        elif route and interface:
+            return commands[8].format(
+                    route=route,
+                    interface=interface,
+                    )
+        elif route and vrf:
+            return commands[9].format(
+                    route=route,
+                    vrf=vrf,
+                    )
+        elif interface and vrf:
+            return commands[10].format(
+                    interface=interface,
+                    vrf=vrf,
+                    )
+        elif protocol:
+            return commands[11].format(
+                    protocol=protocol,
+                    )
+        elif route:
+            return commands[12].format(
+                    route=route,
+                    )
+        elif interface:
+            return commands[13].format(
+                    interface=interface,
+                    )
+        elif vrf:
+            return commands[14].format(
+                    vrf=vrf,
+                    )
+        else:
+            return commands[15]
+
+    def parse_iter(self, route=None, protocol=None, vrf=None, interface=None, output=None, cmd=None):
+        """Yield the routes one by one, as (path, route) where path is the
+           keys leading to the route in the cli() result:
+           ('vrf', vrf, 'address_family', af, 'routes', route).
+           A vrf without routes is yielded as an empty dictionary at
+           ('vrf', vrf, 'address_family', af, 'routes').
 
+           output can also be a file object or any iterable of lines.
+        """
         # execute command to get output
         if output is None:
-            if protocol and route and interface and vrf:
-                cmd = self.cli_command[0].format(
-                        protocol=protocol,
-                        route=route,
-                        interface=interface,
-                        vrf=vrf,
-                        )
-            elif protocol and route and interface:
-                cmd = self.cli_command[1].format(
-                        protocol=protocol,
-                        route=route,
-                        interface=interface,
-                        )
-            elif protocol and route and vrf:
-                cmd = self.cli_command[2].format(
-                        protocol=protocol,
-                        route=route,
-                        vrf=vrf,
-                        )
-            elif protocol and interface and vrf:
-                cmd = self.cli_command[3].format(
-                        protocol=protocol,
-                        vrf=vrf,
-                        interface=interface,
-                        )
-            elif route and interface and vrf:
-                cmd = self.cli_command[4].format(
-                        vrf=vrf,
-                        route=route,
-                        interface=interface,
-                        )
-            elif protocol and route:
-                cmd = self.cli_command[5].format(
-                        protocol=protocol,
-                        route=route,
-                        )
-            elif protocol and interface:
-                cmd = self.cli_command[6].format(
-                        protocol=protocol,
-                        interface=interface,
-                        )
-            elif protocol and vrf:
-                cmd = self.cli_command[7].format(
-                        protocol=protocol,
-                        vrf=vrf,
-                        )
-            elif route and interface:
-                cmd = self.cli_command[8].format(
-                        route=route,
-                        interface=interface,
-                        )
-            elif route and vrf:
-                cmd = self.cli_command[9].format(
-                        route=route,
-                        vrf=vrf,
-                        )
-            elif interface and vrf:
-                cmd = self.cli_command[10].format(
-                        interface=interface,
-                        vrf=vrf,
-                        )
-            elif protocol:
-                cmd = self.cli_command[11].format(
-                        protocol=protocol,
-                        )
-            elif route:
-                cmd = self.cli_command[12].format(
-                        route=route,
-                        )
-            elif interface:
-                cmd = self.cli_command[13].format(
-                        interface=interface,
-                        )
-            elif vrf:
-                cmd = self.cli_command[14].format(
-                        vrf=vrf,
-                        )
-            else:
-                cmd = self.cli_command[15]
-
+            cmd = self.get_command(self.cli_command, route=route,
+                                   protocol=protocol, vrf=vrf,
+                                   interface=interface)
             out = self.device.execute(cmd)
         else:
             out = output
@@ -679,7 +720,8 @@ class ShowIpRoute(ShowIpRouteSchema):
         if not cmd:
             cmd = 'ipv4'
         af = 'ipv6' if 'v6' in cmd else 'ipv4'
-        result_dict = {}
+        records = Records()
+        vrf = 'default'
 
         # IP Route Table for VRF "default"
         # IP Route Table for Context "default"
@@ -723,7 +765,10 @@ class ShowIpRoute(ShowIpRouteSchema):
         #    tag 100
         p4 = re.compile(r'^tag +(?P<tag>\d+)$')
 
-        for line in out.splitlines():
+        for line in iter_lines(out):
+            if records.completed:
+                yield from records.pop()
+
             line = line.strip()
 
             # IP Route Table for VRF "default"
@@ -731,13 +776,9 @@ class ShowIpRoute(ShowIpRouteSchema):
             # IPv6 Routing Table for VRF "default"
             m = p1.match(line)
             if m:
-                if 'vrf' not in result_dict:
-                    vrfs_dict = result_dict.setdefault('vrf', {})
-
                 group = m.groupdict()
                 vrf = group['vrf']
-                routes_dict = vrfs_dict.setdefault(vrf, {}).setdefault('address_family', {}). \
-                                        setdefault(af, {}).setdefault('routes', {})
+                records.add({}, 'vrf', vrf, 'address_family', af, 'routes')
                 continue
 
             # 10.4.1.1/32, ubest/mbest: 2/0
@@ -769,12 +810,8 @@ class ShowIpRoute(ShowIpRouteSchema):
                 if groups['attached']:
                     attached = True if 'attached' in groups['attached'] else False
 
-                # if vrf:
-                if 'vrf' not in result_dict:
-                    routes_dict = result_dict.setdefault('vrf', {}).setdefault('default', {}). \
-                        setdefault('address_family', {}).setdefault(af, {}). \
-                        setdefault('routes', {})
-                route_dict = routes_dict.setdefault(route, {})
+                route_dict = records.open('vrf', vrf, 'address_family', af,
+                                          'routes', route)
                 route_dict.update({'route': route})
                 route_dict.update({'active': active})
 
@@ -949,8 +986,103 @@ class ShowIpRoute(ShowIpRouteSchema):
                 groups = m.groupdict()
                 if groups['tag']:
                     route_dict.update({'tag': int(groups['tag'])})
-                    
-        return result_dict
+
+        yield from records.close()
+
+    def json(self, route=None, protocol=None, vrf=None, interface=None, output=None):
+        """Parse the '| json' output of the command, into the cli() schema
+        """
+        if output is None:
+            output = self.device.execute(self.get_command(
+                self.cli_command, route=route, protocol=protocol, vrf=vrf,
+                interface=interface) + ' | json')
+
+        result = {}
+        fields = self.JSON_FIELDS
+        path_key = None
+        index = 0
+        rows = ['ROW_vrf', 'ROW_addrf', 'ROW_prefix', 'ROW_path']
+
+        for tag, row, parents in iter_json_rows(output, rows):
+            vrf_name = find_leaf(row, parents, 'vrf-name-out')
+            if vrf_name is None:
+                continue
+            vrf_dict = result.setdefault('vrf', {}).setdefault(vrf_name, {})
+            af = find_leaf(row, parents, 'addrf')
+            if af is None:
+                continue
+            routes_dict = vrf_dict.setdefault('address_family', {})\
+                .setdefault(af, {}).setdefault('routes', {})
+            prefix = find_leaf(row, parents, 'ipprefix') or \
+                find_leaf(row, parents, 'ipv6prefix')
+            if prefix is None:
+                continue
+            route_dict = routes_dict.setdefault(prefix, {})
+
+            # 10.4.1.1/32, ubest/mbest: 2/0, attached
+            if tag == 'ROW_prefix':
+                route_dict.update({'route': prefix, 'active': True})
+                map_row(row, fields[tag], route_dict)
+                if row.get('attached') == 'true':
+                    route_dict['attached'] = True
+                continue
+
+            # *via 10.1.3.1, Eth1/2, [110/41], 01:01:18, ospf-1, intra
+            if (vrf_name, af, prefix) != path_key:
+                path_key = (vrf_name, af, prefix)
+                index = 0
+            index += 1
+
+            source_protocol, _, process_id = \
+                row.get('clientname', '').partition('-')
+            cast = None
+            if row.get('ubest') == 'true':
+                cast = 'best_ucast_nexthop'
+            elif row.get('mbest') == 'true':
+                cast = 'best_mcast_nexthop'
+            path_dict = map_row(row, fields[tag])
+
+            if cast:
+                for key in ('metric', 'route_preference'):
+                    if key in path_dict:
+                        route_dict[key] = path_dict[key]
+            if process_id:
+                route_dict['process_id'] = process_id
+            if 'tag' in row:
+                route_dict['tag'] = int(row['tag'])
+
+            interface = Common.convert_intf_name(row['ifname']) \
+                if 'ifname' in row else ''
+            next_hop = row.get('ipnexthop') or row.get('ipv6nexthop')
+            next_hop_dict = route_dict.setdefault('next_hop', {})
+
+            if not next_hop:
+                interface_dict = next_hop_dict.setdefault(
+                    'outgoing_interface', {}).setdefault(interface, {})
+                if interface:
+                    interface_dict['outgoing_interface'] = interface
+                if 'uptime' in row:
+                    interface_dict['updated'] = row['uptime']
+                continue
+
+            index_dict = next_hop_dict.setdefault('next_hop_list', {})\
+                .setdefault(index, {})
+            index_dict.update({'index': index, 'next_hop': next_hop})
+            if source_protocol:
+                route_dict['source_protocol'] = source_protocol
+                index_dict['source_protocol'] = source_protocol
+            if 'source_protocol_status' in path_dict:
+                route_dict['source_protocol_status'] = \
+                    path_dict['source_protocol_status']
+            if cast:
+                index_dict[cast] = True
+            if 'uptime' in row:
+                index_dict['updated'] = row['uptime']
+            if interface:
+                index_dict['outgoing_interface'] = interface
+            index_dict.update(path_dict)
+
+        return result
 
 
 # ====================================================
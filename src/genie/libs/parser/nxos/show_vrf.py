@@ -15,6 +15,8 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.device_cache import cached_parse
+from genie.libs.parser.utils.fanout import execute_many
 
 # =====================
 # Parser for 'show vrf'
@@ -298,14 +300,15 @@ class ShowRunningConfigVrf(ShowRunningConfigVrfSchema):
             vrf_list.append(vrf)
 
         else:
-            showVrf = ShowVrf(device=self.device)
-            vrfs = showVrf.parse()
+            vrfs = cached_parse(ShowVrf, self.device)
             for vrf in vrfs['vrfs'].keys():
                 vrf_list.append(vrf)
 
 
-        for vrf in vrf_list:
-            out = self.device.execute(self.cli_command.format(vrf=vrf))
+        outputs = execute_many(self.device,
+                               [self.cli_command.format(vrf=vrf)
+                                for vrf in vrf_list])
+        for out in outputs:
 
             for line in out.splitlines():
                 line = line.strip()
@@ -27,6 +27,7 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.fanout import execute_many
 
 
 class ShowL2routeEvpnImetAllDetailSchema(MetaParser):
@@ -485,8 +486,10 @@ class ShowNveInterfaceDetail(ShowNveInterfaceDetailSchema):
         # Multisite dci-advertise-pip configured: True
         p26 = re.compile(r'Multisite +dci-advertise-pip +configured: +(?P<multisite_dci_advertise_pip>\S+)')
         
-        for nve in nve_list:
-            out = self.device.execute(self.cli_command.format(interface=nve))
+        outputs = execute_many(self.device,
+                               [self.cli_command.format(interface=nve)
+                                for nve in nve_list])
+        for out in outputs:
             for line in out.splitlines():
                 if line:
                     line = line.rstrip()
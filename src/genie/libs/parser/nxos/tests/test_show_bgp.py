@@ -8977,6 +8977,168 @@ BGP neighbor is 10.186.0.4, remote AS 1, ibgp link, fabric-internal, Peer index
             parsed_output = obj.parse(vrf='default')
 
 
+class test_show_bgp_vrf_all_neighbors_xml(unittest.TestCase):
+
+    '''Unit test for show bgp vrf all all neighbors - XML'''
+
+    device = Device(name='aDevice')
+    empty_output = {'execute.return_value': ''}
+
+    golden_parsed_output = {
+        'neighbor':
+            {'10.16.2.2':
+                {'address_family':
+                    {'ipv4 unicast':
+                        {'bgp_table_version': 48,
+                         'neighbor_version': 48,
+                         'path': {'accepted_paths': 2,
+                                  'memory_usage': 208},
+                         'session_state': 'established'},
+                    'vpnv4 unicast':
+                        {'bgp_table_version': 53,
+                         'neighbor_version': 53,
+                         'session_state': 'established'}},
+                'bgp_negotiated_keepalive_timers':
+                    {'hold_time': 99,
+                     'keepalive_interval': 33,
+                     'last_read': '00:00:24',
+                     'last_written': '00:00:02'},
+                'bgp_session_transport':
+                    {'connection':
+                        {'attempts': 1,
+                         'dropped': 0,
+                         'established': 1,
+                         'last_reset': 'never',
+                         'reset_reason': 'No error'},
+                    'transport':
+                        {'fd': '44',
+                         'foreign_host': '10.16.2.2',
+                         'foreign_port': '179',
+                         'local_host': '10.186.0.2',
+                         'local_port': '48392'}},
+                'bgp_version': 4,
+                'description': 'nei_desc',
+                'link': 'ibgp',
+                'peer_index': 1,
+                'received_bytes_queue': 0,
+                'received_messages': 108554,
+                'received_notifications': 0,
+                'remote_as': 100,
+                'router_id': '10.16.2.2',
+                'sent_bytes_queue': 0,
+                'sent_messages': 108566,
+                'sent_notifications': 0,
+                'session_state': 'established',
+                'shutdown': False,
+                'up_time': '5w0d'},
+            '10.16.2.5':
+                {'bgp_version': 4,
+                 'link': 'ebgp',
+                 'local_as': '333',
+                 'peer_index': 2,
+                 'remote_as': 200,
+                 'router_id': '0.0.0.0',
+                 'session_state': 'shut (admin)',
+                 'shutdown': True,
+                 'up_time': '5w0d'}}}
+
+    golden_output = {'execute.return_value': '''<?xml version="1.0" encoding="ISO-8859-1"?>
+        <nf:rpc-reply xmlns="http://www.cisco.com/nxos:1.0:bgp" xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0">
+         <nf:data>
+          <show>
+           <bgp>
+            <__XML__OPT_Cmd_show_bgp_neighbors_cmd_vrf>
+             <__readonly__>
+              <TABLE_neighbor>
+               <ROW_neighbor>
+                <neighbor>10.16.2.2</neighbor>
+                <remoteas>100</remoteas>
+                <link>ibgp</link>
+                <index>1</index>
+                <description>nei_desc</description>
+                <version>4</version>
+                <remote-id>10.16.2.2</remote-id>
+                <state>Established</state>
+                <elapsedtime>5w0d</elapsedtime>
+                <lastread>00:00:24</lastread>
+                <holdtime>99</holdtime>
+                <keepalivetime>33</keepalivetime>
+                <lastwrite>00:00:02</lastwrite>
+                <msgrecvd>108554</msgrecvd>
+                <notificationsrcvd>0</notificationsrcvd>
+                <recvbufbytes>0</recvbufbytes>
+                <msgsent>108566</msgsent>
+                <notificationssent>0</notificationssent>
+                <sentbytesoutstanding>0</sentbytesoutstanding>
+                <connattempts>1</connattempts>
+                <connsestablished>1</connsestablished>
+                <connsdropped>0</connsdropped>
+                <resettime>never</resettime>
+                <resetreason>No error</resetreason>
+                <TABLE_af>
+                 <ROW_af>
+                  <af-afi>1</af-afi>
+                  <TABLE_saf>
+                   <ROW_saf>
+                    <af-safi>1</af-safi>
+                    <af-name>IPv4 Unicast</af-name>
+                    <tableversion>48</tableversion>
+                    <neighbortableversion>48</neighbortableversion>
+                    <acceptedpaths>2</acceptedpaths>
+                    <pfxbytes>208</pfxbytes>
+                   </ROW_saf>
+                   <ROW_saf>
+                    <af-safi>128</af-safi>
+                    <af-name>VPNv4 Unicast</af-name>
+                    <tableversion>53</tableversion>
+                    <neighbortableversion>53</neighbortableversion>
+                   </ROW_saf>
+                  </TABLE_saf>
+                 </ROW_af>
+                </TABLE_af>
+                <localaddr>10.186.0.2</localaddr>
+                <localport>48392</localport>
+                <remoteaddr>10.16.2.2</remoteaddr>
+                <remoteport>179</remoteport>
+                <fd>44</fd>
+               </ROW_neighbor>
+               <ROW_neighbor>
+                <neighbor>10.16.2.5</neighbor>
+                <remoteas>200</remoteas>
+                <localas>333</localas>
+                <link>ebgp</link>
+                <index>2</index>
+                <version>4</version>
+                <remote-id>0.0.0.0</remote-id>
+                <state>Shut (Admin)</state>
+                <elapsedtime>5w0d</elapsedtime>
+               </ROW_neighbor>
+              </TABLE_neighbor>
+             </__readonly__>
+            </__XML__OPT_Cmd_show_bgp_neighbors_cmd_vrf>
+           </bgp>
+          </show>
+         </nf:data>
+        </nf:rpc-reply>
+        ]]>]]>
+        '''}
+
+    def test_show_bgp_vrf_all_neighbors_golden_xml(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output)
+        obj = ShowBgpVrfAllNeighbors(device=self.device, context='xml')
+        parsed_output = obj.parse(vrf='all', address_family='all')
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+        self.device.execute.assert_called_once_with(
+            'show bgp vrf all all neighbors | xml')
+
+    def test_show_bgp_vrf_all_neighbors_empty_xml(self):
+        self.device = Mock(**self.empty_output)
+        obj = ShowBgpVrfAllNeighbors(device=self.device, context='xml')
+        with self.assertRaises(SchemaEmptyParserError):
+            parsed_output = obj.parse(vrf='default')
+
+
 class test_show_bgp_vrf_all_neighbors_yang(unittest.TestCase):
 
     '''Unit test for show vrf all neighbors - YANG'''
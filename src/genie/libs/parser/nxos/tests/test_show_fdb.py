@@ -1022,6 +1022,83 @@ class test_show_mac_address_table(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output_2)
 
+    golden_output_json = {'execute.return_value': '''
+        show mac address-table vlan 10 | json
+        {"TABLE_mac_address": {"ROW_mac_address": [
+          {"disp_mac_addr": "aaaa.bbff.8888", "disp_type": "*",
+           "disp_vlan": "10", "disp_is_static": "enabled",
+           "disp_age": "-", "disp_is_secure": "disabled",
+           "disp_is_ntfy": "disabled", "disp_port": "Ethernet1/2"},
+          {"disp_mac_addr": "aaaa.bbff.8888", "disp_type": "*",
+           "disp_vlan": "20", "disp_is_static": "enabled",
+           "disp_age": "-", "disp_is_secure": "disabled",
+           "disp_is_ntfy": "disabled", "disp_port": "Drop"},
+          {"disp_mac_addr": "0000.01ff.9191", "disp_type": "C",
+           "disp_vlan": "10", "disp_is_static": "disabled",
+           "disp_age": "0", "disp_is_secure": "disabled",
+           "disp_is_ntfy": "disabled", "disp_port": "nve1(10.9.0.101)"}
+        ]}}
+    '''}
+
+    golden_parsed_output_json = {
+        'mac_table': {
+            'vlans': {
+                '10': {
+                    'mac_addresses': {
+                        '0000.01ff.9191': {
+                            'entry': 'C',
+                            'interfaces': {
+                                'Nve1(10.9.0.101)': {
+                                    'age': '0',
+                                    'interface': 'Nve1(10.9.0.101)',
+                                    'mac_type': 'dynamic'}},
+                            'mac_address': '0000.01ff.9191',
+                            'ntfy': 'F',
+                            'secure': 'F'},
+                        'aaaa.bbff.8888': {
+                            'entry': '*',
+                            'interfaces': {
+                                'Ethernet1/2': {
+                                    'age': '-',
+                                    'interface': 'Ethernet1/2',
+                                    'mac_type': 'static'}},
+                            'mac_address': 'aaaa.bbff.8888',
+                            'ntfy': 'F',
+                            'secure': 'F'}},
+                    'vlan': '10'},
+                '20': {
+                    'mac_addresses': {
+                        'aaaa.bbff.8888': {
+                            'drop': {
+                                'age': '-',
+                                'drop': True,
+                                'mac_type': 'static'},
+                            'entry': '*',
+                            'mac_address': 'aaaa.bbff.8888',
+                            'ntfy': 'F',
+                            'secure': 'F'}},
+                    'vlan': '20'}}}}
+
+    def test_golden_json(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output_json)
+        obj = ShowMacAddressTable(device=self.device, context='json')
+        parsed_output = obj.parse(vlan='10')
+        self.assertEqual(parsed_output, self.golden_parsed_output_json)
+        self.device.execute.assert_called_once_with(
+            'show mac address-table vlan 10 | json')
+
+    def test_golden_compact(self):
+        self.device = Mock(**self.golden_output)
+        obj = ShowMacAddressTable(device=self.device)
+        compact = obj.compact()
+        mac = compact['mac_table']['vlans']['10']['mac_addresses']\
+            ['aaaa.bbff.8888']
+        self.assertEqual([intf.interface for intf in mac.interfaces],
+                         ['Ethernet1/2'])
+        self.assertEqual(ShowMacAddressTable.compact_to_dict(compact),
+                         self.golden_parsed_output)
+
 
 class test_show_mac_address_table_limit(unittest.TestCase):
     device = Device(name='aDevice')
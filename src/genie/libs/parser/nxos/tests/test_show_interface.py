@@ -1253,6 +1253,137 @@ class TestShowInterface(unittest.TestCase):
         self.maxDiff = None
         self.assertEqual(parsed_output, self.golden_parsed_output_5)
 
+    golden_output_json = {'execute.return_value': '''
+        {
+         "TABLE_interface": {
+          "ROW_interface": [
+           {
+            "interface": "Ethernet2/1",
+            "state": "up",
+            "admin_state": "up",
+            "share_state": "Dedicated",
+            "eth_hw_desc": "Ethernet",
+            "eth_hw_addr": "aaaa.bbff.8888",
+            "eth_bia_addr": "5254.00ff.9c38",
+            "desc": "desc",
+            "eth_ip_addr": "10.4.4.4",
+            "eth_ip_mask": 24,
+            "eth_mtu": "1600",
+            "eth_bw": 768,
+            "eth_dly": 3330,
+            "eth_reliability": "255",
+            "eth_txload": "1",
+            "eth_rxload": "1",
+            "medium": "broadcast",
+            "eth_mode": "routed",
+            "eth_duplex": "full",
+            "eth_speed": "1000 Mb/s",
+            "eth_beacon": "off",
+            "eth_autoneg": "off",
+            "eth_in_flowctrl": "off",
+            "eth_out_flowctrl": "off",
+            "eth_mdix": "off",
+            "eth_swt_monitor": "off",
+            "eth_ethertype": "0x8100",
+            "eth_eee_state": "n/a",
+            "eth_link_flapped": "00:07:28",
+            "eth_clear_counters": "never",
+            "eth_reset_cntr": 1,
+            "eth_load_interval1_rx": 30,
+            "eth_inrate1_bits": "0",
+            "eth_inrate1_pkts": "0",
+            "eth_load_interval1_tx": "30",
+            "eth_outrate1_bits": "24",
+            "eth_outrate1_pkts": "0",
+            "eth_inucast": 0,
+            "eth_inmcast": 0,
+            "eth_inbcast": 0,
+            "eth_inpkts": 0,
+            "eth_inbytes": 0,
+            "eth_outucast": 0,
+            "eth_outpkts": 0,
+            "eth_outbytes": 0
+           },
+           {
+            "interface": "port-channel1",
+            "state": "down",
+            "admin_state": "down",
+            "eth_mtu": "1500",
+            "eth_members": "Eth1/15, Eth1/16"
+           }
+          ]
+         }
+        }
+    '''}
+
+    golden_parsed_output_json = {
+        'Ethernet2/1': {
+            'admin_state': 'up',
+            'auto_mdix': 'off',
+            'auto_negotiate': False,
+            'bandwidth': 768,
+            'beacon': 'off',
+            'counters': {
+                'in_broadcast_pkts': 0,
+                'in_multicast_pkts': 0,
+                'in_octets': 0,
+                'in_pkts': 0,
+                'in_unicast_pkts': 0,
+                'last_clear': 'never',
+                'out_octets': 0,
+                'out_pkts': 0,
+                'out_unicast_pkts': 0,
+                'rate': {'in_rate': 0,
+                         'in_rate_pkts': 0,
+                         'load_interval': 30,
+                         'out_rate': 24,
+                         'out_rate_pkts': 0}},
+            'dedicated_interface': True,
+            'delay': 3330,
+            'description': 'desc',
+            'duplex_mode': 'full',
+            'efficient_ethernet': 'n/a',
+            'enabled': True,
+            'ethertype': '0x8100',
+            'flow_control': {'receive': False, 'send': False},
+            'interface_reset': 1,
+            'ipv4': {'10.4.4.4/24': {'ip': '10.4.4.4',
+                                     'prefix_length': '24'}},
+            'last_link_flapped': '00:07:28',
+            'link_state': 'up',
+            'mac_address': 'aaaa.bbff.8888',
+            'medium': 'broadcast',
+            'mtu': 1600,
+            'oper_status': 'up',
+            'phys_address': '5254.00ff.9c38',
+            'port_channel': {'port_channel_member': False},
+            'port_mode': 'routed',
+            'port_speed': '1000',
+            'reliability': '255/255',
+            'rxload': '1/255',
+            'switchport_monitor': 'off',
+            'txload': '1/255',
+            'types': 'Ethernet'},
+        'port-channel1': {
+            'admin_state': 'down',
+            'enabled': False,
+            'link_state': 'down',
+            'mtu': 1500,
+            'oper_status': 'down',
+            'port_channel': {
+                'port_channel_member': True,
+                'port_channel_member_intfs': ['Ethernet1/15',
+                                              'Ethernet1/16']}},
+    }
+
+    def test_golden_json(self):
+        self.device = Mock(**self.golden_output_json)
+        interface_obj = ShowInterface(device=self.device, context='json')
+        parsed_output = interface_obj.parse()
+        self.maxDiff = None
+        self.assertEqual(parsed_output, self.golden_parsed_output_json)
+        self.device.execute.assert_called_once_with('show interface | json')
+
 # #############################################################################
 # # Unittest For Show Ip Interface Vrf All
 # #############################################################################
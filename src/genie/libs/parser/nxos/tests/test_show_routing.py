@@ -3252,6 +3252,163 @@ class test_show_ip_route(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output_00)
 
+    def test_show_ip_route_parse_iter(self):
+        self.maxDiff = None
+        lines = iter(self.golden_output_3['execute.return_value'].splitlines())
+        obj = ShowIpRoute(device=Mock())
+        routes = obj.parse_iter(output=lines)
+
+        # Routes are yielded as soon as they are complete
+        path, route = next(routes)
+        self.assertEqual(path, ('vrf', 'default', 'address_family', 'ipv4',
+                                'routes'))
+        self.assertEqual(route, {})
+        path, route = next(routes)
+        self.assertEqual(path[-1], route['route'])
+        self.assertTrue(next(lines, None))
+
+    golden_output_json = {'execute.return_value': '''
+        {
+         "TABLE_vrf": {
+          "ROW_vrf": [
+           {
+            "vrf-name-out": "default",
+            "TABLE_addrf": {
+             "ROW_addrf": {
+              "addrf": "ipv4",
+              "TABLE_prefix": {
+               "ROW_prefix": [
+                {
+                 "ipprefix": "10.1.3.0/24",
+                 "ucast-nhops": "1",
+                 "mcast-nhops": "0",
+                 "attached": "true",
+                 "TABLE_path": {
+                  "ROW_path": {
+                   "ipnexthop": "10.1.3.1",
+                   "ifname": "Eth1/2",
+                   "uptime": "P1DT1H1M",
+                   "pref": "0",
+                   "metric": "0",
+                   "clientname": "direct",
+                   "ubest": "true"
+                  }
+                 }
+                },
+                {
+                 "ipprefix": "10.4.1.1/32",
+                 "ucast-nhops": "2",
+                 "mcast-nhops": "0",
+                 "attached": "false",
+                 "TABLE_path": {
+                  "ROW_path": [
+                   {
+                    "ipnexthop": "10.1.3.1",
+                    "ifname": "Eth1/2",
+                    "uptime": "PT1H1M18S",
+                    "pref": "110",
+                    "metric": "41",
+                    "clientname": "ospf-1",
+                    "type": "intra",
+                    "ubest": "true",
+                    "tag": "100"
+                   },
+                   {
+                    "ipnexthop": "10.229.11.11",
+                    "uptime": "PT1H1M12S",
+                    "pref": "200",
+                    "metric": "0",
+                    "clientname": "bgp-100",
+                    "type": "internal",
+                    "ubest": "false"
+                   }
+                  ]
+                 }
+                }
+               ]
+              }
+             }
+            }
+           },
+           {
+            "vrf-name-out": "VRF1",
+            "TABLE_addrf": {
+             "ROW_addrf": {
+              "addrf": "ipv4"
+             }
+            }
+           }
+          ]
+         }
+        }
+    '''}
+
+    golden_parsed_output_json = {
+        'vrf': {
+            'VRF1': {
+                'address_family': {'ipv4': {'routes': {}}}},
+            'default': {
+                'address_family': {
+                    'ipv4': {
+                        'routes': {
+                            '10.1.3.0/24': {
+                                'active': True,
+                                'attached': True,
+                                'mbest': 0,
+                                'metric': 0,
+                                'next_hop': {
+                                    'next_hop_list': {
+                                        1: {'best_ucast_nexthop': True,
+                                            'index': 1,
+                                            'metric': 0,
+                                            'next_hop': '10.1.3.1',
+                                            'outgoing_interface': 'Ethernet1/2',
+                                            'route_preference': 0,
+                                            'source_protocol': 'direct',
+                                            'updated': 'P1DT1H1M'}}},
+                                'route': '10.1.3.0/24',
+                                'route_preference': 0,
+                                'source_protocol': 'direct',
+                                'ubest': 1},
+                            '10.4.1.1/32': {
+                                'active': True,
+                                'mbest': 0,
+                                'metric': 41,
+                                'next_hop': {
+                                    'next_hop_list': {
+                                        1: {'best_ucast_nexthop': True,
+                                            'index': 1,
+                                            'metric': 41,
+                                            'next_hop': '10.1.3.1',
+                                            'outgoing_interface': 'Ethernet1/2',
+                                            'route_preference': 110,
+                                            'source_protocol': 'ospf',
+                                            'source_protocol_status': 'intra',
+                                            'updated': 'PT1H1M18S'},
+                                        2: {'index': 2,
+                                            'metric': 0,
+                                            'next_hop': '10.229.11.11',
+                                            'route_preference': 200,
+                                            'source_protocol': 'bgp',
+                                            'source_protocol_status': 'internal',
+                                            'updated': 'PT1H1M12S'}}},
+                                'process_id': '100',
+                                'route': '10.4.1.1/32',
+                                'route_preference': 110,
+                                'source_protocol': 'bgp',
+                                'source_protocol_status': 'internal',
+                                'tag': 100,
+                                'ubest': 2}}}}}}}
+
+    def test_show_ip_route_json(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output_json)
+        obj = ShowIpRoute(device=self.device, context='json')
+        parsed_output = obj.parse(vrf='all')
+        self.assertEqual(parsed_output, self.golden_parsed_output_json)
+        self.device.execute.assert_called_once_with(
+            'show ip route vrf all | json')
+
 
 # ============================================
 # unit test for 'show ipv6 route'
@@ -0,0 +1,91 @@
+
+# Python
+import unittest
+
+# nxos xml_rows
+from genie.libs.parser.nxos.xml_rows import iter_rows, iter_json_rows, \
+    map_row, find_leaf
+
+OUTPUT = '''<?xml version="1.0" encoding="ISO-8859-1"?>
+<nf:rpc-reply xmlns="http://www.cisco.com/nxos:1.0:bgp" xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0">
+ <nf:data>
+  <show>
+   <__readonly__>
+    <processid>23800</processid>
+    <TABLE_vrf>
+     <ROW_vrf>
+      <vrf-name-out>default</vrf-name-out>
+      <TABLE_af>
+       <ROW_af>
+        <af-name>IPv4 Unicast</af-name>
+       </ROW_af>
+      </TABLE_af>
+      <vrf-id>1</vrf-id>
+     </ROW_vrf>
+    </TABLE_vrf>
+    <protocoltag>333</protocoltag>
+   </__readonly__>
+  </show>
+ </nf:data>
+</nf:rpc-reply>
+]]>]]>
+'''
+
+JSON_OUTPUT = '''show bgp process vrf all | json
+{"processid": 23800, "TABLE_vrf": {"ROW_vrf": [
+  {"vrf-name-out": "default", "vrf-id": 1,
+   "TABLE_af": {"ROW_af": {"af-name": "IPv4 Unicast", "af-graceful": true}}},
+  {"vrf-name-out": "VRF1", "vrf-id": 3, "vrf-rd": null}
+ ]}, "protocoltag": "333 "}
+'''
+
+
+class test_xml_rows(unittest.TestCase):
+
+    def test_iter_rows(self):
+        rows = list(iter_rows(OUTPUT, ['__readonly__', 'ROW_vrf', 'ROW_af']))
+        self.assertEqual(rows, [
+            ('ROW_af', {'af-name': 'IPv4 Unicast'},
+             [{'processid': '23800'}, {'vrf-name-out': 'default'}]),
+            ('ROW_vrf', {'vrf-name-out': 'default', 'vrf-id': '1'},
+             [{'processid': '23800'}]),
+            ('__readonly__', {'processid': '23800', 'protocoltag': '333'},
+             []),
+        ])
+        tag, row, parents = rows[0]
+        self.assertEqual(find_leaf(row, parents, 'vrf-name-out'), 'default')
+        self.assertIsNone(find_leaf(row, parents, 'vrf-id'))
+
+    def test_iter_rows_lines(self):
+        rows = list(iter_rows(OUTPUT.splitlines(True), ['ROW_vrf']))
+        self.assertEqual([tag for tag, row, parents in rows], ['ROW_vrf'])
+
+    def test_iter_rows_empty(self):
+        self.assertEqual(list(iter_rows('', ['ROW_vrf'])), [])
+
+    def test_iter_json_rows(self):
+        rows = list(iter_json_rows(JSON_OUTPUT, ['ROW_vrf', 'ROW_af']))
+        self.assertEqual(rows, [
+            ('ROW_af', {'af-name': 'IPv4 Unicast', 'af-graceful': 'true'},
+             [{'vrf-name-out': 'default', 'vrf-id': '1'}]),
+            ('ROW_vrf', {'vrf-name-out': 'default', 'vrf-id': '1'}, []),
+            ('ROW_vrf', {'vrf-name-out': 'VRF1', 'vrf-id': '3'}, []),
+        ])
+        rows = list(iter_json_rows(JSON_OUTPUT.splitlines(True), ['ROW_af']))
+        self.assertEqual([tag for tag, row, parents in rows], ['ROW_af'])
+        self.assertEqual(list(iter_json_rows('', ['ROW_vrf'])), [])
+
+    def test_map_row(self):
+        fields = {'processid': ('bgp_pid', int),
+                  'protocoltag': 'bgp_tag',
+                  'srgbmin': (('srgb', 'min'), int),
+                  'srgbmax': ('srgb', 'max')}
+        row = {'processid': '23800', 'protocoltag': '333',
+               'srgbmin': '10000', 'srgbmax': '25000', 'mmode': 'x'}
+        self.assertEqual(map_row(row, fields), {
+            'bgp_pid': 23800, 'bgp_tag': '333',
+            'srgb': {'min': 10000, 'max': '25000'}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+'''xml_rows.py
+
+Rows of NX-OS '| xml' and '| json' outputs
+
+NX-OS xml outputs hold their data in TABLE_<name>/ROW_<name> elements,
+nested under a chain of command elements (show, bgp, __XML__OPT_Cmd_...,
+__readonly__). iter_rows reads the output incrementally and yields each row
+once complete, with its leaves keyed by tag without namespace, and the
+leaves read so far of the rows enclosing it. Rows are released from the
+tree once yielded, and the command elements are never walked.
+
+'| json' outputs hold the same TABLE_<name>/ROW_<name> keys, a ROW_ being a
+dictionary, or a list of them when the table has many rows. iter_json_rows
+decodes the output with the json module and yields the rows as iter_rows
+does, so a parser maps both outputs with the same table.
+
+map_row converts the leaves of a row to schema keys, following a table of
+{tag: key} or {tag: (key, convert)}, where key is a schema key or a tuple of
+keys leading to it.
+
+example:
+
+    >>> fields = {'processid': ('bgp_pid', int),
+    ...           'protocoltag': 'bgp_tag'}
+    >>> result = {}
+    >>> for tag, row, parents in iter_rows(output, ['__readonly__']):
+    ...     map_row(row, fields, result)
+'''
+
+# python
+import json
+
+# import parser utils
+from genie.libs.parser.utils.stream import iter_lines
+from genie.libs.parser.utils.structured import XmlOutput, local_name
+
+
+def iter_rows(output, rows):
+    '''yield (tag, leaves, parents) for the rows of an NX-OS xml output
+
+        Args:
+            output (`str`, file object or iterable of lines): device output
+            rows (`list`): tags of the rows, such as 'ROW_vrf' or
+                           '__readonly__', without namespace
+
+        Returns:
+            iterator of (tag, {leaf tag: text}, [{leaf tag: text}]), the
+            leaves of the enclosing rows are ordered from the outermost one
+    '''
+    structured = XmlOutput(output)
+    stack = []
+    for event, tag, element in structured.iter(frozenset(rows)):
+        if event == 'start':
+            stack.append(element)
+            continue
+        stack.pop()
+        yield tag, leaves(element), [leaves(parent) for parent in stack]
+
+
+def iter_json_rows(output, rows):
+    '''yield (tag, leaves, parents) for the rows of an NX-OS json output
+
+        Args:
+            output (`str`, file object or iterable of lines): device output,
+                                     lines before the json, such as the
+                                     command, are ignored
+            rows (`list`): keys of the rows, such as 'ROW_vrf'
+
+        Returns:
+            iterator of (tag, {leaf key: text}, [{leaf key: text}]), rows
+            are yielded after the rows they enclose, as iter_rows does
+    '''
+    if not isinstance(output, str):
+        output = '\n'.join(iter_lines(output))
+    start = output.find('{')
+    if start < 0:
+        return
+    data = json.JSONDecoder().raw_decode(output, start)[0]
+    yield from _json_rows(data, frozenset(rows), [])
+
+
+def _json_rows(element, rows, parents):
+    for tag, value in element.items():
+        for item in value if isinstance(value, list) else [value]:
+            if not isinstance(item, dict):
+                continue
+            if tag in rows:
+                row = json_leaves(item)
+                yield from _json_rows(item, rows, parents + [row])
+                yield tag, row, parents
+            else:
+                yield from _json_rows(item, rows, parents)
+
+
+def json_leaves(item):
+    '''return {key: text} of the values of a json row which are not tables'''
+    row = {}
+    for key, value in item.items():
+        if value is None or isinstance(value, (dict, list)):
+            continue
+        if isinstance(value, bool):
+            value = 'true' if value else 'false'
+        row[key] = str(value).strip()
+    return row
+
+
+def leaves(element):
+    '''return {tag: text} of the children of element holding a text'''
+    row = {}
+    for child in element:
+        if len(child):
+            continue
+        text = child.text
+        # Tables emptied of their rows hold whitespaces
+        if text is None or not text.strip():
+            continue
+        row[local_name(child.tag)] = text.strip()
+    return row
+
+
+def find_leaf(row, parents, tag):
+    '''return the text of leaf tag in row, or else in the closest row
+       enclosing it, None when not found'''
+    if tag in row:
+        return row[tag]
+    for parent in reversed(parents):
+        if tag in parent:
+            return parent[tag]
+    return None
+
+
+def map_row(row, fields, result=None):
+    '''set the schema keys of the leaves of row found in fields
+
+        Args:
+            row (`dict`): leaves of the row, as yielded by iter_rows
+            fields (`dict`): {tag: key} or {tag: (key, convert)}, key is a
+                             schema key, or a tuple of keys leading to it
+            result (`dict`): dictionary updated, default to a new one
+
+        Returns:
+            result
+    '''
+    if result is None:
+        result = {}
+    for tag, text in row.items():
+        field = fields.get(tag)
+        if field is None:
+            continue
+        if isinstance(field, tuple) and len(field) == 2 and \
+                callable(field[1]):
+            key, convert = field
+            value = convert(text)
+        else:
+            key, value = field, text
+        if isinstance(key, tuple):
+            container = result
+            for item in key[:-1]:
+                container = container.setdefault(item, {})
+            container[key[-1]] = value
+        else:
+            result[key] = value
+    return result
@@ -1,3 +1,7 @@
 from .common import get_parser, get_parser_exclude, get_parser_commands
+from .batch import parse_batch
+from .parse_cache import ParseCache
+from .device_cache import collection_session
+from .validation import set_validation
 from . import entry_points
 
@@ -0,0 +1,173 @@
+'''Parse many device outputs at once, over a pool of worker processes'''
+
+# python
+import os
+import math
+import pickle
+import atexit
+import logging
+
+from .common import get_parser
+
+log = logging.getLogger(__name__)
+
+# Number of chunks handed to each worker by default, more chunks balance the
+# load better between workers, fewer have less overhead
+CHUNKS_PER_WORKER = 4
+
+# Worker pools, by number of workers. They are kept between parse_batch calls
+# so workers only import parser modules and compile patterns once.
+_pools = {}
+
+
+def parse_batch(items, processes=None, chunksize=None, cache=None):
+    '''Parse many device outputs in parallel
+
+        Parser classes are resolved with get_parser, then the outputs are
+        parsed by a pool of worker processes, which is kept for the next
+        calls.
+
+        Args:
+            items (`list`): (os, command, output, kwargs) of each output to
+                            parse, kwargs (`dict` or None) are passed to the
+                            parser on top of the ones found in command
+            processes (`int`): number of worker processes, defaults to the
+                               number of cpus. 0 parses in this process.
+            chunksize (`int`): number of items sent to a worker at a time,
+                               defaults to CHUNKS_PER_WORKER chunks per worker
+            cache (`ParseCache`): if given, outputs found in the cache are not
+                                  parsed again, and new results are cached
+
+        Returns:
+            `list` of the parsed outputs, in the order of items. The
+            exception raised is returned in place of the parsed output of
+            an item which failed.
+
+        example:
+
+            >>> parse_batch([('iosxe', 'show version', output1, None),
+            ...              ('nxos', 'show vrf {vrf}', output2, {'vrf': 'a'})])
+    '''
+    results = [None] * len(items)
+    jobs = []
+    devices = {}
+    for position, (os_, command, output, kwargs) in enumerate(items):
+        try:
+            device = devices[os_]
+        except KeyError:
+            device = devices[os_] = _batch_device(os_)
+        try:
+            parser_cls, parser_kwargs = get_parser(command, device)
+        except Exception as e:
+            results[position] = e
+            continue
+        if kwargs:
+            parser_kwargs.update(kwargs)
+        if cache is not None:
+            result = cache.get(parser_cls, output, parser_kwargs)
+            if result is not None:
+                results[position] = result
+                continue
+        jobs.append((position, parser_cls, parser_kwargs, output))
+
+    if not jobs:
+        return results
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    if not processes or len(jobs) <= 1:
+        chunks = [jobs]
+        processes = 0
+    else:
+        if not chunksize:
+            chunksize = math.ceil(len(jobs) / (processes * CHUNKS_PER_WORKER))
+        chunks = [jobs[i:i + chunksize]
+                  for i in range(0, len(jobs), chunksize)]
+
+    for chunk, chunk_results in zip(chunks, map_jobs(processes, _parse_chunk,
+                                                     chunks)):
+        for job, result in zip(chunk, chunk_results):
+            position, parser_cls, parser_kwargs, output = job
+            results[position] = result
+            if cache is not None and not isinstance(result, Exception):
+                cache.set(parser_cls, output, parser_kwargs, result)
+
+    return results
+
+
+def map_jobs(processes, fn, jobs):
+    '''return [fn(job) for job in jobs], computed by the pool of processes
+       workers kept between calls
+
+        fn, the jobs and their results are sent to the workers, they must
+        be picklable. When a worker dies, the pool is dropped and a new one
+        is started by the next call.
+
+        Args:
+            processes (`int`): number of worker processes, 0 computes the
+                               jobs in this process
+            fn (`function`): module level function computing a job
+            jobs (`list`): arguments of fn
+
+        Returns:
+            `list` of the results, in the order of jobs
+    '''
+    if not processes:
+        return [fn(job) for job in jobs]
+    try:
+        return list(_get_pool(processes).map(fn, jobs))
+    except Exception:
+        # A worker died, start a new pool next time
+        pool = _pools.pop(processes, None)
+        if pool:
+            pool.shutdown(wait=False)
+        raise
+
+
+def shutdown_batch_pools():
+    '''Stop the worker processes kept by parse_batch'''
+    while _pools:
+        _, pool = _pools.popitem()
+        pool.shutdown()
+
+atexit.register(shutdown_batch_pools)
+
+
+def _get_pool(processes):
+    '''return the pool of processes workers, start it on first use'''
+    try:
+        return _pools[processes]
+    except KeyError:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = _pools[processes] = ProcessPoolExecutor(processes)
+        return pool
+
+
+def _batch_device(os_):
+    '''return a device only used to look parsers up for this os'''
+    from pyats.topology import Device
+    return Device('parse_batch_{}'.format(os_), os=os_)
+
+
+def _parse_chunk(chunk):
+    '''parse the outputs of a chunk of parse_batch jobs, in a worker'''
+    results = []
+    for _, parser_cls, kwargs, output in chunk:
+        try:
+            result = parser_cls(device=None).parse(output=output, **kwargs)
+        except Exception as e:
+            result = _picklable(e)
+        results.append(result)
+    return results
+
+
+def _picklable(exception):
+    '''return exception, or an equivalent Exception if it cannot be sent
+       back from the worker'''
+    try:
+        pickle.loads(pickle.dumps(exception))
+    except Exception:
+        log.debug('Cannot pickle %r', exception)
+        return Exception('{}: {}'.format(type(exception).__name__, exception))
+    return exception
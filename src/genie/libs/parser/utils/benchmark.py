@@ -0,0 +1,243 @@
+'''Benchmark parsers with the golden outputs of their folder based tests
+
+    <os>/tests/<ParserClass>/cli/equal/*_output.txt
+
+Each parser class is timed cold (first parse, re module cache purged) and
+warm, and reported with its parses per second, output bytes per second and
+peak memory allocated while parsing. Results can be saved and compared to
+a baseline to flag the parsers which got slower.
+
+usage:
+
+    python -m genie.libs.parser.utils.benchmark --os iosxe --save base.json
+    python -m genie.libs.parser.utils.benchmark --os iosxe --compare base.json
+'''
+
+# python
+import os
+import re
+import sys
+import json
+import glob
+import time
+import inspect
+import argparse
+import importlib
+import tracemalloc
+
+from genie.libs import parser
+
+# Relative slow down of the warm time flagged as a regression by compare()
+THRESHOLD = 0.2
+
+
+class _OutputDevice(object):
+    '''Device returning the golden output to every command'''
+
+    def __init__(self, output):
+        self.output = output
+
+    def execute(self, *args, **kwargs):
+        return self.output
+
+
+def get_operating_systems():
+    '''return the operating systems having folder based tests'''
+    return sorted(
+        os_ for os_ in os.listdir(parser.__path__[0])
+        if glob.glob(os.path.join(parser.__path__[0], os_, 'tests', '*',
+                                  'cli', 'equal')))
+
+
+def get_golden_outputs(os_, classes=None):
+    '''return the golden outputs of the parsers of an os
+
+        Args:
+            os_ (`str`): operating system
+            classes (`list`): only these parser class names
+
+        Returns:
+            `dict` of parser class name to a list of (output, arguments)
+    '''
+    goldens = {}
+    pattern = os.path.join(parser.__path__[0], os_, 'tests', '*', 'cli',
+                           'equal', '*_output.txt')
+    for path in sorted(glob.glob(pattern)):
+        name = path.split(os.sep)[-4]
+        if classes and name not in classes:
+            continue
+
+        with open(path) as f:
+            output = f.read()
+        arguments = {}
+        arguments_path = path[:-len('_output.txt')] + '_arguments.json'
+        if os.path.exists(arguments_path):
+            with open(arguments_path) as f:
+                arguments = json.load(f)
+        goldens.setdefault(name, []).append((output, arguments))
+    return goldens
+
+
+def get_parser_classes(os_):
+    '''return the parser classes of an os, by name'''
+    classes = {}
+    pattern = os.path.join(parser.__path__[0], os_, '*.py')
+    for path in sorted(glob.glob(pattern)):
+        module_name = os.path.basename(path)[:-len('.py')]
+        if module_name == '__init__':
+            continue
+        try:
+            module = importlib.import_module(
+                'genie.libs.parser.{}.{}'.format(os_, module_name))
+        except Exception:
+            continue
+        for name, cls in inspect.getmembers(module, inspect.isclass):
+            if hasattr(cls, 'cli') and cls.__module__ == module.__name__:
+                classes[name] = cls
+    return classes
+
+
+def benchmark_class(parser_cls, goldens, repeat=20):
+    '''time a parser class on its golden outputs
+
+        Args:
+            parser_cls (`class`): parser class
+            goldens (`list`): (output, arguments) to parse
+            repeat (`int`): number of warm runs, the fastest one is kept
+
+        Returns:
+            `dict` with the number of outputs and their bytes, the cold and
+            warm time in seconds to parse all of them, parses per second,
+            bytes per second and peak memory allocated in bytes
+    '''
+    def run():
+        for output, arguments in goldens:
+            parser_cls(device=_OutputDevice(output)).parse(**arguments)
+
+    re.purge()
+    start = time.perf_counter()
+    run()
+    cold = time.perf_counter() - start
+
+    warm = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        warm = min(warm, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    size = sum(len(output.encode()) for output, _ in goldens)
+    warm = max(warm, 1e-9)
+    return {'outputs': len(goldens),
+            'bytes': size,
+            'cold': cold,
+            'warm': warm,
+            'ops_per_sec': len(goldens) / warm,
+            'bytes_per_sec': size / warm,
+            'peak': peak}
+
+
+def benchmark(operating_systems=None, classes=None, repeat=20):
+    '''benchmark every parser having golden outputs
+
+        Args:
+            operating_systems (`list`): defaults to all of them
+            classes (`list`): only these parser class names
+            repeat (`int`): number of warm runs
+
+        Returns:
+            `dict` of '<os>.<class>' to the benchmark_class result, or to
+            {'error': message} when the goldens could not be parsed
+    '''
+    results = {}
+    for os_ in operating_systems or get_operating_systems():
+        parser_classes = get_parser_classes(os_)
+        for name, goldens in get_golden_outputs(os_, classes).items():
+            if name not in parser_classes:
+                continue
+            key = '{}.{}'.format(os_, name)
+            try:
+                results[key] = benchmark_class(parser_classes[name], goldens,
+                                               repeat=repeat)
+            except Exception as e:
+                results[key] = {'error': '{}: {}'.format(type(e).__name__, e)}
+    return results
+
+
+def compare(results, baseline, threshold=THRESHOLD):
+    '''return the parsers whose warm time grew by more than threshold
+
+        Returns:
+            `list` of (key, baseline warm time, warm time), slowest first
+    '''
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if not base or 'warm' not in base or 'warm' not in result:
+            continue
+        if result['warm'] > base['warm'] * (1 + threshold):
+            regressions.append((key, base['warm'], result['warm']))
+    return sorted(regressions, key=lambda r: r[2] / r[1], reverse=True)
+
+
+def format_results(results, top=None):
+    '''return the results as a table, slowest parser first'''
+    lines = ['{:<60} {:>8} {:>10} {:>10} {:>10} {:>12} {:>10}'.format(
+        'parser', 'outputs', 'cold ms', 'warm ms', 'ops/s', 'bytes/s',
+        'peak KB')]
+    timed = sorted(((k, r) for k, r in results.items() if 'warm' in r),
+                   key=lambda item: item[1]['warm'], reverse=True)
+    for key, r in timed[:top]:
+        lines.append(
+            '{:<60} {:>8} {:>10.2f} {:>10.2f} {:>10.0f} {:>12.0f} {:>10.0f}'
+            .format(key, r['outputs'], r['cold'] * 1e3, r['warm'] * 1e3,
+                    r['ops_per_sec'], r['bytes_per_sec'], r['peak'] / 1024))
+    for key, r in sorted(results.items()):
+        if 'error' in r:
+            lines.append('{:<60} {}'.format(key, r['error']))
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(
+        description='Benchmark parsers with their golden outputs')
+    arg_parser.add_argument('--os', nargs='*', dest='operating_systems',
+                            help='operating systems, default to all')
+    arg_parser.add_argument('--class', nargs='*', dest='classes',
+                            help='parser class names, default to all')
+    arg_parser.add_argument('--repeat', type=int, default=20,
+                            help='number of warm runs')
+    arg_parser.add_argument('--top', type=int,
+                            help='only show the slowest parsers')
+    arg_parser.add_argument('--save', help='save the results to this file')
+    arg_parser.add_argument('--compare',
+                            help='flag regressions against this baseline')
+    arg_parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                            help='relative slow down flagged as regression')
+    args = arg_parser.parse_args(argv)
+
+    results = benchmark(args.operating_systems, args.classes, args.repeat)
+    print(format_results(results, args.top))
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for key, base, warm in regressions:
+            print('REGRESSION {}: {:.2f} ms -> {:.2f} ms'.format(
+                key, base * 1e3, warm * 1e3))
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
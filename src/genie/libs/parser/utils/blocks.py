@@ -0,0 +1,134 @@
+'''Parse outputs made of independent records, block by block
+
+Outputs such as 'show interfaces' or 'show bgp neighbors' are sequences of
+records, each starting with a header line ('GigabitEthernet1 is up, ...',
+'BGP neighbor is 10.1.1.1'). Parsers of these outputs declare their Blocks:
+
+    * header: pattern of the first line of a record
+    * context: patterns of lines applying to the records following them,
+      such as 'BGP instance 0: default' or 'IS-IS 1 (Level-2) Link State
+      Database'. The last line of each pattern is repeated at the start of
+      a chunk, so parsing it again must not change the result.
+
+Blocks.parse splits the output at headers into chunks of whole records,
+parses each chunk on its own, over the worker processes of map_jobs for
+large outputs, and merges the results of the chunks in order.
+
+example:
+
+    >>> ShowInterfaces(device=device).parse_blocks(processes=8)
+'''
+
+# python
+import os
+import re
+import math
+
+from .batch import CHUNKS_PER_WORKER, map_jobs
+from .stream import merge_record
+
+# Outputs of fewer lines per worker are parsed in this process
+MIN_CHUNK_LINES = 2000
+
+
+class Blocks(object):
+    '''Records of an output and how to parse them
+
+        Args:
+            header (`str`): pattern of the first line of a record, matched
+                            against the stripped line
+            context (`list`): patterns of the lines applying to the records
+                              following them
+            parse (`str`): method of the parser returning the result of a
+                           chunk, called with output=chunk and the keyword
+                           arguments given to Blocks.parse
+            merge (`str`): method of the parser merging the results of the
+                           chunks, merge_results by default
+    '''
+
+    def __init__(self, header, context=(), parse='cli', merge=None):
+        self.header = re.compile(header)
+        self.context = [re.compile(pattern) for pattern in context]
+        self.method = parse
+        self.merge = merge
+
+    def split(self, output, size=1):
+        '''yield the chunks of output, made of whole records of at least
+           size lines, each chunk starting with the context lines applying
+           to it'''
+        if isinstance(output, str):
+            output = output.splitlines()
+        context = {}
+        chunk_context = []
+        chunk = []
+        # Lines before the first header stay with the first record
+        records = False
+        for line in output:
+            stripped = line.strip()
+            header = self.header.match(stripped)
+            if header and records and len(chunk) >= size:
+                yield '\n'.join(chunk_context + chunk)
+                chunk_context = [context[index] for index in sorted(context)]
+                chunk = []
+            records = records or bool(header)
+            for index, pattern in enumerate(self.context):
+                if pattern.match(stripped):
+                    context[index] = line
+            chunk.append(line)
+        if chunk:
+            yield '\n'.join(chunk_context + chunk)
+
+    def parse(self, parser, output, processes=None, chunk_lines=None,
+              **kwargs):
+        '''return the result of parser for output, parsed chunk by chunk
+
+            Args:
+                parser (`MetaParser`): parser declaring these Blocks
+                output (`str`): output to parse
+                processes (`int`): number of worker processes, defaults to
+                                   the number of cpus. 0 or 1 parses in this
+                                   process.
+                chunk_lines (`int`): minimum number of lines of a chunk,
+                                     defaults to CHUNKS_PER_WORKER chunks per
+                                     worker, of MIN_CHUNK_LINES lines or more
+                kwargs: passed to the parse method of the parser
+        '''
+        lines = output.splitlines()
+        if processes is None:
+            processes = os.cpu_count() or 1
+        if chunk_lines is None:
+            chunk_lines = max(MIN_CHUNK_LINES, math.ceil(
+                len(lines) / (max(processes, 1) * CHUNKS_PER_WORKER)))
+        chunks = [chunk for chunk in self.split(lines, chunk_lines)
+                  if chunk.strip()]
+
+        if processes <= 1 or len(chunks) <= 1:
+            method = getattr(parser, self.method)
+            results = [method(output=chunk, **kwargs) for chunk in chunks]
+        else:
+            results = map_jobs(processes, _parse_chunk,
+                               [(type(parser), self.method, kwargs, chunk)
+                                for chunk in chunks])
+
+        if self.merge:
+            return getattr(parser, self.merge)(results)
+        return merge_results(results)
+
+
+def merge_results(results):
+    '''return the results of the chunks of an output merged in order, the
+       values of the later chunks updating the earlier ones'''
+    merged = {}
+    for result in results:
+        for key, value in result.items():
+            if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                merge_record(merged, (key,), value)
+            else:
+                merged[key] = value
+    return merged
+
+
+def _parse_chunk(job):
+    '''parse a chunk of Blocks.parse, in a worker'''
+    parser_cls, method, kwargs, chunk = job
+    return getattr(parser_cls(device=None), method)(output=chunk, **kwargs)
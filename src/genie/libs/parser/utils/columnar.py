@@ -0,0 +1,144 @@
+'''Columnar results of large tabular outputs
+
+Parsers of outputs holding one row per entry, such as NAT translations, flow
+caches or MAC address tables, build one nested dictionary per row in their
+cli() result. Their columns() method returns a Table instead, holding one
+compact column per field of the rows:
+
+    * CODES: dictionary-encoded values, such as interface names, protocols
+      or vlans. codes is an array('i') indexing categories, -1 for None.
+    * INTEGERS: array('q') of the values, mask is None or a bytearray with
+      1 for the rows without value.
+    * VALUES: list of the values, such as lists of protocols.
+
+Values of the whole output, such as totals, are in table.meta. The arrays
+are handed to NumPy or pandas without copying:
+
+    >>> numpy.frombuffer(table['age'].values, dtype='int64')
+    >>> pandas.Categorical.from_codes(table['interface'].codes,
+    ...                               table['interface'].categories)
+
+table_to_dict() of the parser converts a Table back to the cli() schema.
+'''
+
+# python
+from array import array
+from collections import OrderedDict
+
+CODES = 'codes'
+INTEGERS = 'integers'
+VALUES = 'values'
+
+
+class CodedColumn(object):
+    '''Column of dictionary-encoded values'''
+
+    __slots__ = ('codes', 'categories', '_codes')
+
+    def __init__(self):
+        self.codes = array('i')
+        self.categories = []
+        # Code of each category
+        self._codes = {}
+
+    def append(self, value):
+        if value is None:
+            self.codes.append(-1)
+            return
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.categories)
+            self.categories.append(value)
+        self.codes.append(code)
+
+    def __getitem__(self, index):
+        code = self.codes[index]
+        return None if code < 0 else self.categories[code]
+
+    def __iter__(self):
+        categories = self.categories
+        for code in self.codes:
+            yield None if code < 0 else categories[code]
+
+    def __len__(self):
+        return len(self.codes)
+
+
+class IntegerColumn(object):
+    '''Column of integers, None are masked'''
+
+    __slots__ = ('values', 'mask')
+
+    def __init__(self):
+        self.values = array('q')
+        self.mask = None
+
+    def append(self, value):
+        if value is None:
+            if self.mask is None:
+                self.mask = bytearray(len(self.values))
+            self.values.append(0)
+            self.mask.append(1)
+            return
+        self.values.append(value)
+        if self.mask is not None:
+            self.mask.append(0)
+
+    def __getitem__(self, index):
+        if self.mask is not None and self.mask[index]:
+            return None
+        return self.values[index]
+
+    def __iter__(self):
+        if self.mask is None:
+            return iter(self.values)
+        return (None if masked else value
+                for value, masked in zip(self.values, self.mask))
+
+    def __len__(self):
+        return len(self.values)
+
+
+_COLUMNS = {
+    CODES: CodedColumn,
+    INTEGERS: IntegerColumn,
+    VALUES: list,
+}
+
+
+class Table(object):
+    '''Rows of a parsed output, stored by column
+
+        Args:
+            columns (`list`): (name, kind) of the columns, kind is CODES,
+                              INTEGERS or VALUES
+    '''
+
+    def __init__(self, columns):
+        self.columns = OrderedDict((name, _COLUMNS[kind]())
+                                   for name, kind in columns)
+        # Values of the whole output
+        self.meta = {}
+        self._length = 0
+
+    def append(self, row):
+        '''append a row, {column: value}, missing columns are None'''
+        unknown = set(row).difference(self.columns)
+        if unknown:
+            raise KeyError('Unknown columns {}'.format(sorted(unknown)))
+        for name, column in self.columns.items():
+            column.append(row.get(name))
+        self._length += 1
+
+    def rows(self):
+        '''yield the rows, as {column: value} without the None values'''
+        names = list(self.columns)
+        for values in zip(*self.columns.values()):
+            yield {name: value for name, value in zip(names, values)
+                   if value is not None}
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __len__(self):
+        return self._length
@@ -9,6 +9,8 @@ import warnings
 import logging
 import importlib
 import math
+import functools
+from collections import OrderedDict
 
 from genie.libs import parser
 from genie.abstract import Lookup
@@ -36,6 +38,130 @@ def _load_parser_json():
 # Parser within Genie
 parser_data = _load_parser_json()
 
+# Number of resolved (command, os, abstraction tokens) lookups kept by
+# get_parser
+PARSER_CACHE_SIZE = 4096
+
+# Token index of parser_data commands, one per os (None means all os)
+_command_index = {}
+
+# Resolved get_parser lookups, least recently used first
+_parser_cache = OrderedDict()
+
+
+class _CommandNode(object):
+    '''One token position of the command index.
+
+    literals are keyed by the literal command token, argument is the edge for
+    tokens like {vrf} and embedded is the edge for tokens like
+    interface/{interface} where the argument is part of the token.'''
+
+    __slots__ = ('literals', 'argument', 'embedded', 'commands', '_subtree')
+
+    def __init__(self):
+        self.literals = {}
+        self.argument = None
+        self.embedded = None
+        self.commands = []
+        self._subtree = None
+
+    def subtree(self):
+        '''return all the commands ending at or below this node'''
+        if self._subtree is None:
+            commands = list(self.commands)
+            for child in self.literals.values():
+                commands.extend(child.subtree())
+            for child in (self.argument, self.embedded):
+                if child:
+                    commands.extend(child.subtree())
+            self._subtree = commands
+        return self._subtree
+
+
+class _CommandIndex(object):
+    '''Token trie of the parser_data commands.
+
+    It is only used to narrow down which commands can match a search, the
+    actual matching and scoring is still done by _matches_fuzzy.'''
+
+    def __init__(self, data, os=None):
+        self.root = _CommandNode()
+
+        for position, (command, source) in enumerate(data.items()):
+            if os and os not in source:
+                continue
+
+            node = self.root
+            for command_token in command.split():
+                if '{' not in command_token:
+                    node = node.literals.setdefault(command_token,
+                                                    _CommandNode())
+                elif command_token.startswith('{'):
+                    node.argument = node.argument or _CommandNode()
+                    node = node.argument
+                else:
+                    node.embedded = node.embedded or _CommandNode()
+                    node = node.embedded
+            node.commands.append((position, command))
+
+    def candidates(self, tokens, fuzzy):
+        '''return the commands which could match the search tokens, in
+           parser_data order'''
+
+        found = set()
+        visited = set()
+        stack = [(self.root, 0)]
+
+        while stack:
+            node, i = stack.pop()
+            if (id(node), i) in visited:
+                continue
+            visited.add((id(node), i))
+
+            if i == len(tokens):
+                found.update(node.commands)
+                continue
+
+            token = tokens[i]
+            if fuzzy and token != '*':
+                if not _is_regular_token(token):
+                    # A regex can span any of the remaining command tokens
+                    found.update(node.subtree())
+                    continue
+                token = token.replace(r'\|', '|')
+
+            for command_token, child in node.literals.items():
+                if command_token.startswith(token):
+                    stack.append((child, i + 1))
+
+            if node.embedded:
+                stack.append((node.embedded, i + 1))
+
+            if node.argument:
+                # An argument can be up to 2 tokens
+                stack.append((node.argument, i + 1))
+                if i + 1 < len(tokens):
+                    stack.append((node.argument, i + 2))
+
+        return [command for _, command in sorted(found)]
+
+
+def _get_command_index(os=None):
+    '''return the command index of the given os, build it on first use'''
+    try:
+        return _command_index[os]
+    except KeyError:
+        index = _command_index[os] = _CommandIndex(parser_data, os)
+        return index
+
+
+def clear_parser_cache():
+    '''Drop the command index and the resolved get_parser lookups.
+
+       Needs to be called whenever parser_data is modified.'''
+    _command_index.clear()
+    _parser_cache.clear()
+
 def get_parser_commands(device, data=parser_data):
     '''Remove all commands which contain { as this requires
        extra kwargs which cannot be guessed dynamically
@@ -78,6 +204,16 @@ def get_parser(command, device, fuzzy=False):
         order_list = None
 
     lookup = Lookup.from_device(device, packages={'parser': parser})
+
+    if not fuzzy:
+        cache_key = (command, device.os, tuple(lookup._tokens))
+        try:
+            parser_cls, kwargs = _parser_cache[cache_key]
+            _parser_cache.move_to_end(cache_key)
+            return parser_cls, kwargs.copy()
+        except KeyError:
+            pass
+
     results = _fuzzy_search_command(command, fuzzy, device.os, order_list)
     valid_results = []
     
@@ -88,13 +224,15 @@ def get_parser(command, device, fuzzy=False):
             continue
 
         # Check if all the tokens exists and take the farthest one
+        tokens = []
         for token in lookup._tokens:
             if token in data:
                 data = data[token]
+                tokens.append(token)
 
         try:
             valid_results.append((found_command, 
-                                        _find_parser_cls(device, data), kwargs))
+                                _find_parser_cls(device, data, tokens), kwargs))
         except KeyError:
             # Case when the show command is only found under one of
             # the child level tokens
@@ -105,7 +243,11 @@ def get_parser(command, device, fuzzy=False):
                         "'{c}' under {l}".format(c=command, l=lookup._tokens))
 
     if not fuzzy:
-        return valid_results[0][1], valid_results[0][2]
+        _parser_cache[cache_key] = (valid_results[0][1], valid_results[0][2])
+        while len(_parser_cache) > PARSER_CACHE_SIZE:
+            _parser_cache.popitem(last=False)
+
+        return valid_results[0][1], valid_results[0][2].copy()
 
     return valid_results
 
@@ -141,7 +283,9 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
     best_score = -math.inf
     result = []
 
-    for command, source in parser_data.items():
+    for command in _get_command_index(os).candidates(tokens, fuzzy):
+        source = parser_data[command]
+
         # Tokens and kwargs parameter must be non reference
         match_result = _matches_fuzzy(0, 0, tokens.copy(),
                                                         command, {}, fuzzy)
@@ -459,10 +603,98 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
         return None
 
 
-def _find_parser_cls(device, data):
-    lookup = Lookup.from_device(device, packages={'parser':importlib.import_module(data['package'])})
+def _find_parser_cls(device, data, tokens=None):
+    '''return the parser class of a parsers.json entry
+
+       When the abstraction tokens leading to the entry are given, only the
+       module holding the class is imported. Otherwise, or if that module
+       cannot be found, the class is found through genie.abstract Lookup.'''
 
-    return getattr(getattr(lookup.parser, data['module_name']), data['class'])
+    package = data['package']
+    module_name = data['module_name']
+    class_name = data['class']
+
+    if tokens:
+        try:
+            return _import_parser_cls(package, tokens, module_name, class_name)
+        except (ImportError, AttributeError):
+            pass
+
+    lookup = Lookup.from_device(device, packages={'parser':importlib.import_module(package)})
+
+    return getattr(getattr(lookup.parser, module_name), class_name)
+
+def _import_parser_cls(package, tokens, module_name, class_name):
+    '''import <package>.<tokens>.<module_name> and return its class_name
+
+       Example:
+           >>> _import_parser_cls('genie.libs.parser', ['iosxe', 'c9500'],
+                                  'show_platform', 'ShowInventory')
+           <class 'genie.libs.parser.iosxe.c9500.show_platform.ShowInventory'>
+    '''
+    module = importlib.import_module('.'.join([package] + list(tokens) +
+                                              [module_name]))
+    return getattr(module, class_name)
+
+
+# Short interface types and their full name, see Common.convert_intf_name
+# Please add more when face other type of interface
+INTF_TYPES = {'Eth': 'Ethernet',
+              'Lo': 'Loopback',
+              'Fa': 'FastEthernet',
+              'Fas': 'FastEthernet',
+              'Po': 'Port-channel',
+              'PO': 'Port-channel',
+              'Null': 'Null',
+              'Gi': 'GigabitEthernet',
+              'Gig': 'GigabitEthernet',
+              'GE': 'GigabitEthernet',
+              'Te': 'TenGigabitEthernet',
+              'Ten': 'TenGigabitEthernet',
+              'Tw': 'TwoGigabitEthernet',
+              'Two': 'TwoGigabitEthernet',
+              'Twe': 'TwentyFiveGigE',
+              'mgmt': 'mgmt',
+              'Vl': 'Vlan',
+              'Tu': 'Tunnel',
+              'Fe': '',
+              'Hs': 'HSSI',
+              'AT': 'ATM',
+              'Et': 'Ethernet',
+              'BD': 'BDI',
+              'Se': 'Serial',
+              'Fo': 'FortyGigabitEthernet',
+              'For': 'FortyGigabitEthernet',
+              'Hu': 'HundredGigE',
+              'Hun': 'HundredGigE',
+              'vl': 'vasileft',
+              'vr': 'vasiright',
+              'BE': 'Bundle-Ether'
+              }
+
+# Maximum number of interface names kept by convert_intf_name
+INTF_NAME_CACHE_SIZE = 8192
+
+_intf_type = re.compile(r'[a-zA-Z]+')
+_intf_port = re.compile(r'[\d\/\.]+')
+
+
+@functools.lru_cache(maxsize=INTF_NAME_CACHE_SIZE)
+def _convert_intf_name(intf):
+    '''return the full interface name, see Common.convert_intf_name'''
+    m = _intf_type.search(intf)
+    m1 = _intf_port.search(intf)
+    if m and m1:
+        int_type = m.group(0)
+        int_port = m1.group(0)
+        try:
+            return INTF_TYPES[int_type] + int_port
+        except KeyError:
+            # Unifying interface names
+            return intf[0].capitalize() + intf[1:].replace(
+                ' ', '').replace('ethernet', 'Ethernet')
+    else:
+        return intf
 
 
 class Common():
@@ -495,54 +727,23 @@ class Common():
 
                 >>> convert_intf_name(intf='Eth2/1')
         '''
+        return _convert_intf_name(intf)
 
-        # Please add more when face other type of interface
-        convert = {'Eth': 'Ethernet',
-                   'Lo': 'Loopback',
-                   'Fa': 'FastEthernet',
-                   'Fas': 'FastEthernet',
-                   'Po': 'Port-channel',
-                   'PO': 'Port-channel',
-                   'Null': 'Null',
-                   'Gi': 'GigabitEthernet',
-                   'Gig': 'GigabitEthernet',
-                   'GE': 'GigabitEthernet',
-                   'Te': 'TenGigabitEthernet',
-                   'Ten': 'TenGigabitEthernet',
-                   'Tw': 'TwoGigabitEthernet',
-                   'Two': 'TwoGigabitEthernet',
-                   'Twe': 'TwentyFiveGigE',
-                   'mgmt': 'mgmt',
-                   'Vl': 'Vlan',
-                   'Tu': 'Tunnel',
-                   'Fe': '',
-                   'Hs': 'HSSI',
-                   'AT': 'ATM',
-                   'Et': 'Ethernet',
-                   'BD': 'BDI',
-                   'Se': 'Serial',
-                   'Fo': 'FortyGigabitEthernet',
-                   'For': 'FortyGigabitEthernet',
-                   'Hu': 'HundredGigE',
-                   'Hun': 'HundredGigE',
-                   'vl': 'vasileft',
-                   'vr': 'vasiright',
-                   'BE': 'Bundle-Ether'
-                   }
-        m = re.search('([a-zA-Z]+)', intf) 
-        m1 = re.search('([\d\/\.]+)', intf)
-        if hasattr(m, 'group') and hasattr(m1, 'group'):
-            int_type = m.group(0)
-            int_port = m1.group(0)
-            if int_type in convert.keys():
-                return(convert[int_type] + int_port)
-            else:
-                # Unifying interface names
-                converted_intf = intf[0].capitalize()+intf[1:].replace(
-                    ' ','').replace('ethernet', 'Ethernet')
-                return(converted_intf)
-        else:
-            return(intf)
+    @classmethod
+    def convert_intf_names(self, intfs):
+        '''return the full name of each interface
+
+            Args:
+                intfs (`list`): Short version of the interface names
+
+            Returns:
+                `list` of the full interface names, see convert_intf_name
+
+            example:
+
+                >>> convert_intf_names(intfs=['Eth2/1', 'Gi1/0/1'])
+        '''
+        return list(map(_convert_intf_name, intfs))
 
 
     @classmethod
@@ -566,12 +767,14 @@ class Common():
                         root=<Element '{urn:ietf:params:xml:ns:netconf:base:1.0}rpc-reply' at 0xf760434c>,
                         key='TABLE_vrf')
         '''
-        for item in root:
+        # Walk down the first children, without recursion
+        while True:
+            item = next(iter(root), None)
+            if item is None:
+                return None
             if key in item.tag:
                 return item
-            else:
-                root = item
-                return self.retrieve_xml_child(root, key)
+            root = item
 
 
     @classmethod
@@ -601,7 +804,7 @@ class Common():
                         expect_command='show bgp all dampening flap-statistics')
         '''
         # get to data node
-        cmd_node = root.getchildren()[0]
+        cmd_node = list(root)[0]
         # compose command from element tree
         # ex.  <nf:data>
         #        <show>
@@ -614,7 +817,7 @@ class Common():
         while True:
             # get next node
             try:
-                cmd_node = cmd_node.getchildren()
+                cmd_node = list(cmd_node)
                 if len(cmd_node) == 1:
 
                     # when only have one child
@@ -0,0 +1,180 @@
+'''Interned strings and compact records of large parsed results
+
+Entries of routing or MAC address tables repeat the same few strings, such as
+interface names, next hops or protocol codes, and each entry is made of
+several small dictionaries. For tables of a million entries most of the
+memory of the parsed result goes there:
+
+    * intern_str, used by the parsers of these tables, makes the repeated
+      strings of a result, and of successive results, one object.
+    * Layout describes the dictionary of an entry. Its records are tuples
+      with named fields shared by all entries (collections.namedtuple), the
+      dictionaries nested in the entry becoming records too.
+
+compact() of the parser returns its cli() result with the entries replaced
+by records. compact_to_dict() converts such a result back to the cli() one.
+
+example:
+
+    >>> result = ShowIpRoute(device=device).compact()
+    >>> route = result['vrf']['default']['address_family']['ipv4'] \\
+    ...               ['routes']['10.1.0.0/24']
+    >>> route.source_protocol, route.next_hop.next_hop_list[0].next_hop
+    ('ospf', '10.186.2.2')
+'''
+
+# python
+import sys
+import keyword
+from collections import namedtuple
+
+from .stream import merge_record
+
+
+def intern_str(value):
+    '''return value interned when it is a str, unchanged otherwise'''
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+class Layout(object):
+    '''Fields of the dictionaries of an entry, stored in records
+
+        None values and missing keys are the same in records, they are left
+        out of the dictionaries returned by unpack. Fields named after a
+        python keyword, such as 'from', get a trailing '_'.
+
+        Args:
+            name (`str`): name of the record type
+            fields (`list`): keys of the dictionary
+            nested (`dict`): {key: Layout} of the keys holding a dictionary.
+                             For a keyed Layout, the key holds
+                             {key: dictionary}, stored as a tuple of records.
+            interned (`list`): keys whose str values are interned
+            keyed (`bool`): records have a first field 'key', holding the
+                            key of the dictionary in its parent
+    '''
+
+    def __init__(self, name, fields, nested=None, interned=(), keyed=False):
+        self.name = name
+        self.fields = tuple(fields)
+        self.nested = nested or {}
+        self.interned = frozenset(interned)
+        self.keyed = keyed
+        names = [field + '_' if keyword.iskeyword(field) else field
+                 for field in self.fields]
+        self.type = namedtuple(name, (['key'] if keyed else []) + names)
+
+    def pack(self, dictionary, key=None):
+        '''return the record of dictionary, key of it in its parent for a
+           keyed Layout'''
+        unknown = set(dictionary).difference(self.fields)
+        if unknown:
+            raise KeyError('Unknown keys {} for {}'.format(sorted(unknown),
+                                                           self.name))
+        values = [intern_str(key)] if self.keyed else []
+        for field in self.fields:
+            value = dictionary.get(field)
+            layout = self.nested.get(field)
+            if value is None:
+                pass
+            elif layout is None:
+                if field in self.interned:
+                    value = intern_str(value)
+            elif layout.keyed:
+                value = tuple(layout.pack(item, item_key)
+                              for item_key, item in value.items())
+            else:
+                value = layout.pack(value)
+            values.append(value)
+        return self.type._make(values)
+
+    def unpack(self, record):
+        '''return the dictionary of record'''
+        dictionary = {}
+        for field, value in zip(self.fields, record[1:] if self.keyed
+                                else record):
+            if value is None:
+                continue
+            layout = self.nested.get(field)
+            if layout is None:
+                dictionary[field] = value
+            elif layout.keyed:
+                dictionary[field] = {item.key: layout.unpack(item)
+                                     for item in value}
+            else:
+                dictionary[field] = layout.unpack(value)
+        return dictionary
+
+
+def compact_result(result, path, layout):
+    '''replace the entries of a parsed result by their records, in place
+
+        Args:
+            result (`dict`): cli() result of a parser
+            path (`tuple`): keys leading to the entries, None for any key
+            layout (`Layout`): layout of the entries
+
+        Returns:
+            result
+    '''
+    for container, key in _entries(result, path):
+        container[key] = layout.pack(container[key])
+    return result
+
+
+def expand_result(result, path, layout):
+    '''return the cli() result of a result returned by compact_result'''
+    return _expand(result, path, layout)
+
+
+def build_compact(records, layout):
+    '''return the result made of the (path, record) items of a parser
+       parse_iter(), each record stored with layout'''
+    result = {}
+    for path, record in records:
+        container = result
+        for key in path[:-1]:
+            container = container.setdefault(key, {})
+        previous = container.get(path[-1])
+        if previous is not None:
+            # Record reopened later in the output
+            merged = {path[-1]: layout.unpack(previous)}
+            merge_record(merged, path[-1:], record)
+            record = merged[path[-1]]
+        container[path[-1]] = layout.pack(record)
+    return result
+
+
+def _entries(result, path):
+    '''yield (container, key) of the values at path'''
+    containers = [result]
+    for key in path[:-1]:
+        if key is None:
+            containers = [value for container in containers
+                          for value in container.values()
+                          if isinstance(value, dict)]
+        else:
+            containers = [container[key] for container in containers
+                          if key in container]
+    for container in containers:
+        if path[-1] is None:
+            for key in list(container):
+                yield container, key
+        elif path[-1] in container:
+            yield container, path[-1]
+
+
+def _expand(value, path, layout):
+    if not path:
+        return layout.unpack(value)
+    key = path[0]
+    expanded = {}
+    for item_key, item in value.items():
+        if (key is None or item_key == key) and \
+                (len(path) == 1 or isinstance(item, dict)):
+            expanded[item_key] = _expand(item, path[1:], layout)
+        else:
+            expanded[item_key] = item
+    return expanded
@@ -0,0 +1,143 @@
+'''Cache of the commands executed and outputs parsed by parsers calling
+other parsers
+
+Some parsers run extra commands behind the scenes, for example the vrf
+names from 'show vrf'. When a full snapshot of a device is collected, the
+same extra command runs for many parsers. Within a collection session, the
+outputs and parsed results of these nested calls are shared.
+
+example:
+
+    >>> with collection_session(device, ttl=300) as cache:
+    ...     device.parse('show ip bgp vpnv4 all summary')
+    ...     device.parse('show ip bgp vpnv6 all summary')
+    >>> cache.hits, cache.misses
+
+Parsers use cached_execute and cached_parse for their nested calls, which
+execute and parse as usual when no session is active for the device.
+'''
+
+# python
+import copy
+import time
+import threading
+import contextlib
+
+# Default number of seconds a cached output or result is used
+DEFAULT_TTL = 60
+
+# Active caches, by id of their device. A cache keeps its device alive, so
+# the id is not reused while the session is active.
+_caches = {}
+_lock = threading.Lock()
+
+
+class DeviceCache(object):
+    '''Outputs executed and results parsed on one device, kept ttl seconds
+
+        Args:
+            device (`Device`): device the commands are executed on
+            ttl (`int`): seconds an output or result is used, None to keep
+                         them until the cache is cleared
+            timer (`callable`): returns the current time in seconds
+    '''
+
+    def __init__(self, device, ttl=DEFAULT_TTL, timer=time.monotonic):
+        self.device = device
+        self.ttl = ttl
+        self.timer = timer
+        self.hits = self.misses = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def execute(self, command):
+        '''return the output of command, execute it only if not cached'''
+        return self._get(('execute', command),
+                         lambda: self.device.execute(command))
+
+    def parse(self, parser_cls, **kwargs):
+        '''return a copy of the parsed output, parse only if not cached'''
+        key = ('parse', parser_cls.__module__, parser_cls.__qualname__,
+               tuple(sorted(kwargs.items())))
+        return copy.deepcopy(self._get(
+            key, lambda: parser_cls(device=self.device).parse(**kwargs)))
+
+    def load(self, key, load):
+        '''return the value of key, calling load() only if not cached'''
+        return self._get(('load', key), load)
+
+    def clear(self):
+        '''drop every cached output and result'''
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _get(self, key, load):
+        now = self.timer()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[0] is None or entry[0] > now):
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        # Loaded outside the lock, commands can take seconds to run.
+        # Exceptions are not cached.
+        value = load()
+        expires = None if self.ttl is None else self.timer() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires, value)
+        return value
+
+
+@contextlib.contextmanager
+def collection_session(device, ttl=DEFAULT_TTL):
+    '''share the nested commands and parsers of device while active
+
+        A session already active for device is reused, and stays active
+        until its outermost block exits.
+
+        Args:
+            device (`Device`): device the snapshot is collected from
+            ttl (`int`): seconds an output or result is used
+
+        Returns:
+            `DeviceCache` of the session
+    '''
+    with _lock:
+        entry = _caches.get(id(device))
+        if entry is None:
+            entry = _caches[id(device)] = [DeviceCache(device, ttl=ttl), 0]
+        entry[1] += 1
+    try:
+        yield entry[0]
+    finally:
+        with _lock:
+            entry[1] -= 1
+            if not entry[1]:
+                del _caches[id(device)]
+
+
+def get_device_cache(device):
+    '''return the DeviceCache of the session active for device, or None'''
+    entry = _caches.get(id(device))
+    return entry[0] if entry is not None else None
+
+
+def cached_execute(device, command):
+    '''execute command on device, sharing the output within a session'''
+    cache = get_device_cache(device)
+    if cache is None:
+        return device.execute(command)
+    return cache.execute(command)
+
+
+def cached_parse(parser_cls, device, **kwargs):
+    '''parse with parser_cls on device, sharing the result within a
+       session'''
+    cache = get_device_cache(device)
+    if cache is None:
+        return parser_cls(device=device).parse(**kwargs)
+    return cache.parse(parser_cls, **kwargs)
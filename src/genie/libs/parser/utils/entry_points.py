@@ -37,7 +37,7 @@ import sys
 import pkg_resources
 import logging
 
-from .common import parser_data
+from .common import parser_data, clear_parser_cache
 
 log = logging.getLogger(__name__)
 
@@ -75,6 +75,9 @@ def add_parser(parser, os_name):
             'class': parser.__name__
         }
 
+    # The command index is built from parser_data, so it needs rebuilding
+    clear_parser_cache()
+
 
 def load_entry_points():
     for ep in pkg_resources.iter_entry_points(ENTRY_POINT_NAME):
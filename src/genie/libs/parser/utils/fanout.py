@@ -0,0 +1,80 @@
+'''Execute the sub-commands of a parser concurrently
+
+Some parsers list vrfs, interfaces or nve interfaces, then execute one
+command for each of them. execute_many runs these commands at once over the
+connection pool of the device, and returns their outputs in the order of the
+commands so results are merged exactly as when run one by one.
+
+example:
+
+    >>> device.connect(pool_size=8)
+    >>> outputs = execute_many(device, ['show run vrf {}'.format(vrf)
+    ...                                 for vrf in vrfs])
+'''
+
+# python
+import logging
+
+from .device_cache import cached_execute
+
+log = logging.getLogger(__name__)
+
+
+def execute_many(device, commands, max_workers=None, batch=False):
+    '''return the output of each command, in the order of commands
+
+        Outputs are shared within a collection session, see
+        utils.device_cache.
+
+        Args:
+            device (`Device`): device the commands are executed on
+            commands (`list`): commands to execute
+            max_workers (`int`): number of commands executed at once,
+                                 defaults to the size of the connection pool
+                                 of the device. 1 executes them one by one.
+            batch (`bool`): send all the commands in a single execute call,
+                            for connections returning a dict of command to
+                            output when given a list of commands
+
+        Returns:
+            `list` of outputs
+    '''
+    commands = list(commands)
+    if batch and len(commands) > 1:
+        return _execute_batch(device, commands)
+
+    if max_workers is None:
+        max_workers = connection_pool_size(device)
+    max_workers = min(max_workers, len(commands))
+    if max_workers <= 1:
+        return [cached_execute(device, command) for command in commands]
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers) as executor:
+        return list(executor.map(lambda command: cached_execute(device,
+                                                                command),
+                                 commands))
+
+
+def connection_pool_size(device):
+    '''return the number of workers of the default connection pool of
+       device, 1 if it is not connected through a pool'''
+    try:
+        connections = device.connectionmgr.connections
+        connection = connections[device.default_connection_alias]
+        workers = connection.workers
+        size = len(workers)
+    except Exception:
+        return 1
+    return size if isinstance(size, int) and size > 1 else 1
+
+
+def _execute_batch(device, commands):
+    '''execute commands in one call, one by one if the connection does not
+       support it'''
+    try:
+        outputs = device.execute(commands)
+        return [outputs[command] for command in commands]
+    except Exception as e:
+        log.debug('Cannot execute %d commands at once: %s', len(commands), e)
+    return [cached_execute(device, command) for command in commands]
@@ -0,0 +1,151 @@
+'''Cache of parsed outputs, for outputs which do not change between polls'''
+
+# python
+import os
+import pickle
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+
+from genie.libs import parser
+
+log = logging.getLogger(__name__)
+
+
+class ParseCache(object):
+    '''LRU cache of parsed outputs, keyed by parser class, parser arguments
+       and a hash of the output.
+
+       Results are kept pickled, every hit returns a new copy which the
+       caller is free to modify.
+
+        Args:
+            maxsize (`int`): number of results kept in memory
+            directory (`str`): if given, results are also stored in this
+                               directory and survive the process. Results
+                               of another genie.libs.parser version are not
+                               used.
+
+        example:
+
+            >>> cache = ParseCache(maxsize=512)
+            >>> parsed = cache.parse(ShowVersion, output=output)
+            >>> # Parsed again only if output changed
+            >>> parsed = cache.parse(ShowVersion, output=output)
+    '''
+
+    def __init__(self, maxsize=1024, directory=None):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.hits = self.misses = 0
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def parse(self, parser_cls, output, **kwargs):
+        '''return the parsed output, parse it only if it is not cached
+
+            Args:
+                parser_cls (`class`): parser class
+                output (`str`): device output
+                kwargs: arguments of the parser
+
+            Returns:
+                parsed output
+        '''
+        result = self.get(parser_cls, output, kwargs)
+        if result is None:
+            result = parser_cls(device=None).parse(output=output, **kwargs)
+            self.set(parser_cls, output, kwargs, result)
+        return result
+
+    def get(self, parser_cls, output, kwargs=None):
+        '''return a copy of the cached result, None if not cached'''
+        key = self._key(parser_cls, output, kwargs)
+        with self._lock:
+            try:
+                data = self._results[key]
+                self._results.move_to_end(key)
+            except KeyError:
+                data = None
+
+        if data is None and self.directory:
+            data = self._load(key)
+            if data is not None:
+                self._store(key, data)
+
+        if data is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return pickle.loads(data)
+
+    def set(self, parser_cls, output, kwargs, result):
+        '''cache the result of parsing output'''
+        try:
+            data = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            log.debug('Cannot cache the result of %s', parser_cls.__name__)
+            return
+
+        key = self._key(parser_cls, output, kwargs)
+        self._store(key, data)
+        if self.directory:
+            self._save(key, data)
+
+    def clear(self):
+        '''drop every cached result, including the ones stored on disk'''
+        with self._lock:
+            self._results.clear()
+        if self.directory:
+            for name in os.listdir(self.directory):
+                if name.endswith('.pickle'):
+                    os.remove(os.path.join(self.directory, name))
+
+    def __len__(self):
+        return len(self._results)
+
+    def _key(self, parser_cls, output, kwargs):
+        key = hashlib.blake2b(digest_size=20)
+        key.update('{}.{}\0{}\0'.format(
+            parser_cls.__module__, parser_cls.__qualname__,
+            sorted((kwargs or {}).items())).encode())
+        key.update(output.encode('utf-8', 'surrogatepass'))
+        return key.hexdigest()
+
+    def _store(self, key, data):
+        with self._lock:
+            self._results[key] = data
+            self._results.move_to_end(key)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.directory, '{}-{}.pickle'.format(
+            parser.__version__, key))
+
+    def _load(self, key):
+        try:
+            with open(self._path(key), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _save(self, key, data):
+        # Written to a temporary file first so readers never see a partial
+        # result
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, self._path(key))
+        except OSError as e:
+            log.debug('Cannot store cached result: %s', e)
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
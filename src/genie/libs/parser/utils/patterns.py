@@ -0,0 +1,240 @@
+'''Shared registry of compiled regular expressions for parsers'''
+
+# python
+import re
+
+try:
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:
+    # python < 3.11
+    import sre_parse
+    import sre_constants
+
+# Every pattern compiled through this module, keyed by (pattern, flags).
+# Unlike the re module cache it is never flushed, so parsers cycling through
+# more patterns than the re cache can hold do not recompile them.
+_registry = {}
+
+
+class _NeverMatch(object):
+    '''Bound in place of the patterns a line cannot match (see
+       CompiledPatterns.dispatch). Failing here does not enter the regex
+       engine, which is several times cheaper than a failed re match.'''
+    match = search = fullmatch = {}.get
+
+_NEVER = _NeverMatch()
+
+# Ascii characters matched by each \d, \s, \w (and negation) category.
+# Lines starting with a non ascii character are not dispatched.
+_ASCII = [chr(i) for i in range(128)]
+_CATEGORIES = {
+    getattr(sre_constants, 'CATEGORY_' + name): set(
+        c for c in _ASCII if re.match(regex, c))
+    for name, regex in (('DIGIT', r'\d'), ('NOT_DIGIT', r'\D'),
+                        ('SPACE', r'\s'), ('NOT_SPACE', r'\S'),
+                        ('WORD', r'\w'), ('NOT_WORD', r'\W'))}
+
+
+def compile_pattern(pattern, flags=0):
+    r'''return the compiled pattern, compiling it only the first time
+
+        Args:
+            pattern (`str`): regular expression
+            flags (`int`): re flags
+
+        Returns:
+            compiled regular expression, shared by every caller
+
+        example:
+
+            >>> compile_pattern(r'^(?P<interface>\S+) +is +up$')
+    '''
+    try:
+        return _registry[pattern, flags]
+    except KeyError:
+        compiled = _registry[pattern, flags] = re.compile(pattern, flags)
+        return compiled
+
+
+def first_chars(pattern, flags=0):
+    r'''return the set of ascii characters a string matched by
+       pattern.match() can start with, or None when it cannot be worked out
+       (lookarounds, back references, patterns matching an empty string...)
+
+        example:
+
+            >>> first_chars(r'^(?P<in_pkts>\d+) +packets +input')
+            {'0', '1', '2', '3', '4', '5', '6', '7', '8', '9'}
+    '''
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except Exception:
+        return None
+
+    chars, nullable = _first_chars(list(parsed))
+    if chars is None or nullable:
+        # Can match an empty line
+        return None
+
+    if parsed.state.flags & re.IGNORECASE:
+        chars |= set(c.swapcase() for c in chars)
+
+    return chars
+
+def _first_chars(items):
+    '''return the possible first characters of the parsed pattern items
+       (None if unknown), and whether the items can match an empty string'''
+
+    chars = set()
+    for op, av in items:
+        if op is sre_constants.AT:
+            # Anchors do not consume characters
+            continue
+        elif op is sre_constants.LITERAL:
+            chars.add(chr(av))
+            return chars, False
+        elif op is sre_constants.NOT_LITERAL:
+            return chars | (set(_ASCII) - {chr(av)}), False
+        elif op is sre_constants.ANY:
+            return chars | set(_ASCII), False
+        elif op is sre_constants.IN:
+            in_chars = _in_chars(av)
+            if in_chars is None:
+                return None, False
+            return chars | in_chars, False
+        elif op is sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, sub = av
+            if add_flags or del_flags:
+                return None, False
+            sub_chars, nullable = _first_chars(list(sub))
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            minimum, _, sub = av
+            sub_chars, nullable = _first_chars(list(sub))
+            nullable = nullable or minimum == 0
+        elif op is sre_constants.BRANCH:
+            sub_chars, nullable = set(), False
+            for branch in av[1]:
+                branch_chars, branch_nullable = _first_chars(list(branch))
+                if branch_chars is None:
+                    return None, False
+                sub_chars |= branch_chars
+                nullable = nullable or branch_nullable
+        else:
+            # Lookarounds, back references, ...
+            return None, False
+
+        if sub_chars is None:
+            return None, False
+        chars |= sub_chars
+        if not nullable:
+            return chars, False
+
+    return chars, True
+
+def _in_chars(items):
+    '''return the ascii characters of a [...] set, None if unknown'''
+    chars = set()
+    negate = False
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is sre_constants.LITERAL:
+            chars.add(chr(av))
+        elif op is sre_constants.RANGE:
+            chars.update(chr(c) for c in range(av[0], min(av[1], 127) + 1))
+        elif op is sre_constants.CATEGORY and av in _CATEGORIES:
+            chars |= _CATEGORIES[av]
+        else:
+            return None
+    return set(_ASCII) - chars if negate else chars
+
+
+class CompiledPatterns(object):
+    '''Compiled patterns of a Patterns declaration, as attributes'''
+
+    def __init__(self, flags, patterns):
+        self._flags = flags
+        self._patterns = patterns
+        self._views = None
+        for name, pattern in patterns.items():
+            setattr(self, name, compile_pattern(pattern, flags))
+
+    def dispatch(self, line):
+        '''return the patterns to match this line against
+
+           Patterns which cannot match the first character of the line are
+           replaced by a stand-in whose match() returns None without running
+           the regex engine, so a parser trying its patterns one after the
+           other only runs the candidates. The
+           returned patterns are only meant for match(line), use the
+           CompiledPatterns object for anything else.
+
+            example:
+
+                >>> patterns = self.patterns
+                >>> for line in out.splitlines():
+                ...     line = line.strip()
+                ...     p = patterns.dispatch(line)
+                ...     m = p.p1.match(line)
+        '''
+        if self._views is None:
+            self._build_views()
+
+        try:
+            return self._views[line[:1]]
+        except KeyError:
+            # Empty line or non ascii first character
+            return self
+
+    def _build_views(self):
+        '''build, for every ascii character, the patterns a line starting
+           with it can match'''
+        candidates = {name: first_chars(pattern, self._flags)
+                      for name, pattern in self._patterns.items()}
+
+        views = {}
+        for char in _ASCII:
+            view = views[char] = _DispatchedPatterns()
+            for name, chars in candidates.items():
+                if chars is None or char in chars:
+                    setattr(view, name, getattr(self, name))
+                else:
+                    setattr(view, name, _NEVER)
+        self._views = views
+
+
+class _DispatchedPatterns(object):
+    '''Patterns a line starting with a given character can match'''
+
+
+class Patterns(object):
+    r'''Regular expressions of a parser, declared once at class level and
+       compiled through compile_pattern the first time the parser uses them.
+
+        Args:
+            flags (`int`): re flags applied to every pattern
+            **patterns: name and regular expression of each pattern
+
+        example:
+
+            >>> class ShowVlan(ShowVlanSchema):
+            ...     patterns = Patterns(
+            ...         # 1    default    active    Gi1/0/1
+            ...         p1=r'^(?P<vlan_id>\d+) +(?P<name>\S+) +'
+            ...            r'(?P<status>\S+)')
+            ...
+            ...     def cli(self, output=None):
+            ...         p = self.patterns
+            ...         for line in output.splitlines():
+            ...             m = p.p1.match(line.strip())
+    '''
+
+    def __init__(self, flags=0, **patterns):
+        self.flags = flags
+        self.patterns = patterns
+        self.compiled = None
+
+    def __get__(self, instance, owner):
+        if self.compiled is None:
+            self.compiled = CompiledPatterns(self.flags, self.patterns)
+        return self.compiled
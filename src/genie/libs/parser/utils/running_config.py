@@ -0,0 +1,261 @@
+'''Running-config snapshot of a device, queried locally
+
+Parsers completing their output from the configuration run filtered
+commands, such as 'show running-config | section router ospf 1', often once
+per interface or neighbor they find. Within a collection session the whole
+running-config is fetched once and indexed, and these commands are answered
+from it:
+
+    * show running-config | section X: lines matching X with the lines
+      indented under them
+    * show running-config | include Y: lines matching Y, chained includes
+      match every pattern
+    * show running-config interface Z, or show run router isis: top level
+      sections starting with the words given
+
+Patterns are regular expressions searched in the lines, as on the device.
+The lines holding the words of a pattern are found from an index of the
+words of the configuration, only they are searched, so a query costs the
+number of lines it matches rather than the size of the configuration.
+
+Without an active session, or for commands not answered locally, the
+command is executed on the device.
+
+example:
+
+    >>> with collection_session(device):
+    ...     device.parse('show ip ospf interface')
+    >>> execute_config(device, 'show running-config | section router ospf 1')
+'''
+
+# python
+import re
+from collections import defaultdict
+
+from .common import Common
+from .device_cache import get_device_cache
+
+COMMAND = 'show running-config'
+
+# Top level sections answered by 'show running-config <words>', other words
+# change the content of the output
+SECTION_KEYWORDS = ('interface', 'router')
+
+# Characters of a pattern which are not matched literally
+_METACHARS = re.compile(r'[.^$*+?{}\[\]\\|()]')
+
+
+class RunningConfig(object):
+    '''Indexed lines of a running-config output
+
+        Lines are nested under the closest line above them with a smaller
+        indentation. Empty lines are dropped.
+
+        Args:
+            output (`str`): output of 'show running-config'
+    '''
+
+    def __init__(self, output):
+        self.lines = []
+        # Index of the line following the last line nested under each line
+        self.ends = []
+        # Offsets of the top level lines
+        self.starts = []
+        # (indentation, offset) of the enclosing lines
+        stack = []
+        for line in output.splitlines():
+            line = line.rstrip()
+            text = line.lstrip()
+            if not text:
+                continue
+            offset = len(self.lines)
+            indent = len(line) - len(text)
+            while stack and stack[-1][0] >= indent:
+                self.ends[stack.pop()[1]] = offset
+            if not stack:
+                self.starts.append(offset)
+            self.lines.append(line)
+            self.ends.append(offset + 1)
+            stack.append((indent, offset))
+        for indent, offset in stack:
+            self.ends[offset] = len(self.lines)
+        # Built on first use
+        self._words = None
+        self._heads = None
+        self._containing = {}
+
+    def query(self, command):
+        '''return the output of a 'show running-config' command, None when
+           it is not answered locally
+
+            Args:
+                command (`str`): 'show running-config' or 'show run',
+                                 followed by section keywords and by
+                                 '| section' and '| include' filters
+        '''
+        filters = command.split('|')
+        words = filters.pop(0).split()
+        if len(words) < 2 or words[0] != 'show' or len(words[1]) < 3 or \
+                not 'running-config'.startswith(words[1]):
+            return None
+
+        words = words[2:]
+        if words:
+            if words[0] not in SECTION_KEYWORDS:
+                return None
+            if words[0] == 'interface' and len(words) > 1:
+                words[1:] = [Common.convert_intf_name(''.join(words[1:]))]
+            offsets = self._sections(words)
+        else:
+            offsets = None
+
+        for item in filters:
+            keyword, _, pattern = item.strip().partition(' ')
+            pattern = pattern.strip()
+            if not keyword or not pattern:
+                return None
+            if 'section'.startswith(keyword) and offsets is None:
+                # '| section include' and '| section exclude'
+                if pattern.split()[0] in ('include', 'exclude'):
+                    return None
+                offsets = self._section(pattern)
+            elif 'include'.startswith(keyword):
+                offsets = self._include(pattern, offsets)
+            else:
+                return None
+        return self._output(offsets)
+
+    def section(self, pattern):
+        '''return the output of '| section pattern' '''
+        return self._output(self._section(pattern))
+
+    def include(self, *patterns):
+        '''return the output of '| include pattern', chained for each
+           pattern'''
+        offsets = None
+        for pattern in patterns:
+            offsets = self._include(pattern, offsets)
+        return self._output(offsets)
+
+    def _output(self, offsets):
+        if offsets is None:
+            return '\n'.join(self.lines)
+        return '\n'.join(self.lines[offset] for offset in offsets)
+
+    def _sections(self, words):
+        '''return the offsets of the top level sections starting with
+           words'''
+        if self._heads is None:
+            self._heads = defaultdict(list)
+            for start in self.starts:
+                self._heads[self.lines[start].split()[0]].append(start)
+        offsets = []
+        for start in self._heads.get(words[0], ()):
+            if self.lines[start].split()[:len(words)] == words:
+                offsets.extend(range(start, self.ends[start]))
+        return offsets
+
+    def _section(self, pattern):
+        '''return the offsets of the lines matching pattern, and of the
+           lines nested under them'''
+        search = re.compile(pattern).search
+        offsets = []
+        end = 0
+        for offset in self._candidates(pattern):
+            # Nested under a line already matched
+            if offset < end:
+                continue
+            if search(self.lines[offset]):
+                end = self.ends[offset]
+                offsets.extend(range(offset, end))
+        return offsets
+
+    def _include(self, pattern, offsets=None):
+        '''return the offsets of the lines matching pattern, among offsets
+           when given'''
+        search = re.compile(pattern).search
+        if offsets is None:
+            offsets = self._candidates(pattern)
+        return [offset for offset in offsets if search(self.lines[offset])]
+
+    def _candidates(self, pattern):
+        '''return the offsets of the lines which may match pattern, from the
+           index of the words of the configuration'''
+        literal = pattern
+        if literal.startswith('^'):
+            literal = literal[1:]
+        if literal.endswith('$'):
+            literal = literal[:-1]
+        if _METACHARS.search(literal):
+            return range(len(self.lines))
+
+        words = literal.split(' ')
+        candidates = None
+        for position, word in enumerate(words):
+            if not word:
+                continue
+            if 0 < position < len(words) - 1:
+                # Inner words of the pattern are whole words of the line
+                offsets = self.words.get(word, ())
+            else:
+                offsets = self._lines_containing(word)
+            if candidates is None or len(offsets) < len(candidates):
+                candidates = offsets
+        if candidates is None:
+            return range(len(self.lines))
+        return candidates
+
+    @property
+    def words(self):
+        '''{word: [offset]} of the lines holding each word'''
+        if self._words is None:
+            words = defaultdict(list)
+            for offset, line in enumerate(self.lines):
+                for word in set(line.split()):
+                    words[word].append(offset)
+            self._words = dict(words)
+        return self._words
+
+    def _lines_containing(self, text):
+        '''return the sorted offsets of the lines with a word holding text'''
+        offsets = self._containing.get(text)
+        if offsets is None:
+            offsets = set()
+            for word, lines in self.words.items():
+                if text in word:
+                    offsets.update(lines)
+            offsets = self._containing[text] = sorted(offsets)
+        return offsets
+
+
+def running_config(device):
+    '''return the RunningConfig of the session active for device, fetched
+       once per session, None when no session is active'''
+    cache = get_device_cache(device)
+    if cache is None:
+        return None
+    return cache.load(COMMAND, lambda: RunningConfig(cache.execute(COMMAND)))
+
+
+def execute_config(device, command):
+    '''return the output of a 'show running-config' command of device,
+       answered from the running-config of the active session when
+       possible'''
+    cache = get_device_cache(device)
+    if cache is None:
+        return device.execute(command)
+    output = running_config(device).query(command)
+    if output is None:
+        return cache.execute(command)
+    return output
+
+
+def config_section(device, pattern):
+    '''return 'show running-config | section pattern' of device'''
+    return execute_config(device, '{} | section {}'.format(COMMAND, pattern))
+
+
+def config_include(device, *patterns):
+    '''return 'show running-config | i pattern' of device, chained for each
+       pattern'''
+    return execute_config(device, ' | i '.join((COMMAND,) + patterns))
@@ -0,0 +1,261 @@
+'''Validators of the lists of dicts found in schemas
+
+Schemas written from xml or json outputs hold lists of dicts, which the
+schema engine does not validate by itself. They are validated by a Use()
+callback, which used to build a Schema for each list on every parse.
+ListSchema builds its Schema once, when first used, and checks each item
+with a compiled validator before falling back to the Schema, which reports
+the error as usual.
+
+example:
+
+    class ShowRouteSchema(MetaParser):
+
+        validate_nh_list = ListSchema({
+            Optional("to"): str,
+            Optional("via"): str,
+        }, 'nh list is not a list')
+
+        schema = {
+            'route-information': {
+                'nh': Use(validate_nh_list),
+            }
+        }
+
+The validators are shared by the classes inheriting the schema.
+
+benchmark:
+
+    python -m genie.libs.parser.utils.schema --items 100000
+'''
+
+# python
+import time
+import argparse
+import threading
+
+from pyats.utils.exceptions import SchemaError
+from genie.metaparser.util.schemaengine import Schema, Optional, Any, Use
+
+
+class ListSchema(object):
+    '''Validator of a list of dicts, called by Use()
+
+        Args:
+            schema (`dict`): schema of each item of the list
+            message (`str`): message of the SchemaError raised when the
+                             value is not a list
+            single (`bool`): accept a dict as a list of this one item
+    '''
+
+    def __init__(self, schema, message='value is not a list', single=False):
+        self.schema = schema
+        self.message = message
+        self.single = single
+        self._schema = None
+        self._check = None
+        self._lock = threading.Lock()
+
+    def _compile(self):
+        with self._lock:
+            if self._schema is None:
+                self._check = compile_schema(self.schema)
+                self._schema = Schema(self.schema)
+        return self._schema, self._check
+
+    def __call__(self, value):
+        if self.single and isinstance(value, dict):
+            value = [value]
+        if not isinstance(value, list):
+            raise SchemaError(self.message)
+        schema, check = self._schema, self._check
+        if schema is None:
+            schema, check = self._compile()
+        for item in value:
+            if check is None or not check(item):
+                schema.validate(item)
+        return value
+
+    def check(self, value):
+        '''return True when value is a list of valid items, without raising'''
+        if self.single and isinstance(value, dict):
+            value = [value]
+        if not isinstance(value, list):
+            return False
+        check = self._check if self._schema is not None else \
+            self._compile()[1]
+        if check is None:
+            try:
+                self(value)
+            except Exception:
+                return False
+            return True
+        return all(map(check, value))
+
+
+def compile_schema(schema):
+    '''return a function checking data against schema, None when schema
+       uses constructs not supported by the compiled validator
+
+        The function returns True when data is valid, and False when it may
+        not be. Data which is not found valid is then validated by a Schema,
+        which accepts it or raises the error.
+
+        Supported are types, dicts keyed by strings, Optional() strings and
+        Any(), and Use() of a ListSchema or of another function.
+
+        Args:
+            schema: schema of the data
+
+        Returns:
+            `function` of data returning a `bool`, or None
+    '''
+    try:
+        check = _compile(schema)
+    except _Unsupported:
+        return None
+    if isinstance(schema, dict):
+        # Schema rejects empty outputs
+        return lambda data: bool(data) and check(data)
+    return check
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _compile(schema):
+    if isinstance(schema, type):
+        if schema is object:
+            raise _Unsupported(schema)
+        return lambda data: isinstance(data, schema)
+    if isinstance(schema, dict):
+        return _compile_dict(schema)
+    if type(schema) is Use:
+        return _compile_use(schema.schema)
+    raise _Unsupported(schema)
+
+
+def _compile_use(function):
+    if isinstance(function, ListSchema):
+        return function.check
+
+    def check(data):
+        try:
+            function(data)
+        except Exception:
+            return False
+        return True
+    return check
+
+
+def _compile_dict(schema):
+    if not schema:
+        raise _Unsupported(schema)
+    required = set()
+    checks = {}
+    any_check = None
+    for key, value in schema.items():
+        if type(key) is Optional:
+            key = key.schema
+            optional = True
+        else:
+            optional = False
+        if type(key) is Any:
+            if any_check is not None:
+                raise _Unsupported(schema)
+            any_check = _compile(value)
+            continue
+        if not isinstance(key, str):
+            raise _Unsupported(key)
+        checks[key] = _compile(value)
+        if not optional:
+            required.add(key)
+
+    def check(data):
+        if not isinstance(data, dict):
+            return False
+        missing = len(required)
+        for key, value in data.items():
+            key_check = checks.get(key)
+            if key_check is None:
+                if any_check is None or not any_check(value):
+                    return False
+            elif not key_check(value):
+                return False
+            elif key in required:
+                missing -= 1
+        return not missing
+    return check
+
+
+_NH_SCHEMA = {
+    Optional('to'): str,
+    Optional('via'): str,
+}
+
+_RT_SCHEMA = {
+    Optional('rt-destination'): str,
+    'rt-entry': {
+        'age': {'#text': str, Optional('@junos:seconds'): str},
+        Optional('metric'): str,
+        'preference': str,
+        'protocol-name': str,
+    },
+}
+
+
+def _validate_rt_list(value):
+    # Validator building its sub-schemas on every call
+    def validate_nh_list(value):
+        nh_schema = Schema(_NH_SCHEMA)
+        for item in value:
+            nh_schema.validate(item)
+        return value
+
+    rt_schema = dict(_RT_SCHEMA)
+    rt_schema['rt-entry'] = dict(_RT_SCHEMA['rt-entry'])
+    rt_schema['rt-entry'][Optional('nh')] = Use(validate_nh_list)
+    rt_schema = Schema(rt_schema)
+    for item in value:
+        rt_schema.validate(item)
+    return value
+
+
+def _benchmark(items):
+    '''return the seconds to validate a list of items routes with a
+       validator building its sub-schemas on every call, then with a
+       ListSchema'''
+    validate_nh_list = ListSchema(_NH_SCHEMA)
+    rt_schema = dict(_RT_SCHEMA)
+    rt_schema['rt-entry'] = dict(_RT_SCHEMA['rt-entry'])
+    rt_schema['rt-entry'][Optional('nh')] = Use(validate_nh_list)
+    validate_rt_list = ListSchema(rt_schema)
+
+    routes = [{'rt-destination': '10.{}.{}.0/24'.format(i // 256, i % 256),
+               'rt-entry': {'age': {'#text': '1w2d'}, 'metric': '1',
+                            'nh': [{'to': '10.0.0.1', 'via': 'ge-0/0/0.0'}],
+                            'preference': '170', 'protocol-name': 'BGP'}}
+              for i in range(items)]
+
+    results = []
+    for validator in (_validate_rt_list, validate_rt_list):
+        start = time.perf_counter()
+        validator(routes)
+        results.append(time.perf_counter() - start)
+    return tuple(results)
+
+
+def main(argv=None):
+    argument_parser = argparse.ArgumentParser(description=__doc__.split(
+        '\n')[0])
+    argument_parser.add_argument('--items', type=int, default=100000,
+                                 help='number of routes validated')
+    args = argument_parser.parse_args(argv)
+    before, after = _benchmark(args.items)
+    print('Schema per call: {:.3f}s'.format(before))
+    print('ListSchema:      {:.3f}s ({:.1f}x)'.format(after, before / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+'''Helpers for parsers yielding their result record by record (parse_iter)
+
+A record is a dictionary, together with the path of keys leading to it in the
+dictionary returned by the parser cli(). Parsers of very large outputs, such
+as routing tables, yield each record once it is complete so the output can be
+processed with bounded memory; cli() builds its result from the same records.
+'''
+
+# python
+from collections import deque
+
+
+def iter_lines(output):
+    '''return an iterator over the lines of a device output
+
+        Args:
+            output (`str`, file object or iterable of lines): device output
+
+        Returns:
+            iterator of lines, without their line ending
+    '''
+    if isinstance(output, str):
+        return iter(output.splitlines())
+    return (line.rstrip('\r\n') for line in output)
+
+
+def merge_record(result, path, record):
+    '''merge a record into a parsed result
+
+        Args:
+            result (`dict`): parsed result being built
+            path (`tuple`): keys leading to the record in result. Integers
+                            are list positions, the position following the
+                            last item of a list appends to it.
+            record (`dict`): record to merge
+
+        Returns:
+            None
+    '''
+    container = result
+    for key, next_key in zip(path, path[1:]):
+        try:
+            container = container[key]
+        except (KeyError, IndexError):
+            child = [] if isinstance(next_key, int) else {}
+            if isinstance(container, list):
+                container.append(child)
+            else:
+                container[key] = child
+            container = child
+
+    key = path[-1]
+    if isinstance(container, list):
+        if key == len(container):
+            container.append(record)
+        else:
+            _update(container[key], record)
+    elif key in container:
+        _update(container[key], record)
+    else:
+        container[key] = record
+
+
+def build_result(records):
+    '''return the parsed result made of the (path, record) items of records'''
+    result = {}
+    for path, record in records:
+        merge_record(result, path, record)
+    return result
+
+
+def _update(target, source):
+    '''recursively update dictionary target with source'''
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _update(target[key], value)
+        else:
+            target[key] = value
+
+
+class Records(object):
+    '''Records of a parser yielding its result record by record
+
+       The record being parsed stays open, so the lines following it can
+       complete it, until the parser opens a record at another path.
+
+        example:
+
+            >>> records = Records()
+            >>> for line in iter_lines(output):
+            ...     if records.completed:
+            ...         yield from records.pop()
+            ...     ...
+            ...     route_dict = records.open('vrf', vrf, 'routes', route)
+            >>> yield from records.close()
+    '''
+
+    def __init__(self):
+        self.path = None
+        self.record = None
+        # (path, record) completed but not yielded yet
+        self.completed = deque()
+
+    def open(self, *path):
+        '''return the record at path, a new one unless it is the open record'''
+        if path != self.path:
+            self._complete()
+            self.path = path
+            self.record = {}
+        return self.record
+
+    def add(self, record, *path):
+        '''add a record which is already complete'''
+        self._complete()
+        self.completed.append((path, record))
+
+    def pop(self):
+        '''yield, and forget, the records completed so far'''
+        completed = self.completed
+        while completed:
+            yield completed.popleft()
+
+    def close(self):
+        '''complete the open record, and yield the records not yielded yet'''
+        self._complete()
+        return self.pop()
+
+    def _complete(self):
+        if self.path is not None:
+            self.completed.append((self.path, self.record))
+            self.path = self.record = None
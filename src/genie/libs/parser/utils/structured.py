@@ -0,0 +1,266 @@
+'''Structured outputs of devices, '| display xml' and '| display json'
+
+Parsers of structured outputs walk the elements of the output, and convert
+the records they are interested in to dictionaries. XML outputs are read
+incrementally, each element yielded by iter() is removed from the tree
+once the parser moved on, so outputs of any size are converted with the
+memory of a single record.
+
+Elements are converted as xmltodict would, attributes are keys starting
+with '@', text is '#text' when the element has attributes, and guided by
+the schema of the parser:
+
+    * elements not in the schema are dropped
+    * elements validated by a ListSchema, or typed list, are lists
+    * empty elements typed bool are True
+
+example:
+
+    >>> structured = XmlOutput(output)
+    >>> for event, name, element in structured.iter(['rt']):
+    ...     if event == 'end':
+    ...         rt = structured.to_dict(element, rt_schema)
+'''
+
+# python
+import json
+from xml.etree import ElementTree
+
+from genie.metaparser.util.schemaengine import Optional, Any, Use
+
+from .schema import ListSchema
+from .stream import iter_lines
+
+# Separator returned at the end of some xml outputs
+XML_END = ']]>]]>'
+
+
+class XmlOutput(object):
+    '''Xml output of a device, such as '| display xml' of Junos
+
+        Args:
+            output (`str`, file object or iterable of lines): device output.
+                                     Lines before the xml, such as the
+                                     command, and after it are ignored.
+    '''
+
+    def __init__(self, output):
+        self.output = output
+        # Prefix of the xml namespaces, by uri
+        self.prefixes = {}
+
+    def iter(self, tags):
+        '''yield ('start' or 'end', tag, element) for the elements of tags
+
+            The element yielded at 'end' is complete, it is removed from the
+            tree when the next one is requested. Tags are without namespace.
+        '''
+        parser = ElementTree.XMLPullParser(events=('start', 'end',
+                                                   'start-ns'))
+        stack = []
+        started = False
+        for line in iter_lines(self.output):
+            if not started:
+                if not line.lstrip().startswith('<'):
+                    continue
+                started = True
+            parser.feed(line.replace(XML_END, '') + '\n')
+            for event, item in parser.read_events():
+                if event == 'start-ns':
+                    prefix, uri = item
+                    self.prefixes.setdefault(uri, prefix)
+                    continue
+                name = local_name(item.tag)
+                if event == 'start':
+                    stack.append(item)
+                    if name in tags:
+                        yield event, name, item
+                    continue
+                stack.pop()
+                if name in tags:
+                    yield event, name, item
+                    if stack:
+                        stack[-1].remove(item)
+                if not stack:
+                    parser.close()
+                    return
+
+    def to_dict(self, element, schema):
+        '''return element converted to a dictionary following schema'''
+        return _convert(self, element, schema)
+
+    def attributes(self, element):
+        for name, value in element.attrib.items():
+            if name.startswith('{'):
+                uri, name = name[1:].split('}', 1)
+                prefix = self.prefixes.get(uri)
+                if prefix:
+                    name = '{}:{}'.format(prefix, name)
+            yield name, value
+
+    def children(self, element):
+        for child in element:
+            yield local_name(child.tag), child
+
+    def text(self, element):
+        return (element.text or '').strip()
+
+
+class JsonOutput(object):
+    '''Json output of a device, such as '| display json' of Junos
+
+        Each element is a dictionary of its children, attributes and text
+        are under the 'attributes' and 'data' keys, and every child is a
+        list of elements.
+
+        Args:
+            output (`str`): device output. Lines before the json, such as
+                            the command, and after it are ignored.
+    '''
+
+    def __init__(self, output):
+        if not isinstance(output, str):
+            output = '\n'.join(iter_lines(output))
+        start = output.find('{')
+        self.data = json.JSONDecoder().raw_decode(output, start)[0] \
+            if start >= 0 else {}
+
+    def iter(self, tags):
+        '''yield ('start' or 'end', tag, element) for the elements of tags
+
+            Elements are yielded in the order of the output, the elements
+            yielded are removed from their parent once all their siblings
+            were yielded.
+        '''
+        return self._iter(self.data, tags)
+
+    def _iter(self, element, tags):
+        for name, children in list(element.items()):
+            if name in ('attributes', 'data') or \
+                    not isinstance(children, list):
+                continue
+            for child in children:
+                if not isinstance(child, dict):
+                    continue
+                if name in tags:
+                    yield 'start', name, child
+                yield from self._iter(child, tags)
+                if name in tags:
+                    yield 'end', name, child
+            if name in tags:
+                del element[name]
+
+    def to_dict(self, element, schema):
+        '''return element converted to a dictionary following schema'''
+        return _convert(self, element, schema)
+
+    def attributes(self, element):
+        return element.get('attributes', {}).items()
+
+    def children(self, element):
+        for name, children in element.items():
+            if name in ('attributes', 'data') or \
+                    not isinstance(children, list):
+                continue
+            for child in children:
+                if isinstance(child, dict):
+                    yield name, child
+
+    def text(self, element):
+        data = element.get('data')
+        # Empty elements are [null]
+        if data is None or isinstance(data, list):
+            return ''
+        return str(data).strip()
+
+
+def structured_output(output, display='xml'):
+    '''return the XmlOutput or JsonOutput of output'''
+    if display == 'json':
+        return JsonOutput(output)
+    return XmlOutput(output)
+
+
+def local_name(tag):
+    '''return tag without its namespace'''
+    return tag.rsplit('}', 1)[-1]
+
+
+def schema_of(schema, key):
+    '''return the schema of key in a dictionary schema, None if not found'''
+    return _index(schema)[0].get(key)
+
+
+# Keys of the dictionary schemas, by id, with the schema to keep the id valid
+_indexes = {}
+
+
+def _index(schema):
+    '''return ({key: schema}, schema of Any() keys) of a dictionary schema'''
+    try:
+        return _indexes[id(schema)][1]
+    except KeyError:
+        pass
+    index = {}
+    any_schema = None
+    for key, value in schema.items():
+        if type(key) is Optional:
+            key = key.schema
+        if type(key) is Any:
+            any_schema = value
+        elif isinstance(key, str):
+            index[key] = value
+    _indexes[id(schema)] = (schema, (index, any_schema))
+    return index, any_schema
+
+
+def _item_schema(schema):
+    '''return the schema of the items of a list schema, None if schema is not
+       a list'''
+    if type(schema) is Use and isinstance(schema.schema, ListSchema):
+        return schema.schema.schema
+    if schema is list:
+        return str
+    return None
+
+
+def _convert(structured, element, schema):
+    index, any_schema = _index(schema)
+    result = {}
+    for name, value in structured.attributes(element):
+        key = '@' + name
+        if key in index:
+            result[key] = value
+    if '#text' in index:
+        text = structured.text(element)
+        if text:
+            result['#text'] = text
+
+    repeated = set()
+    for name, child in structured.children(element):
+        child_schema = index.get(name, any_schema)
+        if child_schema is None:
+            continue
+        item_schema = _item_schema(child_schema)
+        if item_schema is not None:
+            result.setdefault(name, []).append(
+                _value(structured, child, item_schema))
+            continue
+        value = _value(structured, child, child_schema)
+        if name not in result:
+            result[name] = value
+        elif name in repeated:
+            result[name].append(value)
+        else:
+            # Repeated elements of a dictionary schema, as xmltodict does
+            result[name] = [result[name], value]
+            repeated.add(name)
+    return result
+
+
+def _value(structured, element, schema):
+    if isinstance(schema, dict):
+        return _convert(structured, element, schema)
+    if schema is bool:
+        return True
+    return structured.text(element)
@@ -0,0 +1,190 @@
+'''Synthetic device outputs of any size, for scale testing parsers
+
+The golden outputs of the folder based tests only hold a few entries, which
+hides parsers whose time grows faster than their output. Each function below
+repeats the entries of a golden output n times, with unique names and
+addresses, to build realistic large outputs.
+
+example:
+
+    >>> output = show_ip_route(100000)
+    >>> ShowIpRoute(device=None).parse(output=output)
+'''
+
+# IOSXE 'show interfaces'
+# iosxe/tests/ShowInterfaces/cli/equal/golden_interface_output_2_output.txt
+_INTERFACE = '''\
+TenGigabitEthernet{slot}/{port} is up, line protocol is up
+  Hardware is SPA-1X10GE-L-V2, address is {mac} (bia {mac})
+  Description: {description}
+  Internet address is {ip}/30
+  MTU 1552 bytes, BW 10000000 Kbit/sec, DLY 10 usec,
+     reliability 255/255, txload 2/255, rxload 2/255
+  Encapsulation ARPA, loopback not set
+  Keepalive not supported
+  Full Duplex, 10000Mbps, link type is force-up, media type is 10GBase-SR/SW
+  output flow-control is on, input flow-control is on
+  Asymmetric Carrier-Delay Up Timer is 2 sec
+  Asymmetric Carrier-Delay Down Timer is 10 sec
+  ARP type: ARPA, ARP Timeout 04:00:00
+  Last input 00:07:19, output 03:51:33, output hang never
+  Last clearing of "show interface" counters never
+  Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
+  Queueing strategy: fifo
+  Output queue: 0/40 (size/max)
+  5 minute input rate 79676000 bits/sec, 9999 packets/sec
+  5 minute output rate 79998000 bits/sec, 9999 packets/sec
+     1779405333 packets input, 1772200805652 bytes, 0 no buffer
+     Received 3 broadcasts (0 IP multicasts)
+     0 runts, 0 giants, 0 throttles
+     0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
+     0 watchdog, 60322 multicast, 0 pause input
+     1791189623 packets output, 1790956453417 bytes, 0 underruns
+     0 output errors, 0 collisions, 2 interface resets
+     291 unknown protocol drops
+     0 babbles, 0 late collision, 0 deferred
+     0 lost carrier, 0 no carrier, 0 pause output
+     0 output buffer failures, 0 output buffers swapped out
+'''
+
+# IOSXE 'show ip route'
+# iosxe/tests/ShowIpRoute/cli/equal/golden_output_1_output.txt
+_ROUTE_HEADER = '''\
+R1_iosv#show ip route
+Codes: L - local, C - connected, S - static, R - RIP, M - mobile, B - BGP
+       D - EIGRP, EX - EIGRP external, O - OSPF, IA - OSPF inter area
+       N1 - OSPF NSSA external type 1, N2 - OSPF NSSA external type 2
+       E1 - OSPF external type 1, E2 - OSPF external type 2
+       i - IS-IS, su - IS-IS summary, L1 - IS-IS level-1, L2 - IS-IS level-2
+       ia - IS-IS inter area, * - candidate default, U - per-user static route
+       o - ODR, P - periodic downloaded static route, H - NHRP, l - LISP
+       a - application route
+       + - replicated route, % - next hop override
+
+Gateway of last resort is not set
+
+      10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
+'''
+_ROUTES = (
+    'C        {ip}/24 is directly connected, GigabitEthernet0/0\n',
+    'O        {ip}/24 [110/2] via 10.186.2.2, 06:46:59, GigabitEthernet0/1\n'
+    '                     [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0\n',
+    'i L1     {ip}/24 [115/20] via 10.186.2.2, 06:47:04, GigabitEthernet0/1\n'
+    '                 [115/20] via 10.1.2.2, 06:47:04, GigabitEthernet0/0\n',
+    'B        {ip}/24 [200/0] via 10.66.12.12, 1d00h\n',
+)
+
+# IOSXE 'show ip bgp'
+# iosxe/tests/ShowIpBgp/cli/equal/golden_output_output.txt
+_BGP_HEADER = '''\
+#show ip bgp
+BGP table version is 569861, local router ID is 10.150.0.5
+Status codes: s suppressed, d damped, h history, * valid, > best, i - internal,
+              r RIB-failure, S Stale, m multipath, b backup-path, f RT-Filter,
+              x best-external, a additional-path, c RIB-compressed,
+              t secondary path,
+Origin codes: i - IGP, e - EGP, ? - incomplete
+RPKI validation codes: V valid, I invalid, N Not found
+     Network          Next Hop            Metric LocPrf Weight Path
+'''
+_BGP_ROUTES = (
+    ' * i  {ip}/24     10.0.0.5          134430 233451 123450 20450 65500 3549 i\n',
+    ' * i  {ip}/24     10.0.0.5                   1000      0 20450 65500 3549 i\n',
+    ' *m {ip}/24      10.4.1.1               2219    100      0 20450 65500 3549 {{27016}} e\n',
+)
+
+# IOSXE 'show mac address-table'
+# iosxe/tests/ShowMacAddressTable/cli/equal/golden_output_output.txt
+_MAC_HEADER = '''\
+          Mac Address Table
+-------------------------------------------
+
+Vlan    Mac Address       Type        Ports
+----    -----------       --------    -----
+'''
+_MACS = (
+    ' {vlan:>3}    {mac}    DYNAMIC     Po12\n',
+    ' {vlan:>3}    {mac}    STATIC      Vl{vlan}\n',
+    ' {vlan:>3}    {mac}    DYNAMIC     Gi1/0/{port}\n',
+)
+
+# IOSXE 'show ip ospf database'
+# iosxe/tests/ShowIpOspfDatabase/cli/equal/golden_output1_output.txt
+_OSPF_HEADER = '''\
+Router#show ip ospf database
+
+            OSPF Router with ID (172.31.197.254) (Process ID 65109)
+'''
+_OSPF_ROUTER = '''
+        Router Link States (Area {area})
+
+Link ID         ADV Router      Age         Seq#       Checksum Link count
+'''
+_OSPF_NETWORK = '''
+        Net Link States (Area {area})
+
+Link ID         ADV Router      Age         Seq#       Checksum
+'''
+_LSA_ROUTER = '{ip:<15} {ip:<15} 2794        0x80000043 0x002254 3\n'
+_LSA_NETWORK = '{ip:<15} 172.31.197.253  70          0x8000003F 0x0015EF\n'
+
+# Number of LSAs of each type per area
+_LSAS_PER_AREA = 1000
+
+
+def ip(i, first_octet=10):
+    '''return the i-th ipv4 address of first_octet.0.0.0/8'''
+    return '{}.{}.{}.{}'.format(first_octet, (i >> 16) & 255, (i >> 8) & 255,
+                                i & 255)
+
+
+def mac(i):
+    '''return the i-th mac address'''
+    return '0000.{:04x}.{:04x}'.format((i >> 16) & 0xffff, i & 0xffff)
+
+
+def show_interfaces(n):
+    '''return an IOSXE 'show interfaces' output of n interfaces'''
+    return ''.join(
+        _INTERFACE.format(slot=i // 48, port=i % 48, mac=mac(i),
+                          description='port {}'.format(i), ip=ip(i << 2))
+        for i in range(n))
+
+
+def show_ip_route(n):
+    '''return an IOSXE 'show ip route' output of n prefixes'''
+    return _ROUTE_HEADER + ''.join(
+        _ROUTES[i % len(_ROUTES)].format(ip=ip(i << 8)) for i in range(n))
+
+
+def show_ip_bgp(n):
+    '''return an IOSXE 'show ip bgp' output of n prefixes'''
+    return _BGP_HEADER + ''.join(
+        _BGP_ROUTES[i % len(_BGP_ROUTES)].format(ip=ip(i << 8, 172))
+        for i in range(n))
+
+
+def show_mac_address_table(n):
+    '''return an IOSXE 'show mac address-table' output of n mac addresses'''
+    return _MAC_HEADER + ''.join(
+        _MACS[i % len(_MACS)].format(vlan=i % 4000 + 1, mac=mac(i),
+                                     port=i % 48 + 1)
+        for i in range(n)) + \
+        'Total Mac Addresses for this criterion: {}\n'.format(n)
+
+
+def show_ip_ospf_database(n):
+    '''return an IOSXE 'show ip ospf database' output of n LSAs, half
+       router and half network LSAs, in areas of _LSAS_PER_AREA LSAs'''
+    out = [_OSPF_HEADER]
+    routers = (n + 1) // 2
+    networks = n // 2
+    for area, start in enumerate(range(0, routers, _LSAS_PER_AREA)):
+        out.append(_OSPF_ROUTER.format(area=area))
+        out.extend(_LSA_ROUTER.format(ip=ip(i, 172))
+                   for i in range(start, min(start + _LSAS_PER_AREA, routers)))
+        out.append(_OSPF_NETWORK.format(area=area))
+        out.extend(_LSA_NETWORK.format(ip=ip(i))
+                   for i in range(start, min(start + _LSAS_PER_AREA,
+                                             networks)))
+    return ''.join(out)
@@ -0,0 +1,181 @@
+'''Schema validation of parsed outputs, always, never or 1 in N parses
+
+MetaParser.parse validates every parsed output against the schema of its
+parser. Parsers trusted in production can skip it, or only validate a
+sample of their outputs. Failures of sampled validations are counted and
+reported to the failure hooks instead of raising, the unvalidated output is
+returned.
+
+Validation is set, from the highest priority:
+
+    per call:   device.parse('show version', schema_validation=NEVER)
+                ShowVersion(device=device).parse(schema_validation=100)
+    per class:  set_validation(NEVER, parser_cls=ShowVersion)
+    globally:   set_validation(100)
+
+A validation is ALWAYS, NEVER, or an `int` N validating 1 in N parses of a
+parser class. ALWAYS is the default, and validates as MetaParser does.
+
+When an output is not validated, Use() conversions and Default() values of
+the schema are not applied, it is returned as built by the parser.
+
+The setting applies once this module is imported, which importing
+genie.libs.parser.utils does.
+'''
+
+# python
+import logging
+import functools
+import itertools
+import threading
+from collections import Counter
+
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import Schema
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+log = logging.getLogger(__name__)
+
+ALWAYS = 'always'
+NEVER = 'never'
+
+# Global validation
+_validation = ALWAYS
+
+# Counter of the parses of each parser class, to pick the sampled ones
+_parse_counts = {}
+_lock = threading.Lock()
+
+# Functions called with (parser, output, exception) when a sampled
+# validation fails
+failure_hooks = []
+
+# Number of outputs 'validated', 'skipped' and 'failed', by parser class name
+stats = Counter()
+
+# MetaParser.parse, as installed by genie.metaparser
+_parse = None
+_unset = object()
+
+
+def set_validation(validation, parser_cls=None):
+    '''set the validation of all parsers, or of a parser class and its
+       subclasses
+
+        Args:
+            validation: ALWAYS, NEVER or `int` N validating 1 in N parses.
+                        None removes the setting of parser_cls.
+            parser_cls (`class`): parser class, default to all parsers
+    '''
+    if validation is not None:
+        _check_validation(validation)
+    if parser_cls is None:
+        global _validation
+        _validation = ALWAYS if validation is None else validation
+    elif validation is None:
+        if 'schema_validation' in vars(parser_cls):
+            del parser_cls.schema_validation
+    else:
+        parser_cls.schema_validation = validation
+
+
+def get_validation(parser, validation=None):
+    '''return the validation of a parser, or parser class'''
+    if validation is None:
+        validation = getattr(parser, 'schema_validation', None)
+    if validation is None:
+        validation = _validation
+    return validation
+
+
+def reset_stats():
+    '''clear the counters of validated, skipped and failed outputs'''
+    stats.clear()
+    with _lock:
+        _parse_counts.clear()
+
+
+def install():
+    '''route MetaParser.parse through the validation settings'''
+    global _parse
+    if _parse is not None:
+        return
+    _parse = MetaParser.parse
+    # Wraps the original parse when this module is imported again
+    while hasattr(_parse, 'schema_validation'):
+        _parse = _parse.__wrapped__
+
+    @functools.wraps(_parse)
+    def parse(self, *args, schema_validation=None, **kwargs):
+        validation = get_validation(self, schema_validation)
+        if validation == ALWAYS:
+            return _parse(self, *args, **kwargs)
+        if validation != NEVER:
+            _check_validation(validation)
+        return _parse_trusted(
+            self, *args, validate=validation != NEVER and _sampled(
+                type(self), validation), **kwargs)
+
+    parse.schema_validation = True
+    MetaParser.parse = parse
+
+
+def _check_validation(validation):
+    if validation in (ALWAYS, NEVER):
+        return
+    if isinstance(validation, bool) or not isinstance(validation, int) or \
+            validation < 1:
+        raise ValueError("Validation must be '{}', '{}' or a positive int, "
+                         "got {!r}".format(ALWAYS, NEVER, validation))
+
+
+def _sampled(parser_cls, validation):
+    '''return True for 1 in validation parses of parser_cls'''
+    counter = _parse_counts.get(parser_cls)
+    if counter is None:
+        with _lock:
+            counter = _parse_counts.setdefault(parser_cls, itertools.count())
+    return next(counter) % validation == 0
+
+
+def _parse_trusted(parser, *args, validate=False, selected_keys=None,
+                       **kwargs):
+    '''parse with the schema check of MetaParser disabled, validate the
+       output when validate is True'''
+    schema = parser.schema
+    # An empty schema is not checked by MetaParser
+    instance_schema = vars(parser).get('schema', _unset)
+    parser.schema = None
+    try:
+        output = _parse(parser, *args, **kwargs)
+    finally:
+        if instance_schema is _unset:
+            del parser.schema
+        else:
+            parser.schema = instance_schema
+
+    name = type(parser).__name__
+    if schema and not output:
+        # Still raised, callers rely on it for empty outputs
+        raise SchemaEmptyParserError(output)
+    if not schema or not validate:
+        stats[name, 'skipped'] += 1
+    else:
+        try:
+            output = Schema(schema).validate(output)
+        except Exception as e:
+            stats[name, 'failed'] += 1
+            log.warning('Parser %s schema checking failed: %s', name, e)
+            for hook in list(failure_hooks):
+                try:
+                    hook(parser, output, e)
+                except Exception:
+                    log.exception('Schema failure hook %r failed', hook)
+        else:
+            stats[name, 'validated'] += 1
+    if selected_keys:
+        output = parser.parse_selected_keys(selected_keys, output)
+    return output
+
+
+install()
@@ -0,0 +1,88 @@
+import os
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils import common, parse_batch, ParseCache
+from genie.libs.parser.utils.batch import shutdown_batch_pools, map_jobs, \
+    _pools
+from genie.libs.parser.iosxe.show_vrf import ShowVrf
+
+
+class TestParseBatch(unittest.TestCase):
+
+    output = '''\
+          Name                             Default RD            Protocols   Interfaces
+          Mgmt-intf                        <not set>             ipv4,ipv6   Gi1
+          VRF1                             65000:1               ipv4,ipv6   Tu1
+    '''
+
+    def setUp(self):
+        common.clear_parser_cache()
+        self.addCleanup(common.clear_parser_cache)
+        self.addCleanup(shutdown_batch_pools)
+
+        lookup = patch.object(common.Lookup, 'from_device',
+                              side_effect=lambda device, **kwargs:
+                                  Mock(_tokens=[device.os]))
+        lookup.start()
+        self.addCleanup(lookup.stop)
+
+    def test_parse_batch(self):
+        items = [('iosxe', 'show vrf', self.output, None),
+                 ('iosxe', 'show vrf', '', None),
+                 ('iosxe', 'show something unknown', self.output, None)]
+        items += [('iosxe', 'show vrf {vrf}', self.output, {'vrf': 'VRF1'})] * 4
+        expected = ShowVrf(device=None).parse(output=self.output)
+
+        for processes in (0, 2):
+            results = parse_batch(items, processes=processes, chunksize=2)
+
+            self.assertEqual(len(results), len(items))
+            self.assertEqual(results[0], expected)
+            self.assertIsInstance(results[1], SchemaEmptyParserError)
+            self.assertIsInstance(results[2], Exception)
+            self.assertEqual(results[3:], [expected] * 4)
+
+    def test_workers_are_reused(self):
+        items = [('iosxe', 'show vrf', self.output, None)] * 4
+
+        parse_batch(items, processes=2)
+        pool = _pools[2]
+        parse_batch(items, processes=2)
+        self.assertIs(_pools[2], pool)
+
+    def test_cache(self):
+        cache = ParseCache()
+        items = [('iosxe', 'show vrf', self.output, None)] * 2
+        first = parse_batch(items, processes=0, cache=cache)
+
+        with patch('genie.libs.parser.utils.batch._parse_chunk') as parse:
+            self.assertEqual(parse_batch(items, processes=0, cache=cache),
+                             first)
+        self.assertFalse(parse.called)
+
+
+class TestMapJobs(unittest.TestCase):
+
+    def setUp(self):
+        self.addCleanup(shutdown_batch_pools)
+
+    def test_map_jobs(self):
+        for processes in (0, 2):
+            self.assertEqual(map_jobs(processes, abs, [-1, 2, -3]),
+                             [1, 2, 3])
+
+    def test_worker_died(self):
+        map_jobs(2, abs, [-1])
+        pool = _pools[2]
+        with self.assertRaises(Exception):
+            map_jobs(2, os._exit, [1])
+        self.assertNotIn(2, _pools)
+        self.assertEqual(map_jobs(2, abs, [-1]), [1])
+        self.assertIsNot(_pools[2], pool)
+
+
+if __name__ == '__main__':
+    unittest.main()
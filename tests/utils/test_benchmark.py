@@ -0,0 +1,57 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.utils import benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_benchmark_class(self):
+        with patch.object(benchmark, 'get_parser_classes',
+                          wraps=benchmark.get_parser_classes) as classes:
+            results = benchmark.benchmark(['iosxe'], ['ShowVrf'], repeat=1)
+        classes.assert_called_once_with('iosxe')
+
+        self.assertEqual(list(results), ['iosxe.ShowVrf'])
+        result = results['iosxe.ShowVrf']
+        self.assertGreater(result['outputs'], 0)
+        self.assertGreater(result['ops_per_sec'], 0)
+        self.assertGreater(result['bytes_per_sec'], result['ops_per_sec'])
+        self.assertGreater(result['peak'], 0)
+
+    def test_compare(self):
+        baseline = {'iosxe.A': {'warm': 1.0}, 'iosxe.B': {'warm': 1.0},
+                    'iosxe.C': {'error': 'KeyError'}}
+        results = {'iosxe.A': {'warm': 1.1}, 'iosxe.B': {'warm': 2.0},
+                   'iosxe.C': {'warm': 2.0}, 'iosxe.D': {'warm': 2.0}}
+        self.assertEqual(benchmark.compare(results, baseline),
+                         [('iosxe.B', 1.0, 2.0)])
+        self.assertEqual(benchmark.compare(results, baseline, threshold=0.05),
+                         [('iosxe.B', 1.0, 2.0), ('iosxe.A', 1.0, 1.1)])
+
+    def test_main(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        baseline = os.path.join(directory, 'baseline.json')
+
+        with patch('sys.stdout'):
+            self.assertEqual(benchmark.main(
+                ['--os', 'iosxe', '--class', 'ShowVrf', '--repeat', '1',
+                 '--save', baseline]), 0)
+            with open(baseline) as f:
+                saved = json.load(f)
+            saved['iosxe.ShowVrf']['warm'] /= 100
+            with open(baseline, 'w') as f:
+                json.dump(saved, f)
+
+            self.assertEqual(benchmark.main(
+                ['--os', 'iosxe', '--class', 'ShowVrf', '--repeat', '1',
+                 '--compare', baseline]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.blocks import Blocks, merge_results
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+BLOCKS = Blocks(header=r'^neighbor +\S+$', context=[r'^instance +\S+$'])
+
+OUTPUT = '''\
+instance 1
+neighbor 10.1.1.1
+  state up
+neighbor 10.1.1.2
+  state down
+instance 2
+neighbor 10.2.2.1
+  state up'''
+
+INTERFACES_OUTPUT = '''\
+GigabitEthernet1 is up, line protocol is up
+  Hardware is CSR vNIC, address is 5e00.0001.0000 (bia 5e00.0001.0000)
+  Internet address is 10.1.1.1/24
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+Port-channel1 is up, line protocol is up
+  Hardware is GEChannel, address is 5e00.0001.0001 (bia 5e00.0001.0001)
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+    Members in this channel: Gi2
+GigabitEthernet2 is up, line protocol is up
+  Hardware is CSR vNIC, address is 5e00.0001.0002 (bia 5e00.0001.0002)
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+Loopback1 is up, line protocol is up
+  Hardware is Loopback
+  Interface is unnumbered. Using address of GigabitEthernet1 (10.1.1.1)
+  MTU 1514 bytes, BW 8000000 Kbit/sec, DLY 5000 usec,
+'''
+
+
+class TestBlocks(unittest.TestCase):
+
+    def test_split(self):
+        self.assertEqual(list(BLOCKS.split(OUTPUT)), [
+            'instance 1\nneighbor 10.1.1.1\n  state up',
+            'instance 1\nneighbor 10.1.1.2\n  state down\ninstance 2',
+            'instance 2\nneighbor 10.2.2.1\n  state up'])
+
+    def test_split_size(self):
+        self.assertEqual(list(BLOCKS.split(OUTPUT, size=4)), [
+            'instance 1\nneighbor 10.1.1.1\n  state up\n'
+            'neighbor 10.1.1.2\n  state down\ninstance 2',
+            'instance 2\nneighbor 10.2.2.1\n  state up'])
+
+    def test_merge_results(self):
+        self.assertEqual(
+            merge_results([
+                {'instance': {'1': {'neighbor': {'10.1.1.1': {}}}}},
+                {'instance': {'1': {'neighbor': {'10.1.1.2': {}}}},
+                 'total': 2}]),
+            {'instance': {'1': {'neighbor': {'10.1.1.1': {}, '10.1.1.2': {}}}},
+             'total': 2})
+
+
+class TestParseBlocks(unittest.TestCase):
+
+    def test_show_interfaces(self):
+        parser = ShowInterfaces(device=Mock())
+        expected = parser.cli(output=INTERFACES_OUTPUT)
+        # Port-channel membership and unnumbered addresses of other chunks
+        self.assertTrue(expected['GigabitEthernet2']['port_channel']
+                        ['port_channel_member'])
+        self.assertEqual(expected['Loopback1']['ipv4']['unnumbered'],
+                         {'interface_ref': 'GigabitEthernet1'})
+        for processes in (0, 2):
+            self.assertEqual(parser.parse_blocks(output=INTERFACES_OUTPUT,
+                                                 processes=processes,
+                                                 chunk_lines=1), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
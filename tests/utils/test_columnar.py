@@ -0,0 +1,90 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.columnar import Table, CODES, INTEGERS, VALUES
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+from genie.libs.parser.iosxe.show_ip_nat import ShowIpNatTranslations
+
+MAC_OUTPUT = '''\
+Vlan    Mac Address       Type        Ports
+----    -----------       --------    -----
+ All    0100.0cff.9999    STATIC      CPU
+  20    aaaa.bbff.8888    STATIC      Drop
+ 100    3820.56ff.6f75    DYNAMIC     Po12
+ 101    3820.56ff.6f75    DYNAMIC     Po12
+ * 10    aaaa.bbff.8888    STATIC      Gi1/0/8 Gi1/0/9
+                                      Vl101
+Total Mac Addresses for this criterion: 5
+'''
+
+NAT_OUTPUT = '''\
+Pro Inside global      Inside local       Outside local      Outside global
+any ---                ---                10.1.0.2          10.144.0.2
+    Group_id:0   vrf: genie
+    Format(H:M:S) Time-left :0:0:-1
+any ---                ---                10.1.2.21          120.1.211
+    Group_id:0   vrf: genie
+    Format(H:M:S) Time-left :0:1:38
+Total number of translations: 2
+'''
+
+
+class TestTable(unittest.TestCase):
+
+    def setUp(self):
+        self.table = Table([('interface', CODES), ('age', INTEGERS),
+                            ('protocols', VALUES)])
+
+    def test_columns(self):
+        self.table.append({'interface': 'Po12', 'age': 10})
+        self.table.append({'interface': 'Po12', 'protocols': ['ip']})
+        self.table.append({'interface': 'Vl100', 'age': 20})
+        self.assertEqual(len(self.table), 3)
+        interface = self.table['interface']
+        self.assertEqual(list(interface.codes), [0, 0, 1])
+        self.assertEqual(interface.categories, ['Po12', 'Vl100'])
+        self.assertEqual(interface[2], 'Vl100')
+        age = self.table['age']
+        self.assertEqual(list(age.values), [10, 0, 20])
+        self.assertEqual(list(age.mask), [0, 1, 0])
+        self.assertEqual(list(age), [10, None, 20])
+        self.assertEqual(self.table['protocols'], [None, ['ip'], None])
+
+    def test_rows(self):
+        rows = [{'interface': 'Po12', 'age': 10},
+                {'protocols': ['ip']}]
+        for row in rows:
+            self.table.append(row)
+        self.assertIsNone(self.table['age'][1])
+        self.assertEqual(self.table['interface'][1], None)
+        self.assertEqual(list(self.table.rows()), rows)
+
+    def test_unknown_column(self):
+        with self.assertRaises(KeyError):
+            self.table.append({'vlan': '100'})
+        self.assertEqual(len(self.table), 0)
+
+
+class TestParserColumns(unittest.TestCase):
+
+    def test_mac_address_table(self):
+        parser = ShowMacAddressTable(device=Mock())
+        table = parser.columns(output=MAC_OUTPUT)
+        # One row per interface of each address
+        self.assertEqual(len(table), 7)
+        self.assertEqual(table['vlan'].categories, ['all', 20, 100, 101, 10])
+        self.assertEqual(ShowMacAddressTable.table_to_dict(table),
+                         parser.cli(output=MAC_OUTPUT))
+
+    def test_nat_translations(self):
+        parser = ShowIpNatTranslations(device=Mock())
+        table = parser.columns(output=NAT_OUTPUT)
+        self.assertEqual(list(table['vrf']), ['genie', 'genie'])
+        self.assertEqual(table.meta, {'number_of_translations': 2})
+        result = parser.cli(output=NAT_OUTPUT)
+        self.assertEqual(ShowIpNatTranslations.table_to_dict(table), result)
+        self.assertEqual(sorted(result['vrf']['genie']['index']), [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.common import (
+    _CommandIndex,
+    _matches_fuzzy,
+    clear_parser_cache,
+    get_parser,
+)
+
+DATA = {
+    'show version': {'iosxe': {}, 'nxos': {}},
+    'show vrf': {'iosxe': {}},
+    'show vrf {vrf}': {'iosxe': {}},
+    'show bgp {address_family} summary': {'iosxe': {}},
+    'show bgp vrf {vrf} all summary': {'nxos': {}},
+    'show ip ospf interface {interface}': {'iosxe': {}},
+    '/dna/intent/api/v1/interface/{interface}': {'dnac': {}},
+}
+
+
+class TestCommandIndex(unittest.TestCase):
+
+    def _full_scan(self, search, fuzzy, os=None):
+        return [command for command, source in DATA.items()
+                    if _matches_fuzzy(0, 0, search.split(), command, {}, fuzzy)
+                        and (not os or os in source)]
+
+    def test_candidates_are_superset(self):
+        searches = [('sh ver', False), ('show vrf blue', False),
+                    ('sh bgp vpnv4 unicast summ', False), ('s b .* sum', True),
+                    ('show ip ospf int Gi1/0/1', False), ('.*', True),
+                    ('/dna/intent/api/v1/interface/abc', False),
+                    ('show vrf', True), ('sh xyz', False)]
+        for os in (None, 'iosxe', 'nxos'):
+            index = _CommandIndex(DATA, os)
+            for search, fuzzy in searches:
+                candidates = index.candidates(search.split(), fuzzy)
+                for command in self._full_scan(search, fuzzy, os):
+                    self.assertIn(command, candidates, search)
+
+    def test_candidates_narrow_down(self):
+        index = _CommandIndex(DATA)
+        self.assertEqual(index.candidates('sh ver'.split(), False),
+                         ['show version'])
+        self.assertEqual(index.candidates('sh v'.split(), False),
+                         ['show version', 'show vrf'])
+        self.assertEqual(index.candidates('sh xyz'.split(), False), [])
+        self.assertEqual(index.candidates('show vrf'.split(), False),
+                         ['show vrf'])
+
+    def test_candidates_os(self):
+        index = _CommandIndex(DATA, 'nxos')
+        self.assertEqual(index.candidates('show vrf blue'.split(), False), [])
+        self.assertEqual(
+            index.candidates('sh b vrf blue all summary'.split(), False),
+            ['show bgp vrf {vrf} all summary'])
+
+
+class TestGetParserCache(unittest.TestCase):
+
+    def setUp(self):
+        clear_parser_cache()
+        self.addCleanup(clear_parser_cache)
+
+    def test_resolved_lookup_is_cached(self):
+        device = Mock(os='iosxe', custom={})
+        lookup = Mock(_tokens=['iosxe'])
+        parser_cls = Mock()
+        data = {'iosxe': {'module_name': 'show_vrf',
+                          'package': 'genie.libs.parser',
+                          'class': 'ShowVrf'}}
+
+        with patch.object(common.Lookup, 'from_device', return_value=lookup), \
+             patch.object(common, '_fuzzy_search_command',
+                 return_value=[('show vrf {vrf}', data, {'vrf': 'blue'})]) \
+                 as search, \
+             patch.object(common, '_find_parser_cls',
+                          return_value=parser_cls):
+            first = get_parser('show vrf blue', device)
+            first[1]['vrf'] = 'modified'
+            second = get_parser('show vrf blue', device)
+
+        self.assertEqual(search.call_count, 1)
+        self.assertIs(second[0], parser_cls)
+        self.assertEqual(second[1], {'vrf': 'blue'})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.compact import Layout, intern_str, \
+    compact_result, expand_result, build_compact
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+
+LAYOUT = Layout(
+    'Route', ['route', 'source_protocol', 'next_hop'],
+    nested={'next_hop': Layout('NextHop', ['next_hop_list'], nested={
+        'next_hop_list': Layout('NextHopPath',
+                                ['index', 'next_hop', 'from'],
+                                keyed=True, interned=['next_hop'])})},
+    interned=['source_protocol'])
+
+ROUTE = {'route': '10.1.0.0/24',
+         'source_protocol': 'ospf',
+         'next_hop': {'next_hop_list': {
+             1: {'index': 1, 'next_hop': '10.186.2.2', 'from': '10.4.1.1'},
+             2: {'index': 2, 'next_hop': '10.186.3.2'}}}}
+
+ROUTE_OUTPUT = '''\
+Gateway of last resort is not set
+
+      10.0.0.0/8 is variably subnetted, 3 subnets, 2 masks
+O        10.2.3.0/24 [110/2] via 10.186.2.2, 06:46:59, GigabitEthernet0/1
+                     [110/2] via 10.186.3.2, 06:46:59, GigabitEthernet0/2
+C        10.4.1.1 is directly connected, Loopback0
+O        10.2.4.0/24 [110/2] via 10.186.2.2, 06:46:59, GigabitEthernet0/1
+'''
+
+
+class TestLayout(unittest.TestCase):
+
+    def test_pack(self):
+        record = LAYOUT.pack(ROUTE)
+        self.assertEqual(record.route, '10.1.0.0/24')
+        first, second = record.next_hop.next_hop_list
+        self.assertEqual((first.key, first.next_hop, first.from_),
+                         (1, '10.186.2.2', '10.4.1.1'))
+        self.assertIsNone(second.from_)
+        self.assertIs(first.next_hop, intern_str('10.186.2.2'))
+        self.assertEqual(LAYOUT.unpack(record), ROUTE)
+
+    def test_unknown_key(self):
+        with self.assertRaises(KeyError):
+            LAYOUT.pack(dict(ROUTE, metric=2))
+
+    def test_intern_str(self):
+        value = ''.join(['Gigabit', 'Ethernet1'])
+        self.assertIs(intern_str(value), intern_str('GigabitEthernet1'))
+        self.assertIsNone(intern_str(None))
+        self.assertEqual(intern_str(1), 1)
+
+
+class TestCompactResult(unittest.TestCase):
+
+    path = ('vrf', None, 'routes', None)
+
+    def test_compact_result(self):
+        result = {'vrf': {'default': {'routes': {'10.1.0.0/24': dict(ROUTE)},
+                                      'last_resort': {'gateway': 'not set'}}}}
+        expected = {'vrf': {'default': {
+            'routes': {'10.1.0.0/24': dict(ROUTE)},
+            'last_resort': {'gateway': 'not set'}}}}
+        compact = compact_result(result, self.path, LAYOUT)
+        self.assertIsInstance(
+            compact['vrf']['default']['routes']['10.1.0.0/24'], LAYOUT.type)
+        self.assertEqual(expand_result(compact, self.path, LAYOUT), expected)
+
+    def test_build_compact(self):
+        # The second record completes the first one
+        records = [
+            (('vrf', 'default', 'routes', '10.1.0.0/24'),
+             {'route': '10.1.0.0/24', 'next_hop': {'next_hop_list': {
+                 1: {'index': 1, 'next_hop': '10.186.2.2',
+                     'from': '10.4.1.1'}}}}),
+            (('vrf', 'default', 'routes', '10.1.0.0/24'),
+             {'source_protocol': 'ospf', 'next_hop': {'next_hop_list': {
+                 2: {'index': 2, 'next_hop': '10.186.3.2'}}}})]
+        compact = build_compact(records, LAYOUT)
+        self.assertEqual(expand_result(compact, self.path, LAYOUT),
+                         {'vrf': {'default': {'routes': {
+                             '10.1.0.0/24': ROUTE}}}})
+
+
+class TestParserCompact(unittest.TestCase):
+
+    def test_show_ip_route(self):
+        parser = ShowIpRoute(device=Mock())
+        compact = parser.compact(output=ROUTE_OUTPUT)
+        routes = compact['vrf']['default']['address_family']['ipv4']['routes']
+        self.assertEqual(routes['10.2.3.0/24'].source_protocol, 'ospf')
+        paths = routes['10.2.3.0/24'].next_hop.next_hop_list
+        self.assertEqual([path.outgoing_interface for path in paths],
+                         ['GigabitEthernet0/1', 'GigabitEthernet0/2'])
+        # Interfaces of the routes are one object
+        self.assertIs(
+            paths[0].outgoing_interface,
+            routes['10.2.4.0/24'].next_hop.next_hop_list[0]
+            .outgoing_interface)
+        self.assertEqual(ShowIpRoute.compact_to_dict(compact),
+                         parser.cli(output=ROUTE_OUTPUT))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from genie.libs.parser.utils.common import Common
+
+
+class TestConvertIntfName(unittest.TestCase):
+
+    def test_convert_intf_name(self):
+        names = {
+            'Eth2/1': 'Ethernet2/1',
+            'Gi1/0/1': 'GigabitEthernet1/0/1',
+            'Gig0/0.100': 'GigabitEthernet0/0.100',
+            'Te0/1/0': 'TenGigabitEthernet0/1/0',
+            'Po12': 'Port-channel12',
+            'Vl100': 'Vlan100',
+            'BE10.1': 'Bundle-Ether10.1',
+            'Fe0/0': '0/0',
+            'GigabitEthernet1': 'GigabitEthernet1',
+            'Tunnel-te1': 'Tunnel-te1',
+            'ethernet1/1': 'Ethernet1/1',
+            'port channel 1': 'Portchannel1',
+            'mgmt0': 'mgmt0',
+            'Null0': 'Null0',
+            'Gi': 'Gi',
+            '1/1': '1/1',
+            '': '',
+        }
+        for intf, expected in names.items():
+            self.assertEqual(Common.convert_intf_name(intf), expected, intf)
+
+    def test_convert_intf_names(self):
+        self.assertEqual(
+            Common.convert_intf_names(['Gi1/0/1', 'Lo0', 'Gi1/0/1']),
+            ['GigabitEthernet1/0/1', 'Loopback0', 'GigabitEthernet1/0/1'])
+        self.assertEqual(Common.convert_intf_names(iter(['Hu0/0/0/1'])),
+                         ['HundredGigE0/0/0/1'])
+        self.assertEqual(Common.convert_intf_names([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.nxos.show_vrf import ShowVrf
+from genie.libs.parser.nxos.show_mcast import \
+    ShowForwardingDistributionMulticastRoute
+from genie.libs.parser.utils.device_cache import DeviceCache, \
+    collection_session, get_device_cache, cached_execute, cached_parse
+
+SHOW_VRF = '''
+VRF-Name                           VRF-ID State   Reason
+VRF1                                    3 Up      --
+default                                 1 Up      --
+'''
+
+
+class TestDeviceCache(unittest.TestCase):
+
+    def setUp(self):
+        self.device = Mock(**{'execute.return_value': SHOW_VRF})
+
+    def test_execute(self):
+        cache = DeviceCache(self.device)
+        self.assertEqual(cache.execute('show vrf'), SHOW_VRF)
+        self.assertEqual(cache.execute('show vrf'), SHOW_VRF)
+        cache.execute('show vrf detail')
+        self.assertEqual(self.device.execute.call_count, 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        self.assertEqual(len(cache), 2)
+
+    def test_ttl(self):
+        now = [0]
+        cache = DeviceCache(self.device, ttl=10, timer=lambda: now[0])
+        cache.execute('show vrf')
+        now[0] = 9
+        cache.execute('show vrf')
+        now[0] = 10
+        cache.execute('show vrf')
+        self.assertEqual(self.device.execute.call_count, 2)
+        cache.clear()
+        cache.execute('show vrf')
+        self.assertEqual(self.device.execute.call_count, 3)
+
+    def test_parse(self):
+        cache = DeviceCache(self.device)
+        parsed = cache.parse(ShowVrf)
+        self.assertEqual(sorted(parsed['vrfs']), ['VRF1', 'default'])
+        # Each hit returns a copy
+        parsed['vrfs'].clear()
+        self.assertEqual(cache.parse(ShowVrf), cache.parse(ShowVrf))
+        self.assertEqual(sorted(cache.parse(ShowVrf)['vrfs']),
+                         ['VRF1', 'default'])
+        self.assertEqual(self.device.execute.call_count, 1)
+        cache.parse(ShowVrf, output=SHOW_VRF)
+        self.assertEqual(cache.misses, 2)
+
+    def test_exceptions_not_cached(self):
+        self.device.execute.side_effect = [Exception('timeout'), SHOW_VRF]
+        cache = DeviceCache(self.device)
+        with self.assertRaises(Exception):
+            cache.execute('show vrf')
+        self.assertEqual(cache.execute('show vrf'), SHOW_VRF)
+
+
+class TestCollectionSession(unittest.TestCase):
+
+    def setUp(self):
+        self.device = Mock(**{'execute.return_value': SHOW_VRF})
+
+    def test_no_session(self):
+        self.assertIsNone(get_device_cache(self.device))
+        cached_execute(self.device, 'show vrf')
+        cached_execute(self.device, 'show vrf')
+        cached_parse(ShowVrf, self.device)
+        self.assertEqual(self.device.execute.call_count, 3)
+
+    def test_session(self):
+        other = Mock(**{'execute.return_value': SHOW_VRF})
+        with collection_session(self.device) as cache:
+            cached_execute(self.device, 'show vrf')
+            cached_execute(other, 'show vrf')
+            cached_parse(ShowVrf, self.device)
+            cached_parse(ShowVrf, self.device)
+            with collection_session(self.device) as inner:
+                self.assertIs(inner, cache)
+            self.assertIs(get_device_cache(self.device), cache)
+        self.assertIsNone(get_device_cache(self.device))
+        self.assertEqual(self.device.execute.call_count, 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_nested_parsers(self):
+        parser_cls = ShowForwardingDistributionMulticastRoute
+        with collection_session(self.device) as cache:
+            for _ in range(3):
+                # 'show vrf' output parsed as multicast routes is empty
+                with self.assertRaises(Exception):
+                    parser_cls(device=self.device).parse(vrf='all')
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
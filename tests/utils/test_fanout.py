@@ -0,0 +1,85 @@
+import time
+import threading
+import unittest
+from unittest.mock import Mock
+
+from pyats.topology import Device
+from pyats.connections.pool import ConnectionPool
+
+from genie.libs.parser.utils.device_cache import collection_session
+from genie.libs.parser.utils.fanout import execute_many, \
+                                           connection_pool_size
+
+
+class _Session(object):
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+class TestExecuteMany(unittest.TestCase):
+
+    def setUp(self):
+        self.threads = set()
+
+        def execute(command):
+            self.threads.add(threading.current_thread())
+            # Later commands complete first
+            time.sleep(0.01 * (5 - int(command.split()[-1])))
+            return 'output ' + command
+
+        self.device = Mock(**{'execute.side_effect': execute})
+        self.commands = ['show run vrf {}'.format(i) for i in range(5)]
+        self.outputs = ['output show run vrf {}'.format(i) for i in range(5)]
+
+    def test_serial(self):
+        self.assertEqual(execute_many(self.device, self.commands),
+                         self.outputs)
+        self.assertEqual(self.threads, {threading.current_thread()})
+        self.assertEqual(execute_many(self.device, []), [])
+
+    def test_concurrent(self):
+        self.assertEqual(
+            execute_many(self.device, iter(self.commands), max_workers=4),
+            self.outputs)
+        self.assertGreater(len(self.threads), 1)
+
+    def test_exception(self):
+        self.device.execute.side_effect = Exception('timeout')
+        with self.assertRaises(Exception):
+            execute_many(self.device, self.commands, max_workers=4)
+
+    def test_batch(self):
+        self.device.execute.side_effect = lambda commands: {
+            command: 'output ' + command for command in commands}
+        self.assertEqual(execute_many(self.device, self.commands, batch=True),
+                         self.outputs)
+        self.assertEqual(self.device.execute.call_count, 1)
+
+    def test_batch_not_supported(self):
+        self.assertEqual(execute_many(self.device, self.commands, batch=True),
+                         self.outputs)
+        self.assertEqual(self.device.execute.call_count, 6)
+
+    def test_session(self):
+        with collection_session(self.device) as cache:
+            execute_many(self.device, self.commands, max_workers=4)
+            execute_many(self.device, self.commands, max_workers=4)
+        self.assertEqual(self.device.execute.call_count, 5)
+        self.assertEqual((cache.hits, cache.misses), (5, 5))
+
+
+class TestConnectionPoolSize(unittest.TestCase):
+
+    def test_connection_pool_size(self):
+        device = Device('aDevice', os='nxos')
+        self.assertEqual(connection_pool_size(device), 1)
+        device.connectionmgr.connections['default'] = ConnectionPool(
+            device=device, alias='default', via='cli', factory=_Session,
+            pool_size=3)
+        self.assertEqual(connection_pool_size(device), 3)
+        self.assertEqual(connection_pool_size(Mock()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import sys
+import json
+import unittest
+import subprocess
+
+# Self import time, in microseconds, the genie.libs.parser modules are allowed
+# to take on "import genie.libs.parser" (dependencies are not counted)
+IMPORT_TIME_BUDGET = 50000
+
+
+def run_python(code, *options):
+    '''run code in a fresh interpreter and return its stdout and stderr'''
+    proc = subprocess.run([sys.executable] + list(options) + ['-c', code],
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          universal_newlines=True, check=True)
+    return proc.stdout, proc.stderr
+
+
+class TestLazyImport(unittest.TestCase):
+
+    def test_import_time_budget(self):
+        _, stderr = run_python('import genie.libs.parser', '-X', 'importtime')
+
+        self_time = {}
+        for line in stderr.splitlines():
+            # import time: self [us] | cumulative | imported package
+            if not line.startswith('import time:'):
+                continue
+            us, _, module = line[len('import time:'):].split('|')
+            if us.strip().isdigit():
+                self_time[module.strip()] = int(us)
+
+        parser_modules = {module: us for module, us in self_time.items()
+                                    if module.startswith('genie.libs.parser')}
+        self.assertEqual(set(parser_modules),
+                         {'genie.libs.parser', 'genie.libs.parser.base'})
+        self.assertLess(sum(parser_modules.values()), IMPORT_TIME_BUDGET)
+
+    def test_find_parser_cls_imports_one_module(self):
+        stdout, _ = run_python(
+            'import sys, json\n'
+            'from genie.libs.parser.utils.common import _find_parser_cls\n'
+            'cls = _find_parser_cls(None, {"package": "genie.libs.parser", '
+            '"module_name": "show_vrf", "class": "ShowVrf"}, ["iosxe"])\n'
+            'print(json.dumps([cls.__module__, sorted(m for m in sys.modules '
+            'if m.startswith("genie.libs.parser.iosxe"))]))')
+
+        module, imported = json.loads(stdout.splitlines()[-1])
+        self.assertEqual(module, 'genie.libs.parser.iosxe.show_vrf')
+        self.assertEqual(imported, ['genie.libs.parser.iosxe',
+                                    'genie.libs.parser.iosxe.show_vrf'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.utils import ParseCache
+from genie.libs.parser.iosxe.show_vrf import ShowVrf
+
+
+class TestParseCache(unittest.TestCase):
+
+    output = '''\
+          Name                             Default RD            Protocols   Interfaces
+          Mgmt-intf                        <not set>             ipv4,ipv6   Gi1
+          VRF1                             65000:1               ipv4,ipv6   Tu1
+    '''
+
+    def test_parsed_once(self):
+        cache = ParseCache()
+        with patch.object(ShowVrf, 'cli', wraps=ShowVrf(device=None).cli) \
+                as cli:
+            first = cache.parse(ShowVrf, output=self.output)
+            second = cache.parse(ShowVrf, output=self.output)
+        self.assertEqual(cli.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_results_are_copies(self):
+        cache = ParseCache()
+        first = cache.parse(ShowVrf, output=self.output)
+        first['vrf'].clear()
+        second = cache.parse(ShowVrf, output=self.output)
+        self.assertIn('VRF1', second['vrf'])
+        self.assertIsNot(second, cache.parse(ShowVrf, output=self.output))
+
+    def test_key(self):
+        cache = ParseCache()
+        cache.parse(ShowVrf, output=self.output)
+        self.assertIsNone(cache.get(ShowVrf, self.output + ' '))
+        self.assertIsNone(cache.get(ShowVrf, self.output, {'vrf': 'VRF1'}))
+        self.assertIsNotNone(cache.get(ShowVrf, self.output, {}))
+
+    def test_maxsize(self):
+        cache = ParseCache(maxsize=2)
+        for i in range(3):
+            cache.set(ShowVrf, str(i), None, {'i': i})
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(ShowVrf, '0'))
+        self.assertEqual(cache.get(ShowVrf, '2'), {'i': 2})
+
+    def test_directory(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        ParseCache(directory=directory).set(ShowVrf, 'out', None, {'a': 1})
+        cache = ParseCache(directory=directory)
+        self.assertEqual(cache.get(ShowVrf, 'out'), {'a': 1})
+        self.assertEqual(len(cache), 1)
+
+        cache.clear()
+        self.assertIsNone(ParseCache(directory=directory).get(ShowVrf, 'out'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import re
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils.patterns import Patterns, compile_pattern, \
+                                             first_chars
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+
+class TestPatterns(unittest.TestCase):
+
+    def test_compile_pattern_is_shared(self):
+        p1 = compile_pattern(r'^Vlan(?P<vlan>\d+) +is +up$')
+        self.assertIs(p1, compile_pattern(r'^Vlan(?P<vlan>\d+) +is +up$'))
+        self.assertIsNot(p1, compile_pattern(r'^Vlan(?P<vlan>\d+) +is +up$',
+                                             re.I))
+
+    def test_compiled_on_first_use(self):
+        class Parser(object):
+            patterns = Patterns(p1=r'^interface +(?P<intf>\S+)$',
+                                p2=r'^ +description +(?P<desc>.*)$')
+
+        self.assertIsNone(Parser.__dict__['patterns'].compiled)
+
+        p = Parser().patterns
+        self.assertEqual(p.p1.match('interface Gi1').group('intf'), 'Gi1')
+        self.assertIs(p, Parser().patterns)
+        self.assertIs(p.p2, compile_pattern(r'^ +description +(?P<desc>.*)$'))
+
+    def test_flags(self):
+        class Parser(object):
+            patterns = Patterns(re.I, p1=r'^vlan (?P<vlan>\d+)$')
+
+        self.assertTrue(Parser.patterns.p1.match('VLAN 10'))
+
+    def test_parser_does_not_recompile(self):
+        output = '''\
+            GigabitEthernet1 is up, line protocol is up
+              Hardware is CSR vNIC, address is 0050.56ff.df2b (bia 0050.56ff.df2b)
+              Carrier delay is 10 sec
+              Encapsulation ARPA, loopback not set
+        '''
+        parser = ShowInterfaces(device=Mock())
+        expected = parser.cli(output=output)
+
+        re.purge()
+        with patch('re.compile', wraps=re.compile) as compile:
+            self.assertEqual(parser.cli(output=output), expected)
+        self.assertEqual(compile.call_count, 0)
+
+class TestDispatch(unittest.TestCase):
+
+    def test_first_chars(self):
+        self.assertEqual(first_chars(r'^Hardware +is +(?P<type>.*)$'), {'H'})
+        self.assertEqual(first_chars(r'^(?P<in_pkts>\d+) +packets'),
+                         set('0123456789'))
+        self.assertEqual(first_chars(r'^(Full|[Aa]uto)-duplex'),
+                         {'F', 'A', 'a'})
+        self.assertEqual(first_chars(r'^ *(?P<x>\d+)?Vlan'),
+                         set(' 0123456789V'))
+        self.assertEqual(first_chars(r'^vlan', re.I), {'v', 'V'})
+        # Matches an empty line or cannot be worked out
+        self.assertIsNone(first_chars(r'^(?P<x>\S*)$'))
+        self.assertIsNone(first_chars(r'^(?!Vlan)(?P<intf>\S+)'))
+        self.assertIsNone(first_chars(r'^(?i:vlan)'))
+
+    def test_dispatch(self):
+        class Parser(object):
+            patterns = Patterns(p1=r'^Hardware +is +(?P<type>.*)$',
+                                p2=r'^(?P<in_pkts>\d+) +packets +input',
+                                p3=r'^(?P<intf>\S+) +is +up')
+
+        patterns = Parser.patterns
+
+        p = patterns.dispatch('Hardware is CSR vNIC')
+        self.assertIs(p.p1, patterns.p1)
+        self.assertIs(p.p3, patterns.p3)
+        self.assertIsNone(p.p2.match('Hardware is CSR vNIC'))
+
+        p = patterns.dispatch('10 packets input')
+        self.assertIsNone(p.p1.match('10 packets input'))
+        self.assertEqual(p.p2.match('10 packets input').group('in_pkts'),
+                         '10')
+
+        self.assertIs(patterns.dispatch(''), patterns)
+        self.assertIs(patterns.dispatch('\u00e9 is up'), patterns)
+
+    def test_parser_output_unchanged(self):
+        output = '''\
+            GigabitEthernet1 is up, line protocol is up
+              Hardware is CSR vNIC, address is 0050.56ff.df2b (bia 0050.56ff.df2b)
+              Internet address is 10.1.1.1/24
+              MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+                 reliability 255/255, txload 1/255, rxload 1/255
+              Encapsulation ARPA, loopback not set
+              Full Duplex, 1000Mbps, link type is auto, media type is Virtual
+              5 minute input rate 0 bits/sec, 0 packets/sec
+              5 minute output rate 0 bits/sec, 0 packets/sec
+                 10 packets input, 1000 bytes, 0 no buffer
+                 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
+        '''
+        parser = ShowInterfaces(device=Mock())
+        with patch.object(ShowInterfaces.patterns, 'dispatch',
+                          lambda line: ShowInterfaces.patterns):
+            expected = parser.cli(output=output)
+        self.assertEqual(parser.cli(output=output), expected)
+        self.assertEqual(expected['GigabitEthernet1']['counters']['in_pkts'],
+                         10)
+
+
+if __name__ == '__main__':
+    unittest.main()
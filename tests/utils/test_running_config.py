@@ -0,0 +1,149 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.device_cache import collection_session
+from genie.libs.parser.utils.running_config import RunningConfig, \
+    running_config, execute_config, config_section, config_include
+
+RUNNING_CONFIG = '''\
+Building configuration...
+
+Current configuration : 1024 bytes
+!
+hostname R1
+!
+interface GigabitEthernet1
+ ip address 10.1.2.1 255.255.255.0
+ ip router isis test
+!
+interface GigabitEthernet10
+ ip router isis test
+!
+router ospf 1
+ area 1 virtual-link 10.100.5.5
+ !
+router ospf 10 vrf VRF1
+ area 1 sham-link 10.229.11.11 10.151.22.22 cost 111
+router bgp 100
+ address-family ipv4 vrf VRF1
+  neighbor 10.4.6.6 remote-as 300
+ exit-address-family
+ !
+ address-family ipv4 vrf VRF2
+  neighbor 10.4.7.7 remote-as 400
+ exit-address-family
+!
+router isis test
+ net 49.0001.11ff.2211.2222.00
+ !
+ address-family ipv6
+  multi-topology
+ exit-address-family
+!
+end
+'''
+
+
+class TestRunningConfig(unittest.TestCase):
+
+    def setUp(self):
+        self.config = RunningConfig(RUNNING_CONFIG)
+
+    def test_offsets(self):
+        start = self.config.lines.index('router bgp 100')
+        self.assertIn(start, self.config.starts)
+        self.assertEqual(self.config.lines[self.config.ends[start]], '!')
+        self.assertEqual(self.config.ends[start + 1] - start, 3)
+
+    def test_section(self):
+        self.assertEqual(self.config.section('router ospf 1'),
+                         'router ospf 1\n'
+                         ' area 1 virtual-link 10.100.5.5\n'
+                         ' !\n'
+                         'router ospf 10 vrf VRF1\n'
+                         ' area 1 sham-link 10.229.11.11 10.151.22.22 '
+                         'cost 111')
+        # Nested lines are returned with the lines under them only
+        self.assertEqual(self.config.section('address-family ipv4 vrf'),
+                         ' address-family ipv4 vrf VRF1\n'
+                         '  neighbor 10.4.6.6 remote-as 300\n'
+                         ' address-family ipv4 vrf VRF2\n'
+                         '  neighbor 10.4.7.7 remote-as 400')
+        self.assertEqual(self.config.section('isis').splitlines()[:3],
+                         [' ip router isis test', ' ip router isis test',
+                          'router isis test'])
+        self.assertEqual(self.config.section('^router eigrp'), '')
+
+    def test_include(self):
+        self.assertEqual(self.config.include('virtual-link', '10.100.5.5'),
+                         ' area 1 virtual-link 10.100.5.5')
+        self.assertEqual(self.config.include('ospf'),
+                         'router ospf 1\nrouter ospf 10 vrf VRF1')
+        self.assertEqual(self.config.include('remote-as [34]00$'),
+                         '  neighbor 10.4.6.6 remote-as 300\n'
+                         '  neighbor 10.4.7.7 remote-as 400')
+
+    def test_query(self):
+        query = self.config.query
+        self.assertEqual(query('show running-config interface Gi1'),
+                         'interface GigabitEthernet1\n'
+                         ' ip address 10.1.2.1 255.255.255.0\n'
+                         ' ip router isis test')
+        self.assertEqual(query('show run router isis').splitlines()[0],
+                         'router isis test')
+        self.assertEqual(query('show run | sec address-family ipv4 vrf'),
+                         self.config.section('address-family ipv4 vrf'))
+        self.assertEqual(query('show running-config | s router bgp | i VRF2'),
+                         ' address-family ipv4 vrf VRF2')
+        self.assertEqual(query('show running-config | i sham-link | i '
+                               '10.151.22.22'),
+                         self.config.include('sham-link', '10.151.22.22'))
+        self.assertEqual(query('show running-config').splitlines()[-1],
+                         'end')
+        for command in ('show version', 'show running-config all',
+                        'show running-config | exclude isis',
+                        'show running-config | begin router',
+                        'show running-config | section include isis'):
+            self.assertIsNone(query(command), command)
+
+    def test_index(self):
+        self.assertEqual(len(self.config._candidates('router ospf 1')), 2)
+        self.assertEqual(len(self.config._candidates('ip router isis')), 3)
+        self.assertEqual(len(self.config._candidates('router (ospf|bgp)')),
+                         len(self.config.lines))
+
+
+class TestDeviceRunningConfig(unittest.TestCase):
+
+    def setUp(self):
+        self.device = Mock(**{'execute.return_value': RUNNING_CONFIG})
+
+    def test_without_session(self):
+        self.assertIsNone(running_config(self.device))
+        config_section(self.device, 'router ospf 1')
+        config_include(self.device, 'sham-link', '10.151.22.22')
+        execute_config(self.device, 'show running-config interface Gi1')
+        self.assertEqual(
+            [args[0] for args, kwargs in self.device.execute.call_args_list],
+            ['show running-config | section router ospf 1',
+             'show running-config | i sham-link | i 10.151.22.22',
+             'show running-config interface Gi1'])
+
+    def test_session(self):
+        with collection_session(self.device):
+            config = running_config(self.device)
+            self.assertIs(running_config(self.device), config)
+            self.assertEqual(config_section(self.device, 'router bgp'),
+                             config.section('router bgp'))
+            self.assertEqual(
+                config_include(self.device, 'sham-link', '10.151.22.22'),
+                ' area 1 sham-link 10.229.11.11 10.151.22.22 cost 111')
+            self.device.execute.assert_called_once_with('show running-config')
+            # Executed on the device
+            execute_config(self.device, 'show running-config | begin isis')
+            self.device.execute.assert_called_with(
+                'show running-config | begin isis')
+
+
+if __name__ == '__main__':
+    unittest.main()
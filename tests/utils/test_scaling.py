@@ -0,0 +1,73 @@
+import time
+import unittest
+
+from genie.libs.parser.utils import synthetic
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.iosxe.show_bgp import ShowIpBgp
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+from genie.libs.parser.iosxe.show_ospf import ShowIpOspfDatabase
+
+# Output n times larger must be parsed in less than SCALE * LINEAR_TOLERANCE
+# times longer. A quadratic parser would take SCALE * SCALE times longer.
+SCALE = 4
+LINEAR_TOLERANCE = 2
+
+
+def parse_time(parser_cls, output, repeat=2):
+    '''return the fastest time taken to parse output, and the parsed output'''
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parsed = parser_cls(device=None).parse(output=output)
+        best = min(best, time.perf_counter() - start)
+    return best, parsed
+
+
+class TestScaling(unittest.TestCase):
+
+    def assert_linear(self, parser_cls, generator, count, n):
+        small, parsed = parse_time(parser_cls, generator(n))
+        self.assertEqual(count(parsed), n)
+
+        large, parsed = parse_time(parser_cls, generator(n * SCALE))
+        self.assertEqual(count(parsed), n * SCALE)
+        self.assertLess(large / small, SCALE * LINEAR_TOLERANCE,
+                        '{} is not linear: {:.3f}s for {} entries, {:.3f}s '
+                        'for {}'.format(parser_cls.__name__, small, n, large,
+                                        n * SCALE))
+
+    def test_show_interfaces(self):
+        self.assert_linear(ShowInterfaces, synthetic.show_interfaces, len, 25)
+
+    def test_show_ip_route(self):
+        self.assert_linear(
+            ShowIpRoute, synthetic.show_ip_route,
+            lambda parsed: len(parsed['vrf']['default']['address_family']
+                                     ['ipv4']['routes']), 300)
+
+    def test_show_ip_bgp(self):
+        self.assert_linear(
+            ShowIpBgp, synthetic.show_ip_bgp,
+            lambda parsed: len(parsed['vrf']['default']['address_family']
+                                     ['']['routes']), 300)
+
+    def test_show_mac_address_table(self):
+        self.assert_linear(
+            ShowMacAddressTable, synthetic.show_mac_address_table,
+            lambda parsed: sum(len(vlan['mac_addresses']) for vlan in
+                               parsed['mac_table']['vlans'].values()), 500)
+
+    def test_show_ip_ospf_database(self):
+        def count(parsed):
+            instance = parsed['vrf']['default']['address_family']['ipv4'] \
+                             ['instance']['65109']
+            return sum(len(lsa_type['lsas'])
+                       for area in instance['areas'].values()
+                       for lsa_type in area['database']['lsa_types'].values())
+        self.assert_linear(ShowIpOspfDatabase,
+                           synthetic.show_ip_ospf_database, count, 300)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+
+from pyats.utils.exceptions import SchemaError
+from genie.metaparser.util.schemaengine import Schema, Optional, Any, Use, \
+    Or
+
+from genie.libs.parser.junos.show_route import ShowRouteSchema
+from genie.libs.parser.utils.schema import ListSchema, compile_schema
+
+NH = {
+    Optional('to'): str,
+    'via': str,
+}
+
+
+class TestListSchema(unittest.TestCase):
+
+    def test_validate(self):
+        validator = ListSchema(NH, 'nh is not a list')
+        value = [{'to': '10.0.0.1', 'via': 'ge-0/0/0.0'}, {'via': 'lo0.0'}]
+        self.assertIs(validator(value), value)
+        self.assertEqual(validator([]), [])
+        with self.assertRaisesRegex(SchemaError, 'nh is not a list'):
+            validator({'via': 'lo0.0'})
+        for item in ({'to': '10.0.0.1'}, {'via': 1},
+                     {'via': 'lo0.0', 'weight': '1'}, {}):
+            with self.assertRaises(Exception):
+                validator([{'via': 'lo0.0'}, item])
+
+    def test_single(self):
+        validator = ListSchema(NH, single=True)
+        self.assertEqual(validator({'via': 'lo0.0'}), [{'via': 'lo0.0'}])
+
+    def test_schema_built_once(self):
+        validator = ListSchema(NH)
+        validator([{'via': 'lo0.0'}])
+        schema = validator._schema
+        validator([{'via': 'lo0.0'}])
+        self.assertIs(validator._schema, schema)
+
+    def test_nested(self):
+        schema = {
+            'route-information': {
+                'rt': Use(ShowRouteSchema.validate_rt_list),
+            },
+        }
+        rt = {'rt-destination': '10.0.0.0/24',
+              'rt-entry': {'age': {'#text': '1w2d'},
+                           'nh': [{'to': '10.0.0.1'}],
+                           'preference': '170',
+                           'protocol-name': 'BGP'}}
+        Schema(schema).validate({'route-information': {'rt': [rt]}})
+        rt['rt-entry']['nh'].append({'to': 1})
+        with self.assertRaises(Exception):
+            Schema(schema).validate({'route-information': {'rt': [rt]}})
+
+
+class TestCompileSchema(unittest.TestCase):
+
+    def test_matches_schema(self):
+        schemas = [
+            {'a': int, Optional('b'): {'c': str}},
+            {Any(): {'x': int}, 'a': str},
+            {'a': {Optional(Any()): int}},
+            {'a': Use(ListSchema({'b': str}))},
+            {'a': list, Optional('b'): bool},
+        ]
+        data = [
+            {'a': 1}, {'a': 1, 'b': {'c': 'x'}}, {'a': 1, 'b': {}},
+            {'a': 'x'}, {'a': 'x', 'k': {'x': 1}}, {'a': 'x', 'k': 1},
+            {'a': {}}, {'a': {'k': 1}}, {'a': {'k': 'x'}}, {'b': 1},
+            {'a': [{'b': 'x'}]}, {'a': [{'b': 1}]}, {'a': []},
+            {'a': [], 'b': True}, {}, [], 'a',
+        ]
+        for schema in schemas:
+            check = compile_schema(schema)
+            for item in data:
+                try:
+                    Schema(schema).validate(item)
+                except Exception:
+                    valid = False
+                else:
+                    valid = True
+                # Valid data may be left to the Schema, never invalid data
+                if check(item):
+                    self.assertTrue(valid, (schema, item))
+
+    def test_valid(self):
+        self.assertTrue(compile_schema(NH)({'to': '10.0.0.1', 'via': 'x'}))
+        self.assertFalse(compile_schema(NH)({}))
+
+    def test_unsupported(self):
+        self.assertIsNone(compile_schema({'a': Or(int, str)}))
+        self.assertIsNone(compile_schema({int: str}))
+        validator = ListSchema({'a': Or(int, str)})
+        self.assertEqual(validator([{'a': 1}, {'a': 'x'}]),
+                         [{'a': 1}, {'a': 'x'}])
+        with self.assertRaises(Exception):
+            validator([{'a': None}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import io
+import unittest
+
+from genie.libs.parser.utils.stream import Records, iter_lines, \
+                                           merge_record, build_result
+
+
+class TestStream(unittest.TestCase):
+
+    def test_iter_lines(self):
+        self.assertEqual(list(iter_lines('a\r\nb\n')), ['a', 'b'])
+        self.assertEqual(list(iter_lines(io.StringIO('a\r\nb\n'))), ['a', 'b'])
+        self.assertEqual(list(iter_lines(['a\n', 'b'])), ['a', 'b'])
+
+    def test_merge_record(self):
+        result = {}
+        merge_record(result, ('vrf', 'default', 'routes', '10.0.0.0/8'),
+                     {'route': '10.0.0.0/8',
+                      'next_hop': {'next_hop_list': {1: {'index': 1}}}})
+        merge_record(result, ('vrf', 'default', 'routes', '10.0.0.0/8'),
+                     {'next_hop': {'next_hop_list': {2: {'index': 2}}}})
+        self.assertEqual(result, {'vrf': {'default': {'routes': {
+            '10.0.0.0/8': {'route': '10.0.0.0/8',
+                           'next_hop': {'next_hop_list': {1: {'index': 1},
+                                                          2: {'index': 2}}}}}}}})
+
+    def test_merge_record_list(self):
+        result = build_result([
+            (('route-table', 0), {'table-name': 'inet.0'}),
+            (('route-table', 0, 'rt', 0), {'rt-destination': '10.0.0.0/8'}),
+            (('route-table', 0, 'rt', 1), {'rt-destination': '10.1.0.0/16'}),
+            (('route-table', 1), {'table-name': 'inet.3'})])
+        self.assertEqual(result, {'route-table': [
+            {'table-name': 'inet.0',
+             'rt': [{'rt-destination': '10.0.0.0/8'},
+                    {'rt-destination': '10.1.0.0/16'}]},
+            {'table-name': 'inet.3'}]})
+
+    def test_records(self):
+        records = Records()
+        first = records.open('routes', 'a')
+        self.assertIs(records.open('routes', 'a'), first)
+        self.assertFalse(records.completed)
+
+        second = records.open('routes', 'b')
+        self.assertEqual(list(records.pop()), [(('routes', 'a'), first)])
+        self.assertFalse(records.completed)
+
+        records.add({}, 'vrf')
+        self.assertEqual(list(records.close()),
+                         [(('routes', 'b'), second), (('vrf',), {})])
+        self.assertEqual(list(records.close()), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import io
+import unittest
+
+from genie.metaparser.util.schemaengine import Optional, Any, Use
+
+from genie.libs.parser.utils.schema import ListSchema
+from genie.libs.parser.utils.structured import XmlOutput, JsonOutput, \
+    structured_output, schema_of
+
+XML = '''
+show route | display xml
+<rpc-reply xmlns:junos="http://xml.juniper.net/junos/19.2R1/junos">
+    <route-information xmlns="http://xml.juniper.net/junos/19.2R1/junos-routing">
+        <rt junos:style="brief">
+            <rt-destination>10.0.0.0/24</rt-destination>
+            <nh><to>10.0.0.1</to></nh>
+            <active/>
+        </rt>
+        <rt junos:style="brief">
+            <rt-destination>10.0.1.0/24</rt-destination>
+            <nh><to>10.0.0.1</to></nh>
+            <nh><to>10.0.0.2</to></nh>
+            <age junos:seconds="60">1:00</age>
+            <unknown>dropped</unknown>
+        </rt>
+    </route-information>
+</rpc-reply>
+]]>]]>
+{master}
+'''
+
+JSON = '''
+show route | display json
+{
+    "route-information" : [
+    {
+        "rt" : [
+        {
+            "attributes" : {"junos:style" : "brief"},
+            "rt-destination" : [{"data" : "10.0.0.0/24"}],
+            "nh" : [{"to" : [{"data" : "10.0.0.1"}]}],
+            "active" : [{"data" : [null]}]
+        },
+        {
+            "attributes" : {"junos:style" : "brief"},
+            "rt-destination" : [{"data" : "10.0.1.0/24"}],
+            "nh" : [{"to" : [{"data" : "10.0.0.1"}]},
+                    {"to" : [{"data" : "10.0.0.2"}]}],
+            "age" : [{"data" : "1:00", "attributes" : {"junos:seconds" : "60"}}],
+            "unknown" : [{"data" : "dropped"}]
+        }
+        ]
+    }
+    ]
+}
+{master}
+'''
+
+RT_SCHEMA = {
+    '@junos:style': str,
+    'rt-destination': str,
+    'nh': Use(ListSchema({'to': str})),
+    Optional('active'): bool,
+    Optional('age'): {'#text': str, '@junos:seconds': str},
+}
+
+RTS = [
+    {'@junos:style': 'brief', 'rt-destination': '10.0.0.0/24',
+     'nh': [{'to': '10.0.0.1'}], 'active': True},
+    {'@junos:style': 'brief', 'rt-destination': '10.0.1.0/24',
+     'nh': [{'to': '10.0.0.1'}, {'to': '10.0.0.2'}],
+     'age': {'#text': '1:00', '@junos:seconds': '60'}},
+]
+
+
+def _rts(structured):
+    rts = []
+    for event, name, element in structured.iter(['rt']):
+        if event == 'end':
+            rts.append(structured.to_dict(element, RT_SCHEMA))
+    return rts
+
+
+class TestXmlOutput(unittest.TestCase):
+
+    def test_iter(self):
+        self.assertEqual(_rts(XmlOutput(XML)), RTS)
+
+    def test_lines(self):
+        self.assertEqual(_rts(XmlOutput(io.StringIO(XML))), RTS)
+        self.assertEqual(_rts(XmlOutput(XML.splitlines(True))), RTS)
+
+    def test_removed(self):
+        structured = XmlOutput(XML)
+        parents = []
+        for event, name, element in structured.iter(['rt',
+                                                     'route-information']):
+            if name == 'route-information' and event == 'end':
+                parents.append(len(element))
+        # Each rt was removed from its parent once yielded
+        self.assertEqual(parents, [0])
+
+    def test_repeated(self):
+        schema = {'rt-destination': str, 'nh': {'to': str}}
+        structured = XmlOutput(XML)
+        rts = [structured.to_dict(element, schema)
+               for event, name, element in structured.iter(['rt'])
+               if event == 'end']
+        self.assertEqual(rts[0]['nh'], {'to': '10.0.0.1'})
+        self.assertEqual(rts[1]['nh'], [{'to': '10.0.0.1'},
+                                        {'to': '10.0.0.2'}])
+
+    def test_empty(self):
+        self.assertEqual(_rts(XmlOutput('')), [])
+
+
+class TestJsonOutput(unittest.TestCase):
+
+    def test_iter(self):
+        self.assertEqual(_rts(JsonOutput(JSON)), RTS)
+
+    def test_structured_output(self):
+        self.assertIsInstance(structured_output(JSON, 'json'), JsonOutput)
+        self.assertIsInstance(structured_output(XML), XmlOutput)
+        self.assertEqual(_rts(structured_output(JSON.splitlines(), 'json')),
+                         RTS)
+
+    def test_empty(self):
+        self.assertEqual(_rts(JsonOutput('')), [])
+
+
+class TestSchemaOf(unittest.TestCase):
+
+    def test_schema_of(self):
+        b_schema = {Any(): int}
+        schema = {Optional('a'): str, 'b': b_schema}
+        self.assertIs(schema_of(schema, 'a'), str)
+        self.assertIs(schema_of(schema, 'b'), b_schema)
+        self.assertIsNone(schema_of(schema, 'c'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import Use
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.nxos.show_vrf import ShowVrf
+from genie.libs.parser.utils import validation
+from genie.libs.parser.utils.validation import ALWAYS, NEVER, \
+    set_validation, get_validation
+
+SHOW_VRF = '''
+VRF-Name                           VRF-ID State   Reason
+VRF1                                    3 Up      --
+default                                 1 Up      --
+'''
+
+
+class _Parser(MetaParser):
+    schema = {'count': Use(int)}
+    cli_command = 'show count'
+
+    def cli(self, output=None):
+        return {'count': output} if output else {}
+
+
+class TestValidation(unittest.TestCase):
+
+    def setUp(self):
+        validation.reset_stats()
+        self.failures = []
+        validation.failure_hooks.append(
+            lambda parser, output, e: self.failures.append(output))
+
+    def tearDown(self):
+        validation.failure_hooks.clear()
+        set_validation(None)
+        set_validation(None, parser_cls=_Parser)
+
+    def test_always(self):
+        self.assertEqual(_Parser(device=None).parse(output='1'), {'count': 1})
+        with self.assertRaises(Exception):
+            _Parser(device=None).parse(output='one')
+        with self.assertRaises(SchemaEmptyParserError):
+            _Parser(device=None).parse()
+        self.assertFalse(validation.stats)
+
+    def test_never(self):
+        parser = _Parser(device=None)
+        self.assertEqual(parser.parse(output='one', schema_validation=NEVER),
+                         {'count': 'one'})
+        self.assertEqual(parser.schema, _Parser.schema)
+        with self.assertRaises(SchemaEmptyParserError):
+            parser.parse(schema_validation=NEVER)
+        self.assertEqual(validation.stats['_Parser', 'skipped'], 1)
+
+    def test_sampled(self):
+        set_validation(3)
+        outputs = [_Parser(device=None).parse(output=output)
+                   for output in ('1', 'two', 'three', 'four')]
+        self.assertEqual(outputs, [{'count': 1}, {'count': 'two'},
+                                   {'count': 'three'}, {'count': 'four'}])
+        # 'four' was validated, and failed without raising
+        self.assertEqual(self.failures, [{'count': 'four'}])
+        self.assertEqual(validation.stats['_Parser', 'validated'], 1)
+        self.assertEqual(validation.stats['_Parser', 'failed'], 1)
+        self.assertEqual(validation.stats['_Parser', 'skipped'], 2)
+
+    def test_priority(self):
+        set_validation(NEVER)
+        set_validation(ALWAYS, parser_cls=_Parser)
+        parser = _Parser(device=None)
+        self.assertEqual(get_validation(parser), ALWAYS)
+        self.assertEqual(get_validation(ShowVrf), NEVER)
+        self.assertEqual(get_validation(parser, 10), 10)
+        set_validation(None, parser_cls=_Parser)
+        self.assertEqual(get_validation(parser), NEVER)
+        with self.assertRaises(ValueError):
+            set_validation(0)
+        with self.assertRaises(ValueError):
+            parser.parse(output='1', schema_validation='sometimes')
+
+    def test_selected_keys(self):
+        parsed = ShowVrf(device=None).parse(
+            output=SHOW_VRF, schema_validation=1,
+            selected_keys=[['vrfs', 'VRF1', 'vrf_id']])
+        self.assertEqual(parsed, {'vrfs': {'VRF1': {'vrf_id': 3}}})
+
+
+if __name__ == '__main__':
+    unittest.main()